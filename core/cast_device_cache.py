@@ -0,0 +1,122 @@
+"""Persistent table of last-known cast devices.
+
+Opening the cast picker used to run a blocking Chromecast, DLNA and AirPlay scan
+of several seconds before anything could be chosen, and connecting could start
+another discovery round. Devices seen on the network (by a scan or by the
+passive listeners in core.casting) are stored in rss.db with their address, so
+the picker lists them immediately and connecting can go straight to the known
+host. Reachability is checked again lazily by the casting manager.
+
+Rows are plain dicts (protocol, identifier, name, host, port, metadata) so this
+module does not need the optional casting libraries.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import time
+from typing import Dict, Iterable, List
+
+from core.db import cache_connection
+
+LOG = logging.getLogger(__name__)
+
+# Devices not seen for this long are dropped.
+MAX_AGE_S = 30 * 24 * 3600
+
+
+def _json_metadata(metadata) -> Dict:
+    """Only JSON-safe scalars survive (pyatv config objects and the like are rebuilt by a rescan)."""
+    out = {}
+    for k, v in (metadata or {}).items():
+        if v is None or isinstance(v, (str, int, float, bool)):
+            out[str(k)] = v
+    return out
+
+
+def remember(devices: Iterable[dict], connected: bool = False) -> int:
+    """Insert or refresh devices; returns how many rows were written."""
+    now = int(time.time())
+    rows = []
+    for d in devices or []:
+        protocol = str(d.get("protocol") or "")
+        identifier = str(d.get("identifier") or "")
+        if not protocol or not identifier:
+            continue
+        rows.append(
+            (
+                f"{protocol}:{identifier}",
+                protocol,
+                identifier,
+                d.get("name"),
+                d.get("host"),
+                int(d.get("port") or 0),
+                json.dumps(_json_metadata(d.get("metadata")), separators=(",", ":")),
+                now,
+                now if connected else None,
+            )
+        )
+    if not rows:
+        return 0
+    try:
+        with cache_connection(write=True) as conn:
+            conn.executemany(
+                "INSERT INTO cast_devices (unique_id, protocol, identifier, name, host, port, metadata, last_seen, last_connected) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(unique_id) DO UPDATE SET "
+                "name = excluded.name, host = excluded.host, port = excluded.port, metadata = excluded.metadata, "
+                "last_seen = excluded.last_seen, "
+                "last_connected = COALESCE(excluded.last_connected, cast_devices.last_connected)",
+                rows,
+            )
+            conn.execute("DELETE FROM cast_devices WHERE last_seen < ?", (now - MAX_AGE_S,))
+        return len(rows)
+    except sqlite3.Error as e:
+        LOG.debug("cast_devices write failed: %s", e)
+        return 0
+
+
+def load(max_age_s: int = MAX_AGE_S) -> List[dict]:
+    """Known devices, most recently connected (then seen) first."""
+    cutoff = int(time.time()) - max(0, int(max_age_s))
+    try:
+        with cache_connection() as conn:
+            rows = conn.execute(
+                "SELECT protocol, identifier, name, host, port, metadata, last_seen, last_connected FROM cast_devices "
+                "WHERE last_seen >= ? ORDER BY COALESCE(last_connected, 0) DESC, last_seen DESC",
+                (cutoff,),
+            ).fetchall()
+        out = []
+        for protocol, identifier, name, host, port, metadata, last_seen, last_connected in rows:
+            try:
+                meta = json.loads(metadata) if metadata else {}
+            except ValueError:
+                meta = {}
+            out.append(
+                {
+                    "protocol": protocol,
+                    "identifier": identifier,
+                    "name": name or identifier,
+                    "host": host or "",
+                    "port": int(port or 0),
+                    "metadata": meta if isinstance(meta, dict) else {},
+                    "last_seen": int(last_seen or 0),
+                    "last_connected": int(last_connected or 0) or None,
+                }
+            )
+        return out
+    except sqlite3.Error as e:
+        LOG.debug("cast_devices read failed: %s", e)
+        return []
+
+
+def forget(unique_id: str) -> None:
+    if not unique_id:
+        return
+    try:
+        with cache_connection(write=True) as conn:
+            conn.execute("DELETE FROM cast_devices WHERE unique_id = ?", (str(unique_id),))
+    except sqlite3.Error as e:
+        LOG.debug("cast_devices delete failed: %s", e)
@@ -0,0 +1,197 @@
+"""Passive SSDP listening and reachability checks for cast devices.
+
+DLNA/UPnP renderers announce themselves with multicast `NOTIFY` messages
+(`ssdp:alive` when they appear and periodically after that, `ssdp:byebye` when
+they leave). `SsdpListener` joins the SSDP group on the casting manager's event
+loop and reports renderers as they come and go, so the device table stays
+current without a blocking scan each time the cast picker opens. It also sends
+an occasional `M-SEARCH` from the same socket, because some renderers announce
+rarely.
+
+Only the standard library is used; Chromecast (mDNS) is handled by pychromecast's
+own browser in core.casting.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import socket
+import struct
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+LOG = logging.getLogger(__name__)
+
+SSDP_GROUP = "239.255.255.250"
+SSDP_PORT = 1900
+RENDERER_TYPE = "urn:schemas-upnp-org:device:MediaRenderer:1"
+# Active search from the listening socket at start and then this often.
+SEARCH_INTERVAL_S = 10 * 60
+
+# on_alive(usn, st, location, headers) / on_byebye(usn)
+AliveCallback = Callable[[str, str, str, Dict[str, str]], None]
+ByeCallback = Callable[[str], None]
+
+
+def parse_ssdp_message(data: bytes) -> Tuple[str, Dict[str, str]]:
+    """Split an SSDP datagram into its start line and lower-cased headers."""
+    try:
+        text = data.decode("utf-8", errors="replace")
+    except Exception:
+        return "", {}
+    lines = text.replace("\r\n", "\n").split("\n")
+    start = lines[0].strip() if lines else ""
+    headers: Dict[str, str] = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if not sep:
+            continue
+        headers[name.strip().lower()] = value.strip()
+    return start, headers
+
+
+def is_renderer(st: str, usn: str) -> bool:
+    return "MediaRenderer" in (st or "") or "MediaRenderer" in (usn or "")
+
+
+def search_request(target: str = RENDERER_TYPE, mx: int = 2) -> bytes:
+    return (
+        "M-SEARCH * HTTP/1.1\r\n"
+        f"HOST: {SSDP_GROUP}:{SSDP_PORT}\r\n"
+        'MAN: "ssdp:discover"\r\n'
+        f"MX: {int(mx)}\r\n"
+        f"ST: {target}\r\n"
+        "\r\n"
+    ).encode("ascii")
+
+
+class SsdpListener(asyncio.DatagramProtocol):
+    """Reports MediaRenderer announcements and search responses."""
+
+    def __init__(self, on_alive: AliveCallback, on_byebye: Optional[ByeCallback] = None):
+        self._on_alive = on_alive
+        self._on_byebye = on_byebye
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        self._search_task: Optional[asyncio.Task] = None
+        self._last_alive: Dict[str, float] = {}
+
+    def connection_made(self, transport) -> None:
+        self._transport = transport
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        start, headers = parse_ssdp_message(data)
+        upper = start.upper()
+        if upper.startswith("NOTIFY"):
+            st = headers.get("nt", "")
+            nts = headers.get("nts", "").lower()
+        elif upper.startswith("HTTP/"):
+            st = headers.get("st", "")
+            nts = "ssdp:alive"
+        else:
+            # Other hosts' M-SEARCH requests.
+            return
+        usn = headers.get("usn", "")
+        if not usn or not is_renderer(st, usn):
+            return
+        try:
+            if nts == "ssdp:byebye":
+                self._last_alive.pop(usn, None)
+                if self._on_byebye is not None:
+                    self._on_byebye(usn)
+                return
+            location = headers.get("location", "")
+            if not location:
+                return
+            # Renderers repeat alive messages for every service; one report a minute is plenty.
+            now = time.monotonic()
+            if now - self._last_alive.get(usn, -1e9) < 60.0:
+                return
+            self._last_alive[usn] = now
+            self._on_alive(usn, st, location, headers)
+        except Exception as e:
+            LOG.debug("SSDP callback failed for %s: %s", usn, e)
+
+    def error_received(self, exc) -> None:
+        LOG.debug("SSDP listener error: %s", exc)
+
+    def search(self, target: str = RENDERER_TYPE) -> None:
+        if self._transport is None:
+            return
+        try:
+            self._transport.sendto(search_request(target), (SSDP_GROUP, SSDP_PORT))
+        except OSError as e:
+            LOG.debug("SSDP search send failed: %s", e)
+
+    async def _search_loop(self, interval_s: float) -> None:
+        while self._transport is not None:
+            self.search()
+            await asyncio.sleep(interval_s)
+
+    def close(self) -> None:
+        if self._search_task is not None:
+            self._search_task.cancel()
+            self._search_task = None
+        if self._transport is not None:
+            try:
+                self._transport.close()
+            except Exception:
+                pass
+            self._transport = None
+
+
+def _multicast_socket() -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if hasattr(socket, "SO_REUSEPORT"):
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        except OSError:
+            pass
+    sock.bind(("", SSDP_PORT))
+    mreq = struct.pack("4s4s", socket.inet_aton(SSDP_GROUP), socket.inet_aton("0.0.0.0"))
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 2)
+    sock.setblocking(False)
+    return sock
+
+
+async def start_ssdp_listener(
+    on_alive: AliveCallback,
+    on_byebye: Optional[ByeCallback] = None,
+    search_interval_s: float = SEARCH_INTERVAL_S,
+) -> Optional[SsdpListener]:
+    """Listen for renderers on the running loop; None if the SSDP port can't be joined."""
+    try:
+        sock = _multicast_socket()
+    except OSError as e:
+        LOG.debug("SSDP listener unavailable: %s", e)
+        return None
+    loop = asyncio.get_running_loop()
+    try:
+        _transport, listener = await loop.create_datagram_endpoint(
+            lambda: SsdpListener(on_alive, on_byebye), sock=sock
+        )
+    except OSError as e:
+        LOG.debug("SSDP listener unavailable: %s", e)
+        sock.close()
+        return None
+    if search_interval_s and search_interval_s > 0:
+        listener._search_task = loop.create_task(listener._search_loop(float(search_interval_s)))
+    return listener
+
+
+async def is_reachable(host: str, port: int, timeout: float = 1.5) -> bool:
+    """Whether a TCP connection to host:port opens within `timeout` seconds."""
+    if not host or not port:
+        return False
+    try:
+        _reader, writer = await asyncio.wait_for(asyncio.open_connection(host, int(port)), timeout=timeout)
+    except (OSError, asyncio.TimeoutError, ValueError):
+        return False
+    try:
+        writer.close()
+        await writer.wait_closed()
+    except Exception:
+        pass
+    return True
@@ -13,8 +13,11 @@ from enum import Enum
 from typing import Dict, List, Optional
 import os
 import urllib.parse
+from uuid import UUID
 
 from core import utils
+from core import cast_device_cache
+from core import cast_discovery
 
 try:
     from core.stream_proxy import get_proxy
@@ -151,6 +154,10 @@ except ImportError:
     pychromecast = None
 
 
+# Connecting straight to a known host gives up after this and falls back to discovery.
+DIRECT_CONNECT_TIMEOUT_S = 8.0
+
+
 class ChromecastCaster(BaseCaster):
     """Chromecast protocol implementation."""
     
@@ -160,11 +167,118 @@ class ChromecastCaster(BaseCaster):
         self._cast = None
         self._browser = None
         self._devices: Dict[str, any] = {}
+        # Long-running mDNS browser (start_passive); its table makes scans and connects instant.
+        self._zconf = None
+        self._passive_browser = None
         # StreamProxy starts lazily when needed.
-    
+
+    @staticmethod
+    def _device_from_cast_info(info) -> Optional[CastDevice]:
+        uuid = str(getattr(info, "uuid", "") or "")
+        host = getattr(info, "host", None)
+        if not uuid or not host:
+            return None
+        return CastDevice(
+            name=getattr(info, "friendly_name", None) or f"Chromecast {uuid[:8]}",
+            protocol=CastProtocol.CHROMECAST,
+            identifier=uuid,
+            host=host,
+            port=int(getattr(info, "port", None) or 8009),
+            metadata={
+                "uuid": uuid,
+                "model_name": getattr(info, "model_name", None),
+                "manufacturer": getattr(info, "manufacturer", None) or "Google",
+                "cast_type": getattr(info, "cast_type", None),
+            }
+        )
+
+    def _passive_cast_info(self, identifier: str):
+        browser = self._passive_browser
+        if browser is None:
+            return None
+        try:
+            for key, info in list(browser.devices.items()):
+                if str(key) == str(identifier):
+                    return info
+        except Exception:
+            pass
+        return None
+
+    def start_passive(self, on_seen, on_lost) -> bool:
+        """Keep an mDNS browser running.
+
+        `on_seen(device)` and `on_lost(unique_id)` are called from zeroconf's thread.
+        """
+        if self._passive_browser is not None:
+            return True
+        try:
+            import zeroconf
+            from pychromecast.discovery import CastBrowser, SimpleCastListener
+        except ImportError as e:
+            LOG.debug("Passive Chromecast discovery unavailable: %s", e)
+            return False
+
+        holder = {}
+
+        def _seen(uuid, _service):
+            browser = holder.get("browser")
+            info = browser.devices.get(uuid) if browser is not None else None
+            device = self._device_from_cast_info(info) if info is not None else None
+            if device is not None:
+                on_seen(device)
+
+        def _lost(uuid, _service, _cast_info):
+            on_lost(f"{CastProtocol.CHROMECAST.value}:{uuid}")
+
+        zconf = None
+        try:
+            zconf = zeroconf.Zeroconf()
+            browser = CastBrowser(SimpleCastListener(add_callback=_seen, remove_callback=_lost, update_callback=_seen), zconf)
+            holder["browser"] = browser
+            browser.start_discovery()
+        except Exception as e:
+            LOG.debug("Passive Chromecast discovery failed to start: %s", e)
+            if zconf is not None:
+                try:
+                    zconf.close()
+                except Exception:
+                    pass
+            return False
+        self._zconf = zconf
+        self._passive_browser = browser
+        return True
+
+    def stop_passive(self) -> None:
+        browser, zconf = self._passive_browser, self._zconf
+        self._passive_browser = None
+        self._zconf = None
+        if browser is not None:
+            try:
+                browser.stop_discovery()
+            except Exception:
+                pass
+        if zconf is not None:
+            try:
+                zconf.close()
+            except Exception:
+                pass
+
     async def discover(self, timeout: float = 5.0) -> List[CastDevice]:
         """Discover Chromecast devices."""
         devices = []
+
+        if self._passive_browser is not None:
+            # The running browser already holds the table; give fresh answers a moment.
+            await asyncio.sleep(min(float(timeout), 1.0))
+            try:
+                infos = list(self._passive_browser.devices.values())
+            except Exception:
+                infos = []
+            for info in infos:
+                device = self._device_from_cast_info(info)
+                if device is not None:
+                    devices.append(device)
+            return devices
         
         # Run discovery in thread pool to avoid blocking the event loop
         loop = asyncio.get_event_loop()
@@ -216,6 +330,41 @@ class ChromecastCaster(BaseCaster):
     async def connect(self, device: CastDevice) -> None:
         """Connect to a Chromecast device."""
         loop = asyncio.get_event_loop()
+
+        def do_connect_direct():
+            # Known address (passive browser or device cache): no discovery round.
+            info = self._passive_cast_info(device.identifier)
+            try:
+                if info is not None and self._zconf is not None:
+                    cast = pychromecast.get_chromecast_from_cast_info(info, self._zconf)
+                elif device.host:
+                    try:
+                        uuid = UUID(str(device.identifier))
+                    except ValueError:
+                        uuid = None
+                    cast = pychromecast.get_chromecast_from_host(
+                        (device.host, int(device.port or 8009), uuid, device.metadata.get("model_name"), device.name)
+                    )
+                else:
+                    return None
+            except Exception as e:
+                LOG.debug("Direct Chromecast connect to %s failed: %s", device.host, e)
+                return None
+            try:
+                cast.wait(timeout=DIRECT_CONNECT_TIMEOUT_S)
+                return cast
+            except Exception as e:
+                LOG.debug("Direct Chromecast connect to %s failed: %s", device.host, e)
+                try:
+                    cast.disconnect()
+                except Exception:
+                    pass
+                return None
+
+        cast = await loop.run_in_executor(None, do_connect_direct)
+        if cast is not None:
+            self._cast, self._browser = cast, None
+            return
         
         def do_connect():
             try:
@@ -318,7 +467,8 @@ class ChromecastCaster(BaseCaster):
                     if proxy and needs_proxy:
                         if content_type_actual == 'video/mp2t':
                             proxied_url = proxy.get_transcoded_url(url, headers, device_ip=device_ip)
-                            stream_type = 'LIVE'
+                            # Finite sources remux to an EVENT/VOD playlist the receiver can seek in.
+                            stream_type = proxy.transcoded_stream_type(url)
                             content_type_actual = 'application/x-mpegURL'
                             LOG.info('Remuxing MPEG-TS to HLS via proxy: %s', proxied_url)
                         else:
@@ -525,6 +675,37 @@ except ImportError:
     _HAS_UPNP = False
 
 
+def dlna_device_from_ssdp(usn: str, st: str, location: str) -> CastDevice:
+    """Build a renderer entry from an SSDP search response or NOTIFY."""
+    # Extract host/port from location
+    parsed = urllib.parse.urlparse(location)
+    host = parsed.hostname or ""
+    port = parsed.port or 80
+
+    # Placeholder name from the USN until the device description is fetched
+    name = usn.split("::")[0] if "::" in usn else usn
+    if name.startswith("uuid:"):
+        name = f"DLNA Device {name[5:13]}"
+
+    if "DLNA" in st.upper() or "dlna" in location.lower():
+        protocol = CastProtocol.DLNA
+    else:
+        protocol = CastProtocol.UPNP
+
+    return CastDevice(
+        name=name,
+        protocol=protocol,
+        identifier=usn,
+        host=host,
+        port=port,
+        metadata={
+            "location": location,
+            "st": st,
+            "usn": usn,
+        }
+    )
+
+
 class DLNACaster(BaseCaster):
     """DLNA/UPnP protocol implementation."""
     
@@ -571,36 +752,7 @@ class DLNACaster(BaseCaster):
                     return
                 
                 LOG.info("Found DLNA Renderer: %s", usn)
-                
-                # Extract host/port from location
-                from urllib.parse import urlparse
-                parsed = urlparse(location)
-                host = parsed.hostname or ""
-                port = parsed.port or 80
-                
-                # Get friendly name from cache-control or USN
-                name = usn.split("::")[0] if "::" in usn else usn
-                if name.startswith("uuid:"):
-                    name = f"DLNA Device {name[5:13]}"
-                
-                if "DLNA" in st.upper() or "dlna" in location.lower():
-                    protocol = CastProtocol.DLNA
-                else:
-                    protocol = CastProtocol.UPNP
-                
-                device = CastDevice(
-                    name=name,
-                    protocol=protocol,
-                    identifier=usn,
-                    host=host,
-                    port=port,
-                    metadata={
-                        "location": location,
-                        "st": st,
-                        "usn": usn,
-                    }
-                )
-                devices.append(device)
+                devices.append(dlna_device_from_ssdp(usn, st, location))
                 
             except Exception as e:
                 LOG.debug("Failed to process DLNA device: %s", e)
@@ -990,16 +1142,59 @@ def _detect_mime_type(url: str, default: str = "video/mp2t") -> str:
 # Unified Casting Manager
 # ============================================================================
 
+def _device_to_row(device: CastDevice) -> dict:
+    return {
+        "protocol": device.protocol.value,
+        "identifier": device.identifier,
+        "name": device.name,
+        "host": device.host,
+        "port": device.port,
+        "metadata": device.metadata,
+    }
+
+
+def _device_from_row(row: dict) -> Optional[CastDevice]:
+    try:
+        protocol = CastProtocol(row.get("protocol"))
+    except ValueError:
+        return None
+    return CastDevice(
+        name=row.get("name") or row.get("identifier") or "",
+        protocol=protocol,
+        identifier=str(row.get("identifier") or ""),
+        host=row.get("host") or "",
+        port=int(row.get("port") or 0),
+        metadata=dict(row.get("metadata") or {}),
+    )
+
+
 class CastingManager:
-    """Manages multiple casting protocols and active sessions on a background loop."""
+    """Manages multiple casting protocols and active sessions on a background loop.
+
+    Besides on-demand scans it keeps a device table: last-known devices from
+    core.cast_device_cache, kept current by passive mDNS (Chromecast) and SSDP
+    (DLNA/UPnP) listeners running on the manager's loop. `known_devices()`
+    answers from that table without touching the network.
+    """
+
+    # Devices loaded from the cache start "cached" until seen again or probed.
+    DEVICE_CACHED = "cached"
+    DEVICE_LIVE = "live"
     
-    def __init__(self):
+    def __init__(self, passive_discovery: bool = True, persist_devices: bool = True):
         self.casters: Dict[CastProtocol, BaseCaster] = {}
         self.active_caster: Optional[BaseCaster] = None
         self.active_device: Optional[CastDevice] = None
         self._loop = None
         self._thread = None
         self._running = False
+        self._passive_discovery = bool(passive_discovery)
+        self._persist_devices = bool(persist_devices)
+        self._devices: Dict[str, CastDevice] = {}
+        self._device_state: Dict[str, str] = {}
+        self._devices_lock = threading.Lock()
+        self._device_listeners: List = []
+        self._ssdp = None
         
         # Initialize available casters
         if _HAS_CHROMECAST:
@@ -1018,6 +1213,8 @@ class CastingManager:
         self._loop = asyncio.new_event_loop()
         self._thread = threading.Thread(target=self._run_loop, daemon=True, name="CastingManagerLoop")
         self._thread.start()
+        # Fire and forget: the cast picker must not wait for listeners to come up.
+        asyncio.run_coroutine_threadsafe(self._start_background_discovery(), self._loop)
 
     def _run_loop(self):
         asyncio.set_event_loop(self._loop)
@@ -1031,6 +1228,7 @@ class CastingManager:
         if not self._running:
             return
         self._running = False
+        self._stop_passive_discovery()
         if self._loop:
             self._loop.call_soon_threadsafe(self._loop.stop)
         if self._thread:
@@ -1043,6 +1241,160 @@ class CastingManager:
         future = asyncio.run_coroutine_threadsafe(coro, self._loop)
         return future.result()
 
+    # ------------------------------------------------------------------
+    # Device table
+    # ------------------------------------------------------------------
+
+    def add_device_listener(self, callback) -> None:
+        """Call `callback()` (from a background thread) whenever the device table changes."""
+        with self._devices_lock:
+            if callback not in self._device_listeners:
+                self._device_listeners.append(callback)
+
+    def remove_device_listener(self, callback) -> None:
+        with self._devices_lock:
+            try:
+                self._device_listeners.remove(callback)
+            except ValueError:
+                pass
+
+    def _notify_device_listeners(self) -> None:
+        with self._devices_lock:
+            listeners = list(self._device_listeners)
+        for cb in listeners:
+            try:
+                cb()
+            except Exception as e:
+                LOG.debug("Cast device listener failed: %s", e)
+
+    def known_devices(self, live_only: bool = False) -> List[CastDevice]:
+        """Devices from the table (live ones and, unless `live_only`, last-known ones)."""
+        with self._devices_lock:
+            devices = [
+                d for uid, d in self._devices.items()
+                if not live_only or self._device_state.get(uid) == self.DEVICE_LIVE
+            ]
+        return sorted(devices, key=lambda d: d.name)
+
+    def _update_devices(self, devices, live: bool = True, persist: bool = True) -> List[CastDevice]:
+        """Merge devices into the table; returns the ones that were new or changed."""
+        changed = []
+        with self._devices_lock:
+            for device in devices or []:
+                uid = device.unique_id
+                old = self._devices.get(uid)
+                state = self.DEVICE_LIVE if live else self._device_state.get(uid, self.DEVICE_CACHED)
+                if old is not None and not live:
+                    continue
+                if old is not None:
+                    # Keep a friendly name fetched earlier over a placeholder from a bare announcement.
+                    if device.name.startswith("DLNA Device ") and not old.name.startswith("DLNA Device "):
+                        device.name = old.name
+                    for key, value in old.metadata.items():
+                        device.metadata.setdefault(key, value)
+                if (
+                    old is None
+                    or (old.name, old.host, old.port) != (device.name, device.host, device.port)
+                    or self._device_state.get(uid) != state
+                ):
+                    changed.append(device)
+                self._devices[uid] = device
+                self._device_state[uid] = state
+        if changed and live and persist and self._persist_devices:
+            self._persist(changed)
+        if changed:
+            self._notify_device_listeners()
+        return changed
+
+    def _drop_device(self, unique_id: str) -> None:
+        with self._devices_lock:
+            removed = self._devices.pop(unique_id, None)
+            self._device_state.pop(unique_id, None)
+        if removed is not None:
+            self._notify_device_listeners()
+
+    def _persist(self, devices, connected: bool = False) -> None:
+        rows = [_device_to_row(d) for d in devices]
+        if self._loop is not None and self._running:
+            self._loop.call_soon_threadsafe(
+                lambda: self._loop.run_in_executor(None, lambda: cast_device_cache.remember(rows, connected=connected))
+            )
+        else:
+            cast_device_cache.remember(rows, connected=connected)
+
+    def _load_cached_devices(self) -> None:
+        if not self._persist_devices:
+            return
+        devices = [d for d in (_device_from_row(r) for r in cast_device_cache.load()) if d is not None]
+        self._update_devices(devices, live=False, persist=False)
+
+    def revalidate_known_devices(self, timeout: float = 1.5) -> List[CastDevice]:
+        """Probe last-known devices not seen live yet; unreachable ones leave the table."""
+        return self.dispatch(self._revalidate_async(timeout))
+
+    async def _revalidate_async(self, timeout: float) -> List[CastDevice]:
+        with self._devices_lock:
+            pending = [d for uid, d in self._devices.items() if self._device_state.get(uid) != self.DEVICE_LIVE]
+        if pending:
+            results = await asyncio.gather(
+                *[cast_discovery.is_reachable(d.host, d.port, timeout) for d in pending],
+                return_exceptions=True
+            )
+            for device, ok in zip(pending, results):
+                if ok is True:
+                    self._update_devices([device], live=True)
+                else:
+                    self._drop_device(device.unique_id)
+        return self.known_devices()
+
+    # ------------------------------------------------------------------
+    # Passive discovery
+    # ------------------------------------------------------------------
+
+    async def _start_background_discovery(self) -> None:
+        loop = asyncio.get_event_loop()
+        try:
+            await loop.run_in_executor(None, self._load_cached_devices)
+        except Exception as e:
+            LOG.debug("Loading cached cast devices failed: %s", e)
+        if not self._passive_discovery:
+            return
+
+        chromecast = self.casters.get(CastProtocol.CHROMECAST)
+        if isinstance(chromecast, ChromecastCaster):
+            await loop.run_in_executor(
+                None, chromecast.start_passive, lambda d: self._update_devices([d]), self._drop_device
+            )
+
+        dlna = self.casters.get(CastProtocol.DLNA)
+
+        def _on_alive(usn, st, location, _headers):
+            device = dlna_device_from_ssdp(usn, st, location)
+            with self._devices_lock:
+                known = device.unique_id in self._devices
+            if isinstance(dlna, DLNACaster) and not known:
+                loop.create_task(self._add_dlna_device(dlna, device))
+            else:
+                self._update_devices([device])
+
+        def _on_byebye(usn):
+            for protocol in (CastProtocol.DLNA, CastProtocol.UPNP):
+                self._drop_device(f"{protocol.value}:{usn}")
+
+        self._ssdp = await cast_discovery.start_ssdp_listener(_on_alive, _on_byebye)
+
+    async def _add_dlna_device(self, caster, device: CastDevice) -> None:
+        await caster._fetch_device_names([device])
+        self._update_devices([device])
+
+    def _stop_passive_discovery(self) -> None:
+        chromecast = self.casters.get(CastProtocol.CHROMECAST)
+        if isinstance(chromecast, ChromecastCaster):
+            chromecast.stop_passive()
+        ssdp, self._ssdp = self._ssdp, None
+        if ssdp is not None and self._loop is not None:
+            self._loop.call_soon_threadsafe(ssdp.close)
+
     def discover_all(self, timeout: float = 5.0) -> List[CastDevice]:
         """Discover devices across all supported protocols."""
         return self.dispatch(self._discover_all_async(timeout))
@@ -1058,8 +1410,10 @@ class CastingManager:
         for res in results:
             if isinstance(res, list):
                 all_devices.extend(res)
-        
-        return sorted(all_devices, key=lambda d: d.name)
+        self._update_devices(all_devices)
+
+        # Include renderers the passive listeners saw that missed this scan's window.
+        return self.known_devices(live_only=True)
 
     def connect(self, device: CastDevice, credentials: Optional[str] = None) -> None:
         """Connect to a selected device."""
@@ -1085,6 +1439,9 @@ class CastingManager:
             
         self.active_caster = caster
         self.active_device = device
+        self._update_devices([device], persist=False)
+        if self._persist_devices:
+            self._persist([device], connected=True)
 
     def start_pairing(self, device: CastDevice) -> object:
         """Start pairing if supported by the protocol."""
@@ -0,0 +1,69 @@
+"""In-process feed of article changes written by the persistence layer.
+
+Refresh and retention code publish `ArticleChange` records after their rows are
+committed; the main window subscribes and applies just those deltas to its open
+and cached views instead of re-querying pages. Callbacks run synchronously on
+the publishing thread, so subscribers must hand work off to their own thread.
+"""
+
+import itertools
+import logging
+import threading
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+log = logging.getLogger(__name__)
+
+ADDED = "added"
+UPDATED = "updated"
+DELETED = "deleted"
+
+
+class ArticleChange(NamedTuple):
+    article_id: str
+    feed_id: Optional[str]
+    kind: str
+
+
+_lock = threading.Lock()
+_subscribers: Dict[int, Callable[[List[ArticleChange]], None]] = {}
+_tokens = itertools.count(1)
+
+
+def subscribe(callback: Callable[[List[ArticleChange]], None]) -> int:
+    """Register `callback(changes)`; returns a token for `unsubscribe`."""
+    with _lock:
+        token = next(_tokens)
+        _subscribers[token] = callback
+    return token
+
+
+def unsubscribe(token: int) -> None:
+    with _lock:
+        _subscribers.pop(token, None)
+
+
+def has_subscribers() -> bool:
+    with _lock:
+        return bool(_subscribers)
+
+
+def publish(changes: Iterable[ArticleChange]) -> None:
+    with _lock:
+        callbacks = list(_subscribers.values())
+    if not callbacks:
+        return
+    batch = [c for c in (changes or []) if c and c.article_id]
+    if not batch:
+        return
+    for cb in callbacks:
+        try:
+            cb(list(batch))
+        except Exception:
+            log.exception("Article change subscriber failed")
+
+
+def publish_ids(kind: str, feed_id: Optional[str], article_ids: Iterable) -> None:
+    """Convenience wrapper for a batch of ids of one feed and one change kind."""
+    if not has_subscribers():
+        return
+    publish(ArticleChange(str(aid), feed_id, kind) for aid in (article_ids or []) if aid)
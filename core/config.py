@@ -30,6 +30,12 @@ DEFAULT_CONFIG = {
     "feed_timeout_seconds": 15,
     "feed_retry_attempts": 1,
     "playback_resolve_timeout_s": 4.0,
+    # Reuse yt-dlp/Rumble stream resolutions until the signed URL expires (or this TTL).
+    "media_resolve_cache_enabled": True,
+    "media_resolve_cache_ttl_s": 10800,
+    # Resolve (and warm the first bytes of) the focused playable article and the next one.
+    "media_prefetch_enabled": True,
+    "media_prefetch_warm_kb": 512,
     "active_provider": "local",
     "debug_mode": False,
     "refresh_on_startup": True,
@@ -59,6 +65,8 @@ DEFAULT_CONFIG = {
     "minimize_to_tray": True,
     "start_maximized": False,
     "max_cached_views": 15,
+    # Memory budget for cached article lists; older views beyond it are kept as id-only stubs.
+    "view_cache_max_mb": 96,
     "cache_full_text": False,
     "playback_speed": 1.0,
     "volume": 100,
@@ -92,6 +100,8 @@ DEFAULT_CONFIG = {
     "persistent_searches": [],
     "show_search_field": True,
     "search_mode": "title_content",
+    # Upper bound on matches pulled from the full-text index for partially loaded views.
+    "search_index_max_results": 500,
     # Translation (future/experimental feature wiring)
     "translation_enabled": False,
     "translation_provider": "grok",
@@ -108,8 +118,18 @@ DEFAULT_CONFIG = {
     "translation_gemini_api_key": "",
     "translation_qwen_model": "",
     "translation_qwen_api_key": "",
+    # Translated chunks are cached in rss.db so reopening an article doesn't re-bill the API.
+    "translation_cache_enabled": True,
+    # Show translated parts of long articles as soon as each one is ready.
+    "translation_streaming": True,
     "article_sort_by": "date",
     "article_sort_ascending": False,
+    # Mirror hosted accounts (Miniflux, Inoreader, BazQux, TheOldReader) into a local
+    # SQLite file and serve views from it, syncing only new entries in the background.
+    # Off by default: background syncs spend requests from quota-limited accounts.
+    "hosted_article_mirror": False,
+    # Render the feed tree and last view from the previous session at launch, then reconcile.
+    "startup_snapshot_enabled": True,
     "providers": {
         "local": {
             "feeds": []  # List of feed URLs/data
@@ -135,6 +155,10 @@ DEFAULT_CONFIG = {
             "article_cache_ttl_seconds": 90,
             # stream/contents page size; larger values reduce request count at the expense of payload size.
             "article_request_page_size": 100,
+            # Keep fetched stream pages in rss.db (keyed by stream + continuation) so paging back and
+            # reopening views after a restart costs no requests; first pages are topped up with `ot`.
+            "persistent_page_cache": True,
+            "page_cache_ttl_seconds": 21600,
             # Inoreader redirect URIs are typically required to be HTTPS. For localhost callbacks we
             # use an HTTPS URL and complete authorization by pasting the redirected URL back into
             # BlindRSS (no local TLS server needed).
@@ -1,7 +1,12 @@
 import sqlite3
 import os
 import logging
+import threading
+import time
 import uuid
+from contextlib import contextmanager
+from typing import Optional
+from core import change_feed, search_index
 from core.config import APP_DIR
 
 log = logging.getLogger(__name__)
@@ -184,10 +189,69 @@ def _migrate_legacy_chapters_foreign_key(conn: sqlite3.Connection) -> None:
         log.exception("Failed to migrate legacy chapters FK from old_articles; leaving schema unchanged")
 
 
-def init_db():
-    conn = sqlite3.connect(DB_FILE, timeout=30, check_same_thread=False)
+# SQL function used to keep articles.published_ts in sync with the TEXT date column.
+DATE_TS_FUNCTION = "blindrss_date_ts"
+
+
+def register_functions(conn: sqlite3.Connection) -> None:
+    """Register the app's SQL functions; needed on every connection that writes articles."""
+    # core.utils imports this module, so resolve it lazily.
+    from core.utils import date_to_timestamp
+
+    search_index.register_functions(conn)
+    try:
+        conn.create_function(DATE_TS_FUNCTION, 1, date_to_timestamp, deterministic=True)
+    except (TypeError, sqlite3.NotSupportedError):
+        conn.create_function(DATE_TS_FUNCTION, 1, date_to_timestamp)
+
+
+def _ensure_published_ts(c) -> None:
+    """Add/backfill articles.published_ts and the triggers that maintain it."""
+    try:
+        c.execute("ALTER TABLE articles ADD COLUMN published_ts INTEGER")
+    except sqlite3.OperationalError:
+        pass
+
+    c.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS articles_published_ts_ai AFTER INSERT ON articles
+        WHEN new.published_ts IS NULL BEGIN
+            UPDATE articles SET published_ts = {DATE_TS_FUNCTION}(new.date) WHERE rowid = new.rowid;
+        END
+        """
+    )
+    c.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS articles_published_ts_au AFTER UPDATE OF date ON articles BEGIN
+            UPDATE articles SET published_ts = {DATE_TS_FUNCTION}(new.date) WHERE rowid = new.rowid;
+        END
+        """
+    )
+    c.execute(f"UPDATE articles SET published_ts = {DATE_TS_FUNCTION}(date) WHERE published_ts IS NULL")
+    if c.rowcount and c.rowcount > 0:
+        log.info(f"Backfilled published_ts for {c.rowcount} articles")
+
+    c.execute("CREATE INDEX IF NOT EXISTS idx_articles_published_ts_id ON articles (published_ts, id)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_articles_feed_id_published_ts_id ON articles (feed_id, published_ts, id)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_articles_is_read_feed_id_published_ts ON articles (is_read, feed_id, published_ts)")
+    # Superseded by the published_ts indexes above.
+    c.execute("DROP INDEX IF EXISTS idx_articles_date_id")
+    c.execute("DROP INDEX IF EXISTS idx_articles_feed_id_date_id")
+
+
+def init_db(path: Optional[str] = None):
+    """Create or migrate the schema in DB_FILE (or another database file, e.g. a provider mirror)."""
+    conn = sqlite3.connect(path or DB_FILE, timeout=30, check_same_thread=False)
+    register_functions(conn)
     try:
         c = conn.cursor()
+        # Let retention cleanup hand freed pages back to the OS in small steps. This only
+        # takes effect on a brand-new file; existing ones are converted by convert_to_incremental_vacuum().
+        try:
+            if not _table_exists(c, "articles"):
+                c.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        except sqlite3.Error as e:
+            log.warning(f"Failed to enable incremental auto_vacuum: {e}")
         # Improve concurrent writer/readers when refresh runs in multiple threads
         try:
             c.execute("PRAGMA journal_mode=WAL")
@@ -219,6 +283,7 @@ def init_db():
             media_url TEXT,
             media_type TEXT,
             chapter_url TEXT,
+            published_ts INTEGER,
             FOREIGN KEY(feed_id) REFERENCES feeds(id)
         )''')
         
@@ -227,8 +292,6 @@ def init_db():
         c.execute("CREATE INDEX IF NOT EXISTS idx_articles_date ON articles (date)")
         # Composite indexes to speed up common paging/count queries on larger databases.
         c.execute("CREATE INDEX IF NOT EXISTS idx_articles_is_read_feed_id ON articles (is_read, feed_id)")
-        c.execute("CREATE INDEX IF NOT EXISTS idx_articles_date_id ON articles (date, id)")
-        c.execute("CREATE INDEX IF NOT EXISTS idx_articles_feed_id_date_id ON articles (feed_id, date, id)")
 
         c.execute('''CREATE TABLE IF NOT EXISTS chapters (
             id TEXT PRIMARY KEY,
@@ -259,6 +322,69 @@ def init_db():
         )'''
         )
         c.execute("CREATE INDEX IF NOT EXISTS idx_playback_state_updated_at ON playback_state (updated_at)")
+
+        # Best-effort caches (core.translation_cache, stream_page_cache, media_resolve_cache,
+        # cast_device_cache); they read and write through cache_connection().
+        c.execute(
+            '''CREATE TABLE IF NOT EXISTS translation_cache (
+            key TEXT PRIMARY KEY,
+            provider TEXT,
+            model TEXT,
+            target_language TEXT,
+            translated TEXT NOT NULL,
+            size INTEGER NOT NULL DEFAULT 0,
+            created_at INTEGER NOT NULL,
+            last_used_at INTEGER NOT NULL
+        )'''
+        )
+        c.execute("CREATE INDEX IF NOT EXISTS idx_translation_cache_last_used_at ON translation_cache (last_used_at)")
+        c.execute(
+            '''CREATE TABLE IF NOT EXISTS stream_pages (
+            account TEXT NOT NULL,
+            stream_key TEXT NOT NULL,
+            continuation TEXT NOT NULL,
+            next_continuation TEXT,
+            items TEXT NOT NULL,
+            fetched_at INTEGER NOT NULL,
+            PRIMARY KEY (account, stream_key, continuation)
+        )'''
+        )
+        c.execute("CREATE INDEX IF NOT EXISTS idx_stream_pages_fetched_at ON stream_pages (fetched_at)")
+        c.execute(
+            '''CREATE TABLE IF NOT EXISTS stream_item_flags (
+            account TEXT NOT NULL,
+            item_id TEXT NOT NULL,
+            is_read INTEGER,
+            is_starred INTEGER,
+            updated_at INTEGER NOT NULL,
+            PRIMARY KEY (account, item_id)
+        )'''
+        )
+        c.execute(
+            '''CREATE TABLE IF NOT EXISTS resolved_media (
+            page_url TEXT PRIMARY KEY,
+            media_url TEXT NOT NULL,
+            headers TEXT,
+            title TEXT,
+            formats TEXT,
+            resolved_at INTEGER NOT NULL,
+            expires_at INTEGER NOT NULL
+        )'''
+        )
+        c.execute("CREATE INDEX IF NOT EXISTS idx_resolved_media_expires_at ON resolved_media (expires_at)")
+        c.execute(
+            '''CREATE TABLE IF NOT EXISTS cast_devices (
+            unique_id TEXT PRIMARY KEY,
+            protocol TEXT NOT NULL,
+            identifier TEXT NOT NULL,
+            name TEXT,
+            host TEXT,
+            port INTEGER,
+            metadata TEXT,
+            last_seen INTEGER NOT NULL,
+            last_connected INTEGER
+        )'''
+        )
         
         # Migration: Add columns if they don't exist
         try:
@@ -295,6 +421,12 @@ def init_db():
             c.execute("CREATE INDEX IF NOT EXISTS idx_articles_is_favorite ON articles (is_favorite)")
         except sqlite3.OperationalError:
             pass
+
+        # Integer publish time (epoch seconds) for SQL ordering and retention.
+        try:
+            _ensure_published_ts(c)
+        except sqlite3.Error as e:
+            log.warning(f"Failed to migrate published_ts: {e}")
             
         try:
             c.execute("ALTER TABLE feeds ADD COLUMN etag TEXT")
@@ -324,67 +456,198 @@ def init_db():
             )
             # Ensure Uncategorized exists
             c.execute("INSERT OR IGNORE INTO categories (id, title) VALUES (?, ?)", ("uncategorized", "Uncategorized"))
+
+        # Full-text search index (FTS5) over articles; built once, then kept in sync by triggers.
+        try:
+            search_index.ensure_schema(conn)
+        except sqlite3.Error as e:
+            log.warning(f"Failed to set up article search index: {e}")
         
         conn.commit()
     finally:
         conn.close()
 
 
-def cleanup_old_articles(days: int, keep_favorites: bool = True):
+RETENTION_BATCH_SIZE = 500
+RETENTION_PAUSE_SECONDS = 0.02
+VACUUM_STEP_PAGES = 256
+# Existing (non-incremental) databases are VACUUMed once at startup to switch modes, but
+# only when at least this share of the file is free pages, so the one-time cost buys real
+# space, and only up to a size that rewrites in a few seconds.
+AUTO_VACUUM_CONVERT_FREE_RATIO = 0.25
+AUTO_VACUUM_CONVERT_MAX_BYTES = 256 * 1024 * 1024
+_AUTO_VACUUM_INCREMENTAL = 2
+
+
+def cleanup_old_articles(
+    days: int,
+    keep_favorites: bool = True,
+    batch_size: int = RETENTION_BATCH_SIZE,
+    progress_cb=None,
+    should_stop=None,
+    pause_seconds: float = RETENTION_PAUSE_SECONDS,
+) -> int:
     """
     Delete articles older than 'days' days.
-    
+
+    Deletes in bounded batches (oldest first, via the published_ts index), each in its
+    own short transaction, pausing between batches so refresh writers and UI reads are
+    not starved. Returns the number of deleted articles.
+
     Args:
         days: Number of days to retain.
         keep_favorites: If True, do not delete favorited articles.
+        batch_size: Max articles deleted per transaction.
+        progress_cb: Optional callable(deleted_so_far, total_to_delete).
+        should_stop: Optional callable; when it returns True the job stops after the current batch.
+        pause_seconds: Sleep between batches.
     """
     if days is None or days < 0:
-        return
-        
+        return 0
+
+    # published_ts is UTC epoch seconds (0 for unknown dates, which have always been purged).
+    cutoff_ts = int(time.time()) - int(days) * 86400
+    where_str = "published_ts < ?"
+    if keep_favorites:
+        where_str += " AND is_favorite = 0"
+    batch_size = max(1, int(batch_size))
+
+    deleted = 0
     conn = get_connection()
     try:
-        # Calculate cutoff date
-        # SQLite's 'now' is UTC. verify if we need 'localtime' or if normalization uses UTC.
-        # core.utils.normalize_date produces 'YYYY-MM-DD HH:MM:SS' (usually UTC or naive).
-        # We'll use SQLite's date modifier.
-        cutoff_date_query = f"date('now', '-{days} days')"
-        
-        query = "DELETE FROM articles WHERE date < date('now', '-? days')"
-        # Parameter substitution for days in modifiers is tricky in sqlite, constructing string is safer for modifier
-        # provided 'days' is int.
-        
-        params = []
-        where_clauses = [f"date < date('now', '-{int(days)} days')"]
-        
-        if keep_favorites:
-            where_clauses.append("is_favorite = 0")
-            
-        where_str = " AND ".join(where_clauses)
-        
-        # 1. Delete chapters for these articles first (no CASCADE support guaranteed)
-        # We can use subquery: DELETE FROM chapters WHERE article_id IN (SELECT id FROM articles WHERE ...)
-        
-        subquery = f"SELECT id FROM articles WHERE {where_str}"
-        
         c = conn.cursor()
-        c.execute(f"DELETE FROM chapters WHERE article_id IN ({subquery})")
-        c.execute(f"DELETE FROM articles WHERE {where_str}")
-        
-        deleted = c.rowcount
-        conn.commit()
+        c.execute(f"SELECT COUNT(*) FROM articles WHERE {where_str}", (cutoff_ts,))
+        total = int(c.fetchone()[0] or 0)
+        if total <= 0:
+            return 0
+
+        while True:
+            if should_stop is not None and should_stop():
+                break
+            c.execute(
+                f"SELECT rowid, id, feed_id FROM articles WHERE {where_str} ORDER BY published_ts LIMIT ?",
+                (cutoff_ts, batch_size),
+            )
+            rows = c.fetchall()
+            if not rows:
+                break
+            placeholders = ",".join("?" for _ in rows)
+            # Delete chapters first (no CASCADE support guaranteed).
+            c.execute(f"DELETE FROM chapters WHERE article_id IN ({placeholders})", [r[1] for r in rows])
+            c.execute(f"DELETE FROM articles WHERE rowid IN ({placeholders})", [r[0] for r in rows])
+            conn.commit()
+            deleted += len(rows)
+            change_feed.publish(change_feed.ArticleChange(r[1], r[2], change_feed.DELETED) for r in rows)
+            if progress_cb is not None:
+                try:
+                    progress_cb(deleted, max(total, deleted))
+                except Exception:
+                    log.debug("Retention progress callback failed", exc_info=True)
+            if len(rows) < batch_size:
+                break
+            if pause_seconds and pause_seconds > 0:
+                time.sleep(pause_seconds)
+
         if deleted > 0:
             log.info(f"Cleaned up {deleted} old articles (retention: {days} days)")
-            # VACUUM is heavy, maybe just auto_vacuum handles it or do it rarely.
-            # c.execute("VACUUM") 
-            
     except Exception as e:
+        try:
+            conn.rollback()
+        except Exception:
+            pass
         log.error(f"Error cleaning up old articles: {e}")
     finally:
         conn.close()
+    return deleted
+
+
+def reclaim_free_pages(
+    max_pages: Optional[int] = None,
+    step_pages: int = VACUUM_STEP_PAGES,
+    should_stop=None,
+    pause_seconds: float = RETENTION_PAUSE_SECONDS,
+) -> int:
+    """Return free pages to the OS in small incremental_vacuum steps (call when idle).
+
+    Does nothing on databases created before incremental auto_vacuum; those are
+    converted by convert_to_incremental_vacuum() at startup.
+
+    Returns the number of pages released.
+    """
+    released = 0
+    conn = get_connection()
+    try:
+        c = conn.cursor()
+        mode = int(c.execute("PRAGMA auto_vacuum").fetchone()[0] or 0)
+        free = int(c.execute("PRAGMA freelist_count").fetchone()[0] or 0)
+        if free <= 0 or mode != _AUTO_VACUUM_INCREMENTAL:
+            return 0
+
+        step_pages = max(1, int(step_pages))
+        while free > 0:
+            if should_stop is not None and should_stop():
+                break
+            if max_pages is not None and released >= int(max_pages):
+                break
+            n = min(step_pages, free)
+            if max_pages is not None:
+                n = min(n, int(max_pages) - released)
+            c.execute(f"PRAGMA incremental_vacuum({int(n)})")
+            c.fetchall()
+            conn.commit()
+            released += n
+            free = int(c.execute("PRAGMA freelist_count").fetchone()[0] or 0)
+            if free > 0 and pause_seconds and pause_seconds > 0:
+                time.sleep(pause_seconds)
+        if released:
+            log.debug(f"Released {released} free database pages")
+    except sqlite3.Error as e:
+        log.warning(f"Free page reclamation failed: {e}")
+    finally:
+        conn.close()
+    return released
+
+
+def convert_to_incremental_vacuum(max_file_bytes: int = AUTO_VACUUM_CONVERT_MAX_BYTES) -> bool:
+    """Switch a pre-incremental database to incremental auto_vacuum with one full VACUUM.
+
+    Meant for startup, before anything else holds the database. Only runs when at least
+    AUTO_VACUUM_CONVERT_FREE_RATIO of the file is free and the file is no larger than
+    `max_file_bytes`. VACUUM may renumber article rowids, so the full-text index is
+    rebuilt afterwards. Returns True if the database was converted.
+    """
+    conn = get_connection()
+    try:
+        c = conn.cursor()
+        if int(c.execute("PRAGMA auto_vacuum").fetchone()[0] or 0) == _AUTO_VACUUM_INCREMENTAL:
+            return False
+        free = int(c.execute("PRAGMA freelist_count").fetchone()[0] or 0)
+        pages = int(c.execute("PRAGMA page_count").fetchone()[0] or 0)
+        page_size = int(c.execute("PRAGMA page_size").fetchone()[0] or 0)
+        if pages <= 0 or (free / float(pages)) < AUTO_VACUUM_CONVERT_FREE_RATIO:
+            return False
+        if pages * page_size > int(max_file_bytes):
+            return False
+        log.info(f"Converting database to incremental auto_vacuum ({free} of {pages} pages free)")
+        c.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        c.execute("VACUUM")
+        try:
+            if search_index.index_exists(conn):
+                search_index.rebuild(conn)
+                conn.commit()
+        except sqlite3.Error as e:
+            log.warning(f"Failed to rebuild search index after VACUUM: {e}")
+        return True
+    except sqlite3.Error as e:
+        log.warning(f"Incremental auto_vacuum conversion failed: {e}")
+        return False
+    finally:
+        conn.close()
 
 
-def get_connection():
-    conn = sqlite3.connect(DB_FILE, timeout=30, check_same_thread=False)
+def _configure_connection(conn: sqlite3.Connection) -> None:
+    # Needed by the article search index triggers on every connection that writes articles.
+    register_functions(conn)
     try:
         conn.execute("PRAGMA busy_timeout=60000")
         conn.execute("PRAGMA journal_mode=WAL")
@@ -392,9 +655,188 @@ def get_connection():
         conn.execute("PRAGMA foreign_keys=ON")
     except Exception as e:
         log.warning(f"Failed to set PRAGMAs on connection: {e}")
+
+
+def get_connection(path: Optional[str] = None):
+    conn = sqlite3.connect(path or DB_FILE, timeout=30, check_same_thread=False, cached_statements=CACHED_STATEMENTS)
+    _configure_connection(conn)
     return conn
 
 
+# --- Pooled connections ---
+#
+# get_connection() opens (and PRAGMA-configures) a fresh connection per call, which
+# dominates small, frequent queries. connection() hands out long-lived ones instead:
+# one reader per thread, plus a single writer shared by all threads behind a lock.
+# PRAGMAs run once per connection and the statement cache persists across uses.
+
+CACHED_STATEMENTS = 512
+_DEFAULT_BUSY_TIMEOUT_MS = 60000
+
+_pool_lock = threading.Lock()
+# Readers live in thread-local storage, so they are freed with their thread. close_pool()
+# bumps the generation; other threads then drop their stale readers on next use.
+_thread_readers = threading.local()
+_pool_generation = 0
+_writers = {}  # db path -> (connection, RLock)
+
+_stats_lock = threading.Lock()
+_stats = {}
+
+
+def _open_pooled(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False, cached_statements=CACHED_STATEMENTS)
+    _configure_connection(conn)
+    return conn
+
+
+def _close_quietly(conn: sqlite3.Connection) -> None:
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+def _reader_for_thread(path: str) -> sqlite3.Connection:
+    readers = getattr(_thread_readers, "by_path", None)
+    if readers is None or getattr(_thread_readers, "generation", None) != _pool_generation:
+        for old in (readers or {}).values():
+            _close_quietly(old)
+        readers = {}
+        _thread_readers.by_path = readers
+        _thread_readers.generation = _pool_generation
+    conn = readers.get(path)
+    if conn is None:
+        conn = _open_pooled(path)
+        readers[path] = conn
+    return conn
+
+
+def _writer(path: str):
+    with _pool_lock:
+        entry = _writers.get(path)
+    if entry is None:
+        conn = _open_pooled(path)
+        with _pool_lock:
+            entry = _writers.get(path)
+            if entry is None:
+                entry = (conn, threading.RLock())
+                _writers[path] = entry
+                conn = None
+        if conn is not None:
+            # Another thread won the race; discard ours.
+            _close_quietly(conn)
+    return entry
+
+
+def _record_query_time(kind: str, elapsed: float) -> None:
+    with _stats_lock:
+        st = _stats.get(kind)
+        if st is None:
+            st = {"count": 0, "total_s": 0.0, "max_s": 0.0}
+            _stats[kind] = st
+        st["count"] += 1
+        st["total_s"] += elapsed
+        if elapsed > st["max_s"]:
+            st["max_s"] = elapsed
+
+
+def query_stats() -> dict:
+    """Timing counters for pooled connection use, keyed by "read"/"write"."""
+    with _stats_lock:
+        return {k: dict(v) for k, v in _stats.items()}
+
+
+def reset_query_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
+
+
+@contextmanager
+def connection(write: bool = False, lock_timeout: Optional[float] = None, busy_timeout_ms: Optional[int] = None):
+    """Borrow a pooled connection; do not close it.
+
+    Readers are per-thread. Writers share one connection serialized by a lock, and
+    the block is committed on success or rolled back on error. If lock_timeout
+    elapses first, sqlite3.OperationalError("database is locked") is raised, like
+    a busy SQLite write would. busy_timeout_ms temporarily overrides the connection's
+    busy timeout (the GUI thread uses a short one so it never stalls on refresh writes).
+    """
+    path = DB_FILE
+    kind = "write" if write else "read"
+    lock = None
+    if write:
+        conn, lock = _writer(path)
+        if lock_timeout is None:
+            acquired = lock.acquire()
+        else:
+            acquired = lock.acquire(timeout=max(0.0, float(lock_timeout)))
+        if not acquired:
+            raise sqlite3.OperationalError("database is locked")
+    else:
+        conn = _reader_for_thread(path)
+
+    started = time.perf_counter()
+    try:
+        if busy_timeout_ms is not None:
+            conn.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+        try:
+            yield conn
+            if conn.in_transaction:
+                conn.commit()
+        except BaseException:
+            if conn.in_transaction:
+                try:
+                    conn.rollback()
+                except sqlite3.Error:
+                    pass
+            raise
+        finally:
+            if busy_timeout_ms is not None:
+                try:
+                    conn.execute(f"PRAGMA busy_timeout={_DEFAULT_BUSY_TIMEOUT_MS}")
+                except sqlite3.Error:
+                    pass
+    finally:
+        _record_query_time(kind, time.perf_counter() - started)
+        if lock is not None:
+            lock.release()
+
+
+# Cache tables never make a caller wait on a busy writer; a miss or a dropped write only
+# costs a refetch.
+CACHE_BUSY_TIMEOUT_MS = 500
+
+
+def cache_connection(write: bool = False):
+    """connection() for the best-effort cache tables: writes give up after CACHE_BUSY_TIMEOUT_MS."""
+    if not write:
+        return connection()
+    timeout_ms = int(CACHE_BUSY_TIMEOUT_MS)
+    return connection(write=True, lock_timeout=timeout_ms / 1000.0, busy_timeout_ms=timeout_ms)
+
+
+def close_pool() -> None:
+    """Close pooled connections (shutdown, or after swapping DB_FILE in tests).
+
+    The writer and this thread's readers close now; other threads' readers are
+    replaced the next time those threads borrow one.
+    """
+    global _pool_generation
+    with _pool_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+        _pool_generation += 1
+    for conn, lock in writers:
+        with lock:
+            _close_quietly(conn)
+    readers = getattr(_thread_readers, "by_path", None)
+    for conn in (readers or {}).values():
+        _close_quietly(conn)
+    _thread_readers.by_path = {}
+    _thread_readers.generation = _pool_generation
+
+
 def sync_categories(category_titles):
     """Ensure all category titles exist in the local categories table.
 
@@ -403,21 +845,18 @@ def sync_categories(category_titles):
     """
     if not category_titles:
         return
-    conn = get_connection()
     try:
-        c = conn.cursor()
-        for title in category_titles:
-            if not title:
-                continue
-            c.execute(
-                "INSERT OR IGNORE INTO categories (id, title) VALUES (?, ?)",
-                (str(uuid.uuid4()), title),
-            )
-        conn.commit()
+        with connection(write=True) as conn:
+            c = conn.cursor()
+            for title in category_titles:
+                if not title:
+                    continue
+                c.execute(
+                    "INSERT OR IGNORE INTO categories (id, title) VALUES (?, ?)",
+                    (str(uuid.uuid4()), title),
+                )
     except Exception as e:
         log.error(f"Error syncing categories: {e}")
-    finally:
-        conn.close()
 
 
 def get_category_hierarchy():
@@ -46,6 +46,8 @@ _EXTRACTORS_REQUIRE_MEDIA_HINTS = {
 _ytdlp_extractors = None
 _ytdlp_extractors_lock = threading.Lock()
 _ytdlp_extractors_loading = False
+# Host-bucketed index over the extractors (see core.ytdlp_matcher)
+_ytdlp_matcher = None
 
 _YTDLP_SEARCH_SITE_LABEL_OVERRIDES = {
     "ytsearch": "YouTube",
@@ -115,6 +117,22 @@ def _load_ytdlp_extractors():
     finally:
         with _ytdlp_extractors_lock:
             _ytdlp_extractors_loading = False
+    _load_ytdlp_matcher()
+
+
+def _load_ytdlp_matcher():
+    """Load (or build and save) the host index for the loaded extractors."""
+    global _ytdlp_matcher
+    extractors = _ytdlp_extractors
+    if not extractors or _ytdlp_matcher is not None:
+        return
+    try:
+        from core import ytdlp_matcher
+
+        _ytdlp_matcher = ytdlp_matcher.load_matcher(extractors)
+    except Exception:
+        # Fall back to scanning every extractor.
+        _ytdlp_matcher = None
 
 
 def _get_ytdlp_extractors():
@@ -388,8 +406,26 @@ def _alternate_feed_candidates(soup: BeautifulSoup, page_url: str) -> list[str]:
     return [candidate for _score, _neg_idx, candidate in scored]
 
 
-# Pre-load extractors in background thread at module import
-threading.Thread(target=_load_ytdlp_extractors, daemon=True).start()
+_ytdlp_preload_started = False
+
+
+def ytdlp_extractors_loaded() -> bool:
+    return _ytdlp_extractors is not None
+
+
+def preload_ytdlp_extractors() -> None:
+    """Start loading yt-dlp's extractors on a background thread (once).
+
+    Importing yt-dlp's extractor table takes a second or more of CPU. The app
+    calls this after its window is up rather than at import time, so the
+    import no longer competes with building the first window.
+    """
+    global _ytdlp_preload_started
+    with _ytdlp_extractors_lock:
+        if _ytdlp_preload_started or _ytdlp_extractors is not None:
+            return
+        _ytdlp_preload_started = True
+    threading.Thread(target=_load_ytdlp_extractors, name="YtdlpExtractorPreload", daemon=True).start()
 
 
 @lru_cache(maxsize=2048)
@@ -434,9 +470,14 @@ def is_ytdlp_supported(url: str) -> bool:
         if _ARTICLE_DATE_PATH_RE.search(path_low) or any(hint in path_low for hint in _ARTICLE_PATH_HINTS):
             return False
 
-    # Use yt-dlp's extractor regexes (offline) and ignore Generic.
+    # Use yt-dlp's extractor regexes (offline) and ignore Generic. The host
+    # index narrows ~1,800 extractors to the handful that can match this host.
     try:
-        for extractor_cls in _get_ytdlp_extractors():
+        extractors = _get_ytdlp_extractors()
+        matcher = _ytdlp_matcher
+        if matcher is not None:
+            extractors = matcher.candidates(url)
+        for extractor_cls in extractors:
             try:
                 if not extractor_cls.suitable(url):
                     continue
@@ -1719,7 +1760,13 @@ def _normalize_ytdlp_search_entries(entries, site: dict, limit: int = 10) -> lis
     return out
 
 
-def _run_ytdlp_query_search(search_key: str, term: str, limit: int = 10, timeout: int = 15):
+def _run_ytdlp_query_search(
+    search_key: str,
+    term: str,
+    limit: int = 10,
+    timeout: int = 15,
+    cancel_event: threading.Event | None = None,
+):
     query = str(term or "").strip()
     sk = str(search_key or "").strip()
     if not query or not sk:
@@ -1734,6 +1781,28 @@ def _run_ytdlp_query_search(search_key: str, term: str, limit: int = 10, timeout
     except Exception:
         timeout = 15
 
+    # In-process first: no interpreter start-up or extractor loading per site.
+    try:
+        from core import ytdlp_search
+
+        if ytdlp_search.available():
+            entries = ytdlp_search.get_engine().search(
+                sk, query, limit=limit, timeout=timeout, cancel_event=cancel_event
+            )
+            if entries is not None:
+                return entries
+    except Exception:
+        pass
+    return _run_ytdlp_query_search_subprocess(sk, query, limit=limit, timeout=timeout)
+
+
+def _run_ytdlp_query_search_subprocess(search_key: str, term: str, limit: int = 10, timeout: int = 15):
+    """Run the search through the yt-dlp CLI (used when the module can't be imported)."""
+    query = str(term or "").strip()
+    sk = str(search_key or "").strip()
+    if not query or not sk:
+        return []
+
     try:
         from core.dependency_check import _get_startup_info
 
@@ -1774,16 +1843,29 @@ def _run_ytdlp_query_search(search_key: str, term: str, limit: int = 10, timeout
         return []
 
 
-def search_ytdlp_site(term: str, site: dict, limit: int = 10, timeout: int = 15) -> list[dict]:
-    """Search a single yt-dlp query-search site and normalize results for the GUI."""
+def search_ytdlp_site(
+    term: str,
+    site: dict,
+    limit: int = 10,
+    timeout: int = 15,
+    cancel_event: threading.Event | None = None,
+) -> list[dict]:
+    """Search a single yt-dlp query-search site and normalize results for the GUI.
+
+    Setting `cancel_event` stops the search after the entry being fetched.
+    """
     if not isinstance(site, dict):
         return []
+    kwargs = {"limit": limit, "timeout": timeout}
+    if cancel_event is not None:
+        kwargs["cancel_event"] = cancel_event
     entries = _run_ytdlp_query_search(
         str(site.get("search_key") or ""),
         str(term or ""),
-        limit=limit,
-        timeout=timeout,
+        **kwargs,
     )
+    if cancel_event is not None and cancel_event.is_set():
+        return []
     return _normalize_ytdlp_search_entries(entries, site=site, limit=limit)
 
 
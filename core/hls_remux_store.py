@@ -0,0 +1,361 @@
+"""Persistent store of MPEG-TS -> HLS remuxes for casting.
+
+Chromecast can't play raw MPEG-TS, so StreamProxy remuxes such sources to HLS
+with ffmpeg (`-c copy`). Each source URL gets a directory here that keeps every
+segment ffmpeg produced plus a small manifest (segment names, durations, whether
+the remux reached the end of the source). The proxy renders the playlist from
+the manifest:
+
+- EVENT while a remux is running, so the receiver can seek anywhere that is
+  already remuxed instead of only within a short sliding window;
+- VOD (with ENDLIST) once the whole source is remuxed, so casting the same item
+  again is served straight from disk with no ffmpeg at all.
+
+An unfinished remux of a file with a known duration is resumed from the time it
+stopped at. The store is bounded by a disk budget; items not in use are evicted
+least recently used first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from core.config import APP_DIR
+
+LOG = logging.getLogger(__name__)
+
+# Under the app directory so OS temp cleanup can't drop finished remuxes between runs.
+STORE_DIR = os.path.join(APP_DIR, "cache", "hls")
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024 * 1024
+MANIFEST_NAME = "index.json"
+# Playlist ffmpeg writes for the current run; only read to learn about finished segments.
+RUN_PLAYLIST_NAME = "run.m3u8"
+SEGMENT_RE = re.compile(r"^seg_(\d{5,})\.ts$")
+
+
+@dataclass(frozen=True)
+class Segment:
+    name: str
+    duration: float
+    # First segment of a resumed run: timestamps restart, so the receiver must reset its decoder.
+    discontinuity: bool = False
+
+    @property
+    def index(self) -> int:
+        m = SEGMENT_RE.match(self.name)
+        return int(m.group(1)) if m else -1
+
+
+def segment_name(index: int) -> str:
+    return f"seg_{int(index):05d}.ts"
+
+
+def parse_media_playlist(text: str) -> List[Segment]:
+    """(name, duration) pairs of an ffmpeg-written media playlist, in order."""
+    out: List[Segment] = []
+    duration = None
+    for raw in (text or "").splitlines():
+        line = raw.strip()
+        if line.startswith("#EXTINF:"):
+            try:
+                duration = float(line[len("#EXTINF:"):].split(",", 1)[0])
+            except ValueError:
+                duration = None
+            continue
+        if not line or line.startswith("#"):
+            continue
+        name = os.path.basename(line)
+        if duration is not None and SEGMENT_RE.match(name):
+            out.append(Segment(name=name, duration=duration))
+        duration = None
+    return out
+
+
+class RemuxItem:
+    """One source URL's segments and manifest."""
+
+    def __init__(self, root: str, key: str, source_url: str):
+        self.key = key
+        self.source_url = source_url
+        self.dir = os.path.join(root, key)
+        self.lock = threading.RLock()
+        self.segments: List[Segment] = []
+        self.complete = False
+        # Source duration from ffmpeg's input probe; None for live streams or until known.
+        self.duration: Optional[float] = None
+        self.live = False
+        # Set once leading segments of a live item were trimmed for the budget.
+        self.trimmed = False
+        self.last_access = time.time()
+        os.makedirs(self.dir, exist_ok=True)
+        self._load()
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.dir, MANIFEST_NAME)
+
+    @property
+    def run_playlist_path(self) -> str:
+        return os.path.join(self.dir, RUN_PLAYLIST_NAME)
+
+    def _load(self) -> None:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            LOG.debug("Remux manifest unreadable for %s: %s", self.key, e)
+            return
+        try:
+            if data.get("url") != self.source_url:
+                return
+            segments = []
+            for s in data.get("segments") or []:
+                seg = Segment(name=str(s["name"]), duration=float(s["duration"]), discontinuity=bool(s.get("disc")))
+                # Keep only what is actually on disk (a crash may have lost the tail).
+                if SEGMENT_RE.match(seg.name) and os.path.isfile(os.path.join(self.dir, seg.name)):
+                    segments.append(seg)
+                else:
+                    break
+            self.segments = segments
+            self.complete = bool(data.get("complete")) and len(segments) == len(data.get("segments") or [])
+            self.duration = float(data["duration"]) if data.get("duration") else None
+            self.live = bool(data.get("live"))
+            self.trimmed = bool(data.get("trimmed"))
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            LOG.debug("Remux manifest malformed for %s: %s", self.key, e)
+            self.segments = []
+            self.complete = False
+
+    def save(self) -> None:
+        with self.lock:
+            payload = {
+                "url": self.source_url,
+                "complete": self.complete,
+                "duration": self.duration,
+                "live": self.live,
+                "trimmed": self.trimmed,
+                "segments": [
+                    {"name": s.name, "duration": round(s.duration, 6), **({"disc": True} if s.discontinuity else {})}
+                    for s in self.segments
+                ],
+            }
+        tmp = self.manifest_path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp, self.manifest_path)
+        except OSError as e:
+            LOG.debug("Remux manifest write failed for %s: %s", self.key, e)
+
+    def touch(self) -> None:
+        self.last_access = time.time()
+        try:
+            os.utime(self.dir, None)
+        except OSError:
+            pass
+
+    @property
+    def remuxed_seconds(self) -> float:
+        with self.lock:
+            return sum(s.duration for s in self.segments)
+
+    @property
+    def next_index(self) -> int:
+        with self.lock:
+            return (self.segments[-1].index + 1) if self.segments else 0
+
+    @property
+    def resumable(self) -> bool:
+        """An unfinished remux of a finite source that can continue where it stopped."""
+        with self.lock:
+            return bool(self.segments) and not self.complete and not self.live and bool(self.duration)
+
+    @property
+    def covers_source(self) -> bool:
+        """Whether the segments reach the end of a finite source (within one segment)."""
+        with self.lock:
+            if self.live or not self.duration or not self.segments:
+                return False
+            longest = max(s.duration for s in self.segments)
+            return sum(s.duration for s in self.segments) >= self.duration - longest
+
+    def ingest(self, run_segments: Iterable[Segment], discontinuity_at: Optional[str] = None) -> int:
+        """Add finished segments from the current run; returns how many were new."""
+        added = 0
+        with self.lock:
+            known = {s.name for s in self.segments}
+            last = self.segments[-1].index if self.segments else -1
+            for seg in run_segments:
+                if seg.name in known or seg.index <= last:
+                    continue
+                if not os.path.isfile(os.path.join(self.dir, seg.name)):
+                    # ffmpeg lists a segment only after closing it; a missing file means it's gone.
+                    break
+                if discontinuity_at and seg.name == discontinuity_at and self.segments:
+                    seg = Segment(name=seg.name, duration=seg.duration, discontinuity=True)
+                self.segments.append(seg)
+                known.add(seg.name)
+                last = seg.index
+                added += 1
+        return added
+
+    def render_playlist(self) -> str:
+        with self.lock:
+            segments = list(self.segments)
+            complete = self.complete
+            trimmed = self.trimmed
+        target = max([int(math.ceil(s.duration)) for s in segments] or [4])
+        lines = [
+            "#EXTM3U",
+            "#EXT-X-VERSION:3",
+            f"#EXT-X-TARGETDURATION:{target}",
+            f"#EXT-X-MEDIA-SEQUENCE:{segments[0].index if segments else 0}",
+        ]
+        if complete:
+            lines.append("#EXT-X-PLAYLIST-TYPE:VOD")
+        elif not trimmed:
+            # EVENT: segments are only ever appended, so everything listed stays seekable.
+            lines.append("#EXT-X-PLAYLIST-TYPE:EVENT")
+        for seg in segments:
+            if seg.discontinuity:
+                lines.append("#EXT-X-DISCONTINUITY")
+            lines.append(f"#EXTINF:{seg.duration:.6f},")
+            lines.append(seg.name)
+        if complete:
+            lines.append("#EXT-X-ENDLIST")
+        return "\n".join(lines) + "\n"
+
+    def segment_path(self, name: str) -> Optional[str]:
+        """Path of a listed segment; None for unknown or malformed names."""
+        if not SEGMENT_RE.match(name or ""):
+            return None
+        path = os.path.join(self.dir, name)
+        return path if os.path.isfile(path) else None
+
+    def size_bytes(self) -> int:
+        total = 0
+        try:
+            for entry in os.scandir(self.dir):
+                try:
+                    total += entry.stat().st_size
+                except OSError:
+                    pass
+        except OSError:
+            pass
+        return total
+
+    def trim_to(self, max_bytes: int) -> int:
+        """Drop the oldest segments of a live item until it fits; returns bytes freed."""
+        freed = 0
+        with self.lock:
+            size = self.size_bytes()
+            while self.segments and size - freed > max_bytes and len(self.segments) > 3:
+                seg = self.segments.pop(0)
+                path = os.path.join(self.dir, seg.name)
+                try:
+                    freed += os.path.getsize(path)
+                    os.remove(path)
+                except OSError:
+                    pass
+                self.trimmed = True
+        if freed:
+            self.save()
+        return freed
+
+    def reset(self) -> None:
+        """Forget everything remuxed so far (new live session, failed source)."""
+        with self.lock:
+            for name in os.listdir(self.dir) if os.path.isdir(self.dir) else []:
+                if SEGMENT_RE.match(name) or name.endswith(".tmp") or name == RUN_PLAYLIST_NAME:
+                    try:
+                        os.remove(os.path.join(self.dir, name))
+                    except OSError:
+                        pass
+            self.segments = []
+            self.complete = False
+            self.trimmed = False
+        self.save()
+
+
+class RemuxStore:
+    def __init__(self, root: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = root or STORE_DIR
+        self.max_bytes = max(64 * 1024 * 1024, int(max_bytes))
+        self._items: Dict[str, RemuxItem] = {}
+        self._lock = threading.Lock()
+        os.makedirs(self.root, exist_ok=True)
+
+    @staticmethod
+    def key_for(source_url: str) -> str:
+        return hashlib.sha256(str(source_url or "").encode("utf-8")).hexdigest()[:24]
+
+    def open(self, source_url: str) -> RemuxItem:
+        key = self.key_for(source_url)
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                item = RemuxItem(self.root, key, source_url)
+                self._items[key] = item
+        item.touch()
+        return item
+
+    def enforce_budget(self, active_keys: Iterable[str] = ()) -> int:
+        """Evict idle items (oldest first), then trim live items in use; returns bytes freed."""
+        active = set(active_keys or ())
+        entries = []
+        try:
+            for entry in os.scandir(self.root):
+                if not entry.is_dir():
+                    continue
+                item_dir = entry.path
+                size = 0
+                for f in os.scandir(item_dir):
+                    try:
+                        size += f.stat().st_size
+                    except OSError:
+                        pass
+                entries.append((entry.stat().st_mtime, entry.name, item_dir, size))
+        except OSError as e:
+            LOG.debug("Remux store scan failed: %s", e)
+            return 0
+        total = sum(e[3] for e in entries)
+        freed = 0
+        for _mtime, key, item_dir, size in sorted(entries):
+            if total - freed <= self.max_bytes:
+                break
+            if key in active:
+                continue
+            shutil.rmtree(item_dir, ignore_errors=True)
+            with self._lock:
+                self._items.pop(key, None)
+            freed += size
+        if total - freed > self.max_bytes:
+            with self._lock:
+                live_items = [self._items[k] for k in active if k in self._items and self._items[k].live]
+            for item in live_items:
+                freed += item.trim_to(max(0, self.max_bytes - (total - freed - item.size_bytes())))
+        return freed
+
+
+_STORE: Optional[RemuxStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_remux_store() -> RemuxStore:
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            _STORE = RemuxStore()
+        return _STORE
@@ -210,3 +210,34 @@ def refresh_access_token(
     resp = requests.post(TOKEN_URL, data=data, headers=headers, timeout=timeout_s)
     resp.raise_for_status()
     return resp.json()
+
+
+USER_INFO_URL = "https://www.inoreader.com/reader/api/0/user-info"
+
+
+def fetch_user_id(access_token: str, app_id: str = "", app_key: str = "", timeout_s: int = 15) -> str:
+    """Inoreader user id of the account a token belongs to ("" if it can't be read)."""
+    headers = utils.HEADERS.copy()
+    headers["Accept"] = "application/json"
+    headers["Authorization"] = f"Bearer {access_token}"
+    if app_id:
+        headers["AppId"] = app_id
+    if app_key:
+        headers["AppKey"] = app_key
+    try:
+        resp = requests.get(USER_INFO_URL, headers=headers, timeout=timeout_s)
+        resp.raise_for_status()
+        return str((resp.json() or {}).get("userId") or "").strip()
+    except (requests.RequestException, ValueError, AttributeError):
+        return ""
+
+
+def account_key(access_token: str, app_id: str = "", app_key: str = "", timeout_s: int = 15) -> str:
+    """Key for per-account caches (mirror, stream pages, startup snapshot).
+
+    The app id only names the OAuth application, so it can't tell two users of the
+    same app apart. Falls back to a fresh random key per authorization when the user
+    id can't be read, so a new login never reuses another account's caches.
+    """
+    user_id = fetch_user_id(access_token, app_id, app_key, timeout_s=timeout_s)
+    return f"user:{user_id}" if user_id else f"auth:{secrets.token_hex(8)}"
@@ -0,0 +1,61 @@
+"""Deferred module imports for a faster cold start.
+
+The main window used to import the player (python-vlc), casting
+(pychromecast/pyatv), translation and full-text extraction (trafilatura) before
+it could appear, although none of them is needed until the user plays, casts,
+translates or opens full text. `lazy_module()` returns a stand-in that imports
+the real module on first attribute access, so call sites such as
+`article_extractor.extract_full_article(...)` keep working unchanged.
+"""
+
+import importlib
+import sys
+import threading
+import types
+
+_lock = threading.RLock()
+
+
+class _LazyModule(types.ModuleType):
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_target"] = None
+
+    def _load(self):
+        target = self.__dict__["_lazy_target"]
+        if target is None:
+            with _lock:
+                target = self.__dict__["_lazy_target"]
+                if target is None:
+                    target = importlib.import_module(self.__name__)
+                    self.__dict__["_lazy_target"] = target
+        return target
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        # Keep monkeypatching (tests, runtime overrides) on the real module.
+        setattr(self._load(), attr, value)
+
+    def __delattr__(self, attr):
+        delattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_lazy_target"] is not None else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_module(name: str) -> types.ModuleType:
+    """The module `name` if it is imported already, else a proxy that imports it on first use."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return _LazyModule(name)
+
+
+def is_loaded(name: str) -> bool:
+    return name in sys.modules
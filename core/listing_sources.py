@@ -0,0 +1,274 @@
+"""Source adapters for listing feeds (Rumble and Odysee channels/playlists).
+
+These sites have no usable RSS for channels, so their listing pages are read
+page by page (Rumble HTML, Odysee via yt-dlp) and turned into articles. An
+adapter says which URLs it handles, how to normalize them and how to fetch one
+page; `fetch_listing` does the rest:
+
+- Page requests run on a small shared resolver pool, so a channel with hundreds
+  of videos loads in one round of parallel requests instead of one page after
+  another inside a refresh worker.
+- On refresh (the feed already has articles) page 1 is fetched alone first. If
+  it holds an item the feed already knows, nothing older can be new and the
+  listing stops there, which is the common case and costs a single request.
+  Only when page 1 is all new are the remaining pages fetched, again in one
+  round.
+
+Items only need `id`, `title`, `url`, `author` and `published` attributes
+(`core.rumble.RumbleListingItem`, `core.odysee.OdyseeListingItem`).
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
+
+from core import odysee as odysee_mod
+from core import rumble as rumble_mod
+
+LOG = logging.getLogger(__name__)
+
+# Page requests in flight across all listing feeds being refreshed.
+RESOLVER_WORKERS = 6
+_FEED_SUFFIXES = (".xml", ".rss", ".atom")
+
+
+@dataclass(frozen=True)
+class ListingResult:
+    title: Optional[str]
+    # Newest first, deduplicated by id, ending with the first page that held a known item.
+    items: List[Any] = field(default_factory=list)
+    pages: int = 0
+    reached_known: bool = False
+
+
+class ListingSource:
+    """Adapter for one site's listing pages."""
+
+    name = ""
+    # Author used for items when neither the item nor the page names one.
+    label = ""
+    # Items per page when the site pages in fixed sizes; a shorter page is the last one.
+    page_size: Optional[int] = None
+
+    def matches(self, url: str) -> bool:
+        raise NotImplementedError
+
+    def normalize(self, url: str) -> str:
+        return url
+
+    def max_pages(self, config, initial: bool) -> int:
+        raise NotImplementedError
+
+    def fetch_page(self, url: str, page: int, timeout_s: float) -> Tuple[Optional[str], list]:
+        """(page title, items) of 1-based page `page`."""
+        raise NotImplementedError
+
+    def fetch_title(self, url: str, timeout_s: float) -> Optional[str]:
+        title, _items = self.fetch_page(url, 1, timeout_s)
+        return title
+
+
+def _config_int(config, key: str, default: int) -> int:
+    try:
+        return int(config.get(key, default))
+    except Exception:
+        return default
+
+
+def _is_feed_document(url: str) -> bool:
+    return str(url or "").lower().endswith(_FEED_SUFFIXES)
+
+
+class RumbleSource(ListingSource):
+    name = "rumble"
+    label = "Rumble"
+
+    def matches(self, url: str) -> bool:
+        return rumble_mod.is_rumble_url(url) and not _is_feed_document(url)
+
+    def normalize(self, url: str) -> str:
+        return rumble_mod.normalize_rumble_feed_url(url)
+
+    def max_pages(self, config, initial: bool) -> int:
+        if initial:
+            pages = _config_int(config, "rumble_max_pages_initial", 3)
+        else:
+            pages = _config_int(config, "rumble_max_pages_refresh", 3)
+        return max(1, min(10, pages))
+
+    @staticmethod
+    def page_url(url: str, page: int) -> str:
+        if page <= 1:
+            return url
+        try:
+            parts = urlsplit(url)
+            qs = parse_qs(parts.query)
+            qs["page"] = [str(int(page))]
+            return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(qs, doseq=True), ""))
+        except Exception:
+            return url
+
+    def fetch_page(self, url: str, page: int, timeout_s: float) -> Tuple[Optional[str], list]:
+        return rumble_mod.fetch_listing_items(self.page_url(url, page), timeout_s=float(timeout_s))
+
+
+class OdyseeSource(ListingSource):
+    name = "odysee"
+    label = "Odysee"
+    # yt-dlp reads Odysee channels through the claim search API 50 claims at a time.
+    page_size = 50
+
+    def matches(self, url: str) -> bool:
+        return odysee_mod.is_odysee_url(url) and not _is_feed_document(url)
+
+    def normalize(self, url: str) -> str:
+        return odysee_mod.normalize_odysee_feed_url(url)
+
+    def max_pages(self, config, initial: bool) -> int:
+        if initial:
+            items = _config_int(config, "odysee_max_items_initial", 150)
+        else:
+            items = _config_int(config, "odysee_max_items_refresh", 150)
+        items = max(1, min(500, items))
+        return max(1, int(math.ceil(items / float(self.page_size))))
+
+    def fetch_page(self, url: str, page: int, timeout_s: float) -> Tuple[Optional[str], list]:
+        return odysee_mod.fetch_listing_items(
+            url,
+            max_items=self.page_size,
+            start=(max(1, int(page)) - 1) * self.page_size + 1,
+            timeout_s=float(timeout_s),
+        )
+
+    def fetch_title(self, url: str, timeout_s: float) -> Optional[str]:
+        title, _items = odysee_mod.fetch_listing_items(url, max_items=1, timeout_s=float(timeout_s))
+        return title
+
+
+_SOURCES: List[ListingSource] = [RumbleSource(), OdyseeSource()]
+_SOURCES_LOCK = threading.Lock()
+
+
+def register_source(source: ListingSource) -> None:
+    """Add an adapter; it takes precedence over the built-in ones."""
+    with _SOURCES_LOCK:
+        _SOURCES.insert(0, source)
+
+
+def source_for(url: str) -> Optional[ListingSource]:
+    """The adapter handling `url`, or None for ordinary feeds."""
+    if not url:
+        return None
+    with _SOURCES_LOCK:
+        sources = list(_SOURCES)
+    for source in sources:
+        try:
+            if source.matches(url):
+                return source
+        except Exception as e:
+            LOG.debug("Listing source %s match failed for %s: %s", source.name, url, e)
+    return None
+
+
+_POOL: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+
+def _pool() -> concurrent.futures.ThreadPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = concurrent.futures.ThreadPoolExecutor(
+                max_workers=RESOLVER_WORKERS,
+                thread_name_prefix="listing-resolver",
+            )
+        return _POOL
+
+
+def _fetch_page(source: ListingSource, url: str, page: int, timeout_s: float, retries: int):
+    attempts = max(0, int(retries)) + 1
+    for attempt in range(1, attempts + 1):
+        try:
+            return source.fetch_page(url, page, timeout_s)
+        except Exception as e:
+            if attempt >= attempts:
+                raise
+            LOG.debug("%s listing page %s failed for %s (attempt %s): %s", source.name, page, url, attempt, e)
+            time.sleep(min(4, attempt))
+    return None, []
+
+
+def _fetch_round(source: ListingSource, url: str, pages: List[int], timeout_s: float, retries: int) -> list:
+    """Fetch pages concurrently; (page, result or exception) in page order."""
+    if len(pages) == 1:
+        try:
+            return [(pages[0], _fetch_page(source, url, pages[0], timeout_s, retries))]
+        except Exception as e:
+            return [(pages[0], e)]
+    futures = [(page, _pool().submit(_fetch_page, source, url, page, timeout_s, retries)) for page in pages]
+    out = []
+    for page, future in futures:
+        try:
+            out.append((page, future.result()))
+        except Exception as e:
+            out.append((page, e))
+    return out
+
+
+def fetch_listing(
+    source: ListingSource,
+    url: str,
+    *,
+    known_ids: Iterable[str] = (),
+    max_pages: int = 1,
+    timeout_s: float = 20.0,
+    retries: int = 0,
+) -> ListingResult:
+    """Read up to `max_pages` pages, stopping after the first page with a known item."""
+    known = set(known_ids or ())
+    max_pages = max(1, int(max_pages))
+    if known:
+        plan = [[1], list(range(2, max_pages + 1))]
+    else:
+        plan = [list(range(1, max_pages + 1))]
+
+    title = None
+    items: list = []
+    seen: set = set()
+    fetched = 0
+    for pages in plan:
+        if not pages:
+            continue
+        for page, result in _fetch_round(source, url, pages, timeout_s, retries):
+            if isinstance(result, Exception):
+                if page == 1:
+                    raise result
+                # Keep what the earlier pages gave; the next refresh picks up the rest.
+                LOG.debug("%s listing stopped at page %s for %s: %s", source.name, page, url, result)
+                return ListingResult(title=title, items=items, pages=fetched)
+            fetched += 1
+            page_title, page_items = result
+            if page_title and not title:
+                title = page_title
+            page_items = list(page_items or [])
+            hit_known = False
+            for item in page_items:
+                item_id = getattr(item, "id", None)
+                if not item_id or item_id in seen:
+                    continue
+                seen.add(item_id)
+                items.append(item)
+                hit_known = hit_known or item_id in known
+            if hit_known:
+                return ListingResult(title=title, items=items, pages=fetched, reached_known=True)
+            if not page_items or (source.page_size and len(page_items) < source.page_size):
+                # End of the listing; later pages of the round are empty or repeats.
+                return ListingResult(title=title, items=items, pages=fetched)
+    return ListingResult(title=title, items=items, pages=fetched)
@@ -0,0 +1,141 @@
+"""Speculative media resolution ahead of playback.
+
+Pressing play used to start all of the slow work: tracker redirect chains
+(op3/podtrac/chartable can take seconds on their own), yt-dlp or Rumble
+resolution, then VLC's first range requests. While the user is still reading an
+article the player can do that work for the focused item and the next one.
+
+This module holds the pieces that don't depend on the player window:
+
+- a short-lived, in-memory cache of resolved tracker redirects, consulted by the
+  player before it follows a redirect chain itself;
+- `SpeculativeResolver`, a small worker pool that runs the player's resolve
+  callback for the most recently focused items. Newer submissions replace work
+  that hasn't started yet, so scrolling through a long list never builds a
+  backlog.
+
+yt-dlp/Rumble results go to the persistent resolved-stream cache
+(core.media_resolve_cache) instead; the first bytes of the media are warmed in
+the range-cache proxy's chunk store.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+REDIRECT_TTL_S = 10 * 60
+# Items resolved (or attempted) this recently are not resolved again.
+RECENT_TTL_S = 2 * 60
+_REDIRECT_CACHE_MAX = 256
+
+_redirects: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+_redirects_lock = threading.Lock()
+
+
+def cached_redirect(url: str) -> Optional[str]:
+    """The final URL a redirect chain starting at `url` led to recently, if known."""
+    if not url:
+        return None
+    now = time.monotonic()
+    with _redirects_lock:
+        hit = _redirects.get(str(url))
+        if hit is None:
+            return None
+        final_url, expires_at = hit
+        if expires_at <= now:
+            _redirects.pop(str(url), None)
+            return None
+        _redirects.move_to_end(str(url))
+        return final_url
+
+
+def remember_redirect(url: str, final_url: str, ttl_s: float = REDIRECT_TTL_S) -> None:
+    if not url or not final_url:
+        return
+    with _redirects_lock:
+        _redirects[str(url)] = (str(final_url), time.monotonic() + max(0.0, float(ttl_s)))
+        _redirects.move_to_end(str(url))
+        while len(_redirects) > _REDIRECT_CACHE_MAX:
+            _redirects.popitem(last=False)
+
+
+def clear_redirects() -> None:
+    with _redirects_lock:
+        _redirects.clear()
+
+
+class SpeculativeResolver:
+    """Runs `resolve_fn(url, use_ytdlp)` for focused items on background threads."""
+
+    def __init__(
+        self,
+        resolve_fn: Callable[[str, bool], object],
+        max_workers: int = 2,
+        recent_ttl_s: float = RECENT_TTL_S,
+    ):
+        self._resolve_fn = resolve_fn
+        self._max_workers = max(1, int(max_workers))
+        self._recent_ttl_s = max(0.0, float(recent_ttl_s))
+        self._cond = threading.Condition()
+        self._pending: List[Tuple[str, bool]] = []
+        self._inflight: set = set()
+        self._recent: Dict[str, float] = {}
+        self._workers: List[threading.Thread] = []
+        self._closed = False
+
+    def submit(self, targets: Iterable[Tuple[str, bool]]) -> int:
+        """Queue `(url, use_ytdlp)` targets in place of anything not started yet.
+
+        Returns how many were queued; items already running or resolved within
+        `recent_ttl_s` are skipped.
+        """
+        now = time.monotonic()
+        with self._cond:
+            if self._closed:
+                return 0
+            self._recent = {u: t for u, t in self._recent.items() if now - t < self._recent_ttl_s}
+            pending: List[Tuple[str, bool]] = []
+            for url, use_ytdlp in targets or []:
+                url = str(url or "").strip()
+                if not url or url in self._inflight or url in self._recent:
+                    continue
+                if any(p[0] == url for p in pending):
+                    continue
+                pending.append((url, bool(use_ytdlp)))
+            self._pending = pending
+            while len(self._workers) < min(self._max_workers, len(pending)):
+                worker = threading.Thread(target=self._run, name="MediaPrefetch", daemon=True)
+                self._workers.append(worker)
+                worker.start()
+            self._cond.notify_all()
+            return len(pending)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                url, use_ytdlp = self._pending.pop(0)
+                self._inflight.add(url)
+            try:
+                self._resolve_fn(url, use_ytdlp)
+            except Exception as e:
+                log.debug("Speculative resolve failed for %s: %s", url, e)
+            finally:
+                with self._cond:
+                    self._inflight.discard(url)
+                    self._recent[url] = time.monotonic()
+
+    def shutdown(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._pending = []
+            self._cond.notify_all()
@@ -0,0 +1,196 @@
+"""Persistent cache of resolved media streams (page URL -> direct media URL).
+
+Playing a YouTube/Rumble/etc. page means a yt-dlp extraction (or a Rumble
+resolve) of several seconds before VLC gets a URL. The result -- direct URL,
+request headers, title and the format list -- is stored in rss.db keyed by the
+page URL, so replays, resumes and reloads after an error start immediately.
+
+Signed media URLs stop working after a while. An entry expires at the URL's own
+`expire=` stamp (YouTube/googlevideo and most CDNs), less a safety margin, or
+after a fixed TTL when the URL carries no expiry.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from core.db import cache_connection
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_TTL_S = 3 * 3600
+# Signed URLs are dropped this long before they expire, so a stream that is
+# started from the cache can still open its later range requests.
+EXPIRY_MARGIN_S = 15 * 60
+# Entries with less than this left are treated as misses by get().
+DEFAULT_MIN_REMAINING_S = 60
+_PRUNE_INTERVAL_S = 3600
+_EXPIRY_PARAMS = ("expire", "expires", "exp")
+_PATH_EXPIRY_RE = re.compile(r"/expire/(\d{9,11})(?:/|$)")
+
+_last_prune = 0.0
+
+
+@dataclass(frozen=True)
+class ResolvedMedia:
+    page_url: str
+    media_url: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    title: str | None = None
+    formats: List[dict] = field(default_factory=list)
+    resolved_at: int = 0
+    expires_at: int = 0
+
+
+def signed_url_expiry(media_url: str) -> Optional[int]:
+    """Unix time a signed media URL stops working, if the URL says so."""
+    try:
+        parts = urlsplit(str(media_url or ""))
+    except ValueError:
+        return None
+    candidates = [v for k, v in parse_qsl(parts.query) if k.lower() in _EXPIRY_PARAMS]
+    m = _PATH_EXPIRY_RE.search(parts.path or "")
+    if m:
+        candidates.append(m.group(1))
+    for value in candidates:
+        value = str(value or "").strip()
+        # Only plausible epoch seconds; other "exp" values (durations, hashes) are ignored.
+        if value.isdigit() and 9 <= len(value) <= 11:
+            return int(value)
+    return None
+
+
+def compute_expiry(media_url: str, now: float | None = None, ttl_s: int = DEFAULT_TTL_S) -> int:
+    now = int(now if now is not None else time.time())
+    ttl_expiry = now + max(0, int(ttl_s))
+    signed = signed_url_expiry(media_url)
+    if signed is None:
+        return ttl_expiry
+    return min(ttl_expiry, signed - EXPIRY_MARGIN_S)
+
+
+def _slim_formats(formats) -> List[dict]:
+    """Keep only what a later format choice needs; full yt-dlp format dicts are large."""
+    keys = ("format_id", "ext", "acodec", "vcodec", "abr", "tbr", "asr", "filesize", "protocol", "url")
+    out = []
+    for f in formats or []:
+        if isinstance(f, dict):
+            out.append({k: f.get(k) for k in keys if f.get(k) is not None})
+    return out
+
+
+def get(page_url: str, min_remaining_s: int = DEFAULT_MIN_REMAINING_S) -> Optional[ResolvedMedia]:
+    """The cached resolution for `page_url` if it is still good for `min_remaining_s` seconds."""
+    if not page_url:
+        return None
+    try:
+        with cache_connection() as conn:
+            row = conn.execute(
+                "SELECT media_url, headers, title, formats, resolved_at, expires_at FROM resolved_media WHERE page_url = ?",
+                (str(page_url),),
+            ).fetchone()
+        if row is None or int(row[5] or 0) < time.time() + max(0, int(min_remaining_s)):
+            return None
+        return ResolvedMedia(
+            page_url=str(page_url),
+            media_url=row[0],
+            headers=json.loads(row[1]) if row[1] else {},
+            title=row[2],
+            formats=json.loads(row[3]) if row[3] else [],
+            resolved_at=int(row[4] or 0),
+            expires_at=int(row[5] or 0),
+        )
+    except (sqlite3.Error, ValueError, TypeError) as e:
+        LOG.debug("resolved_media read failed: %s", e)
+        return None
+
+
+def put(
+    page_url: str,
+    media_url: str,
+    headers: Optional[Dict[str, str]] = None,
+    title: str | None = None,
+    formats=None,
+    ttl_s: int = DEFAULT_TTL_S,
+) -> Optional[ResolvedMedia]:
+    """Store a resolution; URLs that are (nearly) expired already are not cached."""
+    global _last_prune
+    if not page_url or not media_url:
+        return None
+    now = int(time.time())
+    expires_at = compute_expiry(media_url, now=now, ttl_s=ttl_s)
+    if expires_at <= now + DEFAULT_MIN_REMAINING_S:
+        return None
+    entry = ResolvedMedia(
+        page_url=str(page_url),
+        media_url=str(media_url),
+        headers={str(k): str(v) for k, v in (headers or {}).items()},
+        title=title,
+        formats=_slim_formats(formats),
+        resolved_at=now,
+        expires_at=expires_at,
+    )
+    try:
+        with cache_connection(write=True) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO resolved_media (page_url, media_url, headers, title, formats, resolved_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.page_url,
+                    entry.media_url,
+                    json.dumps(entry.headers, separators=(",", ":")),
+                    entry.title,
+                    json.dumps(entry.formats, separators=(",", ":")),
+                    entry.resolved_at,
+                    entry.expires_at,
+                ),
+            )
+            if now - _last_prune >= _PRUNE_INTERVAL_S:
+                _last_prune = now
+                conn.execute("DELETE FROM resolved_media WHERE expires_at < ?", (now,))
+        return entry
+    except sqlite3.Error as e:
+        LOG.debug("resolved_media write failed: %s", e)
+        return None
+
+
+def invalidate(page_url: str) -> None:
+    """Forget a resolution (e.g. after the player failed to open it)."""
+    if not page_url:
+        return
+    try:
+        with cache_connection(write=True) as conn:
+            conn.execute("DELETE FROM resolved_media WHERE page_url = ?", (str(page_url),))
+    except sqlite3.Error as e:
+        LOG.debug("resolved_media delete failed: %s", e)
+
+
+def expiring(page_urls: Iterable[str], within_s: int) -> List[str]:
+    """Those of `page_urls` that are cached but expire within `within_s` seconds."""
+    wanted = list(dict.fromkeys(str(u) for u in (page_urls or []) if u))
+    if not wanted:
+        return []
+    cutoff = int(time.time()) + max(0, int(within_s))
+    out: List[str] = []
+    try:
+        with cache_connection() as conn:
+            for i in range(0, len(wanted), 500):
+                batch = wanted[i:i + 500]
+                placeholders = ",".join("?" for _ in batch)
+                for (page_url,) in conn.execute(
+                    f"SELECT page_url FROM resolved_media WHERE page_url IN ({placeholders}) AND expires_at < ?",
+                    batch + [cutoff],
+                ):
+                    out.append(page_url)
+    except sqlite3.Error as e:
+        LOG.debug("resolved_media expiry scan failed: %s", e)
+    order = {u: i for i, u in enumerate(wanted)}
+    out.sort(key=lambda u: order.get(u, 0))
+    return out
@@ -1,42 +1,102 @@
+import sys
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timezone
 from core.utils import parse_datetime_utc
 
+# Shared by every article without chapters (most of them).
+_NO_CHAPTERS = ()
+
+
+def _intern(value):
+    """Intern short, highly repeated identifiers (feed ids, MIME types) so rows share one copy."""
+    if value.__class__ is str:
+        return sys.intern(value)
+    return value
+
+
+def article_cache_key(article_id, feed_id):
+    """Key the UI caches an article under: ids are only unique per feed."""
+    if feed_id and article_id:
+        feed_prefix = f"{feed_id}:"
+        if str(article_id).startswith(feed_prefix):
+            return article_id
+        return f"{feed_id}:{article_id}"
+    return article_id
+
+
 class Article:
-    def __init__(self, title: str, url: str, content: str, date: str, author: str, feed_id: str, is_read: bool = False, id: str = None, media_url: str = None, media_type: str = None, chapters: list = None, is_favorite: bool = False, cache_id: str = None):
+    # Several full article lists are alive at once in the GUI (base list, current list,
+    # every cached view), so avoid a per-instance __dict__.
+    __slots__ = (
+        "id",
+        "title",
+        "url",
+        "content",
+        "date",
+        "author",
+        "feed_id",
+        "is_read",
+        "is_favorite",
+        "media_url",
+        "media_type",
+        "chapters",
+        "cache_id",
+        "timestamp",
+    )
+
+    def __init__(self, title: str, url: str, content: str, date: str, author: str, feed_id: str, is_read: bool = False, id: str = None, media_url: str = None, media_type: str = None, chapters: list = None, is_favorite: bool = False, cache_id: str = None, published_ts: int = None):
         self.id = id or url  # Use URL as ID if generic ID not provided
         self.title = title
         self.url = url
         self.content = content
         self.date = date
         self.author = author
-        self.feed_id = feed_id
+        self.feed_id = _intern(feed_id)
         self.is_read = is_read
         self.is_favorite = bool(is_favorite)
         self.media_url = media_url
-        self.media_type = media_type
-        self.chapters = chapters or []
-        if cache_id:
-            self.cache_id = cache_id
-        else:
-            if self.feed_id and self.id:
-                feed_prefix = f"{self.feed_id}:"
-                if str(self.id).startswith(feed_prefix):
-                    self.cache_id = self.id
-                else:
-                    self.cache_id = f"{self.feed_id}:{self.id}"
-            else:
-                self.cache_id = self.id
+        self.media_type = _intern(media_type)
+        # Chapters are read-only lists of dicts; an immutable tuple lets empty ones share one object.
+        self.chapters = tuple(chapters) if chapters else _NO_CHAPTERS
+        self.cache_id = cache_id or article_cache_key(self.id, self.feed_id)
         
         self.timestamp = 0.0
-        if self.date:
+        if published_ts is not None:
+            # Rows from the local DB carry the precomputed epoch; skip re-parsing the date string.
+            self.timestamp = float(published_ts)
+        elif self.date:
             dt = parse_datetime_utc(self.date)
             if dt:
                 self.timestamp = dt.timestamp()
 
+# Rough CPython costs used for cache accounting (slotted object, str header, chapter dict).
+_ARTICLE_OVERHEAD_BYTES = 200
+_STR_OVERHEAD_BYTES = 49
+_CHAPTER_OVERHEAD_BYTES = 350
+_ARTICLE_TEXT_FIELDS = ("id", "cache_id", "title", "url", "content", "date", "author", "media_url", "media_type")
+
+
+def approx_article_bytes(article) -> int:
+    """Approximate resident size of an Article, including its chapter list."""
+    total = _ARTICLE_OVERHEAD_BYTES
+    for name in _ARTICLE_TEXT_FIELDS:
+        value = getattr(article, name, None)
+        if value:
+            total += _STR_OVERHEAD_BYTES + len(value)
+    for ch in getattr(article, "chapters", None) or ():
+        total += _CHAPTER_OVERHEAD_BYTES
+        try:
+            total += len(ch.get("title") or "") + len(ch.get("href") or "")
+        except AttributeError:
+            pass
+    return total
+
+
 class Feed:
+    __slots__ = ("id", "title", "url", "category", "icon_url", "unread_count")
+
     def __init__(self, id: str, title: str, url: str, category: str = "Uncategorized", icon_url: str = None):
-        self.id = id
+        self.id = _intern(id)
         self.title = title
         self.url = url
         self.category = category
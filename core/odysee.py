@@ -150,6 +150,7 @@ def fetch_listing_items(
     url: str,
     *,
     max_items: int = 100,
+    start: int = 1,
     timeout_s: float = 20.0,
     user_agent: str | None = None,
     allow_browser_cookies: bool = True,
@@ -162,6 +163,10 @@ def fetch_listing_items(
     except Exception:
         max_items_i = 100
     max_items_i = max(1, min(500, max_items_i))
+    try:
+        start_i = max(1, int(start))
+    except Exception:
+        start_i = 1
 
     ua = user_agent or DEFAULT_USER_AGENT
 
@@ -177,7 +182,8 @@ def fetch_listing_items(
         "no_warnings": True,
         "extract_flat": "in_playlist",
         "skip_download": True,
-        "playlistend": max_items_i,
+        "playliststart": start_i,
+        "playlistend": start_i + max_items_i - 1,
         "user_agent": ua,
         "referer": url,
         "noprogress": True,
@@ -6,20 +6,13 @@ import time
 from dataclasses import dataclass
 from typing import Callable, Optional
 
-from core.db import get_connection
+from core.db import connection
 
 LOG = logging.getLogger(__name__)
 
 _PLAYBACK_STATE_BUSY_TIMEOUT_MS = 500
 
 
-def _configure_conn(conn: sqlite3.Connection) -> None:
-    try:
-        conn.execute(f"PRAGMA busy_timeout={int(_PLAYBACK_STATE_BUSY_TIMEOUT_MS)}")
-    except sqlite3.Error as e:
-        LOG.warning("Failed to set playback_state busy_timeout pragma: %s", e)
-
-
 def _is_locked_error(error: Exception) -> bool:
     if not isinstance(error, sqlite3.OperationalError):
         return False
@@ -37,23 +30,18 @@ def _is_locked_error(error: Exception) -> bool:
 
 
 def _execute_write_op(op_name: str, op: Callable[[sqlite3.Cursor], None]) -> bool:
-    conn = get_connection()
+    timeout_ms = int(_PLAYBACK_STATE_BUSY_TIMEOUT_MS)
     try:
-        _configure_conn(conn)
-        c = conn.cursor()
-        try:
-            op(c)
-            conn.commit()
-            return True
-        except sqlite3.OperationalError as e:
-            # Don't block the GUI thread for long if a refresh is writing.
-            # We'll retry on the next timer tick.
-            if _is_locked_error(e):
-                LOG.debug("playback_state is locked; skipping %s", op_name)
-                return False
-            raise
-    finally:
-        conn.close()
+        with connection(write=True, lock_timeout=timeout_ms / 1000.0, busy_timeout_ms=timeout_ms) as conn:
+            op(conn.cursor())
+        return True
+    except sqlite3.OperationalError as e:
+        # Don't block the GUI thread for long if a refresh is writing.
+        # We'll retry on the next timer tick.
+        if _is_locked_error(e):
+            LOG.debug("playback_state is locked; skipping %s", op_name)
+            return False
+        raise
 
 
 @dataclass(frozen=True)
@@ -71,9 +59,7 @@ def get_playback_state(playback_id: str) -> Optional[PlaybackState]:
     if not playback_id:
         return None
 
-    conn = get_connection()
-    try:
-        _configure_conn(conn)
+    with connection(busy_timeout_ms=_PLAYBACK_STATE_BUSY_TIMEOUT_MS) as conn:
         c = conn.cursor()
         c.execute(
             "SELECT id, position_ms, duration_ms, updated_at, completed, seek_supported, title "
@@ -95,8 +81,6 @@ def get_playback_state(playback_id: str) -> Optional[PlaybackState]:
             seek_supported=(None if seek_supported is None else bool(int(seek_supported))),
             title=(str(row[6]) if row[6] is not None else None),
         )
-    finally:
-        conn.close()
 
 
 def upsert_playback_state(
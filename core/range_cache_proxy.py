@@ -637,6 +637,29 @@ class _Entry:
                     best = (s, e)
         return best
 
+    def cached_spans(self, start: int, end: int) -> List[Tuple[str, int, int]]:
+        """Chunk files holding the cached run of bytes from `start`, up to `end` inclusive.
+
+        Returns (path, offset within the file, length) triples in order; empty
+        when `start` itself is not cached. Lets other servers (the cast
+        StreamProxy) send cached bytes straight from disk.
+        """
+        spans: List[Tuple[str, int, int]] = []
+        try:
+            cur = int(start)
+            end_i = int(end)
+        except Exception:
+            return spans
+        while cur <= end_i:
+            seg = self._find_best_segment_covering(cur)
+            if not seg:
+                break
+            s, e = seg
+            part_end = min(e, end_i)
+            spans.append((self._chunk_path(s, e), cur - s, (part_end - cur) + 1))
+            cur = part_end + 1
+        return spans
+
     def stream_cached_range_to(self, start: int, end: int, wfile, chunk_size: int = 512 * 1024) -> int:
         """Stream cached bytes [start..end] inclusive to wfile.
 
@@ -1695,6 +1718,14 @@ class RangeCacheProxy:
                 raise RuntimeError("RangeCacheProxy not started")
             return f"http://{self._host}:{self._port}"
 
+    @staticmethod
+    def _sid_for(url: str, headers: Optional[Dict[str, str]]) -> str:
+        # Include headers in id because some hosts require specific Referer/User-Agent
+        # to permit range access.
+        h = headers or {}
+        id_src = url + "\n" + "\n".join(f"{k.lower()}:{v}" for k, v in sorted(h.items(), key=lambda kv: kv[0].lower()))
+        return _sha256_hex(id_src)[:24]
+
     def proxify(self, url: str, headers: Optional[Dict[str, str]] = None, skip_redirect_resolve: bool = False) -> str:
         """
         Register a URL and return a local proxy URL.
@@ -1706,11 +1737,7 @@ class RangeCacheProxy:
             return url
         self.start()
 
-        # Include headers in id because some hosts require specific Referer/User-Agent
-        # to permit range access.
-        h = headers or {}
-        id_src = url + "\n" + "\n".join(f"{k.lower()}:{v}" for k, v in sorted(h.items(), key=lambda kv: kv[0].lower()))
-        sid = _sha256_hex(id_src)[:24]
+        sid = self._sid_for(url, headers)
 
         # Persist the mapping so /media can still resolve even if the in-memory entry is missing.
         self._save_mapping(sid, url, headers)
@@ -1737,6 +1764,53 @@ class RangeCacheProxy:
 
         return f"{self.base_url}/media?id={sid}"
 
+    def warm(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        max_bytes: int = 512 * 1024,
+        skip_redirect_resolve: bool = False,
+    ) -> bool:
+        """
+        Probe `url` and cache its first `max_bytes` ahead of playback.
+
+        Registers the same entry proxify() would for this url/headers, so a later
+        proxify() finds the probe done and the start of the file on disk. Does
+        not start the server; blocks while fetching (call from a worker thread).
+        """
+        if not url or int(max_bytes) <= 0:
+            return False
+        sid = self._sid_for(url, headers)
+        self._save_mapping(sid, url, headers)
+        ent = self._get_or_create_entry(sid, url, headers)
+        if skip_redirect_resolve and not ent.real_url:
+            ent.real_url = url
+        ent.touch()
+        ent.probe()
+        if ent.range_supported is not True:
+            return False
+        end = int(max_bytes) - 1
+        if ent.total_length:
+            end = min(end, int(ent.total_length) - 1)
+        if end < 0:
+            return False
+        return ent._fetch_range(0, end)
+
+    def cached_entry(self, url: str) -> Optional[_Entry]:
+        """The most recently used probed, range-capable entry for `url` (original or redirected), if any."""
+        if not url:
+            return None
+        best = None
+        with self._lock:
+            for ent in self._entries.values():
+                if url != ent.url and url != ent.real_url:
+                    continue
+                if ent.range_supported is not True or not ent.total_length:
+                    continue
+                if best is None or ent.last_access > best.last_access:
+                    best = ent
+        return best
+
     def prune(self, max_entries: int = 20, max_idle_seconds: int = 1800) -> None:
         # Optional: drop very old entries from memory.
         now = time.time()
@@ -0,0 +1,151 @@
+"""Write-behind queue for article read/unread toggles.
+
+Marking articles while moving down a list used to cost one write transaction
+(or one API call) per keystroke. The queue keeps the latest wanted state per
+article, drops toggles that end where they started, and hands the rest to the
+provider's `mark_read_batch` / `mark_unread_batch` every `flush_interval`
+seconds or as soon as `max_batch` articles are waiting.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+log = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL = 0.3
+DEFAULT_MAX_BATCH = 50
+
+
+class ReadStateQueue:
+    def __init__(self, provider, flush_interval: float = DEFAULT_FLUSH_INTERVAL, max_batch: int = DEFAULT_MAX_BATCH):
+        self._provider = provider
+        self._flush_interval = max(0.0, float(flush_interval))
+        self._max_batch = max(1, int(max_batch))
+        self._cond = threading.Condition()
+        # article_id -> [wanted is_read, is_read before the first queued toggle]
+        self._pending: Dict[str, list] = {}
+        # Held while a batch is written so batches reach the provider in order.
+        self._write_lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def mark(self, article_id, is_read: bool, previous: Optional[bool] = None) -> None:
+        """Queue a read-state change. `previous` is the state the UI showed before it."""
+        if not article_id:
+            return
+        is_read = bool(is_read)
+        with self._cond:
+            entry = self._pending.get(article_id)
+            if entry is None:
+                original = (not is_read) if previous is None else bool(previous)
+                self._pending[article_id] = [is_read, original]
+            else:
+                entry[0] = is_read
+            if self._closed:
+                return
+            self._ensure_worker_locked()
+            if len(self._pending) >= self._max_batch:
+                self._cond.notify_all()
+
+    def pending_state(self, article_id) -> Optional[bool]:
+        """The queued read state for an article, or None if nothing is waiting."""
+        with self._cond:
+            entry = self._pending.get(article_id)
+            return None if entry is None else entry[0]
+
+    def overlay(self, articles: Iterable) -> None:
+        """Apply queued states to articles freshly loaded from the provider."""
+        with self._cond:
+            if not self._pending:
+                return
+            pending = {aid: entry[0] for aid, entry in self._pending.items()}
+        for article in articles or []:
+            state = pending.get(getattr(article, "id", None))
+            if state is not None:
+                article.is_read = state
+
+    def flush(self) -> bool:
+        """Write everything queued now, on the calling thread."""
+        with self._write_lock:
+            with self._cond:
+                provider = self._provider
+                batch = self._take_locked()
+            return self._write(provider, batch)
+
+    def set_provider(self, provider) -> None:
+        """Switch providers; toggles queued for the old one are still written to it."""
+        with self._cond:
+            old = self._provider
+            batch = self._take_locked()
+            self._provider = provider
+        if batch:
+            threading.Thread(target=self._write_in_order, args=(old, batch), daemon=True).start()
+
+    def close(self) -> bool:
+        """Stop the worker and write whatever is still queued (call on shutdown)."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        return self.flush()
+
+    def _ensure_worker_locked(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="ReadStateQueue", daemon=True)
+        self._thread.start()
+
+    def _take_locked(self) -> Dict[str, bool]:
+        batch = {aid: entry[0] for aid, entry in self._pending.items() if entry[0] != entry[1]}
+        self._pending.clear()
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                # Give further toggles a moment to coalesce unless the batch is already full.
+                deadline = time.monotonic() + self._flush_interval
+                while len(self._pending) < self._max_batch and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception:
+                log.exception("Read-state flush failed")
+
+    def _write_in_order(self, provider, batch: Dict[str, bool]) -> bool:
+        with self._write_lock:
+            return self._write(provider, batch)
+
+    def _write(self, provider, batch: Dict[str, bool]) -> bool:
+        if not batch or provider is None:
+            return True
+        read_ids: List[str] = [aid for aid, state in batch.items() if state]
+        unread_ids: List[str] = [aid for aid, state in batch.items() if not state]
+        ok = True
+        if read_ids:
+            try:
+                ok = bool(provider.mark_read_batch(read_ids)) and ok
+            except Exception as e:
+                log.warning(f"Failed to mark {len(read_ids)} article(s) read: {e}")
+                ok = False
+        if unread_ids:
+            try:
+                ok = bool(provider.mark_unread_batch(unread_ids)) and ok
+            except Exception as e:
+                log.warning(f"Failed to mark {len(unread_ids)} article(s) unread: {e}")
+                ok = False
+        return ok
@@ -0,0 +1,117 @@
+"""Client-side accounting of an API's request quota.
+
+Some hosted services (Inoreader in particular) give each app a small daily
+request allowance and report usage in response headers. A RequestBudget keeps
+the latest limit/usage the server reported, counts requests made since then,
+and refuses background work (mirror syncs, prefetching) once only the reserve
+for foreground reads -- the pages the user is waiting for -- is left.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+FOREGROUND = "foreground"
+BACKGROUND = "background"
+
+# Share of the quota kept for foreground requests, and the least that is kept.
+DEFAULT_BACKGROUND_RESERVE = 0.25
+DEFAULT_MIN_RESERVE = 10
+
+
+class RequestBudget:
+    def __init__(
+        self,
+        name: str = "",
+        background_reserve: float = DEFAULT_BACKGROUND_RESERVE,
+        min_reserve: int = DEFAULT_MIN_RESERVE,
+    ):
+        self.name = name
+        self._background_reserve = max(0.0, min(1.0, float(background_reserve)))
+        self._min_reserve = max(0, int(min_reserve))
+        self._lock = threading.Lock()
+        self._limit: Optional[int] = None
+        self._used = 0
+        self._resets_at: Optional[float] = None
+
+    def record(self, limit=None, used=None, reset_after_s=None) -> None:
+        """Adopt the limit/usage the server reported (values that fail to parse are ignored)."""
+        try:
+            limit = int(limit) if limit not in (None, "") else None
+        except (TypeError, ValueError):
+            limit = None
+        try:
+            used = int(used) if used not in (None, "") else None
+        except (TypeError, ValueError):
+            used = None
+        try:
+            reset_after = float(reset_after_s) if reset_after_s not in (None, "") else None
+        except (TypeError, ValueError):
+            reset_after = None
+        with self._lock:
+            if limit is not None and limit > 0:
+                self._limit = limit
+            if used is not None and used >= 0:
+                self._used = used
+            if reset_after is not None and reset_after >= 0:
+                self._resets_at = time.time() + reset_after
+
+    def note_request(self) -> None:
+        """Count a request the server has not reported back on yet."""
+        with self._lock:
+            self._roll_over_locked()
+            self._used += 1
+
+    def allow(self, priority: str = FOREGROUND) -> bool:
+        with self._lock:
+            self._roll_over_locked()
+            if self._limit is None:
+                return True
+            remaining = self._limit - self._used
+            if priority == BACKGROUND:
+                return remaining > self._reserve_locked()
+            return remaining > 0
+
+    def background_remaining(self) -> Optional[int]:
+        """Requests background work may still make before the reset, or None without a known limit."""
+        with self._lock:
+            self._roll_over_locked()
+            if self._limit is None:
+                return None
+            return max(0, self._limit - self._used - self._reserve_locked())
+
+    def remaining(self) -> Optional[int]:
+        with self._lock:
+            self._roll_over_locked()
+            if self._limit is None:
+                return None
+            return max(0, self._limit - self._used)
+
+    def seconds_until_reset(self) -> Optional[int]:
+        with self._lock:
+            if self._resets_at is None:
+                return None
+            return max(0, int(self._resets_at - time.time()))
+
+    def status(self) -> Optional[Dict[str, object]]:
+        """{"name", "limit", "used", "remaining", "reset_in_s"}, or None before the server reported a limit."""
+        with self._lock:
+            self._roll_over_locked()
+            if self._limit is None:
+                return None
+            reset_in = None if self._resets_at is None else max(0, int(self._resets_at - time.time()))
+            return {
+                "name": self.name,
+                "limit": self._limit,
+                "used": self._used,
+                "remaining": max(0, self._limit - self._used),
+                "reset_in_s": reset_in,
+            }
+
+    def _reserve_locked(self) -> int:
+        return max(self._min_reserve, int(self._limit * self._background_reserve))
+
+    def _roll_over_locked(self) -> None:
+        if self._resets_at is not None and time.time() >= self._resets_at:
+            self._used = 0
+            self._resets_at = None
@@ -0,0 +1,181 @@
+"""SQLite FTS5 full-text index over stored articles.
+
+The index lives in the `articles_fts` virtual table, keyed by the rowid of the
+matching `articles` row, and is kept in sync by triggers. Article bodies are
+stored HTML-stripped via the `blindrss_search_text()` SQL function, which
+`core.db` registers on every connection it opens.
+"""
+
+import html
+import logging
+import re
+import sqlite3
+from typing import List
+
+log = logging.getLogger(__name__)
+
+FTS_TABLE = "articles_fts"
+SEARCH_TEXT_FUNCTION = "blindrss_search_text"
+
+# bm25() column weights: title, author, content, feed_title.
+_BM25_WEIGHTS = (10.0, 3.0, 1.0, 2.0)
+
+_TAG_RE = re.compile(r"<(script|style)\b.*?</\1\s*>|<[^>]+>", re.IGNORECASE | re.DOTALL)
+_WS_RE = re.compile(r"\s+")
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+_fts5_supported = None
+
+
+def html_to_search_text(value) -> str:
+    """Cheap HTML -> plain text conversion suitable for indexing."""
+    if value is None:
+        return ""
+    s = str(value)
+    if not s:
+        return ""
+    if "<" in s:
+        s = _TAG_RE.sub(" ", s)
+    if "&" in s:
+        s = html.unescape(s)
+    return _WS_RE.sub(" ", s).strip()
+
+
+def register_functions(conn: sqlite3.Connection) -> None:
+    try:
+        conn.create_function(SEARCH_TEXT_FUNCTION, 1, html_to_search_text, deterministic=True)
+    except (TypeError, sqlite3.NotSupportedError):
+        # deterministic= requires SQLite 3.8.3+.
+        conn.create_function(SEARCH_TEXT_FUNCTION, 1, html_to_search_text)
+
+
+def fts5_available(conn: sqlite3.Connection) -> bool:
+    global _fts5_supported
+    if _fts5_supported is not None:
+        return _fts5_supported
+    try:
+        conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS temp._blindrss_fts5_probe USING fts5(x)")
+        conn.execute("DROP TABLE IF EXISTS temp._blindrss_fts5_probe")
+        _fts5_supported = True
+    except sqlite3.Error:
+        log.info("SQLite FTS5 is unavailable; article search falls back to in-memory filtering")
+        _fts5_supported = False
+    return _fts5_supported
+
+
+def index_exists(conn: sqlite3.Connection) -> bool:
+    try:
+        row = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name = ? LIMIT 1",
+            (FTS_TABLE,),
+        ).fetchone()
+        return row is not None
+    except sqlite3.Error:
+        return False
+
+
+def ensure_schema(conn: sqlite3.Connection) -> bool:
+    """Create the FTS table and sync triggers, backfilling existing articles once.
+
+    Returns True when the index is usable.
+    """
+    if not fts5_available(conn):
+        return False
+
+    c = conn.cursor()
+    created = not index_exists(conn)
+    c.execute(
+        f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+            title,
+            author,
+            content,
+            feed_title,
+            tokenize = 'unicode61 remove_diacritics 2'
+        )
+        """
+    )
+    c.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS articles_fts_ai AFTER INSERT ON articles BEGIN
+            INSERT INTO {FTS_TABLE} (rowid, title, author, content, feed_title)
+            VALUES (
+                new.rowid,
+                new.title,
+                new.author,
+                {SEARCH_TEXT_FUNCTION}(new.content),
+                (SELECT title FROM feeds WHERE id = new.feed_id)
+            );
+        END
+        """
+    )
+    c.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS articles_fts_ad AFTER DELETE ON articles BEGIN
+            DELETE FROM {FTS_TABLE} WHERE rowid = old.rowid;
+        END
+        """
+    )
+    c.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS articles_fts_au AFTER UPDATE OF title, author, content, feed_id ON articles BEGIN
+            DELETE FROM {FTS_TABLE} WHERE rowid = old.rowid;
+            INSERT INTO {FTS_TABLE} (rowid, title, author, content, feed_title)
+            VALUES (
+                new.rowid,
+                new.title,
+                new.author,
+                {SEARCH_TEXT_FUNCTION}(new.content),
+                (SELECT title FROM feeds WHERE id = new.feed_id)
+            );
+        END
+        """
+    )
+    c.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS feeds_fts_title_au AFTER UPDATE OF title ON feeds BEGIN
+            UPDATE {FTS_TABLE} SET feed_title = new.title
+            WHERE rowid IN (SELECT rowid FROM articles WHERE feed_id = new.id);
+        END
+        """
+    )
+
+    if created:
+        rebuild(conn)
+    return True
+
+
+def rebuild(conn: sqlite3.Connection) -> None:
+    """Repopulate the index from the articles table."""
+    c = conn.cursor()
+    c.execute(f"DELETE FROM {FTS_TABLE}")
+    c.execute(
+        f"""
+        INSERT INTO {FTS_TABLE} (rowid, title, author, content, feed_title)
+        SELECT a.rowid, a.title, a.author, {SEARCH_TEXT_FUNCTION}(a.content), f.title
+        FROM articles a
+        LEFT JOIN feeds f ON f.id = a.feed_id
+        """
+    )
+    log.info("Built article search index (%s rows)", c.rowcount)
+
+
+def build_match_query(query: str, title_only: bool = False) -> str:
+    """Turn free-form user input into an FTS5 MATCH expression.
+
+    Every word must match (AND), each as a prefix, so typing "pod epis" finds
+    "podcast episode". User-supplied FTS syntax is neutralized by quoting.
+    """
+    terms: List[str] = _TERM_RE.findall(str(query or ""))
+    if not terms:
+        return ""
+    parts = ['"' + t.replace('"', '""') + '"*' for t in terms]
+    expr = " AND ".join(parts)
+    if title_only:
+        return "{title} : (" + expr + ")"
+    return expr
+
+
+def bm25_expression() -> str:
+    weights = ", ".join(str(w) for w in _BM25_WEIGHTS)
+    return f"bm25({FTS_TABLE}, {weights})"
@@ -0,0 +1,206 @@
+"""Startup snapshot of the feed tree and the first page of the last view.
+
+On launch the main window needs feeds, categories, the category hierarchy and
+the remembered view's first page before it shows anything useful. For hosted
+providers that is several HTTP round-trips. The snapshot stores those pieces in
+a small JSON file next to the config (written on exit and after refreshes), so
+the tree and list render from it immediately while live data is fetched and
+reconciled in the background.
+
+A snapshot belongs to one provider account; a different provider or account
+ignores it.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from core.config import APP_DIR
+from core.models import Article, Feed
+
+LOG = logging.getLogger(__name__)
+
+SNAPSHOT_FILE = os.path.join(APP_DIR, "startup_snapshot.json")
+SNAPSHOT_FORMAT = 1
+# Enough rows to fill the list and keep reading while the live page loads.
+MAX_ARTICLES = 100
+
+# Config fields that tell accounts of the same provider apart (secrets are left out).
+_ACCOUNT_FIELDS = {
+    "miniflux": ("url",),
+    "theoldreader": ("email",),
+    "bazqux": ("email", "username"),
+    # Set per authorization from the Inoreader user id; app credentials are shared between users.
+    "inoreader": ("account_id",),
+}
+
+
+@dataclass(frozen=True)
+class StartupSnapshot:
+    provider_key: str
+    saved_at: float
+    feeds: List[Feed] = field(default_factory=list)
+    categories: List[str] = field(default_factory=list)
+    hierarchy: Dict[str, str] = field(default_factory=dict)
+    view_id: Optional[str] = None
+    articles: List[Article] = field(default_factory=list)
+    total: Optional[int] = None
+
+
+def provider_key(config_manager) -> str:
+    """Identity of the active provider account, e.g. "miniflux|https://rss.example"."""
+    name = str(config_manager.get("active_provider", "local") or "local")
+    parts = [name]
+    try:
+        pcfg = config_manager.get_provider_config(name) or {}
+    except Exception:
+        pcfg = {}
+    for key in _ACCOUNT_FIELDS.get(name, ()):
+        value = str(pcfg.get(key) or "").strip()
+        if value:
+            parts.append(value.rstrip("/").lower())
+    return "|".join(parts)
+
+
+def _feed_to_dict(feed: Feed) -> dict:
+    return {
+        "id": feed.id,
+        "title": feed.title,
+        "url": feed.url,
+        "category": feed.category,
+        "icon_url": feed.icon_url,
+        "unread_count": int(getattr(feed, "unread_count", 0) or 0),
+    }
+
+
+def _feed_from_dict(d: dict) -> Feed:
+    feed = Feed(
+        id=d["id"],
+        title=d.get("title") or "",
+        url=d.get("url") or "",
+        category=d.get("category") or "Uncategorized",
+        icon_url=d.get("icon_url"),
+    )
+    feed.unread_count = int(d.get("unread_count") or 0)
+    return feed
+
+
+def _article_to_dict(a: Article) -> dict:
+    return {
+        "id": a.id,
+        "cache_id": a.cache_id,
+        "title": a.title,
+        "url": a.url,
+        "content": a.content,
+        "date": a.date,
+        "author": a.author,
+        "feed_id": a.feed_id,
+        "is_read": bool(a.is_read),
+        "is_favorite": bool(a.is_favorite),
+        "media_url": a.media_url,
+        "media_type": a.media_type,
+        "chapters": list(a.chapters or ()),
+        "ts": a.timestamp,
+    }
+
+
+def _article_from_dict(d: dict) -> Article:
+    return Article(
+        title=d.get("title"),
+        url=d.get("url"),
+        content=d.get("content"),
+        date=d.get("date"),
+        author=d.get("author"),
+        feed_id=d.get("feed_id"),
+        is_read=bool(d.get("is_read")),
+        id=d.get("id"),
+        media_url=d.get("media_url"),
+        media_type=d.get("media_type"),
+        chapters=d.get("chapters") or None,
+        is_favorite=bool(d.get("is_favorite")),
+        cache_id=d.get("cache_id"),
+        published_ts=d.get("ts") or 0,
+    )
+
+
+def save(
+    provider_key: str,
+    feeds,
+    categories,
+    hierarchy=None,
+    view_id: str | None = None,
+    articles=None,
+    total: int | None = None,
+) -> bool:
+    """Write the snapshot atomically; returns False (and logs) on failure."""
+    payload = {
+        "format": SNAPSHOT_FORMAT,
+        "provider": str(provider_key or ""),
+        "saved_at": time.time(),
+        "feeds": [_feed_to_dict(f) for f in (feeds or [])],
+        "categories": [str(c) for c in (categories or [])],
+        "hierarchy": {str(k): str(v) for k, v in (hierarchy or {}).items() if v},
+        "view": None,
+    }
+    if view_id:
+        payload["view"] = {
+            "id": str(view_id),
+            "total": int(total) if total is not None else None,
+            "articles": [_article_to_dict(a) for a in list(articles or [])[:MAX_ARTICLES]],
+        }
+    path = SNAPSHOT_FILE
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, path)
+        return True
+    except (OSError, TypeError, ValueError) as e:
+        LOG.debug("Startup snapshot write failed: %s", e)
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return False
+
+
+def load(provider_key: str) -> Optional[StartupSnapshot]:
+    """The saved snapshot for this provider account, or None."""
+    try:
+        with open(SNAPSHOT_FILE, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        LOG.debug("Startup snapshot unreadable: %s", e)
+        return None
+    try:
+        if payload.get("format") != SNAPSHOT_FORMAT or payload.get("provider") != str(provider_key or ""):
+            return None
+        view = payload.get("view") or {}
+        return StartupSnapshot(
+            provider_key=payload["provider"],
+            saved_at=float(payload.get("saved_at") or 0),
+            feeds=[_feed_from_dict(d) for d in payload.get("feeds") or []],
+            categories=list(payload.get("categories") or []),
+            hierarchy=dict(payload.get("hierarchy") or {}),
+            view_id=view.get("id"),
+            articles=[_article_from_dict(d) for d in view.get("articles") or []],
+            total=view.get("total"),
+        )
+    except (AttributeError, KeyError, TypeError, ValueError) as e:
+        LOG.debug("Startup snapshot malformed: %s", e)
+        return None
+
+
+def clear() -> None:
+    try:
+        os.remove(SNAPSHOT_FILE)
+    except OSError:
+        pass
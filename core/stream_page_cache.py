@@ -0,0 +1,150 @@
+"""Persistent cache of hosted-stream pages keyed by stream and continuation token.
+
+Google Reader-style APIs page a stream with opaque continuation tokens. Each
+fetched page is stored in rss.db under (account, stream key, continuation), so
+scrolling back through a view or reopening it after a restart costs no API
+requests. Rows keep the raw item JSON; read/starred changes made locally are
+kept in a small overrides table and applied when a page is loaded, so the cache
+never needs to be rewritten when the user marks an item.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.db import cache_connection
+
+LOG = logging.getLogger(__name__)
+
+READ_TAG = "user/-/state/com.google/read"
+STARRED_TAG = "user/-/state/com.google/starred"
+_PRUNE_INTERVAL_S = 3600
+
+_last_prune = 0.0
+
+
+def _apply_flags(items: List[dict], flags: Dict[str, Tuple[Optional[int], Optional[int], int]], fetched_at: int) -> None:
+    for item in items:
+        flag = flags.get(str(item.get("id")))
+        if not flag or flag[2] < fetched_at:
+            continue
+        is_read, is_starred, _updated = flag
+        cats = [c for c in (item.get("categories") or []) if isinstance(c, str)]
+        if is_read is not None:
+            cats = [c for c in cats if not c.endswith("/state/com.google/read")]
+            if is_read:
+                cats.append(READ_TAG)
+        if is_starred is not None:
+            cats = [c for c in cats if not c.endswith("/state/com.google/starred")]
+            if is_starred:
+                cats.append(STARRED_TAG)
+        item["categories"] = cats
+
+
+def get_page(
+    account: str, stream_key: str, continuation: str | None
+) -> Optional[Tuple[List[dict], Optional[str], int]]:
+    """(items, next_continuation, fetched_at) for a cached page, with local flag changes applied."""
+    try:
+        with cache_connection() as conn:
+            row = conn.execute(
+                "SELECT items, next_continuation, fetched_at FROM stream_pages "
+                "WHERE account = ? AND stream_key = ? AND continuation = ?",
+                (account, stream_key, continuation or ""),
+            ).fetchone()
+            if row is None:
+                return None
+            items = json.loads(row[0])
+            fetched_at = int(row[2] or 0)
+            ids = [str(i.get("id")) for i in items if i.get("id") is not None]
+            flags: Dict[str, Tuple[Optional[int], Optional[int], int]] = {}
+            for i in range(0, len(ids), 500):
+                batch = ids[i:i + 500]
+                placeholders = ",".join("?" for _ in batch)
+                for item_id, is_read, is_starred, updated_at in conn.execute(
+                    f"SELECT item_id, is_read, is_starred, updated_at FROM stream_item_flags "
+                    f"WHERE account = ? AND item_id IN ({placeholders})",
+                    [account] + batch,
+                ):
+                    flags[str(item_id)] = (is_read, is_starred, int(updated_at or 0))
+        if flags:
+            _apply_flags(items, flags, fetched_at)
+        return items, (row[1] or None), fetched_at
+    except (sqlite3.Error, ValueError, TypeError) as e:
+        LOG.debug("stream_pages read failed: %s", e)
+        return None
+
+
+def put_page(
+    account: str,
+    stream_key: str,
+    continuation: str | None,
+    items: List[dict],
+    next_continuation: str | None,
+    fetched_at: int | None = None,
+    max_age_s: int | None = None,
+) -> bool:
+    """Store a page; rows older than `max_age_s` are pruned now and then."""
+    global _last_prune
+    try:
+        with cache_connection(write=True) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO stream_pages "
+                "(account, stream_key, continuation, next_continuation, items, fetched_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    account,
+                    stream_key,
+                    continuation or "",
+                    next_continuation or None,
+                    json.dumps(items or [], separators=(",", ":")),
+                    int(fetched_at if fetched_at is not None else time.time()),
+                ),
+            )
+            now = time.time()
+            if max_age_s and now - _last_prune >= _PRUNE_INTERVAL_S:
+                _last_prune = now
+                cutoff = int(now - max_age_s)
+                conn.execute("DELETE FROM stream_pages WHERE fetched_at < ?", (cutoff,))
+                conn.execute("DELETE FROM stream_item_flags WHERE updated_at < ?", (cutoff,))
+        return True
+    except sqlite3.Error as e:
+        LOG.debug("stream_pages write failed: %s", e)
+        return False
+
+
+def set_flags(account: str, item_ids: Iterable, is_read: bool | None = None, is_starred: bool | None = None) -> None:
+    """Record a local read/starred change so cached pages reflect it."""
+    ids = [str(i) for i in (item_ids or []) if i is not None]
+    if not ids or (is_read is None and is_starred is None):
+        return
+    now = int(time.time())
+    read_val = None if is_read is None else int(bool(is_read))
+    star_val = None if is_starred is None else int(bool(is_starred))
+    try:
+        with cache_connection(write=True) as conn:
+            conn.executemany(
+                "INSERT INTO stream_item_flags (account, item_id, is_read, is_starred, updated_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(account, item_id) DO UPDATE SET "
+                "is_read = COALESCE(excluded.is_read, is_read), "
+                "is_starred = COALESCE(excluded.is_starred, is_starred), "
+                "updated_at = excluded.updated_at",
+                [(account, i, read_val, star_val, now) for i in ids],
+            )
+    except sqlite3.Error as e:
+        LOG.debug("stream_item_flags write failed: %s", e)
+
+
+def drop_stream(account: str, stream_key: str | None = None) -> None:
+    """Forget every cached page of one stream (or of the whole account)."""
+    try:
+        with cache_connection(write=True) as conn:
+            if stream_key is None:
+                conn.execute("DELETE FROM stream_pages WHERE account = ?", (account,))
+            else:
+                conn.execute("DELETE FROM stream_pages WHERE account = ? AND stream_key = ?", (account, stream_key))
+    except sqlite3.Error as e:
+        LOG.debug("stream_pages delete failed: %s", e)
@@ -6,6 +6,13 @@
 # - Remuxing MPEG-TS to HLS via ffmpeg for Chromecast compatibility.
 # - Serving local files to network devices (Chromecast) with Range support.
 #
+# Upstream requests share one pooled requests.Session, so the many HEAD and small
+# Range requests a receiver makes while seeking reuse warm keep-alive (TLS)
+# connections per origin. Bodies are copied through fixed 1 MB buffers, and file
+# spans go out with sendfile() where the OS has it. Bytes already sitting in the
+# RangeCacheProxy chunk store (local playback, prefetch warming) are served from
+# disk without contacting the origin.
+#
 # NOTE: This server is intended to be reachable both from localhost (VLC) and
 # from LAN devices (Chromecast). It binds to 0.0.0.0 but will generate URLs
 # using 127.0.0.1 for local clients unless a device_ip is provided.
@@ -17,20 +24,32 @@ import json
 import logging
 import mimetypes
 import os
+import re
 import shutil
 import socket
 import socketserver
 import subprocess
 import sys
-import tempfile
 import threading
 import time
 import urllib.parse
-import urllib.request
 from typing import Dict, Optional, Tuple
 
+import requests
+
+from core import hls_remux_store
+from core.hls_remux_store import RemuxStore, get_remux_store
+
 LOG = logging.getLogger(__name__)
 
+_COPY_BUFFER_BYTES = 1024 * 1024
+_UPSTREAM_POOL_SIZE = 16
+# (connect, read) seconds for origin requests.
+_UPSTREAM_TIMEOUT = (10, 30)
+
+_upstream_session_obj: Optional[requests.Session] = None
+_upstream_session_lock = threading.Lock()
+
 # Ensure common audio types resolve correctly on Windows.
 mimetypes.add_type("audio/mpeg", ".mp3")
 mimetypes.add_type("audio/aac", ".aac")
@@ -66,6 +85,80 @@ def _safe_b64encode(b: bytes) -> str:
     return base64.urlsafe_b64encode(b).decode("utf-8").rstrip("=")
 
 
+def _upstream_session() -> requests.Session:
+    """Process-wide session; urllib3 keeps idle keep-alive connections per origin."""
+    global _upstream_session_obj
+    with _upstream_session_lock:
+        if _upstream_session_obj is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=_UPSTREAM_POOL_SIZE,
+                pool_maxsize=_UPSTREAM_POOL_SIZE,
+                max_retries=0,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _upstream_session_obj = session
+        return _upstream_session_obj
+
+
+def _close_upstream_session() -> None:
+    global _upstream_session_obj
+    with _upstream_session_lock:
+        session, _upstream_session_obj = _upstream_session_obj, None
+    if session is not None:
+        try:
+            session.close()
+        except Exception:
+            pass
+
+
+def _send_file_span(sock, f, offset: int, count: int) -> int:
+    """Send `count` bytes of open file `f` from `offset`; zero-copy where os.sendfile exists."""
+    if count <= 0:
+        return 0
+    if hasattr(os, "sendfile"):
+        return sock.sendfile(f, offset, count)
+    # socket.sendfile's own fallback reads 8 KB at a time; use a large buffer instead.
+    f.seek(offset)
+    buf = bytearray(min(_COPY_BUFFER_BYTES, count))
+    view = memoryview(buf)
+    sent = 0
+    while sent < count:
+        n = f.readinto(view[: min(len(buf), count - sent)])
+        if not n:
+            break
+        sock.sendall(view[:n])
+        sent += n
+    return sent
+
+
+def _copy_stream(src, wfile) -> int:
+    """Copy a raw (undecoded) response body to `wfile` through one reusable buffer."""
+    buf = bytearray(_COPY_BUFFER_BYTES)
+    view = memoryview(buf)
+    total = 0
+    while True:
+        n = src.readinto(view)
+        if not n:
+            break
+        wfile.write(view[:n])
+        total += n
+    return total
+
+
+def _range_cache_entry(target_url: str):
+    """The RangeCacheProxy entry holding `target_url`, if that proxy is running in this process."""
+    mod = sys.modules.get("core.range_cache_proxy")
+    proxy = getattr(mod, "_RANGE_PROXY_SINGLETON", None) if mod is not None else None
+    if proxy is None:
+        return None
+    try:
+        return proxy.cached_entry(target_url)
+    except Exception:
+        return None
+
+
 def _parse_range(range_header: str, size: int) -> Optional[Tuple[int, int]]:
     """
     Parse a single HTTP Range header like:
@@ -149,8 +242,11 @@ class _QuietThreadingTCPServer(socketserver.ThreadingTCPServer):
         return super().handle_error(request, client_address)
 
 
+_DURATION_RE = re.compile(r"Duration:\s*(N/A|(\d+):(\d+):(\d+(?:\.\d+)?))")
+
+
 class HLSConverter:
-    def __init__(self, source_url, headers=None):
+    def __init__(self, source_url, headers=None, store: Optional[RemuxStore] = None):
         """Helper that remuxes a source URL to local HLS for Chromecast.
 
         Some IPTV providers require additional HTTP headers (cookies, referer,
@@ -159,6 +255,10 @@ class HLSConverter:
         the remote server may drop the connection shortly after start. To
         handle this, we keep the full headers dict and forward it via ffmpeg's
         -headers option in addition to an explicit -user_agent when present.
+
+        Segments go to the persistent remux store (core.hls_remux_store): a
+        finished remux is served again without ffmpeg, and an unfinished one
+        of a finite source resumes where it stopped.
         """
         self.source_url = source_url
         self.headers = headers or {}
@@ -166,23 +266,30 @@ class HLSConverter:
             self.headers.get("User-Agent")
             or self.headers.get("user-agent")
         )
-        self.temp_dir = tempfile.mkdtemp(prefix="iptv_remux_")
-        self.playlist_path = os.path.join(self.temp_dir, "stream.m3u8")
+        self.store = store or get_remux_store()
+        self.item = self.store.open(source_url)
         self.process = None
         self.last_access = time.time()
 
         self._playlist_ready_event = threading.Event()
         self._monitor_thread = None
+        self._stopping = threading.Event()
 
         self.start()
 
-    def start(self):
+    def build_command(self, start_number: int = 0, offset_s: Optional[float] = None, offset_bytes: Optional[int] = None):
+        """ffmpeg arguments for a run writing segments from `start_number` on.
+
+        `offset_s` seeks the input by time (any source); `offset_bytes` starts an
+        http(s) input at a byte offset (MPEG-TS can be cut at any packet).
+        """
         # -re is NOT used because we want to fill buffer fast; the upstream
         # server or network will naturally limit the effective rate.
         # -c copy keeps CPU usage low by avoiding re-encoding.
+        # Info level (without stats) so the input's Duration line can be read from stderr.
         cmd = [
             "ffmpeg",
-            "-hide_banner", "-loglevel", "error",
+            "-hide_banner", "-nostats", "-loglevel", "info",
         ]
 
         # Forward headers that some providers require (cookies, referer, auth, etc.)
@@ -204,18 +311,56 @@ class HLSConverter:
             except Exception:
                 pass
 
+        if offset_bytes and str(self.source_url).lower().startswith(("http://", "https://")):
+            cmd.extend(["-offset", str(int(offset_bytes))])
+        if offset_s:
+            cmd.extend(["-ss", f"{float(offset_s):.3f}"])
+
         cmd.extend([
             "-i", self.source_url,
             "-c", "copy",
             "-f", "hls",
             "-hls_time", "4",
-            "-hls_list_size", "20",
-            "-hls_flags", "delete_segments+split_by_time",
-            "-hls_segment_filename", os.path.join(self.temp_dir, "seg_%03d.ts"),
-            self.playlist_path,
+            # Keep every segment; the store's budget decides what is dropped.
+            "-hls_list_size", "0",
+            "-hls_playlist_type", "event",
+            "-hls_flags", "split_by_time+temp_file",
+            "-start_number", str(int(start_number)),
+            "-hls_segment_filename", os.path.join(self.item.dir, "seg_%05d.ts"),
+            self.item.run_playlist_path,
         ])
+        return cmd
+
+    @property
+    def playlist_path(self):
+        return self.item.run_playlist_path
+
+    def start(self):
+        item = self.item
+        if item.complete and item.segments:
+            LOG.info("Serving stored HLS remux for %s", self.source_url)
+            self._playlist_ready_event.set()
+            return
+
+        start_number, offset_s, discontinuity_at = 0, None, None
+        if item.resumable:
+            start_number = item.next_index
+            offset_s = item.remuxed_seconds
+            discontinuity_at = hls_remux_store.segment_name(start_number)
+            LOG.info("Resuming HLS remux of %s at %.1fs", self.source_url, offset_s)
+        elif item.segments:
+            # Live (or unknown-length) source: an old session's segments aren't worth keeping.
+            item.reset()
+        try:
+            os.remove(item.run_playlist_path)
+        except OSError:
+            pass
+        if item.segments:
+            self._playlist_ready_event.set()
 
-        LOG.info("Starting ffmpeg remux to %s", self.temp_dir)
+        cmd = self.build_command(start_number=start_number, offset_s=offset_s)
+
+        LOG.info("Starting ffmpeg remux to %s", item.dir)
 
         if not shutil.which("ffmpeg"):
             LOG.error("ffmpeg not found in PATH. Transcoding impossible.")
@@ -234,7 +379,7 @@ class HLSConverter:
             self.process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 stdin=subprocess.DEVNULL,
                 creationflags=creation_flags,
                 startupinfo=startupinfo
@@ -244,23 +389,77 @@ class HLSConverter:
             self.process = None
             return
 
-        # Monitor playlist creation so /transcode/<id>/stream.m3u8 can block briefly
-        def monitor():
-            try:
-                deadline = time.time() + 15
-                while time.time() < deadline:
-                    if os.path.exists(self.playlist_path) and os.path.getsize(self.playlist_path) > 0:
-                        self._playlist_ready_event.set()
-                        return
-                    time.sleep(0.2)
-            finally:
-                # Even on failure, set so waiters can return
-                self._playlist_ready_event.set()
-
-        self._monitor_thread = threading.Thread(target=monitor, daemon=True)
+        threading.Thread(target=self._read_stderr, args=(self.process,), daemon=True).start()
+        self._monitor_thread = threading.Thread(
+            target=self._monitor, args=(self.process, discontinuity_at), daemon=True
+        )
         self._monitor_thread.start()
 
+    def _read_stderr(self, process):
+        """Learn the source duration (N/A for live streams) from ffmpeg's input summary."""
+        try:
+            for raw in iter(process.stderr.readline, b""):
+                line = raw.decode("utf-8", errors="replace")
+                m = _DURATION_RE.search(line)
+                if m and self.item.duration is None and not self.item.live:
+                    if m.group(1) == "N/A":
+                        self.item.live = True
+                    else:
+                        h, mnt, sec = int(m.group(2)), int(m.group(3)), float(m.group(4))
+                        self.item.duration = h * 3600 + mnt * 60 + sec
+                    self.item.save()
+                elif "error" in line.lower():
+                    LOG.debug("ffmpeg: %s", line.strip())
+        except Exception:
+            pass
+
+    def _ingest_run_playlist(self, discontinuity_at):
+        try:
+            with open(self.item.run_playlist_path, "r", encoding="utf-8", errors="replace") as f:
+                text = f.read()
+        except OSError:
+            return 0
+        added = self.item.ingest(hls_remux_store.parse_media_playlist(text), discontinuity_at=discontinuity_at)
+        if added:
+            self.item.save()
+            self._playlist_ready_event.set()
+        return added
+
+    def _monitor(self, process, discontinuity_at):
+        # Move finished segments into the manifest so /transcode/<id>/stream.m3u8 can list them.
+        deadline = time.time() + 15
+        try:
+            while not self._stopping.is_set():
+                self._ingest_run_playlist(discontinuity_at)
+                if time.time() > deadline:
+                    self._playlist_ready_event.set()
+                code = process.poll()
+                if code is not None:
+                    self._ingest_run_playlist(discontinuity_at)
+                    if code == 0 and not self._stopping.is_set() and self.item.segments:
+                        # ffmpeg also exits 0 when an origin drops the connection early, so a
+                        # clean exit alone doesn't make a live channel or a cut-off file VOD.
+                        if self.item.covers_source:
+                            with self.item.lock:
+                                self.item.complete = True
+                            LOG.info("HLS remux of %s complete (%d segments)", self.source_url, len(self.item.segments))
+                        else:
+                            # Finite sources resume from here next time; live ones are reset by start().
+                            LOG.info(
+                                "HLS remux of %s ended early at %.1fs of %s",
+                                self.source_url,
+                                self.item.remuxed_seconds,
+                                f"{self.item.duration:.1f}s" if self.item.duration else "a live source",
+                            )
+                        self.item.save()
+                    return
+                time.sleep(0.5)
+        finally:
+            # Even on failure, set so waiters can return
+            self._playlist_ready_event.set()
+
     def stop(self):
+        self._stopping.set()
         try:
             if self.process and self.process.poll() is None:
                 self.process.terminate()
@@ -277,21 +476,34 @@ class HLSConverter:
                 LOG.warning(f"Failed to kill ffmpeg process: {k}")
 
         self.process = None
-        try:
-            shutil.rmtree(self.temp_dir)
-        except Exception as e:
-            LOG.warning("Failed to cleanup temp dir %s: %s", self.temp_dir, e)
+        # Segments stay in the store for the next cast of this source.
+        self._ingest_run_playlist(None)
+        self.item.save()
 
     def is_alive(self):
         return self.process and self.process.poll() is None
 
     def touch(self):
         self.last_access = time.time()
+        self.item.touch()
 
     def wait_for_playlist(self, timeout=15):
-        # Block until the monitor thread has had a chance to create playlist
+        # Block until the first segment is listed (or the monitor gives up)
         self._playlist_ready_event.wait(timeout=timeout)
-        return os.path.exists(self.playlist_path) and os.path.getsize(self.playlist_path) > 0
+        return bool(self.item.segments)
+
+    def playlist_bytes(self) -> bytes:
+        return self.item.render_playlist().encode("utf-8")
+
+    def segment_path(self, name: str) -> Optional[str]:
+        return self.item.segment_path(name)
+
+    @property
+    def stream_type(self) -> str:
+        """Chromecast stream type: seekable BUFFERED for finite sources, LIVE otherwise."""
+        if self.item.complete or self.item.duration:
+            return "BUFFERED"
+        return "LIVE"
 
 
 class StreamProxyHandler(http.server.BaseHTTPRequestHandler):
@@ -351,13 +563,27 @@ class StreamProxyHandler(http.server.BaseHTTPRequestHandler):
             if not converter.wait_for_playlist():
                 self.send_error(503, "Playlist generation failed or timed out")
                 return
-            file_path = converter.playlist_path
-            content_type = "application/vnd.apple.mpegurl"
-        else:
-            file_path = os.path.join(converter.temp_dir, filename)
-            content_type = "video/mp2t"
+            # Rendered from the store's manifest: EVENT while remuxing, VOD once complete.
+            body = converter.playlist_bytes()
+            try:
+                self.send_response(200)
+                self.send_header("Content-Type", "application/vnd.apple.mpegurl")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
+                self.send_header("Pragma", "no-cache")
+                self.send_header("Expires", "0")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                if send_body:
+                    self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
+                pass
+            return
 
-        if not os.path.exists(file_path):
+        file_path = converter.segment_path(filename)
+        content_type = "video/mp2t"
+        if not file_path:
             self.send_error(404, "File not found")
             return
 
@@ -380,10 +606,6 @@ class StreamProxyHandler(http.server.BaseHTTPRequestHandler):
                 self.send_header("Content-Length", str(size))
 
             self.send_header("Access-Control-Allow-Origin", "*")
-            if filename.endswith(".m3u8"):
-                self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
-                self.send_header("Pragma", "no-cache")
-                self.send_header("Expires", "0")
             self.send_header("Connection", "close")
             self.end_headers()
 
@@ -392,17 +614,9 @@ class StreamProxyHandler(http.server.BaseHTTPRequestHandler):
 
             with open(file_path, "rb") as f:
                 if r:
-                    f.seek(start)
-                    to_send = length
+                    _send_file_span(self.connection, f, start, length)
                 else:
-                    to_send = size
-
-                while to_send > 0:
-                    chunk = f.read(min(128 * 1024, to_send))
-                    if not chunk:
-                        break
-                    self.wfile.write(chunk)
-                    to_send -= len(chunk)
+                    _send_file_span(self.connection, f, 0, size)
         except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
             return
         except Exception as e:
@@ -458,17 +672,9 @@ class StreamProxyHandler(http.server.BaseHTTPRequestHandler):
 
             with open(file_path, "rb") as f:
                 if r:
-                    f.seek(start)
-                    to_send = length
+                    _send_file_span(self.connection, f, start, length)
                 else:
-                    to_send = size
-
-                while to_send > 0:
-                    chunk = f.read(min(256 * 1024, to_send))
-                    if not chunk:
-                        break
-                    self.wfile.write(chunk)
-                    to_send -= len(chunk)
+                    _send_file_span(self.connection, f, 0, size)
         except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
             return
         except Exception as e:
@@ -513,108 +719,197 @@ class StreamProxyHandler(http.server.BaseHTTPRequestHandler):
 
         method = "GET" if send_body else "HEAD"
 
+        if self._serve_from_range_cache(target_url, req_headers, send_body):
+            return
+
         try:
             LOG.info("Proxying (%s): %s", method, target_url)
-            req = urllib.request.Request(target_url, headers=req_headers, method=method)
+            response = _upstream_session().request(
+                method, target_url, headers=req_headers, stream=True, timeout=_UPSTREAM_TIMEOUT, allow_redirects=True
+            )
+        except Exception as e:
+            LOG.error("Proxy error: %s", e)
+            try:
+                self.send_error(502, str(e))
+            except Exception:
+                pass
+            return
 
-            with urllib.request.urlopen(req, timeout=15) as response:
-                status = getattr(response, "status", 200)
+        try:
+            status = int(response.status_code)
+            if status >= 400:
+                # Mirror origin errors (403 on expired signatures etc.) without a body.
                 self.send_response(status)
+                for k, v in response.headers.items():
+                    if k and k.lower() not in _HOP_BY_HOP_HEADERS and k.lower() != "content-length":
+                        self.send_header(k, v)
+                self.send_header("Content-Length", "0")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                return
 
-                # Determine whether to rewrite m3u8 playlists
-                path = urllib.parse.urlparse(response.geturl()).path
-                is_m3u8 = path.endswith(".m3u8")
+            self.send_response(status)
+
+            # Determine whether to rewrite m3u8 playlists
+            path = urllib.parse.urlparse(response.url).path
+            is_m3u8 = path.endswith(".m3u8")
+
+            # Copy headers, excluding hop-by-hop. Only skip Content-Length when rewriting.
+            sent_content_type = False
+            content_type_override = "application/vnd.apple.mpegurl" if is_m3u8 else None
+
+            for k, v in response.headers.items():
+                lk = k.lower()
+                if lk in _HOP_BY_HOP_HEADERS:
+                    continue
+                if is_m3u8 and lk in ("content-length", "content-encoding"):
+                    continue
+                if lk == "content-type":
+                    sent_content_type = True
+                    if is_m3u8:
+                        # override later
+                        continue
+                self.send_header(k, v)
 
-                # Copy headers, excluding hop-by-hop. Only skip Content-Length when rewriting.
-                sent_content_type = False
-                content_type_override = "application/vnd.apple.mpegurl" if is_m3u8 else None
+            if content_type_override and not sent_content_type:
+                self.send_header("Content-Type", content_type_override)
+            elif content_type_override and sent_content_type:
+                # Replace Content-Type for m3u8
+                self.send_header("Content-Type", content_type_override)
 
-                for k, v in response.getheaders():
-                    lk = k.lower()
-                    if lk in _HOP_BY_HOP_HEADERS:
-                        continue
-                    if is_m3u8 and lk == "content-length":
-                        continue
-                    if lk == "content-type":
-                        sent_content_type = True
-                        if is_m3u8:
-                            # override later
-                            continue
-                    self.send_header(k, v)
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.send_header("Connection", "close")
+
+            if not send_body:
+                self.end_headers()
+                return
 
-                if content_type_override and not sent_content_type:
-                    self.send_header("Content-Type", content_type_override)
-                elif content_type_override and sent_content_type:
-                    # Replace Content-Type for m3u8
-                    self.send_header("Content-Type", content_type_override)
+            if is_m3u8:
+                content = response.content
+                try:
+                    text = content.decode("utf-8", errors="ignore")
+                    new_lines = []
+                    base_url = response.url
+                    headers_val = query.get("headers", [None])[0]
+                    headers_param = ""
+                    if headers_val:
+                        headers_param = "&headers=" + urllib.parse.quote(headers_val, safe="")
+
+                    for line in text.splitlines():
+                        s = line.strip()
+                        if not s or s.startswith("#"):
+                            new_lines.append(line)
+                            continue
 
-                self.send_header("Access-Control-Allow-Origin", "*")
-                self.send_header("Connection", "close")
+                        # Relative segment/playlist -> absolute
+                        abs_url = urllib.parse.urljoin(base_url, s)
+                        # Point back through proxy so segments carry headers/range too
+                        new_lines.append(f"/proxy?url={urllib.parse.quote(abs_url, safe='')}{headers_param}")
 
-                if not send_body:
+                    out_text = "\n".join(new_lines) + "\n"
+                    out = out_text.encode("utf-8")
+                    self.send_header("Content-Length", str(len(out)))
                     self.end_headers()
-                    return
-
-                if is_m3u8:
-                    content = response.read()
-                    try:
-                        text = content.decode("utf-8", errors="ignore")
-                        new_lines = []
-                        base_url = response.geturl()
-                        headers_val = query.get("headers", [None])[0]
-                        headers_param = ""
-                        if headers_val:
-                            headers_param = "&headers=" + urllib.parse.quote(headers_val, safe="")
-
-                        for line in text.splitlines():
-                            s = line.strip()
-                            if not s or s.startswith("#"):
-                                new_lines.append(line)
-                                continue
-
-                            # Relative segment/playlist -> absolute
-                            abs_url = urllib.parse.urljoin(base_url, s)
-                            # Point back through proxy so segments carry headers/range too
-                            new_lines.append(f"/proxy?url={urllib.parse.quote(abs_url, safe='')}{headers_param}")
-
-                        out_text = "\n".join(new_lines) + "\n"
-                        out = out_text.encode("utf-8")
-                        self.send_header("Content-Length", str(len(out)))
-                        self.end_headers()
-                        self.wfile.write(out)
-                    except Exception as e:
-                        LOG.error("Failed to rewrite m3u8: %s", e)
-                        self.end_headers()
-                        self.wfile.write(content)
-                else:
+                    self.wfile.write(out)
+                except Exception as e:
+                    LOG.error("Failed to rewrite m3u8: %s", e)
                     self.end_headers()
-                    try:
-                        while True:
-                            chunk = response.read(64 * 1024)
-                            if not chunk:
-                                break
-                            self.wfile.write(chunk)
-                    except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
-                        return
-                    except Exception as e:
-                        LOG.error("Error writing to client: %s", e)
-        except urllib.error.HTTPError as e:
-            # urllib uses exceptions for HTTP status codes
-            try:
-                self.send_response(e.code)
-                for k, v in getattr(e, "headers", {}).items():
-                    if k and k.lower() not in _HOP_BY_HOP_HEADERS:
-                        self.send_header(k, v)
-                self.send_header("Connection", "close")
+                    self.wfile.write(content)
+            else:
                 self.end_headers()
-            except Exception:
-                pass
+                try:
+                    _copy_stream(response.raw, self.wfile)
+                except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
+                    return
+                except Exception as e:
+                    LOG.error("Error writing to client: %s", e)
+        except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
+            return
         except Exception as e:
             LOG.error("Proxy error: %s", e)
             try:
                 self.send_error(500, str(e))
             except Exception:
                 pass
+        finally:
+            # A fully read body returns the connection to the pool; an aborted one is dropped.
+            try:
+                response.close()
+            except Exception:
+                pass
+
+    def _serve_from_range_cache(self, target_url: str, req_headers: Dict[str, str], send_body: bool) -> bool:
+        """Answer from the RangeCacheProxy chunk store when the requested start is on disk.
+
+        HEAD requests only need the probed length/type. For GET, the cached run is
+        sent from disk and any remainder of the range is fetched from the origin
+        in the same response. Returns False (nothing sent) when the cache can't help.
+        """
+        ent = _range_cache_entry(target_url)
+        if ent is None:
+            return False
+        total = int(ent.total_length)
+        range_header = self.headers.get("Range", "")
+        if range_header:
+            r = _parse_range(range_header, total)
+            if r is None:
+                return False
+            start, end = r
+        else:
+            start, end = 0, total - 1
+
+        spans = ent.cached_spans(start, end) if send_body else []
+        if send_body and not spans:
+            return False
+
+        try:
+            ent.touch()
+        except Exception:
+            pass
+        length = end - start + 1
+        if range_header:
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{total}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", ent.content_type or "application/octet-stream")
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(length))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        if not send_body:
+            return True
+
+        LOG.debug("Serving %s-%s of %s from the range cache", start, end, target_url)
+        cur = start
+        try:
+            for path, offset, count in spans:
+                with open(path, "rb") as f:
+                    sent = _send_file_span(self.connection, f, offset, count)
+                cur += sent
+                if sent != count:
+                    break
+            if cur <= end:
+                self._stream_origin_tail(ent.real_url or target_url, req_headers, cur, end)
+        except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
+            pass
+        except Exception as e:
+            # Headers are out; the receiver sees a short body and retries from where it stopped.
+            LOG.debug("Range cache serve failed at %s: %s", cur, e)
+            self.close_connection = True
+        return True
+
+    def _stream_origin_tail(self, url: str, req_headers: Dict[str, str], start: int, end: int) -> None:
+        headers = {k: v for k, v in req_headers.items() if k.lower() != "range"}
+        headers["Range"] = f"bytes={start}-{end}"
+        response = _upstream_session().get(url, headers=headers, stream=True, timeout=_UPSTREAM_TIMEOUT, allow_redirects=True)
+        try:
+            if response.status_code != 206:
+                raise IOError(f"origin answered {response.status_code} for a tail range")
+            _copy_stream(response.raw, self.wfile)
+        finally:
+            response.close()
 
     # Uncomment to silence request logs entirely.
     # def log_message(self, format, *args):
@@ -661,6 +956,7 @@ class StreamProxy:
                 pass
             self.server = None
             self.thread = None
+        _close_upstream_session()
 
         with self.lock:
             for c in list(self.converters.values()):
@@ -669,6 +965,15 @@ class StreamProxy:
                 except Exception:
                     pass
             self.converters.clear()
+        self._enforce_remux_budget()
+
+    def _enforce_remux_budget(self) -> None:
+        with self.lock:
+            active = [c.item.key for c in self.converters.values()]
+        try:
+            get_remux_store().enforce_budget(active)
+        except Exception as e:
+            LOG.debug("Remux store cleanup failed: %s", e)
 
     def _get_url_host(self, device_ip: Optional[str]) -> str:
         """
@@ -731,6 +1036,19 @@ class StreamProxy:
         with self.lock:
             return self.converters.get(session_id)
 
+    def transcoded_stream_type(self, target_url: str) -> str:
+        """BUFFERED (seekable) when the remux source is finite, else LIVE."""
+        session_id = hashlib.md5(target_url.encode("utf-8")).hexdigest()
+        conv = self.get_converter(session_id)
+        if conv is None:
+            return "LIVE"
+        # ffmpeg reports the input duration within moments of starting.
+        if conv.stream_type == "LIVE" and conv.is_alive():
+            deadline = time.time() + 3.0
+            while time.time() < deadline and conv.item.duration is None and not conv.item.live:
+                time.sleep(0.1)
+        return conv.stream_type
+
     def _cleanup_loop(self):
         while self._running:
             time.sleep(10)
@@ -749,6 +1067,8 @@ class StreamProxy:
                         del self.converters[sid]
                     except Exception:
                         pass
+            if dead:
+                self._enforce_remux_budget()
 
 
 import atexit
@@ -1,10 +1,12 @@
 import logging
-from typing import Iterable, List
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, List
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import requests
 
-from core import utils
+from core import translation_cache, utils
 
 log = logging.getLogger(__name__)
 
@@ -78,6 +80,24 @@ _DEFAULT_MODEL_CANDIDATES = _DEFAULT_GROK_MODEL_CANDIDATES
 _DEFAULT_TIMEOUT_S = 45
 _DEFAULT_CHUNK_CHARS = 3500
 _MAX_TOTAL_CHARS = 50000
+# Parallel chunk requests per provider (shared across all in-flight translations).
+_DEFAULT_PROVIDER_CONCURRENCY = 4
+_PROVIDER_CONCURRENCY = {
+    "grok": 4,
+    "groq": 2,  # Groq's free tier rate-limits aggressively.
+    "openai": 4,
+    "openrouter": 4,
+    "gemini": 3,
+    "qwen": 3,
+}
+
+
+class TranslationCancelled(RuntimeError):
+    """Raised when a streaming translation is abandoned (e.g. the selection changed)."""
+
+
+_PROVIDER_SEMAPHORES: dict[str, threading.BoundedSemaphore] = {}
+_PROVIDER_SEMAPHORES_LOCK = threading.Lock()
 
 
 def _clean_target_language(target_language: str | None) -> str:
@@ -741,6 +761,138 @@ def _translate_chunk_qwen(
     raise RuntimeError(str(last_err) or "Qwen translation failed")
 
 
+def _provider_semaphore(provider: str) -> threading.BoundedSemaphore:
+    key = str(provider or "").strip().lower() or "default"
+    with _PROVIDER_SEMAPHORES_LOCK:
+        sem = _PROVIDER_SEMAPHORES.get(key)
+        if sem is None:
+            limit = _PROVIDER_CONCURRENCY.get(key, _DEFAULT_PROVIDER_CONCURRENCY)
+            sem = threading.BoundedSemaphore(max(1, int(limit)))
+            _PROVIDER_SEMAPHORES[key] = sem
+        return sem
+
+
+def _translate_chunks(
+    raw: str,
+    translate_chunk: Callable[[str], str],
+    *,
+    provider: str,
+    model: str | None,
+    target_language: str,
+    chunk_chars: int,
+    use_cache: bool = False,
+    on_chunk: Callable[[int, int, str], None] | None = None,
+    should_cancel: Callable[[], bool] | None = None,
+) -> str:
+    """Translate `raw` chunk by chunk and reassemble in order.
+
+    Cached chunks are served from `core.translation_cache`; misses run concurrently,
+    bounded by a per-provider semaphore so several open articles cannot flood one API.
+
+    `on_chunk(index, total, translated)` is called from the calling thread for each
+    chunk as soon as it and every chunk before it are available, so callers can render
+    a growing prefix. `should_cancel()` is polled between chunks; when it returns True,
+    queued chunks are dropped and `TranslationCancelled` is raised.
+    """
+    chunks = list(_iter_text_chunks(raw, max_chars=chunk_chars))
+    if not chunks:
+        return ""
+
+    target_language = _clean_target_language(target_language)
+    total = len(chunks)
+    results: List[str | None] = [None] * total
+    keys: List[str] = []
+    if use_cache:
+        keys = [translation_cache.make_key(provider, model, target_language, c) for c in chunks]
+        try:
+            cached = translation_cache.get_many(keys)
+        except Exception as e:
+            log.debug("Translation cache lookup failed: %s", e)
+            cached = {}
+        for i, key in enumerate(keys):
+            hit = cached.get(key)
+            if hit is not None:
+                results[i] = hit
+
+    pending = [i for i, value in enumerate(results) if value is None]
+    sem = _provider_semaphore(provider)
+    emitted = 0
+
+    def _cancelled() -> bool:
+        if should_cancel is None:
+            return False
+        try:
+            return bool(should_cancel())
+        except Exception:
+            return False
+
+    def _emit_ready() -> None:
+        nonlocal emitted
+        if on_chunk is None:
+            return
+        while emitted < total and results[emitted] is not None:
+            try:
+                on_chunk(emitted, total, results[emitted])
+            except Exception as e:
+                log.debug("Translation progress callback failed: %s", e)
+            emitted += 1
+
+    def _run(index: int) -> str:
+        if _cancelled():
+            raise TranslationCancelled("Translation cancelled")
+        with sem:
+            if _cancelled():
+                raise TranslationCancelled("Translation cancelled")
+            return translate_chunk(chunks[index])
+
+    errors: dict[int, BaseException] = {}
+    try:
+        _emit_ready()
+        if len(pending) == 1:
+            # Common case for short articles: skip the thread pool entirely.
+            try:
+                results[pending[0]] = _run(pending[0])
+            except Exception as e:
+                errors[pending[0]] = e
+            _emit_ready()
+        elif pending:
+            workers = min(len(pending), _PROVIDER_CONCURRENCY.get(provider, _DEFAULT_PROVIDER_CONCURRENCY))
+            pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="translate")
+            try:
+                futures = {pool.submit(_run, i): i for i in pending}
+                for fut in as_completed(futures):
+                    i = futures[fut]
+                    try:
+                        results[i] = fut.result()
+                    except Exception as e:
+                        errors[i] = e
+                    if _cancelled():
+                        break
+                    _emit_ready()
+            finally:
+                # Don't wait for in-flight requests when cancelled; their results are discarded.
+                pool.shutdown(wait=not _cancelled(), cancel_futures=True)
+    finally:
+        if use_cache:
+            fresh = [(keys[i], results[i]) for i in pending if results[i] is not None]
+            if fresh:
+                try:
+                    translation_cache.put_many(
+                        fresh,
+                        provider=provider,
+                        model=model,
+                        target_language=target_language,
+                    )
+                except Exception as e:
+                    log.debug("Translation cache store failed: %s", e)
+
+    if _cancelled():
+        raise TranslationCancelled("Translation cancelled")
+    if errors:
+        raise errors[min(errors)]
+    return "".join(r or "" for r in results)
+
+
 def translate_text_grok(
     text: str,
     *,
@@ -751,6 +903,9 @@ def translate_text_grok(
     timeout_s: int = _DEFAULT_TIMEOUT_S,
     chunk_chars: int = _DEFAULT_CHUNK_CHARS,
     endpoint: str = _XAI_CHAT_COMPLETIONS_URL,
+    use_cache: bool = False,
+    on_chunk: Callable[[int, int, str], None] | None = None,
+    should_cancel: Callable[[], bool] | None = None,
 ) -> str:
     raw = str(text or "")
     if not raw.strip():
@@ -760,20 +915,28 @@ def translate_text_grok(
     if len(raw) > _MAX_TOTAL_CHARS:
         raw = raw[:_MAX_TOTAL_CHARS]
 
-    translated_chunks: List[str] = []
-    for chunk in _iter_text_chunks(raw, max_chars=chunk_chars):
-        translated_chunks.append(
-            _translate_chunk_grok(
-                chunk,
-                api_key=api_key,
-                target_language=target_language,
-                model=model,
-                model_candidates=model_candidates,
-                timeout_s=timeout_s,
-                endpoint=endpoint,
-            )
+    def _translate_chunk(chunk: str) -> str:
+        return _translate_chunk_grok(
+            chunk,
+            api_key=api_key,
+            target_language=target_language,
+            model=model,
+            model_candidates=model_candidates,
+            timeout_s=timeout_s,
+            endpoint=endpoint,
         )
-    return "".join(translated_chunks)
+
+    return _translate_chunks(
+        raw,
+        _translate_chunk,
+        provider="grok",
+        model=model,
+        target_language=target_language,
+        chunk_chars=chunk_chars,
+        use_cache=use_cache,
+        on_chunk=on_chunk,
+        should_cancel=should_cancel,
+    )
 
 
 def translate_text_openai(
@@ -786,6 +949,9 @@ def translate_text_openai(
     timeout_s: int = _DEFAULT_TIMEOUT_S,
     chunk_chars: int = _DEFAULT_CHUNK_CHARS,
     endpoint: str = _OPENAI_CHAT_COMPLETIONS_URL,
+    use_cache: bool = False,
+    on_chunk: Callable[[int, int, str], None] | None = None,
+    should_cancel: Callable[[], bool] | None = None,
 ) -> str:
     raw = str(text or "")
     if not raw.strip():
@@ -793,20 +959,28 @@ def translate_text_openai(
     if len(raw) > _MAX_TOTAL_CHARS:
         raw = raw[:_MAX_TOTAL_CHARS]
 
-    translated_chunks: List[str] = []
-    for chunk in _iter_text_chunks(raw, max_chars=chunk_chars):
-        translated_chunks.append(
-            _translate_chunk_openai(
-                chunk,
-                api_key=api_key,
-                target_language=target_language,
-                model=model,
-                model_candidates=model_candidates,
-                timeout_s=timeout_s,
-                endpoint=endpoint,
-            )
+    def _translate_chunk(chunk: str) -> str:
+        return _translate_chunk_openai(
+            chunk,
+            api_key=api_key,
+            target_language=target_language,
+            model=model,
+            model_candidates=model_candidates,
+            timeout_s=timeout_s,
+            endpoint=endpoint,
         )
-    return "".join(translated_chunks)
+
+    return _translate_chunks(
+        raw,
+        _translate_chunk,
+        provider="openai",
+        model=model,
+        target_language=target_language,
+        chunk_chars=chunk_chars,
+        use_cache=use_cache,
+        on_chunk=on_chunk,
+        should_cancel=should_cancel,
+    )
 
 
 def translate_text_groq(
@@ -819,6 +993,9 @@ def translate_text_groq(
     timeout_s: int = _DEFAULT_TIMEOUT_S,
     chunk_chars: int = _DEFAULT_CHUNK_CHARS,
     endpoint: str = _GROQ_CHAT_COMPLETIONS_URL,
+    use_cache: bool = False,
+    on_chunk: Callable[[int, int, str], None] | None = None,
+    should_cancel: Callable[[], bool] | None = None,
 ) -> str:
     raw = str(text or "")
     if not raw.strip():
@@ -826,20 +1003,28 @@ def translate_text_groq(
     if len(raw) > _MAX_TOTAL_CHARS:
         raw = raw[:_MAX_TOTAL_CHARS]
 
-    translated_chunks: List[str] = []
-    for chunk in _iter_text_chunks(raw, max_chars=chunk_chars):
-        translated_chunks.append(
-            _translate_chunk_groq(
-                chunk,
-                api_key=api_key,
-                target_language=target_language,
-                model=model,
-                model_candidates=model_candidates,
-                timeout_s=timeout_s,
-                endpoint=endpoint,
-            )
+    def _translate_chunk(chunk: str) -> str:
+        return _translate_chunk_groq(
+            chunk,
+            api_key=api_key,
+            target_language=target_language,
+            model=model,
+            model_candidates=model_candidates,
+            timeout_s=timeout_s,
+            endpoint=endpoint,
         )
-    return "".join(translated_chunks)
+
+    return _translate_chunks(
+        raw,
+        _translate_chunk,
+        provider="groq",
+        model=model,
+        target_language=target_language,
+        chunk_chars=chunk_chars,
+        use_cache=use_cache,
+        on_chunk=on_chunk,
+        should_cancel=should_cancel,
+    )
 
 
 def translate_text_gemini(
@@ -852,6 +1037,9 @@ def translate_text_gemini(
     timeout_s: int = _DEFAULT_TIMEOUT_S,
     chunk_chars: int = _DEFAULT_CHUNK_CHARS,
     endpoint_template: str = _GEMINI_GENERATE_CONTENT_URL_TEMPLATE,
+    use_cache: bool = False,
+    on_chunk: Callable[[int, int, str], None] | None = None,
+    should_cancel: Callable[[], bool] | None = None,
 ) -> str:
     raw = str(text or "")
     if not raw.strip():
@@ -859,20 +1047,28 @@ def translate_text_gemini(
     if len(raw) > _MAX_TOTAL_CHARS:
         raw = raw[:_MAX_TOTAL_CHARS]
 
-    translated_chunks: List[str] = []
-    for chunk in _iter_text_chunks(raw, max_chars=chunk_chars):
-        translated_chunks.append(
-            _translate_chunk_gemini(
-                chunk,
-                api_key=api_key,
-                target_language=target_language,
-                model=model,
-                model_candidates=model_candidates,
-                timeout_s=timeout_s,
-                endpoint_template=endpoint_template,
-            )
+    def _translate_chunk(chunk: str) -> str:
+        return _translate_chunk_gemini(
+            chunk,
+            api_key=api_key,
+            target_language=target_language,
+            model=model,
+            model_candidates=model_candidates,
+            timeout_s=timeout_s,
+            endpoint_template=endpoint_template,
         )
-    return "".join(translated_chunks)
+
+    return _translate_chunks(
+        raw,
+        _translate_chunk,
+        provider="gemini",
+        model=model,
+        target_language=target_language,
+        chunk_chars=chunk_chars,
+        use_cache=use_cache,
+        on_chunk=on_chunk,
+        should_cancel=should_cancel,
+    )
 
 
 def translate_text_openrouter(
@@ -885,6 +1081,9 @@ def translate_text_openrouter(
     timeout_s: int = _DEFAULT_TIMEOUT_S,
     chunk_chars: int = _DEFAULT_CHUNK_CHARS,
     endpoint: str = _OPENROUTER_CHAT_COMPLETIONS_URL,
+    use_cache: bool = False,
+    on_chunk: Callable[[int, int, str], None] | None = None,
+    should_cancel: Callable[[], bool] | None = None,
 ) -> str:
     raw = str(text or "")
     if not raw.strip():
@@ -892,20 +1091,28 @@ def translate_text_openrouter(
     if len(raw) > _MAX_TOTAL_CHARS:
         raw = raw[:_MAX_TOTAL_CHARS]
 
-    translated_chunks: List[str] = []
-    for chunk in _iter_text_chunks(raw, max_chars=chunk_chars):
-        translated_chunks.append(
-            _translate_chunk_openrouter(
-                chunk,
-                api_key=api_key,
-                target_language=target_language,
-                model=model,
-                model_candidates=model_candidates,
-                timeout_s=timeout_s,
-                endpoint=endpoint,
-            )
+    def _translate_chunk(chunk: str) -> str:
+        return _translate_chunk_openrouter(
+            chunk,
+            api_key=api_key,
+            target_language=target_language,
+            model=model,
+            model_candidates=model_candidates,
+            timeout_s=timeout_s,
+            endpoint=endpoint,
         )
-    return "".join(translated_chunks)
+
+    return _translate_chunks(
+        raw,
+        _translate_chunk,
+        provider="openrouter",
+        model=model,
+        target_language=target_language,
+        chunk_chars=chunk_chars,
+        use_cache=use_cache,
+        on_chunk=on_chunk,
+        should_cancel=should_cancel,
+    )
 
 
 def translate_text_qwen(
@@ -919,6 +1126,9 @@ def translate_text_qwen(
     chunk_chars: int = _DEFAULT_CHUNK_CHARS,
     endpoint: str | None = None,
     endpoint_candidates: Iterable[str] | None = None,
+    use_cache: bool = False,
+    on_chunk: Callable[[int, int, str], None] | None = None,
+    should_cancel: Callable[[], bool] | None = None,
 ) -> str:
     raw = str(text or "")
     if not raw.strip():
@@ -926,21 +1136,29 @@ def translate_text_qwen(
     if len(raw) > _MAX_TOTAL_CHARS:
         raw = raw[:_MAX_TOTAL_CHARS]
 
-    translated_chunks: List[str] = []
-    for chunk in _iter_text_chunks(raw, max_chars=chunk_chars):
-        translated_chunks.append(
-            _translate_chunk_qwen(
-                chunk,
-                api_key=api_key,
-                target_language=target_language,
-                model=model,
-                model_candidates=model_candidates,
-                timeout_s=timeout_s,
-                endpoint=endpoint,
-                endpoint_candidates=endpoint_candidates,
-            )
+    def _translate_chunk(chunk: str) -> str:
+        return _translate_chunk_qwen(
+            chunk,
+            api_key=api_key,
+            target_language=target_language,
+            model=model,
+            model_candidates=model_candidates,
+            timeout_s=timeout_s,
+            endpoint=endpoint,
+            endpoint_candidates=endpoint_candidates,
         )
-    return "".join(translated_chunks)
+
+    return _translate_chunks(
+        raw,
+        _translate_chunk,
+        provider="qwen",
+        model=model,
+        target_language=target_language,
+        chunk_chars=chunk_chars,
+        use_cache=use_cache,
+        on_chunk=on_chunk,
+        should_cancel=should_cancel,
+    )
 
 
 def translate_text(
@@ -957,6 +1175,9 @@ def translate_text(
     qwen_model: str | None = None,
     timeout_s: int = _DEFAULT_TIMEOUT_S,
     chunk_chars: int = _DEFAULT_CHUNK_CHARS,
+    use_cache: bool = False,
+    on_chunk: Callable[[int, int, str], None] | None = None,
+    should_cancel: Callable[[], bool] | None = None,
 ) -> str:
     prov = str(provider or "").strip().lower()
     if prov == "grok":
@@ -967,6 +1188,9 @@ def translate_text(
             model=grok_model,
             timeout_s=timeout_s,
             chunk_chars=chunk_chars,
+            use_cache=use_cache,
+            on_chunk=on_chunk,
+            should_cancel=should_cancel,
         )
     if prov == "groq":
         return translate_text_groq(
@@ -976,6 +1200,9 @@ def translate_text(
             model=groq_model,
             timeout_s=timeout_s,
             chunk_chars=chunk_chars,
+            use_cache=use_cache,
+            on_chunk=on_chunk,
+            should_cancel=should_cancel,
         )
     if prov == "openai":
         return translate_text_openai(
@@ -985,6 +1212,9 @@ def translate_text(
             model=openai_model,
             timeout_s=timeout_s,
             chunk_chars=chunk_chars,
+            use_cache=use_cache,
+            on_chunk=on_chunk,
+            should_cancel=should_cancel,
         )
     if prov == "openrouter":
         return translate_text_openrouter(
@@ -994,6 +1224,9 @@ def translate_text(
             model=openrouter_model,
             timeout_s=timeout_s,
             chunk_chars=chunk_chars,
+            use_cache=use_cache,
+            on_chunk=on_chunk,
+            should_cancel=should_cancel,
         )
     if prov == "gemini":
         return translate_text_gemini(
@@ -1003,6 +1236,9 @@ def translate_text(
             model=gemini_model,
             timeout_s=timeout_s,
             chunk_chars=chunk_chars,
+            use_cache=use_cache,
+            on_chunk=on_chunk,
+            should_cancel=should_cancel,
         )
     if prov == "qwen":
         return translate_text_qwen(
@@ -1012,5 +1248,8 @@ def translate_text(
             model=qwen_model,
             timeout_s=timeout_s,
             chunk_chars=chunk_chars,
+            use_cache=use_cache,
+            on_chunk=on_chunk,
+            should_cancel=should_cancel,
         )
     raise RuntimeError(f"Unsupported translation provider: {provider}")
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import time
+from typing import Dict, Iterable, Tuple
+
+from core.db import cache_connection
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def make_key(provider: str, model: str | None, target_language: str, chunk: str) -> str:
+    """Content-addressed key for one translated chunk."""
+    h = hashlib.sha256()
+    for part in (
+        str(provider or "").strip().lower(),
+        str(model or "").strip().lower(),
+        str(target_language or "").strip().lower(),
+    ):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    h.update(str(chunk or "").encode("utf-8"))
+    return h.hexdigest()
+
+
+def get_many(keys: Iterable[str]) -> Dict[str, str]:
+    """Return {key: translated} for the keys present in the cache and bump their LRU stamp."""
+    wanted = [str(k) for k in (keys or []) if k]
+    if not wanted:
+        return {}
+
+    found: Dict[str, str] = {}
+    try:
+        with cache_connection() as conn:
+            c = conn.cursor()
+            # Stay well below SQLite's default host-parameter limit.
+            for i in range(0, len(wanted), 500):
+                batch = wanted[i:i + 500]
+                placeholders = ",".join("?" for _ in batch)
+                c.execute(
+                    f"SELECT key, translated FROM translation_cache WHERE key IN ({placeholders})",
+                    batch,
+                )
+                for key, translated in c.fetchall():
+                    if translated is not None:
+                        found[str(key)] = str(translated)
+    except sqlite3.Error as e:
+        LOG.debug("translation_cache read failed: %s", e)
+        return found
+    if found:
+        try:
+            now = int(time.time())
+            with cache_connection(write=True) as conn:
+                conn.executemany(
+                    "UPDATE translation_cache SET last_used_at = ? WHERE key = ?",
+                    [(now, k) for k in found.keys()],
+                )
+        except sqlite3.Error as e:
+            # LRU bookkeeping is best-effort.
+            LOG.debug("Could not bump translation_cache usage: %s", e)
+    return found
+
+
+def put_many(
+    entries: Iterable[Tuple[str, str]],
+    *,
+    provider: str = "",
+    model: str | None = None,
+    target_language: str = "",
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> bool:
+    """Store (key, translated) pairs, then evict least-recently-used rows over `max_bytes`."""
+    rows = []
+    now = int(time.time())
+    for key, translated in (entries or []):
+        if not key or translated is None:
+            continue
+        text = str(translated)
+        rows.append(
+            (
+                str(key),
+                str(provider or ""),
+                str(model or ""),
+                str(target_language or ""),
+                text,
+                len(text.encode("utf-8")),
+                now,
+                now,
+            )
+        )
+    if not rows:
+        return True
+
+    try:
+        with cache_connection(write=True) as conn:
+            c = conn.cursor()
+            c.executemany(
+                """
+                INSERT OR REPLACE INTO translation_cache
+                    (key, provider, model, target_language, translated, size, created_at, last_used_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            _evict(c, max_bytes)
+        return True
+    except sqlite3.Error as e:
+        LOG.debug("translation_cache write failed: %s", e)
+        return False
+
+
+def _evict(c: sqlite3.Cursor, max_bytes: int) -> int:
+    try:
+        budget = int(max_bytes)
+    except (TypeError, ValueError):
+        budget = DEFAULT_MAX_BYTES
+    if budget <= 0:
+        return 0
+
+    c.execute("SELECT COALESCE(SUM(size), 0) FROM translation_cache")
+    row = c.fetchone()
+    total = int((row[0] if row else 0) or 0)
+    if total <= budget:
+        return 0
+
+    # Walk oldest-first and drop until we are back under budget.
+    excess = total - budget
+    victims = []
+    c.execute("SELECT key, size FROM translation_cache ORDER BY last_used_at ASC, created_at ASC")
+    for key, size in c.fetchall():
+        victims.append((key,))
+        excess -= int(size or 0)
+        if excess <= 0:
+            break
+    if victims:
+        c.executemany("DELETE FROM translation_cache WHERE key = ?", victims)
+    return len(victims)
+
+
+def clear() -> None:
+    try:
+        with cache_connection(write=True) as conn:
+            conn.execute("DELETE FROM translation_cache")
+    except sqlite3.Error as e:
+        LOG.debug("translation_cache clear failed: %s", e)
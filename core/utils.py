@@ -9,7 +9,7 @@ from datetime import datetime, timezone, timedelta
 from dateutil import parser as dateparser
 from dateutil.parser import UnknownTimezoneWarning
 from io import BytesIO
-from core.db import get_connection
+from core.db import get_connection, connection as db_connection
 import warnings
 import urllib.parse
 
@@ -480,6 +480,20 @@ def parse_datetime_utc(value: str):
     return dt
 
 
+def date_to_timestamp(value) -> int:
+    """Epoch seconds for a stored article date, or 0 when it is missing/unparseable.
+
+    Used for the articles.published_ts column so ordering and retention can run on integers.
+    """
+    dt = parse_datetime_utc(value)
+    if not dt:
+        return 0
+    try:
+        return int(dt.timestamp())
+    except (OverflowError, OSError, ValueError):
+        return 0
+
+
 def humanize_article_date(date_str: str, now_utc: datetime = None) -> str:
     """Human-friendly article date.
 
@@ -515,14 +529,11 @@ def humanize_article_date(date_str: str, now_utc: datetime = None) -> str:
 
 
 def get_chapters_from_db(article_id: str):
-    conn = get_connection()
-    try:
-        c = conn.cursor()
-        c.execute("SELECT start, title, href FROM chapters WHERE article_id = ? ORDER BY start", (article_id,))
-        rows = c.fetchall()
+    with db_connection() as conn:
+        rows = conn.execute(
+            "SELECT start, title, href FROM chapters WHERE article_id = ? ORDER BY start", (article_id,)
+        ).fetchall()
         return [{"start": r[0], "title": r[1], "href": r[2]} for r in rows]
-    finally:
-        conn.close()
 
 
 def get_chapters_batch(article_ids: list) -> dict:
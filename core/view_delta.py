@@ -0,0 +1,138 @@
+"""Apply article change-feed deltas to an in-memory, newest-first article view.
+
+Views are the lists the main window caches per view id ("all", "<feed_id>",
+"category:<name>", optionally prefixed with "unread:", "read:", "favorites:").
+Instead of re-querying a page after a refresh, the window fetches just the
+changed articles and splices them into each loaded list here, keeping the
+view's id set up to date incrementally.
+"""
+
+from typing import Callable, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+
+def split_view_id(view_id: str) -> Tuple[str, Optional[int], Optional[int]]:
+    """Return (scope, read_filter, favorite_filter) for a view id.
+
+    read_filter is None (all), 0 (unread) or 1 (read); favorite_filter is None or 1.
+    Prefixes stack in any order, e.g. "favorites:unread:all".
+    """
+    filter_read = None
+    filter_favorite = None
+    scope = view_id or ""
+    while True:
+        if scope.startswith("favorites:"):
+            filter_favorite = 1
+            scope = scope[10:]
+        elif scope.startswith("fav:"):
+            filter_favorite = 1
+            scope = scope[4:]
+        elif scope.startswith("unread:"):
+            filter_read = 0
+            scope = scope[7:]
+        elif scope.startswith("read:"):
+            filter_read = 1
+            scope = scope[5:]
+        else:
+            break
+    return scope, filter_read, filter_favorite
+
+
+def article_in_view(view_id: str, article, feed_category: Optional[str] = None, category_titles=None) -> bool:
+    """Whether `article` belongs in the view.
+
+    `feed_category` is the category of the article's feed; `category_titles` is the
+    set of category names a "category:<name>" view covers (the name plus its
+    subcategories) and defaults to just the name.
+    """
+    scope, filter_read, filter_favorite = split_view_id(view_id)
+    if filter_read is not None and int(bool(getattr(article, "is_read", False))) != filter_read:
+        return False
+    if filter_favorite and not getattr(article, "is_favorite", False):
+        return False
+    if scope == "all":
+        return True
+    if scope.startswith("category:"):
+        titles = category_titles if category_titles is not None else (scope.split(":", 1)[1],)
+        return feed_category in titles
+    return bool(scope) and getattr(article, "feed_id", None) == scope
+
+
+class ViewDelta(NamedTuple):
+    articles: list
+    changed: bool
+    loaded_delta: int  # change in loaded rows; shifts the view's paging offset
+    total_delta: int  # change in the view's total row count
+    entered: list  # articles that joined the loaded list
+
+
+def _sort_key(article, key_fn):
+    return (getattr(article, "timestamp", 0) or 0, key_fn(article) or "")
+
+
+def insert_position(articles: List, article, key_fn: Callable) -> int:
+    """Index at which `article` keeps a (timestamp, id) descending list sorted."""
+    key = _sort_key(article, key_fn)
+    lo, hi = 0, len(articles)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _sort_key(articles[mid], key_fn) > key:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def apply_to_view(
+    articles: List,
+    id_set: Set,
+    upserts: Iterable[Tuple[object, bool]],
+    removed_ids: Iterable,
+    key_fn: Callable,
+    fully_loaded: bool = False,
+) -> ViewDelta:
+    """Splice changes into a newest-first list.
+
+    `upserts` are (article, is_new) pairs already known to belong to the view;
+    articles already in the list are replaced and re-positioned. `id_set` is
+    updated in place. Articles older than the last loaded row are left for paging
+    unless the view is fully loaded.
+    """
+    pending = {}
+    for article, is_new in upserts or ():
+        key = key_fn(article)
+        if key is not None:
+            pending[key] = (article, bool(is_new))
+    drop = {k for k in (removed_ids or ()) if k in id_set}
+    replace = {k for k in pending if k in id_set}
+
+    if not pending and not drop:
+        return ViewDelta(articles, False, 0, 0, [])
+
+    # Oldest loaded row before any removals: anything older belongs to pages not loaded yet.
+    boundary = _sort_key(articles[-1], key_fn) if articles else None
+    loaded_delta = 0
+    total_delta = 0
+    changed = False
+    gone = drop | replace
+    if gone:
+        out = [a for a in articles if key_fn(a) not in gone]
+        id_set.difference_update(gone)
+        loaded_delta -= len(gone)
+        total_delta -= len(drop)
+        changed = True
+    else:
+        out = list(articles)
+
+    entered = []
+    for key, (article, is_new) in sorted(pending.items(), key=lambda kv: _sort_key(kv[1][0], key_fn), reverse=True):
+        if is_new and key not in replace:
+            total_delta += 1
+        if not fully_loaded and (boundary is None or _sort_key(article, key_fn) < boundary):
+            continue
+        out.insert(insert_position(out, article, key_fn), article)
+        id_set.add(key)
+        loaded_delta += 1
+        entered.append(article)
+        changed = True
+
+    return ViewDelta(out, changed, loaded_delta, total_delta, entered)
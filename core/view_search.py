@@ -0,0 +1,127 @@
+"""Precomputed, casefolded search text for the in-memory article filter.
+
+The main window keeps one `ViewSearchIndex` per cached view. Entries are keyed by
+article cache id and built once (HTML stripped, casefolded), so filter-as-you-type
+only does substring checks against prepared strings instead of rebuilding them
+from every article's HTML on each keystroke.
+"""
+
+import re
+from typing import Callable, Iterable, List, Optional
+
+from core.search_index import html_to_search_text
+
+_SPLIT_RE = re.compile(r"\s+")
+
+# Entry layout (a list so the feed title can be refreshed in place).
+_FEED_ID = 0
+_FEED_TITLE = 1
+_TITLE = 2
+_FULL = 3
+
+
+def _with_feed_title(text: str, old_feed_title: str, new_feed_title: str) -> str:
+    if old_feed_title and text.endswith(" " + old_feed_title):
+        text = text[: -(len(old_feed_title) + 1)]
+    elif old_feed_title and text == old_feed_title:
+        text = ""
+    if not new_feed_title:
+        return text
+    return f"{text} {new_feed_title}" if text else new_feed_title
+
+
+def split_query(query: str) -> List[str]:
+    q = str(query or "").strip().casefold()
+    if not q:
+        return []
+    return [t for t in _SPLIT_RE.split(q) if t]
+
+
+class ViewSearchIndex:
+    def __init__(self, key_fn: Callable, feed_title_fn: Callable[[Optional[str]], str]):
+        self._key_fn = key_fn
+        self._feed_title_fn = feed_title_fn
+        self._entries = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def approx_bytes(self) -> int:
+        """Rough resident size of the prepared strings, for view cache accounting."""
+        return sum(160 + len(e[_FULL]) + len(e[_TITLE]) for e in self._entries.values())
+
+    def _build_entry(self, article) -> list:
+        feed_id = getattr(article, "feed_id", None)
+        title = str(getattr(article, "title", "") or "").casefold()
+        body_parts = [
+            html_to_search_text(getattr(article, "content", "") or ""),
+            str(getattr(article, "author", "") or ""),
+            str(getattr(article, "url", "") or ""),
+            str(getattr(article, "media_url", "") or ""),
+        ]
+        body = " ".join(p for p in body_parts if p).casefold()
+        feed_title = str(self._feed_title_fn(feed_id) or "").casefold() if feed_id else ""
+        full = " ".join(p for p in (title, body, feed_title) if p)
+        return [feed_id, feed_title, title, full]
+
+    def add(self, articles: Iterable) -> None:
+        """Index articles that are not indexed yet (called as pages are appended/merged)."""
+        entries = self._entries
+        for article in articles or []:
+            key = self._key_fn(article)
+            if key is None or key in entries:
+                continue
+            entries[key] = self._build_entry(article)
+
+    def update(self, article) -> None:
+        """Re-index one article after its text changed."""
+        key = self._key_fn(article)
+        if key is not None:
+            self._entries[key] = self._build_entry(article)
+
+    def retain(self, articles: Iterable) -> None:
+        """Drop entries for articles no longer in the view."""
+        keep = {self._key_fn(a) for a in articles or []}
+        for key in [k for k in self._entries if k not in keep]:
+            del self._entries[key]
+
+    def filter(self, articles: Iterable, query: str, title_only: bool = False) -> list:
+        terms = split_query(query)
+        items = list(articles or [])
+        if not terms:
+            return items
+
+        entries = self._entries
+        key_fn = self._key_fn
+        feed_title_fn = self._feed_title_fn
+        feed_titles = {}
+        out = []
+        for article in items:
+            key = key_fn(article)
+            entry = entries.get(key)
+            if entry is None:
+                entry = self._build_entry(article)
+                if key is not None:
+                    entries[key] = entry
+
+            if title_only:
+                text = entry[_TITLE]
+            else:
+                # Feed titles can be renamed while a view is cached; resolve once per feed per query.
+                fid = entry[_FEED_ID]
+                if fid:
+                    current = feed_titles.get(fid)
+                    if current is None:
+                        current = str(feed_title_fn(fid) or "").casefold()
+                        feed_titles[fid] = current
+                    if current != entry[_FEED_TITLE]:
+                        entry[_FULL] = _with_feed_title(entry[_FULL], entry[_FEED_TITLE], current)
+                        entry[_FEED_TITLE] = current
+                text = entry[_FULL]
+
+            for term in terms:
+                if term not in text:
+                    break
+            else:
+                out.append(article)
+        return out
@@ -0,0 +1,409 @@
+"""Host-bucketed index over yt-dlp's extractor URL patterns.
+
+`discovery.is_ytdlp_supported` needs to know which extractors accept a URL.
+Asking all ~1,800 extractors' `suitable()` costs milliseconds per URL, so this
+module reads each `_VALID_URL` once and pulls out literal text that every match
+must contain in the host (e.g. "youtube" for `https?://(?:www\\.)?youtube\\.com/...`).
+Extractors are bucketed under those host keys and a URL only has to try the
+buckets whose keys occur in its host name, plus a small generic bucket of
+extractors whose patterns don't pin the host down.
+
+The index depends only on the installed yt-dlp, so it is written to
+APP_DIR/cache once per yt-dlp version and loaded on later starts.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+from urllib.parse import urlparse
+
+try:
+    from re import _parser as _sre_parse
+    from re import _constants as _sre_c
+except ImportError:  # Python < 3.11
+    import sre_parse as _sre_parse  # type: ignore[no-redef]
+    import sre_constants as _sre_c  # type: ignore[no-redef]
+
+from core.config import APP_DIR
+
+log = logging.getLogger(__name__)
+
+INDEX_DIR = os.path.join(APP_DIR, "cache")
+INDEX_FORMAT = 1
+
+# Text this common would put most extractors in the same bucket, so it is never
+# used as a key; a pattern that offers nothing else goes to the generic bucket.
+_STOP_KEYS = frozenset({"www", "com", "net", "org", "http", "https", "html", "php"})
+_KEY_SPLIT_RE = re.compile(r"[^a-z0-9-]+")
+# Slash count at which the host starts (after "scheme://") and after which it has ended.
+_IN_HOST = 2
+_PAST_HOST = 3
+_SLASH = ord("/")
+_REPEATS = {_sre_c.MAX_REPEAT, _sre_c.MIN_REPEAT}
+if hasattr(_sre_c, "POSSESSIVE_REPEAT"):
+    _REPEATS.add(_sre_c.POSSESSIVE_REPEAT)
+
+
+def _best_key(text: str) -> Optional[str]:
+    """Longest usable label fragment of a literal host run."""
+    best = None
+    for part in _KEY_SPLIT_RE.split(text.lower()):
+        part = part.strip("-")
+        if not part or part in _STOP_KEYS:
+            continue
+        if best is None or len(part) > len(best):
+            best = part
+    return best
+
+
+def _better(a: Optional[Set[str]], b: Optional[Set[str]]) -> Optional[Set[str]]:
+    """Pick the more selective of two key sets (longest weakest key, then fewest keys)."""
+    if not b:
+        return a
+    if not a:
+        return b
+    qa, qb = min(len(k) for k in a), min(len(k) for k in b)
+    if qa != qb:
+        return a if qa > qb else b
+    return a if len(a) <= len(b) else b
+
+
+def _advance(states: Set[int], may_slash: bool) -> Set[int]:
+    if not may_slash:
+        return states
+    return states | {min(s + 1, _PAST_HOST) for s in states}
+
+
+def _class_may_match_slash(items) -> bool:
+    negate = False
+    hit = False
+    for op, av in items:
+        if op is _sre_c.NEGATE:
+            negate = True
+        elif op is _sre_c.LITERAL:
+            hit = hit or av == _SLASH
+        elif op is _sre_c.RANGE:
+            hit = hit or av[0] <= _SLASH <= av[1]
+        elif op is _sre_c.CATEGORY:
+            if av not in (_sre_c.CATEGORY_DIGIT, _sre_c.CATEGORY_WORD, _sre_c.CATEGORY_SPACE):
+                hit = True
+        else:
+            hit = True
+    return hit != negate
+
+
+def _case_literal(items) -> Optional[str]:
+    """The character a class like `[yY]` stands for, if it is just one letter in either case."""
+    chars = set()
+    for op, av in items:
+        if op is not _sre_c.LITERAL:
+            return None
+        chars.add(chr(av).lower())
+    return chars.pop() if len(chars) == 1 else None
+
+
+_DEAD = (set(), None, True, False)
+
+
+def _walk(items, states: Set[int], at_start: bool = False):
+    """Walk a parsed pattern from `states` (possible slash counts so far).
+
+    Returns (states after it, keys, dead, still at start). `keys` is a set one of
+    which every match contains inside the host, or None. `dead` marks a pattern
+    that cannot match an http(s) URL at all, e.g. the "coub:" branch of an
+    extractor that also takes coub: URLs.
+    """
+    best: Optional[Set[str]] = None
+    run: List[str] = []
+
+    def flush():
+        nonlocal best
+        if run:
+            key = _best_key("".join(run))
+            run.clear()
+            if key:
+                best = _better(best, {key})
+
+    for op, av in items:
+        char = None
+        if op is _sre_c.LITERAL:
+            char = chr(av)
+        elif op is _sre_c.IN:
+            char = _case_literal(av)
+        if char is not None:
+            if at_start and char not in ("h", "H"):
+                return _DEAD
+            at_start = False
+            if char in ("/", "?", "#"):
+                flush()
+                states = {min(s + 1, _PAST_HOST) for s in states} if char == "/" else {_PAST_HOST}
+            elif states == {_IN_HOST}:
+                run.append(char)
+            else:
+                flush()
+            continue
+        flush()
+        keys = None
+        if op is _sre_c.SUBPATTERN:
+            states, keys, dead, at_start = _walk(av[-1], states, at_start)
+            if dead:
+                return _DEAD
+        elif hasattr(_sre_c, "ATOMIC_GROUP") and op is _sre_c.ATOMIC_GROUP:
+            states, keys, dead, at_start = _walk(av, states, at_start)
+            if dead:
+                return _DEAD
+        elif op is _sre_c.BRANCH:
+            out: Set[int] = set()
+            union: Optional[Set[str]] = set()
+            live = 0
+            still_at_start = True
+            for branch in av[1]:
+                b_states, b_keys, b_dead, b_at_start = _walk(branch, states, at_start)
+                if b_dead:
+                    continue
+                live += 1
+                out |= b_states
+                still_at_start = still_at_start and b_at_start
+                union = None if (union is None or not b_keys) else union | b_keys
+            if not live:
+                return _DEAD
+            states, keys, at_start = out, union, still_at_start
+        elif op in _REPEATS:
+            lo, hi, body = av
+            body_states, body_keys, dead, body_at_start = _walk(body, states, at_start)
+            if lo == 0 and at_start and not dead and body_states and min(body_states) >= _IN_HOST:
+                # A leading optional "https?://" (or a group that always has one) must be
+                # taken: only http(s) URLs use the index and nothing else could match
+                # the scheme at the start of the URL.
+                lo = 1
+            if dead:
+                if lo:
+                    return _DEAD
+                continue
+            out = set(body_states)
+            if hi is _sre_c.MAXREPEAT or hi > 1:
+                cur = body_states
+                for _ in range(_PAST_HOST):
+                    cur = _walk(body, cur)[0]
+                    out |= cur
+            if lo == 0:
+                out |= states
+                # Whether anything was consumed is unknown now; never call later text dead.
+                at_start = False
+            else:
+                at_start = body_at_start
+            states, keys = out, (body_keys if lo >= 1 else None)
+        elif op is _sre_c.GROUPREF_EXISTS:
+            _group, yes, no = av
+            y_states, y_keys, _y_dead, _ = _walk(yes, states)
+            n_states, n_keys, _n_dead, _ = _walk(no, states) if no is not None else (states, None, False, False)
+            states = y_states | n_states
+            keys = (y_keys | n_keys) if (y_keys and n_keys) else None
+            at_start = False
+        elif op is _sre_c.IN:
+            states = _advance(states, _class_may_match_slash(av))
+            at_start = False
+        elif op is _sre_c.NOT_LITERAL:
+            states = _advance(states, av != _SLASH)
+            at_start = False
+        elif op in (_sre_c.AT, _sre_c.ASSERT, _sre_c.ASSERT_NOT):
+            pass
+        else:
+            # ANY, group references and anything unknown may span a slash.
+            states = _advance(states, True)
+            at_start = False
+        best = _better(best, keys)
+    flush()
+    return states, best, False, at_start
+
+
+def host_keys(pattern: str) -> Optional[Set[str]]:
+    """Host keys one of which every http(s) URL matching `pattern` has in its host.
+
+    An empty set means the pattern never matches an http(s) URL; None means the
+    host could not be pinned down.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except Exception:
+        return None
+    try:
+        _states, keys, dead, _at_start = _walk(parsed, {0}, True)
+    except Exception as e:
+        log.debug("Could not analyse extractor pattern %r: %s", pattern[:80], e)
+        return None
+    if dead:
+        return set()
+    return keys or None
+
+
+def _patterns(extractor_cls) -> List[str]:
+    try:
+        value = getattr(extractor_cls, "_VALID_URL", None)
+    except Exception:
+        return []
+    if value is False or value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, (list, tuple)):
+        return [v for v in value if isinstance(v, str)]
+    return []
+
+
+def _ie_key(extractor_cls) -> str:
+    try:
+        return str(extractor_cls.ie_key())
+    except Exception:
+        return str(getattr(extractor_cls, "__name__", ""))
+
+
+def build_index(extractors: Iterable) -> Dict[str, object]:
+    """{"buckets": {key: [ie_key, ...]}, "generic": [...], "never": [...]} for the given classes.
+
+    "never" lists extractors that cannot match an http(s) URL (search keys,
+    `_VALID_URL = False`, scheme-only patterns like "anvato:...").
+    """
+    buckets: Dict[str, List[str]] = {}
+    generic: List[str] = []
+    never: List[str] = []
+    for extractor_cls in extractors:
+        name = _ie_key(extractor_cls)
+        try:
+            no_urls = getattr(extractor_cls, "_VALID_URL", None) is False
+        except Exception:
+            no_urls = False
+        patterns = _patterns(extractor_cls)
+        if not patterns:
+            (never if no_urls else generic).append(name)
+            continue
+        keys: Optional[Set[str]] = set()
+        for pattern in patterns:
+            pattern_keys = host_keys(pattern)
+            if pattern_keys is None:
+                keys = None
+                break
+            keys |= pattern_keys
+        if keys is None:
+            generic.append(name)
+        elif not keys:
+            never.append(name)
+        else:
+            for key in keys:
+                buckets.setdefault(key, []).append(name)
+    return {"buckets": buckets, "generic": generic, "never": never}
+
+
+def _fingerprint(extractors: List) -> str:
+    names = "\n".join(_ie_key(e) for e in extractors)
+    return hashlib.sha1(names.encode("utf-8", "replace")).hexdigest()
+
+
+def _ytdlp_version() -> str:
+    try:
+        from yt_dlp.version import __version__
+
+        return str(__version__)
+    except Exception:
+        return "unknown"
+
+
+def index_path(version: str) -> str:
+    safe = re.sub(r"[^A-Za-z0-9._-]+", "_", version or "unknown")
+    return os.path.join(INDEX_DIR, f"ytdlp_host_index-{safe}.json")
+
+
+class ExtractorMatcher:
+    """Candidate extractors for a URL, in yt-dlp's own order."""
+
+    def __init__(self, extractors: List, index: Dict[str, object]):
+        self._extractors = list(extractors)
+        by_name: Dict[str, List[int]] = {}
+        for pos, extractor_cls in enumerate(self._extractors):
+            by_name.setdefault(_ie_key(extractor_cls), []).append(pos)
+        known: Set[str] = set()
+        self._buckets: Dict[str, List[int]] = {}
+        for key, names in (index.get("buckets") or {}).items():
+            positions = [pos for n in names for pos in by_name.get(n, ())]
+            known.update(names)
+            if positions:
+                self._buckets[key] = positions
+        known.update(index.get("generic") or [])
+        known.update(index.get("never") or [])
+        generic = {pos for n in (index.get("generic") or []) for pos in by_name.get(n, ())}
+        # Extractors the index doesn't know (plugins, a stale file) are always tried.
+        generic.update(pos for name, positions in by_name.items() if name not in known for pos in positions)
+        self._generic = sorted(generic)
+        self._max_key_len = max((len(k) for k in self._buckets), default=0)
+
+    @property
+    def generic_count(self) -> int:
+        return len(self._generic)
+
+    def candidates(self, url: str) -> List:
+        """Extractors that might accept `url`; all of them for URLs the index can't narrow."""
+        try:
+            parsed = urlparse(url)
+        except Exception:
+            return list(self._extractors)
+        if (parsed.scheme or "").lower() not in ("http", "https") or not parsed.netloc:
+            return list(self._extractors)
+        host = (parsed.hostname or "").lower()
+        positions = set(self._generic)
+        max_len = self._max_key_len
+        for label in host.split("."):
+            n = len(label)
+            for start in range(n):
+                for end in range(start + 1, min(n, start + max_len) + 1):
+                    hit = self._buckets.get(label[start:end])
+                    if hit:
+                        positions.update(hit)
+        return [self._extractors[pos] for pos in sorted(positions)]
+
+
+def _load_index(path: str, fingerprint: str) -> Optional[Dict[str, object]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("format") != INDEX_FORMAT or data.get("fingerprint") != fingerprint:
+        return None
+    return data
+
+
+def _save_index(path: str, data: Dict[str, object]) -> None:
+    tmp = f"{path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp, path)
+    except OSError as e:
+        log.debug("Could not write yt-dlp host index %s: %s", path, e)
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+_matcher_lock = threading.Lock()
+
+
+def load_matcher(extractors: List, version: Optional[str] = None) -> ExtractorMatcher:
+    """Matcher for `extractors`, reading the on-disk index for this yt-dlp version or building it."""
+    extractors = list(extractors)
+    version = version or _ytdlp_version()
+    fingerprint = _fingerprint(extractors)
+    path = index_path(version)
+    with _matcher_lock:
+        data = _load_index(path, fingerprint)
+        if data is None:
+            data = build_index(extractors)
+            data.update({"format": INDEX_FORMAT, "version": version, "fingerprint": fingerprint})
+            _save_index(path, data)
+    return ExtractorMatcher(extractors, data)
@@ -0,0 +1,171 @@
+"""In-process yt-dlp query search.
+
+The global search dialog asks dozens of sites at once. Spawning a `yt-dlp`
+process per site paid interpreter start-up, the yt-dlp import and extractor
+loading every time, usually seconds before any network I/O. This module runs
+the search extractors inside BlindRSS instead: yt-dlp is imported once and
+each worker thread keeps one `YoutubeDL` for all of its queries.
+
+Search extractors produce results lazily, page by page, so entries are pulled
+one at a time. That lets a search stop early on the user's Stop button or on
+its deadline instead of waiting for a child process to exit.
+"""
+
+import itertools
+import logging
+import platform
+import threading
+import time
+from typing import List, Optional
+
+log = logging.getLogger(__name__)
+
+_import_lock = threading.Lock()
+_yt_dlp = None
+_import_failed = False
+
+
+class _QuietLogger:
+    def debug(self, _msg):
+        return
+
+    def warning(self, _msg):
+        return
+
+    def error(self, _msg):
+        return
+
+
+def _load_yt_dlp():
+    global _yt_dlp, _import_failed
+    if _yt_dlp is not None or _import_failed:
+        return _yt_dlp
+    with _import_lock:
+        if _yt_dlp is None and not _import_failed:
+            try:
+                import yt_dlp
+
+                _yt_dlp = yt_dlp
+            except Exception as e:
+                log.debug("yt-dlp module unavailable, searches use the CLI: %s", e)
+                _import_failed = True
+    return _yt_dlp
+
+
+def available() -> bool:
+    """True when the yt_dlp module can be used in-process."""
+    return _load_yt_dlp() is not None
+
+
+class _SearchCancelled(Exception):
+    pass
+
+
+class YtdlpSearchEngine:
+    """Runs `<search_key><n>:<query>` searches on per-thread, long-lived YoutubeDL instances."""
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _base_opts(self, timeout: int) -> dict:
+        from core import utils
+
+        opts = {
+            "quiet": True,
+            "no_warnings": True,
+            "skip_download": True,
+            "extract_flat": True,
+            "socket_timeout": timeout,
+            "noprogress": True,
+            "color": "never",
+            "logger": _QuietLogger(),
+            "user_agent": utils.HEADERS.get("User-Agent", ""),
+        }
+        if platform.system().lower() == "windows":
+            try:
+                from core.dependency_check import _get_startup_info
+
+                opts["subprocess_startupinfo"] = _get_startup_info()
+            except Exception:
+                pass
+        return opts
+
+    def _ydl(self, timeout: int):
+        ydl = getattr(self._local, "ydl", None)
+        if ydl is None:
+            yt_dlp = _load_yt_dlp()
+            if yt_dlp is None:
+                return None
+            ydl = yt_dlp.YoutubeDL(self._base_opts(timeout))
+            self._local.ydl = ydl
+        else:
+            ydl.params["socket_timeout"] = timeout
+        return ydl
+
+    def _drop_ydl(self) -> None:
+        ydl = getattr(self._local, "ydl", None)
+        self._local.ydl = None
+        if ydl is not None:
+            try:
+                ydl.close()
+            except Exception:
+                pass
+
+    def search(
+        self,
+        search_key: str,
+        term: str,
+        limit: int = 10,
+        timeout: int = 15,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Optional[List[dict]]:
+        """Flat search entries, or None when yt-dlp can't run in-process.
+
+        Stops early, returning what it has, when `cancel_event` is set or
+        `timeout` seconds have passed.
+        """
+        ydl = self._ydl(timeout)
+        if ydl is None:
+            return None
+        deadline = time.monotonic() + max(1, int(timeout))
+        out: List[dict] = []
+
+        def _stopped() -> bool:
+            return bool(cancel_event is not None and cancel_event.is_set()) or time.monotonic() >= deadline
+
+        try:
+            info = ydl.extract_info(f"{search_key}{limit}:{term}", download=False, process=False)
+            # Some search keys redirect to a URL that yields the actual playlist.
+            hops = 0
+            while isinstance(info, dict) and info.get("_type") in ("url", "url_transparent") and hops < 2:
+                if _stopped():
+                    raise _SearchCancelled()
+                hops += 1
+                info = ydl.extract_info(info.get("url"), download=False, process=False, ie_key=info.get("ie_key"))
+            entries = info.get("entries") if isinstance(info, dict) else None
+            for entry in itertools.islice(entries or [], limit):
+                if _stopped():
+                    break
+                if not isinstance(entry, dict):
+                    continue
+                out.append(entry)
+        except _SearchCancelled:
+            pass
+        except Exception as e:
+            log.debug("yt-dlp search %s failed: %s", search_key, e)
+            # A failed extractor can leave per-instance state behind; start fresh next time.
+            self._drop_ydl()
+        return out
+
+
+_engine: Optional[YtdlpSearchEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> YtdlpSearchEngine:
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = YtdlpSearchEngine()
+    return _engine
@@ -0,0 +1,154 @@
+import wx
+
+
+class ArticleRowModel:
+    """Rows shown by ArticleListCtrl.
+
+    A row is either an article (cells formatted on demand by `format_cells` and
+    cached per row) or a static row such as "Loading..." / "Load more items".
+    """
+
+    def __init__(self, format_cells, columns: int = 5):
+        self._format_cells = format_cells
+        self._columns = int(columns)
+        self._rows = []
+        self._static = set()
+        self._cells = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def set_articles(self, articles) -> None:
+        self._rows = list(articles or [])
+        self._static = set()
+        self._cells = {}
+
+    def clear(self) -> None:
+        self.set_articles([])
+
+    def is_static(self, row: int) -> bool:
+        return row in self._static
+
+    def article_at(self, row: int):
+        if row in self._static or not (0 <= row < len(self._rows)):
+            return None
+        return self._rows[row]
+
+    def insert_static(self, row: int, label: str) -> int:
+        row = max(0, min(int(row), len(self._rows)))
+        if row < len(self._rows):
+            self._shift(row, 1)
+        self._rows.insert(row, [str(label or "")] + [""] * (self._columns - 1))
+        self._static.add(row)
+        return row
+
+    def set_static_cell(self, row: int, col: int, text: str) -> bool:
+        if row not in self._static or not (0 <= col < self._columns):
+            return False
+        self._rows[row][col] = str(text or "")
+        return True
+
+    def delete(self, row: int) -> None:
+        if not (0 <= row < len(self._rows)):
+            return
+        del self._rows[row]
+        self._static.discard(row)
+        self._cells.pop(row, None)
+        self._shift(row + 1, -1)
+
+    def invalidate(self, row=None) -> None:
+        """Drop cached cell text for one row (or all rows) after the article changed."""
+        if row is None:
+            self._cells = {}
+        else:
+            self._cells.pop(row, None)
+
+    def cell(self, row: int, col: int) -> str:
+        if not (0 <= row < len(self._rows)) or not (0 <= col < self._columns):
+            return ""
+        if row in self._static:
+            return self._rows[row][col]
+        cells = self._cells.get(row)
+        if cells is None:
+            try:
+                cells = tuple(self._format_cells(self._rows[row]))
+            except Exception:
+                cells = ("",) * self._columns
+            self._cells[row] = cells
+        return cells[col] if col < len(cells) else ""
+
+    def _shift(self, start: int, delta: int) -> None:
+        # Rows at/after `start` move by `delta`; static markers and cached cells move with them.
+        self._static = {r + delta if r >= start else r for r in self._static}
+        if self._cells:
+            self._cells = {r + delta if r >= start else r: c for r, c in self._cells.items()}
+
+
+class ArticleListCtrl(wx.ListCtrl):
+    """Virtual (LC_VIRTUAL) report list for articles.
+
+    Cell text is pulled from an ArticleRowModel only for rows the control actually
+    draws (or a screen reader asks for), so repopulating is O(visible rows).
+    InsertItem/SetItem/DeleteItem/DeleteAllItems/GetItemText keep their usual
+    meaning so existing callers that add static rows keep working.
+    """
+
+    def __init__(self, parent, format_cells, columns: int = 5, style: int = wx.LC_REPORT):
+        super().__init__(parent, style=style | wx.LC_VIRTUAL)
+        self.model = ArticleRowModel(format_cells, columns=columns)
+
+    def OnGetItemText(self, item, column):
+        return self.model.cell(item, column)
+
+    def _sync_count(self) -> None:
+        self.SetItemCount(len(self.model))
+
+    def set_articles(self, articles) -> None:
+        """Replace all rows with articles; resets selection/focus like DeleteAllItems."""
+        super().DeleteAllItems()
+        self.model.set_articles(articles)
+        self._sync_count()
+        self.Refresh()
+
+    def refresh_rows(self, rows=None) -> None:
+        """Re-format rows whose article changed (read/favorite state, title)."""
+        if rows is None:
+            self.model.invalidate()
+            self.Refresh()
+            return
+        for row in rows:
+            self.model.invalidate(row)
+            if 0 <= row < self.GetItemCount():
+                self.RefreshItem(row)
+
+    def DeleteAllItems(self):
+        super().DeleteAllItems()
+        self.model.clear()
+        self._sync_count()
+        return True
+
+    def InsertItem(self, index, label="", imageIndex=-1):
+        row = self.model.insert_static(index, label)
+        self._sync_count()
+        self.RefreshItems(row, max(row, self.GetItemCount() - 1))
+        return row
+
+    def SetItem(self, index, column=0, label="", imageId=-1):
+        if not self.model.set_static_cell(index, column, label):
+            # Article rows are derived from the article itself; just re-read it.
+            self.model.invalidate(index)
+        if 0 <= index < self.GetItemCount():
+            self.RefreshItem(index)
+        return True
+
+    def DeleteItem(self, item):
+        if not (0 <= item < len(self.model)):
+            return False
+        self.model.delete(item)
+        self._sync_count()
+        if self.GetItemCount() > 0:
+            self.RefreshItems(min(item, self.GetItemCount() - 1), self.GetItemCount() - 1)
+        return True
+
+    def GetItemText(self, item, col=0):
+        return self.model.cell(item, col)
@@ -22,12 +22,13 @@ from core.discovery import (
     search_piefed_feeds,
 )
 from core import utils
-from core.casting import CastingManager
 from core import inoreader_oauth
-from core import translation as translation_mod
+from core.lazy_import import lazy_module
 
 log = logging.getLogger(__name__)
 
+translation_mod = lazy_module("core.translation")
+
 
 class AddFeedDialog(wx.Dialog):
     def __init__(self, parent, categories=None):
@@ -619,6 +620,13 @@ class SettingsDialog(wx.Dialog):
         self.cache_full_text_chk = wx.CheckBox(general_panel, label="Cache full text in background")
         self.cache_full_text_chk.SetValue(bool(config.get("cache_full_text", False)))
         general_sizer.Add(self.cache_full_text_chk, 0, wx.ALL, 5)
+
+        # Local mirror of hosted accounts
+        self.article_mirror_chk = wx.CheckBox(
+            general_panel, label="Keep a local copy of hosted account articles (uses API requests)"
+        )
+        self.article_mirror_chk.SetValue(bool(config.get("hosted_article_mirror", False)))
+        general_sizer.Add(self.article_mirror_chk, 0, wx.ALL, 5)
         
         # Downloads
         self.downloads_chk = wx.CheckBox(general_panel, label="Enable Downloads")
@@ -1775,6 +1783,8 @@ class SettingsDialog(wx.Dialog):
                 "token": access_token,
                 "refresh_token": refresh_token or "",
                 "token_expires_at": expires_at,
+                # Keys the account's mirror, page cache and startup snapshot.
+                "account_id": inoreader_oauth.account_key(access_token, app_id, app_key),
             }
             wx.CallAfter(self._on_inoreader_oauth_success, token_payload)
         except Exception as exc:
@@ -1805,6 +1815,7 @@ class SettingsDialog(wx.Dialog):
             "token": "",
             "refresh_token": "",
             "token_expires_at": 0,
+            "account_id": "",
         }
         self._set_inoreader_status("Not authorized", ok=False)
 
@@ -1967,6 +1978,7 @@ class SettingsDialog(wx.Dialog):
                     p_cfg["token"] = ""
                     p_cfg["refresh_token"] = ""
                     p_cfg["token_expires_at"] = 0
+                    p_cfg["account_id"] = ""
             providers["inoreader"] = p_cfg
 
         return {
@@ -1984,6 +1996,7 @@ class SettingsDialog(wx.Dialog):
             "range_cache_debug": self.range_cache_debug_chk.GetValue(),
             "max_cached_views": self.cache_ctrl.GetValue(),
             "cache_full_text": self.cache_full_text_chk.GetValue(),
+            "hosted_article_mirror": self.article_mirror_chk.GetValue(),
             "downloads_enabled": self.downloads_chk.GetValue(),
             "download_path": self.dl_path_ctrl.GetValue(),
             "download_retention": self.retention_ctrl.GetValue(),
@@ -2729,7 +2742,7 @@ class FeedSearchDialog(wx.Dialog):
 
 class YtdlpGlobalSearchDialog(wx.Dialog):
     _ALL_SITES_TOKEN = "__all__"
-    _SEARCH_CONCURRENCY = 4
+    _SEARCH_CONCURRENCY = 8
     _PER_SITE_LIMIT = 80
     _LOAD_MORE_STEP = 80
     _PER_SITE_TIMEOUT_S = 12
@@ -3730,40 +3743,43 @@ class YtdlpGlobalSearchDialog(wx.Dialog):
         cancelled = False
 
         max_workers = max(1, min(self._SEARCH_CONCURRENCY, total or 1))
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
         try:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
-                future_map = {}
-                for site in (sites or []):
-                    if self._stop_event.is_set():
-                        cancelled = True
-                        break
-                    fut = pool.submit(
-                        search_ytdlp_site,
-                        term,
-                        site,
-                        int(per_site_limit),
-                        self._PER_SITE_TIMEOUT_S,
-                    )
-                    future_map[fut] = site
-
-                for fut in concurrent.futures.as_completed(list(future_map.keys())):
-                    site = future_map.get(fut) or {}
-                    completed += 1
-                    if self._stop_event.is_set():
-                        cancelled = True
-                    items = []
-                    error_msg = ""
-                    try:
-                        items = list(fut.result() or [])
-                    except Exception as e:
-                        error_msg = str(e) or type(e).__name__
-                    try:
-                        wx.CallAfter(self._on_site_search_results, site, items, completed, total, error_msg)
-                    except Exception:
-                        pass
-                    if cancelled:
-                        break
+            future_map = {}
+            for site in (sites or []):
+                if self._stop_event.is_set():
+                    cancelled = True
+                    break
+                fut = pool.submit(
+                    search_ytdlp_site,
+                    term,
+                    site,
+                    int(per_site_limit),
+                    self._PER_SITE_TIMEOUT_S,
+                    self._stop_event,
+                )
+                future_map[fut] = site
+
+            for fut in concurrent.futures.as_completed(list(future_map.keys())):
+                site = future_map.get(fut) or {}
+                completed += 1
+                if self._stop_event.is_set():
+                    cancelled = True
+                items = []
+                error_msg = ""
+                try:
+                    items = list(fut.result() or [])
+                except Exception as e:
+                    error_msg = str(e) or type(e).__name__
+                try:
+                    wx.CallAfter(self._on_site_search_results, site, items, completed, total, error_msg)
+                except Exception:
+                    pass
+                if cancelled:
+                    break
         finally:
+            # Sites still queued are dropped; running searches see the stop event and return.
+            pool.shutdown(wait=not cancelled, cancel_futures=cancelled)
             try:
                 wx.CallAfter(self._on_search_finished, completed, total, cancelled, bool(append_mode), int(per_site_limit))
             except Exception:
@@ -20,15 +20,19 @@ from .dialogs import (
     AboutDialog,
     PersistentSearchDialog,
 )
-from .player import PlayerFrame
 from .tray import BlindRSSTrayIcon
+from .article_list import ArticleListCtrl
 from .hotkeys import HoldRepeatHotkeys
 from providers.base import RSSProvider
 from core.config import APP_DIR
-from core.models import Article
+from core.models import Article, approx_article_bytes, article_cache_key
 from core import utils
-from core import article_extractor
-from core import translation as translation_mod
+from core.lazy_import import lazy_module
+from core.view_search import ViewSearchIndex, split_query as split_search_query
+from core import change_feed
+from core import startup_snapshot
+from core.read_state_queue import ReadStateQueue
+from core import view_delta
 from core import updater
 from core import windows_integration
 from core.version import APP_VERSION
@@ -37,6 +41,10 @@ import core.discovery
 
 log = logging.getLogger(__name__)
 
+# Not needed until the user opens full text or translates; see core.lazy_import.
+article_extractor = lazy_module("core.article_extractor")
+translation_mod = lazy_module("core.translation")
+
 try:
     EVT_NOTIFICATION_MESSAGE_CLICK = wx.PyEventBinder(wx.adv.wxEVT_NOTIFICATION_MESSAGE_CLICK, 1)
     EVT_NOTIFICATION_MESSAGE_ACTION = wx.PyEventBinder(wx.adv.wxEVT_NOTIFICATION_MESSAGE_ACTION, 1)
@@ -46,10 +54,20 @@ except Exception:
     EVT_NOTIFICATION_MESSAGE_ACTION = None
     EVT_NOTIFICATION_MESSAGE_DISMISSED = None
 
+# Evicted views are kept as id-only stubs; beyond this many the oldest stubs are dropped entirely.
+MAX_VIEW_CACHE_STUBS = 200
+
 # Use a long, finite timeout for actionable toasts.
 # On some backends Timeout_Never can be treated as immediate-dismiss.
 ACTIONABLE_NOTIFICATION_TIMEOUT_SECONDS = 25
 
+# Only the top of a freshly loaded list is checked for cached streams to refresh.
+STREAM_REFRESH_SCAN_LIMIT = 50
+# Articles after the focused one whose media is resolved speculatively.
+MEDIA_PREFETCH_AHEAD = 1
+# Coalesce snapshot writes after a burst of tree rebuilds.
+STARTUP_SNAPSHOT_SAVE_DELAY_MS = 3000
+
 
 class MainFrame(wx.Frame):
     def __init__(self, provider: RSSProvider, config_manager):
@@ -73,6 +91,10 @@ class MainFrame(wx.Frame):
         self.view_cache = {}
         self._view_cache_lock = threading.Lock()
         self.max_cached_views = int(self.config_manager.get("max_cached_views", 15))
+        try:
+            self.view_cache_max_bytes = int(float(self.config_manager.get("view_cache_max_mb", 96)) * 1024 * 1024)
+        except Exception:
+            self.view_cache_max_bytes = 96 * 1024 * 1024
 
         self.current_feed_id = None
         self._loading_more_placeholder = False
@@ -85,6 +107,10 @@ class MainFrame(wx.Frame):
         # Create player window lazily to keep startup fast.
         self.player_window = None
 
+        # Last live (feeds are read from feed_map) categories/hierarchy, for the startup snapshot.
+        self._startup_snapshot_tree = None
+        self._startup_snapshot_save_calllater = None
+
         # Custom hold-to-repeat for media keys (prevents multi-seek on quick tap)
         self._media_hotkeys = HoldRepeatHotkeys(self, hold_delay_s=2.0, repeat_interval_s=0.12, poll_interval_ms=15)
         
@@ -99,6 +125,16 @@ class MainFrame(wx.Frame):
         self._refresh_progress_pending = {}
         self._refresh_progress_flush_scheduled = False
 
+        # Article deltas published by the provider's store (core.change_feed), applied to loaded views.
+        self._article_change_lock = threading.Lock()
+        self._article_changes_pending = []
+        self._article_changes_flush_scheduled = False
+        self._article_change_apply_lock = threading.Lock()
+        self._article_change_token = change_feed.subscribe(self._on_article_changes)
+
+        # Read/unread toggles are coalesced and written in batches off the UI thread.
+        self._read_state_queue = ReadStateQueue(self.provider)
+
         self._unread_filter_enabled = False
         self._is_first_tree_load = True
         self._search_query = ""
@@ -107,6 +143,7 @@ class MainFrame(wx.Frame):
         self._base_view_id = None
         self._search_base_articles = None
         self._search_base_view_id = None
+        self._adhoc_search_index = None
         self._persistent_searches = []
         self._persistent_search_menu = None
         self._persistent_search_items = {}
@@ -137,12 +174,15 @@ class MainFrame(wx.Frame):
         self.refresh_thread = threading.Thread(target=self.refresh_loop, daemon=True)
         self.refresh_thread.start()
         
-        # Initial load
+        # Initial load: show the last session's tree/list right away, then reconcile with live data.
+        self._apply_startup_snapshot()
         self.refresh_feeds()
         wx.CallAfter(self._apply_startup_window_state)
         wx.CallAfter(self._focus_default_control)
         wx.CallLater(15000, self._maybe_auto_check_updates)
         wx.CallLater(4000, self._check_media_dependencies)
+        # yt-dlp's extractor table is only needed to classify/play media links; load it once the window is up.
+        wx.CallLater(1000, core.discovery.preload_ytdlp_extractors)
 
     def _start_critical_worker(self, target, args=(), *, name: str | None = None) -> None:
         """Start a tracked daemon thread for critical operations (e.g. destructive DB work).
@@ -293,7 +333,7 @@ class MainFrame(wx.Frame):
         right_splitter = wx.SplitterWindow(right_panel)
         
         # Top Right: List (Articles)
-        self.list_ctrl = wx.ListCtrl(right_splitter, style=wx.LC_REPORT | wx.LC_SINGLE_SEL)
+        self.list_ctrl = ArticleListCtrl(right_splitter, self._article_list_cells, style=wx.LC_REPORT | wx.LC_SINGLE_SEL)
         self.list_ctrl.SetName("Articles List")
         self.list_ctrl.InsertColumn(0, "Title", width=350)
         self.list_ctrl.InsertColumn(1, "Author", width=120)
@@ -329,6 +369,8 @@ class MainFrame(wx.Frame):
         self._fulltext_cache_source = {}
         self._fulltext_token = 0
         self._fulltext_loading_url = None
+        # Cache key of the article whose streamed translation is currently shown.
+        self._translation_partial_key = None
         # Debounce full-text extraction when moving through the list quickly.
         self._fulltext_debounce = None
         self._fulltext_debounce_ms = 350
@@ -347,6 +389,11 @@ class MainFrame(wx.Frame):
         self._chapters_debounce = None
         self._chapters_debounce_ms = 500
 
+        # Full-text index searches run on a worker; results older than the token are dropped.
+        self._search_index_debounce = None
+        self._search_index_debounce_ms = 250
+        self._search_index_token = 0
+
         # Store article objects for the list
         self.current_articles = []
         self._base_articles = []
@@ -607,47 +654,132 @@ class MainFrame(wx.Frame):
                 top_article_id = self._article_cache_id(self.current_articles[top_idx])
         return top_article_id
 
-    def _article_search_text(self, article) -> str:
-        if not article:
-            return ""
-        parts = []
-        mode = getattr(self, "_search_mode", "title_content")
+    def _search_provider_index(self, query: str, feed_id, title_only: bool, limit: int):
+        """Query the provider's full-text index for a view (worker thread). Returns (matches, total)."""
+        prov = getattr(self, "provider", None)
+        if not query or not feed_id or not prov:
+            return [], 0
         try:
-            parts.append(getattr(article, "title", "") or "")
-            if mode != "title_only":
-                parts.append(getattr(article, "content", "") or "")
-                parts.append(getattr(article, "author", "") or "")
-                parts.append(getattr(article, "url", "") or "")
-                parts.append(getattr(article, "media_url", "") or "")
+            if not prov.supports_article_search():
+                return [], 0
+            return prov.search_articles(query, feed_id=feed_id, limit=limit, title_only=title_only)
         except Exception:
-            pass
-        if mode != "title_only":
+            log.exception("Indexed article search failed")
+            return [], 0
+
+    def _schedule_indexed_search(self):
+        """Look for matches beyond the loaded pages in the provider's index, off the UI thread (debounced)."""
+        self._search_index_token = getattr(self, "_search_index_token", 0) + 1
+        if getattr(self, "_search_index_debounce", None) is not None:
             try:
-                feed_title = ""
-                feed_id = getattr(article, "feed_id", None)
-                if feed_id:
-                    feed = self.feed_map.get(feed_id)
-                    if feed:
-                        feed_title = feed.title or ""
-                if feed_title:
-                    parts.append(feed_title)
+                self._search_index_debounce.Stop()
             except Exception:
                 pass
-        return " ".join([p for p in parts if p]).lower()
+            self._search_index_debounce = None
+        query = (self._search_query or "").strip()
+        fid = getattr(self, "current_feed_id", None)
+        if not query or not fid:
+            return
+        try:
+            st = (self.view_cache or {}).get(fid)
+        except Exception:
+            st = None
+        # The whole view is in memory, so the in-memory filter already saw everything.
+        if st and bool(st.get("fully_loaded", False)):
+            return
+        self._search_index_debounce = wx.CallLater(
+            getattr(self, "_search_index_debounce_ms", 250), self._start_indexed_search, self._search_index_token, query, fid
+        )
+
+    def _start_indexed_search(self, token, query, feed_id):
+        self._search_index_debounce = None
+        if token != self._search_index_token or not self._is_search_active():
+            return
+        title_only = getattr(self, "_search_mode", "title_content") == "title_only"
+        try:
+            limit = int(self.config_manager.get("search_index_max_results", 500) or 500)
+        except Exception:
+            limit = 500
+
+        def _worker():
+            matches, total = self._search_provider_index(query, feed_id, title_only, limit)
+            wx.CallAfter(self._apply_indexed_search_results, token, feed_id, matches, total)
+
+        threading.Thread(target=_worker, daemon=True).start()
+
+    def _apply_indexed_search_results(self, token, feed_id, matches, total):
+        if token != self._search_index_token or not self._is_search_active():
+            return
+        if feed_id != getattr(self, "current_feed_id", None) or not (matches or total):
+            return
+        focused_id, top_id, selected_id, load_more_selected = self._capture_list_view_state()
+        shown = list(self.current_articles or [])
+        seen = {self._article_cache_id(a) for a in shown}
+        for article in matches or []:
+            key = self._article_cache_id(article)
+            if key not in seen:
+                seen.add(key)
+                shown.append(article)
+        self.current_articles = self._sort_articles_for_display(shown)
+
+        base_count = len(self._get_base_articles_for_current_view() or [])
+        self._remove_loading_more_placeholder()
+        self._render_articles_list(self.current_articles, empty_label="No matches.")
+        show_more = self._should_show_load_more_placeholder(base_count)
+        if show_more:
+            self._add_loading_more_placeholder()
+        if load_more_selected and show_more:
+            wx.CallAfter(self._restore_load_more_focus)
+        else:
+            wx.CallAfter(self._restore_list_view, focused_id, top_id, selected_id)
+        try:
+            self._reset_fulltext_prefetch(self.current_articles)
+        except Exception:
+            pass
+        try:
+            self.SetStatusText(f"Filter: {len(self.current_articles)} shown, {total} in database")
+        except Exception:
+            pass
+
+    def _feed_title_for_search(self, feed_id) -> str:
+        try:
+            feed = self.feed_map.get(feed_id) if feed_id else None
+            return (feed.title or "") if feed else ""
+        except Exception:
+            return ""
+
+    def _view_search_index(self, view_id=None, create: bool = True):
+        """Return the precomputed search index for a cached view (built on first use)."""
+        if view_id is None:
+            view_id = getattr(self, "current_feed_id", None)
+        st = None
+        if view_id:
+            try:
+                st = (self.view_cache or {}).get(view_id)
+            except Exception:
+                st = None
+        if st is None:
+            # Lists that don't belong to a cached view still benefit from reuse across keystrokes.
+            adhoc = getattr(self, "_adhoc_search_index", None)
+            if adhoc is not None and adhoc[0] == view_id:
+                return adhoc[1]
+            if not create:
+                return None
+            idx = ViewSearchIndex(self._article_cache_id, self._feed_title_for_search)
+            self._adhoc_search_index = (view_id, idx)
+            return idx
+        idx = st.get("search_index")
+        if idx is None and create:
+            idx = ViewSearchIndex(self._article_cache_id, self._feed_title_for_search)
+            st["search_index"] = idx
+        return idx
 
     def _filter_articles(self, articles, query: str):
-        query = (query or "").strip().lower()
-        if not query:
-            return list(articles or [])
-        terms = [t for t in re.split(r"\s+", query) if t]
-        if not terms:
+        if not split_search_query(query):
             return list(articles or [])
-        filtered = []
-        for article in (articles or []):
-            text = self._article_search_text(article)
-            if all(term in text for term in terms):
-                filtered.append(article)
-        return filtered
+        index = self._view_search_index()
+        title_only = getattr(self, "_search_mode", "title_content") == "title_only"
+        return index.filter(articles, query, title_only=title_only)
 
     def _capture_list_view_state(self):
         focused_idx = self.list_ctrl.GetFocusedItem()
@@ -667,26 +799,28 @@ class MainFrame(wx.Frame):
 
         return focused_article_id, top_article_id, selected_article_id, (focused_on_load_more or selected_on_load_more)
 
+    def _article_list_cells(self, article):
+        """Cell text for one article row; the virtual list asks only for rows it shows."""
+        feed_title = ""
+        if article.feed_id:
+            feed = self.feed_map.get(article.feed_id)
+            if feed:
+                feed_title = feed.title or ""
+        return (
+            self._get_display_title(article),
+            article.author or "",
+            utils.humanize_article_date(article.date),
+            feed_title,
+            "Read" if article.is_read else "Unread",
+        )
+
     def _render_articles_list(self, articles, empty_label: str = "No articles found.") -> None:
-        self.list_ctrl.DeleteAllItems()
         if not articles:
+            self.list_ctrl.DeleteAllItems()
             self.list_ctrl.InsertItem(0, empty_label)
             return
-
-        self.list_ctrl.Freeze()
-        for i, article in enumerate(articles):
-            idx = self.list_ctrl.InsertItem(i, self._get_display_title(article))
-            feed_title = ""
-            if article.feed_id:
-                feed = self.feed_map.get(article.feed_id)
-                if feed:
-                    feed_title = feed.title or ""
-
-            self.list_ctrl.SetItem(idx, 1, article.author or "")
-            self.list_ctrl.SetItem(idx, 2, utils.humanize_article_date(article.date))
-            self.list_ctrl.SetItem(idx, 3, feed_title)
-            self.list_ctrl.SetItem(idx, 4, "Read" if article.is_read else "Unread")
-        self.list_ctrl.Thaw()
+        # Virtual list: only visible rows get formatted, so this is cheap for any view size.
+        self.list_ctrl.set_articles(articles)
 
     def _bind_search_tab_escape(self):
         def _handle_tab(event):
@@ -889,6 +1023,9 @@ class MainFrame(wx.Frame):
         except Exception:
             pass
 
+        # Views that are only partially paged in can still have matches in the database.
+        self._schedule_indexed_search()
+
     def _clear_search_filter(self, force: bool = False):
         if not force and not self._is_search_active():
             self._search_active = False
@@ -965,6 +1102,9 @@ class MainFrame(wx.Frame):
         if pw:
             return pw
         try:
+            # Imported on first use: the player pulls in python-vlc, casting and the stream proxies.
+            from .player import PlayerFrame
+
             pw = PlayerFrame(self, self.config_manager)
         except Exception:
             log.exception("Failed to create player window")
@@ -1044,37 +1184,103 @@ class MainFrame(wx.Frame):
             else:
                 st["last_access"] = time.time()
 
-            # LRU prune
+            self._prune_view_cache_locked()
+            return st
+
+    def _view_state_bytes(self, st) -> int:
+        """Approximate memory held by one cached view (articles plus search index)."""
+        if st.get("stub"):
+            return 64 * len(st.get("stub_ids") or ())
+        articles = st.get("articles") or []
+        idx = st.get("search_index")
+        sig = (id(articles), len(articles), len(idx) if idx is not None else 0)
+        if st.get("bytes_sig") == sig:
+            return int(st.get("bytes") or 0)
+        total = 0
+        for a in articles:
+            total += approx_article_bytes(a)
+        total += 48 * len(st.get("id_set") or ())
+        if idx is not None:
             try:
-                max_views = int(getattr(self, "max_cached_views", 15))
+                total += idx.approx_bytes()
             except Exception:
-                max_views = 15
-
-            if max_views > 0 and len(self.view_cache) > max_views:
-                # Evict least recently used views, but never evict the current view.
-                current = getattr(self, "current_feed_id", None)
-                items = []
-                for k, v in list(self.view_cache.items()):
-                    if k == current:
-                        continue
-                    ts = 0.0
-                    try:
-                        ts = float(v.get("last_access", 0.0))
-                    except Exception:
-                        ts = 0.0
-                    items.append((ts, k))
-                items.sort()
-                while len(self.view_cache) > max_views and items:
-                    _, victim = items.pop(0)
-                    self.view_cache.pop(victim, None)
+                pass
+        st["bytes_sig"] = sig
+        st["bytes"] = total
+        return total
 
-            return st
+    def _stub_view_state(self, st) -> None:
+        """Drop a view's articles but keep enough to rebuild it from the DB: ids, paging, scroll."""
+        st["stub_ids"] = [a.id for a in (st.get("articles") or []) if getattr(a, "id", None)]
+        st["stub"] = True
+        st["articles"] = []
+        st["id_set"] = set()
+        st["search_index"] = None
+        st.pop("bytes_sig", None)
+        st.pop("bytes", None)
+
+    def _prune_view_cache_locked(self) -> None:
+        """LRU-evict cached views by total memory budget and view count. Caller holds _view_cache_lock."""
+        try:
+            max_views = int(getattr(self, "max_cached_views", 15))
+        except Exception:
+            max_views = 15
+        try:
+            max_bytes = int(getattr(self, "view_cache_max_bytes", 0))
+        except Exception:
+            max_bytes = 0
+
+        # Never evict the current view.
+        current = getattr(self, "current_feed_id", None)
+        live = []
+        stubs = []
+        total_bytes = 0
+        for k, v in list(self.view_cache.items()):
+            try:
+                ts = float(v.get("last_access", 0.0))
+            except Exception:
+                ts = 0.0
+            if v.get("stub"):
+                stubs.append((ts, k))
+                continue
+            size = self._view_state_bytes(v)
+            total_bytes += size
+            if k != current:
+                live.append((ts, k, size))
+        live.sort()
+
+        live_count = len(live) + (1 if current in self.view_cache and not self.view_cache[current].get("stub") else 0)
+        while live and ((max_bytes > 0 and total_bytes > max_bytes) or (max_views > 0 and live_count > max_views)):
+            ts, victim, size = live.pop(0)
+            st = self.view_cache.get(victim)
+            if st is None:
+                continue
+            self._stub_view_state(st)
+            total_bytes -= size
+            live_count -= 1
+            stubs.append((ts, victim))
+
+        if len(stubs) > MAX_VIEW_CACHE_STUBS:
+            stubs.sort()
+            for _ts, victim in stubs[: len(stubs) - MAX_VIEW_CACHE_STUBS]:
+                if victim != current:
+                    self.view_cache.pop(victim, None)
 
     def _select_view(self, feed_id: str):
         """Switch the UI to a view, using cached articles when available."""
         if not feed_id:
             return
 
+        # Remember where the outgoing view was scrolled in case it gets evicted to a stub.
+        prev_id = getattr(self, "current_feed_id", None)
+        if prev_id and prev_id != feed_id:
+            try:
+                prev_st = (self.view_cache or {}).get(prev_id)
+                if prev_st is not None and not prev_st.get("stub"):
+                    prev_st["restore_ids"] = tuple(self._capture_list_view_state()[:3])
+            except Exception:
+                pass
+
         self.current_feed_id = feed_id
         self.content_ctrl.Clear()
         self.selected_article_id = None
@@ -1082,6 +1288,9 @@ class MainFrame(wx.Frame):
         # If we have cached articles for this view, render them immediately.
         with getattr(self, "_view_cache_lock", threading.Lock()):
             st = self.view_cache.get(feed_id)
+        if st and st.get("stub"):
+            self._rehydrate_view(feed_id, st)
+            return
         if st and isinstance(st.get("articles"), list) and st.get("articles"):
             base_articles = list(st.get("articles") or [])
             self._set_base_articles(base_articles, feed_id)
@@ -1109,11 +1318,12 @@ class MainFrame(wx.Frame):
             except Exception:
                 pass
 
-            # Start a cheap top-up (latest page) in the background.
+            # Start a cheap top-up (latest page) in the background; snapshot pages are
+            # replaced by the live first page instead.
             self.current_request_id = time.time()
             threading.Thread(
                 target=self._load_articles_thread,
-                args=(feed_id, self.current_request_id, False),
+                args=(feed_id, self.current_request_id, False, bool(st.get("snapshot"))),
                 daemon=True,
             ).start()
             return
@@ -1140,6 +1350,70 @@ class MainFrame(wx.Frame):
         # No cache yet: do fast-first + background history.
         self._begin_articles_load(feed_id, full_load=True, clear_list=True)
 
+    def _rehydrate_view(self, feed_id: str, st) -> None:
+        """Rebuild an evicted (stub) view from the local store by id, then top it up."""
+        ids = list(st.get("stub_ids") or [])
+        meta = {
+            "total": st.get("total"),
+            "page_size": st.get("page_size") or self.article_page_size,
+            "paged_offset": st.get("paged_offset", 0),
+            "fully_loaded": bool(st.get("fully_loaded", False)),
+            "restore_ids": st.get("restore_ids"),
+        }
+        self._set_base_articles([], feed_id)
+        self._remove_loading_more_placeholder()
+        self.list_ctrl.DeleteAllItems()
+        self.list_ctrl.InsertItem(0, "Loading...")
+        self.current_request_id = time.time()
+        threading.Thread(
+            target=self._rehydrate_view_thread,
+            args=(feed_id, self.current_request_id, ids, meta),
+            daemon=True,
+        ).start()
+
+    def _rehydrate_view_thread(self, feed_id, request_id, ids, meta):
+        articles = []
+        if ids:
+            try:
+                articles = self.provider.get_articles_by_ids(ids) or []
+            except Exception:
+                log.exception("Failed to re-hydrate cached view %s", feed_id)
+                articles = []
+        if not articles:
+            # Remote providers have no local store to re-hydrate from; load the view normally.
+            wx.CallAfter(self._rehydrate_view_fallback, feed_id, request_id)
+            return
+
+        articles.sort(key=lambda a: (a.timestamp, self._article_cache_id(a)), reverse=True)
+        wx.CallAfter(self._apply_rehydrated_view, feed_id, request_id, articles, meta)
+        # Same cheap top-up a cached view gets, so new entries since eviction appear.
+        self._load_articles_thread(feed_id, request_id, False)
+
+    def _rehydrate_view_fallback(self, feed_id, request_id):
+        if request_id != getattr(self, "current_request_id", None) or feed_id != getattr(self, "current_feed_id", None):
+            return
+        with getattr(self, "_view_cache_lock", threading.Lock()):
+            self.view_cache.pop(feed_id, None)
+        self._begin_articles_load(feed_id, full_load=True, clear_list=True)
+
+    def _apply_rehydrated_view(self, feed_id, request_id, articles, meta):
+        if request_id != getattr(self, "current_request_id", None) or feed_id != getattr(self, "current_feed_id", None):
+            return
+        self._populate_articles(articles, request_id, meta.get("total"), meta.get("page_size"))
+        st = self._ensure_view_state(feed_id)
+
+        # Paging progress belongs to the provider's page order, not the rows we re-loaded.
+        st["paged_offset"] = meta.get("paged_offset") or len(articles)
+        st["fully_loaded"] = bool(meta.get("fully_loaded"))
+        if st["fully_loaded"]:
+            self._remove_loading_more_placeholder()
+        else:
+            self._add_loading_more_placeholder()
+
+        restore = meta.get("restore_ids")
+        if restore:
+            wx.CallAfter(self._restore_list_view, *restore)
+
     def _resume_history_thread(self, feed_id: str, request_id):
         """Continue paging older entries from the last cached offset for this view."""
         page_size = self.article_page_size
@@ -2281,10 +2555,53 @@ class MainFrame(wx.Frame):
             elif retention_str == "5 years": days = 1825
             
             if days is not None:
-                cleanup_old_articles(days)
+                deleted = cleanup_old_articles(
+                    days,
+                    progress_cb=self._on_retention_progress,
+                    should_stop=self.stop_event.is_set,
+                )
+                if deleted:
+                    wx.CallAfter(self._schedule_db_maintenance)
         except Exception as e:
             log.error(f"Retention cleanup failed: {e}")
 
+    def _on_retention_progress(self, deleted: int, total: int) -> None:
+        try:
+            wx.CallAfter(self.SetStatusText, f"Removing old articles: {deleted} of {total}")
+        except Exception:
+            pass
+
+    def _schedule_db_maintenance(self, delay_ms: int = 60000) -> None:
+        """Reclaim freed DB pages once the app has been idle for a while (debounced)."""
+        timer = getattr(self, "_db_maintenance_timer", None)
+        try:
+            if timer is not None and timer.IsRunning():
+                timer.Stop()
+        except Exception:
+            pass
+        self._db_maintenance_timer = wx.CallLater(int(delay_ms), self._start_db_maintenance)
+
+    def _start_db_maintenance(self) -> None:
+        self._db_maintenance_timer = None
+        if self.stop_event.is_set():
+            return
+        if self._refresh_guard.locked():
+            # A refresh is writing; try again later rather than competing for the write lock.
+            self._schedule_db_maintenance()
+            return
+
+        def _should_stop():
+            return self.stop_event.is_set() or self._refresh_guard.locked()
+
+        def _worker():
+            try:
+                from core.db import reclaim_free_pages
+                reclaim_free_pages(should_stop=_should_stop)
+            except Exception:
+                log.exception("Database maintenance failed")
+
+        threading.Thread(target=_worker, daemon=True).start()
+
     def _run_refresh(self, block: bool, force: bool = False) -> bool:
         """Run provider.refresh with optional blocking guard to avoid overlap.
         
@@ -2335,6 +2652,7 @@ class MainFrame(wx.Frame):
 
             if self.provider.refresh(progress_cb, force=force):
                 wx.CallAfter(self.refresh_feeds)
+            wx.CallAfter(self._show_request_quota)
             if (
                 suppressed.get("count", 0) > 0
                 and bool(self.config_manager.get("windows_notifications_show_summary_when_capped", True))
@@ -2358,6 +2676,24 @@ class MainFrame(wx.Frame):
             except Exception:
                 pass
 
+    def _show_request_quota(self) -> None:
+        """Show how much of a metered provider's API quota is left (e.g. Inoreader's daily limit)."""
+        try:
+            quota = self.provider.get_request_quota()
+        except Exception:
+            quota = None
+        if not quota:
+            return
+        text = f"{self.provider.get_name()} API: {quota.get('remaining')} of {quota.get('limit')} requests left"
+        reset_in = quota.get("reset_in_s")
+        if reset_in:
+            hours, minutes = divmod(int(reset_in) // 60, 60)
+            text += f", resets in {hours}h {minutes:02d}m"
+        try:
+            self.SetStatusText(text)
+        except Exception:
+            pass
+
     def _manual_refresh_thread(self):
         # Manual refresh should wait for any in-flight refresh to finish.
         ran = self._run_refresh(block=True, force=True)
@@ -2391,6 +2727,18 @@ class MainFrame(wx.Frame):
             self._fulltext_worker_event.set()
         except Exception:
             pass
+        try:
+            change_feed.unsubscribe(self._article_change_token)
+        except Exception:
+            pass
+        try:
+            self._read_state_queue.close()
+        except Exception:
+            log.exception("Error flushing queued read-state changes")
+        try:
+            self._save_startup_snapshot(background=False)
+        except Exception:
+            log.exception("Error saving startup snapshot")
 
         self.stop_event.set()
         
@@ -2916,6 +3264,10 @@ class MainFrame(wx.Frame):
             return
 
         article.is_favorite = bool(new_state)
+        try:
+            self.list_ctrl.refresh_rows([idx])
+        except Exception:
+            pass
 
         self._sync_favorite_flag_in_cached_views(self._article_cache_id(article), bool(new_state))
         self._update_cached_favorites_view(article, bool(new_state))
@@ -3211,6 +3563,13 @@ class MainFrame(wx.Frame):
             label = f"{title} ({unread})" if unread > 0 else title
             self.tree.SetItemText(node, label)
 
+        # Providers that publish article changes have their deltas applied by _apply_article_changes.
+        try:
+            if self.provider.publishes_article_changes():
+                return
+        except Exception:
+            pass
+
         # If the selected view is impacted, schedule article reload
         sel = self.tree.GetSelection()
         if sel and sel.IsOk():
@@ -3224,6 +3583,216 @@ class MainFrame(wx.Frame):
                 elif typ == "category" and data.get("id") == category:
                     self._schedule_article_reload()
 
+    def _on_article_changes(self, changes):
+        # Called from refresh/cleanup threads via core.change_feed; batch and marshal to UI thread.
+        if not changes:
+            return
+        with self._article_change_lock:
+            self._article_changes_pending.extend(changes)
+            if self._article_changes_flush_scheduled:
+                return
+            self._article_changes_flush_scheduled = True
+        try:
+            wx.CallAfter(self._flush_article_changes)
+        except Exception:
+            with self._article_change_lock:
+                self._article_changes_pending.clear()
+                self._article_changes_flush_scheduled = False
+            log.debug("Failed to schedule article change flush, likely during shutdown.", exc_info=True)
+
+    def _flush_article_changes(self):
+        with self._article_change_lock:
+            pending = list(self._article_changes_pending)
+            self._article_changes_pending.clear()
+            self._article_changes_flush_scheduled = False
+        if not pending or self.stop_event.is_set():
+            return
+
+        # Evicted (stub) views rebuild from the store when reopened, so only loaded views take deltas.
+        with self._view_cache_lock:
+            view_ids = [
+                vid
+                for vid, st in self.view_cache.items()
+                if not st.get("stub") and (st.get("articles") or st.get("fully_loaded"))
+            ]
+        if not view_ids:
+            return
+
+        # Last change wins per article.
+        latest = {}
+        for change in pending:
+            latest[change.article_id] = change
+        threading.Thread(
+            target=self._article_changes_thread,
+            args=(list(latest.values()), view_ids),
+            daemon=True,
+        ).start()
+
+    def _article_changes_thread(self, changes, view_ids):
+        # Serialized so deltas reach the UI thread in the order they were published.
+        with self._article_change_apply_lock:
+            fetch_ids = [c.article_id for c in changes if c.kind != change_feed.DELETED]
+            articles = []
+            if fetch_ids:
+                try:
+                    articles = self.provider.get_articles_by_ids(fetch_ids) or []
+                except Exception:
+                    log.debug("Failed to load changed articles", exc_info=True)
+                    # Not knowing what changed is not the same as the rows being gone.
+                    wx.CallAfter(self._invalidate_views_after_failed_changes)
+                    return
+                self._read_state_queue.overlay(articles)
+
+            category_titles = {}
+            for vid in view_ids:
+                scope = view_delta.split_view_id(vid)[0]
+                if scope.startswith("category:") and scope not in category_titles:
+                    name = scope.split(":", 1)[1]
+                    try:
+                        from core.db import get_subcategory_titles
+                        subs = get_subcategory_titles(name) or []
+                    except Exception:
+                        subs = []
+                    category_titles[scope] = {name, *subs}
+
+            wx.CallAfter(self._apply_article_changes, changes, articles, category_titles)
+
+    def _apply_article_changes(self, changes, articles, category_titles):
+        if self.stop_event.is_set():
+            return
+        kinds = {c.article_id: c.kind for c in changes}
+        fetched = {a.id: a for a in articles or [] if getattr(a, "id", None)}
+        # Only deletions leave every view; a row missing from the fetch gets its own DELETED change.
+        removed = {
+            article_cache_key(c.article_id, c.feed_id)
+            for c in changes
+            if c.kind == change_feed.DELETED
+        }
+
+        feed_categories = {}
+        for a in fetched.values():
+            if a.feed_id not in feed_categories:
+                feed = self.feed_map.get(a.feed_id)
+                feed_categories[a.feed_id] = getattr(feed, "category", None) if feed else None
+
+        current = getattr(self, "current_feed_id", None)
+        current_changed = False
+        with self._view_cache_lock:
+            items = list(self.view_cache.items())
+        for vid, st in items:
+            if st.get("stub"):
+                continue
+            scope = view_delta.split_view_id(vid)[0]
+            titles = category_titles.get(scope)
+            upserts = []
+            leaving = set(removed)
+            for aid, a in fetched.items():
+                if view_delta.article_in_view(vid, a, feed_categories.get(a.feed_id), titles):
+                    upserts.append((a, kinds.get(aid) == change_feed.ADDED))
+                else:
+                    leaving.add(self._article_cache_id(a))
+
+            loaded = st.get("articles") or []
+            total = st.get("total")
+            fully_loaded = bool(st.get("fully_loaded"))
+            if not fully_loaded and total is not None:
+                try:
+                    fully_loaded = len(loaded) >= int(total)
+                except Exception:
+                    pass
+            id_set = st.get("id_set")
+            if id_set is None:
+                id_set = st["id_set"] = set()
+            delta = view_delta.apply_to_view(loaded, id_set, upserts, leaving, self._article_cache_id, fully_loaded)
+            if not delta.changed and not delta.total_delta:
+                continue
+
+            st["articles"] = delta.articles
+            if total is not None:
+                try:
+                    st["total"] = max(0, int(total) + delta.total_delta)
+                except Exception:
+                    pass
+            try:
+                st["paged_offset"] = max(0, int(st.get("paged_offset", 0) or 0) + delta.loaded_delta)
+            except Exception:
+                pass
+            idx = st.get("search_index")
+            if idx is not None:
+                for a in delta.entered:
+                    idx.update(a)
+            if vid == current and delta.changed:
+                current_changed = True
+
+        if current_changed and current == getattr(self, "_base_view_id", None):
+            self._show_current_view_delta(current)
+
+    def _invalidate_views_after_failed_changes(self):
+        """Drop cached views and re-read the open one when changed articles couldn't be loaded."""
+        if self.stop_event.is_set():
+            return
+        current = getattr(self, "current_feed_id", None)
+        with self._view_cache_lock:
+            for vid in list(self.view_cache):
+                if vid != current:
+                    self.view_cache.pop(vid, None)
+        if current and current == getattr(self, "_base_view_id", None):
+            # Swaps in the live first page only if it differs, keeping the selection and scroll.
+            self._begin_articles_load(current, full_load=False, clear_list=False, reconcile=True)
+
+    def _show_current_view_delta(self, feed_id):
+        """Re-render the open view from its cached list after deltas were applied."""
+        st = self._ensure_view_state(feed_id)
+        combined = list(st.get("articles") or [])
+
+        selected_id = getattr(self, "selected_article_id", None)
+        focused_idx = self.list_ctrl.GetFocusedItem()
+        selected_idx = self.list_ctrl.GetFirstSelected()
+        focused_on_load_more = self._is_load_more_row(focused_idx)
+        selected_on_load_more = self._is_load_more_row(selected_idx)
+        if selected_on_load_more:
+            selected_id = None
+        focused_article_id = None
+        if (not focused_on_load_more) and focused_idx != wx.NOT_FOUND and 0 <= focused_idx < len(self.current_articles):
+            focused_article_id = self._article_cache_id(self.current_articles[focused_idx])
+        top_article_id = self._capture_top_article_for_restore(focused_article_id, selected_id)
+
+        self._updating_list = True
+        try:
+            self._set_base_articles(combined, feed_id)
+            display_articles = combined
+            if self._is_search_active():
+                display_articles = self._filter_articles(combined, self._search_query)
+            self.current_articles = self._sort_articles_for_display(display_articles)
+            self._remove_loading_more_placeholder()
+            empty_label = "No matches." if (self._is_search_active() and combined) else "No articles found."
+            self._render_articles_list(self.current_articles, empty_label=empty_label)
+
+            total = st.get("total")
+            if st.get("fully_loaded"):
+                more = False
+            elif total is None:
+                more = len(combined) >= self.article_page_size
+            else:
+                try:
+                    more = int(total) > len(combined)
+                except Exception:
+                    more = False
+            if more:
+                self._add_loading_more_placeholder()
+
+            if focused_on_load_more or selected_on_load_more:
+                wx.CallAfter(self._restore_load_more_focus)
+            else:
+                wx.CallAfter(self._restore_list_view, focused_article_id, top_article_id, selected_id)
+        finally:
+            self._updating_list = False
+
+        try:
+            self._reset_fulltext_prefetch(self.current_articles)
+        except Exception:
+            pass
+
     def _schedule_article_reload(self):
         if self._article_refresh_pending:
             return
@@ -3234,7 +3803,109 @@ class MainFrame(wx.Frame):
         self._article_refresh_pending = False
         self._reload_selected_articles()
 
-    def _update_tree(self, feeds, all_cats, hierarchy=None):
+    def _startup_view_id(self) -> str:
+        """The view _update_tree selects on launch."""
+        if self.config_manager.get("remember_last_feed", False):
+            last_feed = self.config_manager.get("last_selected_feed")
+            if last_feed:
+                return str(last_feed)
+        return "all"
+
+    def _apply_startup_snapshot(self) -> bool:
+        """Build the tree (and seed the startup view's first page) from the last session's snapshot."""
+        if not bool(self.config_manager.get("startup_snapshot_enabled", False)):
+            return False
+        try:
+            snap = startup_snapshot.load(startup_snapshot.provider_key(self.config_manager))
+        except Exception:
+            log.debug("Startup snapshot load failed", exc_info=True)
+            snap = None
+        if snap is None or not (snap.feeds or snap.categories):
+            return False
+
+        view_id = self._startup_view_id()
+        if snap.view_id == view_id and snap.articles:
+            articles = list(snap.articles)
+            self._read_state_queue.overlay(articles)
+            st = self._ensure_view_state(view_id)
+            st["stub"] = False
+            st["articles"] = articles
+            st["id_set"] = {self._article_cache_id(a) for a in articles}
+            st["total"] = snap.total
+            st["paged_offset"] = len(articles)
+            st["fully_loaded"] = snap.total is not None and len(articles) >= int(snap.total)
+            # Cleared by _reconcile_snapshot_view once the live first page is in.
+            st["snapshot"] = True
+        self._update_tree(snap.feeds, snap.categories, snap.hierarchy, from_snapshot=True)
+        return True
+
+    def _is_snapshot_view(self, feed_id) -> bool:
+        with getattr(self, "_view_cache_lock", threading.Lock()):
+            st = (self.view_cache or {}).get(feed_id)
+        return bool(st and st.get("snapshot"))
+
+    def _reconcile_snapshot_view(self, page, request_id, total, feed_id):
+        """Replace a view rendered from the startup snapshot with the live first page."""
+        if request_id != getattr(self, "current_request_id", None) or feed_id != getattr(self, "current_feed_id", None):
+            return
+        st = self._ensure_view_state(feed_id)
+        st.pop("snapshot", None)
+        base = list(getattr(self, "_base_articles", []) or []) if self._base_view_id == feed_id else []
+
+        def _signature(items):
+            return [(self._article_cache_id(a), bool(a.is_read), bool(a.is_favorite)) for a in items]
+
+        if _signature(page or []) == _signature(base):
+            st["total"] = total
+            return
+        if not page and base:
+            # Provider error or an empty answer: keep showing the snapshot rather than blanking the list.
+            return
+        restore = None
+        try:
+            restore = tuple(self._capture_list_view_state()[:3])
+        except Exception:
+            restore = None
+        self._populate_articles(page, request_id, total, self.article_page_size)
+        if restore and any(restore):
+            wx.CallAfter(self._restore_list_view, *restore)
+
+    def _schedule_startup_snapshot_save(self) -> None:
+        if not bool(self.config_manager.get("startup_snapshot_enabled", False)):
+            return
+        pending = getattr(self, "_startup_snapshot_save_calllater", None)
+        if pending is not None:
+            try:
+                pending.Stop()
+            except Exception:
+                pass
+        self._startup_snapshot_save_calllater = wx.CallLater(STARTUP_SNAPSHOT_SAVE_DELAY_MS, self._save_startup_snapshot)
+
+    def _save_startup_snapshot(self, background: bool = True) -> None:
+        """Persist the live tree and the startup view's first page (collected on the UI thread)."""
+        self._startup_snapshot_save_calllater = None
+        if not bool(self.config_manager.get("startup_snapshot_enabled", False)):
+            return
+        tree = getattr(self, "_startup_snapshot_tree", None)
+        if tree is None:
+            return
+        categories, hierarchy = tree
+        feeds = list((getattr(self, "feed_map", None) or {}).values())
+        view_id = self._startup_view_id()
+        articles, total = None, None
+        with getattr(self, "_view_cache_lock", threading.Lock()):
+            st = (self.view_cache or {}).get(view_id)
+            if st and not st.get("stub") and isinstance(st.get("articles"), list):
+                articles = list(st["articles"][:startup_snapshot.MAX_ARTICLES])
+                total = st.get("total")
+        key = startup_snapshot.provider_key(self.config_manager)
+        args = (key, feeds, categories, hierarchy, view_id if articles else None, articles, total)
+        if not background:
+            startup_snapshot.save(*args)
+            return
+        threading.Thread(target=startup_snapshot.save, args=args, name="StartupSnapshotSave", daemon=True).start()
+
+    def _update_tree(self, feeds, all_cats, hierarchy=None, from_snapshot: bool = False):
         # Save selection to restore it later
         selected_item = self.tree.GetSelection()
         selected_data = None
@@ -3406,6 +4077,10 @@ class MainFrame(wx.Frame):
                     pass
             self._updating_tree = False
 
+        if not from_snapshot:
+            self._startup_snapshot_tree = (list(all_cats or []), dict(hierarchy or {}))
+            self._schedule_startup_snapshot_save()
+
         # Ensure article list refreshes after auto/remote refresh.
         # Re-selecting items on a rebuilt tree does not always emit EVT_TREE_SEL_CHANGED,
         # so explicitly trigger a load for the currently selected node.
@@ -3426,7 +4101,7 @@ class MainFrame(wx.Frame):
             return f"category:{data.get('id')}"
         return None
 
-    def _begin_articles_load(self, feed_id: str, full_load: bool = True, clear_list: bool = True):
+    def _begin_articles_load(self, feed_id: str, full_load: bool = True, clear_list: bool = True, reconcile: bool = False):
         # Track current view so auto-refresh can do a cheap "top-up" without reloading history.
         self.current_feed_id = feed_id
 
@@ -3441,7 +4116,7 @@ class MainFrame(wx.Frame):
         self.current_request_id = time.time()
         threading.Thread(
             target=self._load_articles_thread,
-            args=(feed_id, self.current_request_id, full_load),
+            args=(feed_id, self.current_request_id, full_load, reconcile),
             daemon=True
         ).start()
 
@@ -3467,10 +4142,14 @@ class MainFrame(wx.Frame):
         else:
             have_articles = bool(getattr(self, "current_articles", None))
         same_view = (feed_id == getattr(self, "current_feed_id", None))
+        from_snapshot = self._is_snapshot_view(feed_id)
 
         if have_articles and same_view:
             # Fast: fetch latest page and merge, do not page through history.
-            self._begin_articles_load(feed_id, full_load=False, clear_list=False)
+            self._begin_articles_load(feed_id, full_load=False, clear_list=False, reconcile=from_snapshot)
+        elif from_snapshot:
+            # Render the snapshot's first page now; _select_view reconciles it in the background.
+            self._select_view(feed_id)
         else:
             # First load (or selection changed): fast-first + background history.
             self._begin_articles_load(feed_id, full_load=True, clear_list=True)
@@ -3504,7 +4183,7 @@ class MainFrame(wx.Frame):
 
         self._select_view(feed_id)
 
-    def _load_articles_thread(self, feed_id, request_id, full_load: bool = True):
+    def _load_articles_thread(self, feed_id, request_id, full_load: bool = True, reconcile: bool = False):
         page_size = self.article_page_size
         try:
             # Fast-first page
@@ -3513,6 +4192,10 @@ class MainFrame(wx.Frame):
             page = page or []
             page.sort(key=lambda a: (a.timestamp, self._article_cache_id(a)), reverse=True)
 
+            if reconcile:
+                wx.CallAfter(self._reconcile_snapshot_view, page, request_id, total, feed_id)
+                return
+
             if not full_load:
                 wx.CallAfter(self._quick_merge_articles, page, request_id, feed_id)
                 return
@@ -3521,7 +4204,7 @@ class MainFrame(wx.Frame):
 
         except Exception as e:
             print(f"Error loading articles: {e}")
-            if full_load:
+            if full_load and not reconcile:
                 wx.CallAfter(self._populate_articles, [], request_id, 0, page_size)
             # For quick mode, just do nothing on failure.
 
@@ -3536,6 +4219,7 @@ class MainFrame(wx.Frame):
 
         fid = getattr(self, 'current_feed_id', None)
         base_articles = list(articles or [])
+        self._read_state_queue.overlay(base_articles)
         self._set_base_articles(base_articles, fid)
 
         if not base_articles:
@@ -3545,6 +4229,8 @@ class MainFrame(wx.Frame):
             # Cache empty state
             if fid:
                 st = self._ensure_view_state(fid)
+                st['stub'] = False
+                st.pop('stub_ids', None)
                 st['articles'] = []
                 st['id_set'] = set()
                 st['total'] = total
@@ -3590,8 +4276,13 @@ class MainFrame(wx.Frame):
         # Update cache for this view (fresh first page).
         if fid:
             st = self._ensure_view_state(fid)
+            st['stub'] = False
+            st.pop('stub_ids', None)
             st['articles'] = base_articles
             st['id_set'] = {self._article_cache_id(a) for a in base_articles}
+            search_idx = self._view_search_index(fid)
+            search_idx.retain(base_articles)
+            search_idx.add(base_articles)
             st['total'] = total
             st['page_size'] = int(page_size)
             st['paged_offset'] = len(articles or [])
@@ -3614,6 +4305,7 @@ class MainFrame(wx.Frame):
             self._reset_fulltext_prefetch(self.current_articles)
         except Exception:
             pass
+        self._refresh_resolved_streams_for(self.current_articles)
 
     def _append_articles(self, articles, request_id, total=None, page_size: int | None = None):
         if not hasattr(self, 'current_request_id') or request_id != self.current_request_id:
@@ -3702,6 +4394,7 @@ class MainFrame(wx.Frame):
             st = self._ensure_view_state(fid)
             st['articles'] = combined
             st['id_set'] = {self._article_cache_id(a) for a in combined}
+            self._view_search_index(fid).add(new_articles)
             if total is not None:
                 st['total'] = total
             st['page_size'] = int(page_size)
@@ -3749,26 +4442,31 @@ class MainFrame(wx.Frame):
         if not self.current_articles:
             return
 
-        # 1. Restore Selection
-        selected_idx = None
-        if selected_id:
+        # Locate all targets in one pass; the virtual list makes this the dominant cost on big views.
+        wanted = {x for x in (selected_id, focused_id, top_id) if x}
+        positions = {}
+        if wanted:
             for i, a in enumerate(self.current_articles):
-                if self._article_cache_id(a) == selected_id:
-                    selected_idx = i
-                    self.list_ctrl.SetItemState(i, wx.LIST_STATE_SELECTED, wx.LIST_STATE_SELECTED)
-                    break
+                cid = self._article_cache_id(a)
+                if cid in wanted and cid not in positions:
+                    positions[cid] = i
+                    if len(positions) == len(wanted):
+                        break
+
+        # 1. Restore Selection
+        selected_idx = positions.get(selected_id) if selected_id else None
+        if selected_idx is not None:
+            self.list_ctrl.SetItemState(selected_idx, wx.LIST_STATE_SELECTED, wx.LIST_STATE_SELECTED)
 
         # 2. Restore Focus
         focused_idx = None
         if focused_id:
-            for i, a in enumerate(self.current_articles):
-                if self._article_cache_id(a) == focused_id:
-                    focused_idx = i
-                    self.list_ctrl.SetItemState(i, wx.LIST_STATE_FOCUSED, wx.LIST_STATE_FOCUSED)
-                    # If we don't have a specific scroll target, ensure focused is visible
-                    if not top_id:
-                        self.list_ctrl.EnsureVisible(i)
-                    break
+            focused_idx = positions.get(focused_id)
+            if focused_idx is not None:
+                self.list_ctrl.SetItemState(focused_idx, wx.LIST_STATE_FOCUSED, wx.LIST_STATE_FOCUSED)
+                # If we don't have a specific scroll target, ensure focused is visible
+                if not top_id:
+                    self.list_ctrl.EnsureVisible(focused_idx)
         elif selected_idx is not None:
             try:
                 focused_idx = selected_idx
@@ -3780,11 +4478,7 @@ class MainFrame(wx.Frame):
 
         # 3. Restore Scroll Position (Top Item)
         if top_id:
-            target_idx = -1
-            for i, a in enumerate(self.current_articles):
-                if self._article_cache_id(a) == top_id:
-                    target_idx = i
-                    break
+            target_idx = positions.get(top_id, -1)
             
             if target_idx != -1:
                 # Trick to force the item to the TOP of the view:
@@ -3856,11 +4550,7 @@ class MainFrame(wx.Frame):
             self._update_loading_placeholder(self._loading_label if loading else self._load_more_label)
             return
         label = self._loading_label if loading else self._load_more_label
-        idx = self.list_ctrl.InsertItem(self.list_ctrl.GetItemCount(), label)
-        self.list_ctrl.SetItem(idx, 1, "")
-        self.list_ctrl.SetItem(idx, 2, "")
-        self.list_ctrl.SetItem(idx, 3, "")
-        self.list_ctrl.SetItem(idx, 4, "")
+        self.list_ctrl.InsertItem(self.list_ctrl.GetItemCount(), label)
         self._loading_more_placeholder = True
 
     def _remove_loading_more_placeholder(self):
@@ -3880,10 +4570,6 @@ class MainFrame(wx.Frame):
         label = text or self._load_more_label
         try:
             self.list_ctrl.SetItem(count - 1, 0, label)
-            self.list_ctrl.SetItem(count - 1, 1, "")
-            self.list_ctrl.SetItem(count - 1, 2, "")
-            self.list_ctrl.SetItem(count - 1, 3, "")
-            self.list_ctrl.SetItem(count - 1, 4, "")
         except Exception:
             pass
     def _is_load_more_row(self, idx: int) -> bool:
@@ -3982,6 +4668,7 @@ class MainFrame(wx.Frame):
         new_entries = [a for a in latest_page if self._article_cache_id(a) not in existing_ids]
         if not new_entries:
             return
+        self._read_state_queue.overlay(new_entries)
 
         # Remember selection and focus by article id
         selected_id = getattr(self, "selected_article_id", None)
@@ -4083,6 +4770,10 @@ class MainFrame(wx.Frame):
             st = self._ensure_view_state(fid)
             st['articles'] = combined
             st['id_set'] = {self._article_cache_id(a) for a in combined}
+            search_idx = self._view_search_index(fid)
+            search_idx.add(new_entries)
+            if truncated:
+                search_idx.retain(combined)
             # Do NOT advance paged_offset here; quick top-ups shouldn't change history offset.
             st['page_size'] = page_size
             st['last_access'] = time.time()
@@ -4113,6 +4804,7 @@ class MainFrame(wx.Frame):
             self.selected_article_id = self._article_cache_id(article) # Track selection
             # Reset full-text state for new selection
             self._fulltext_loading_url = None
+            self._translation_partial_key = None
             self._fulltext_token += 1
             
             # Immediate feedback (fast)
@@ -4160,6 +4852,11 @@ class MainFrame(wx.Frame):
         except Exception:
             pass
 
+        try:
+            self._prefetch_media_around(idx)
+        except Exception:
+            log.debug("Media prefetch scheduling failed", exc_info=True)
+
 
     def on_content_focus(self, event):
         """When the content field receives focus, force an immediate full-text load for the selected article."""
@@ -4302,6 +4999,15 @@ class MainFrame(wx.Frame):
             chunk_chars = 3500
         chunk_chars = max(500, min(8000, chunk_chars))
 
+        try:
+            use_cache = bool(self.config_manager.get("translation_cache_enabled", True))
+        except Exception:
+            use_cache = True
+        try:
+            streaming = bool(self.config_manager.get("translation_streaming", True))
+        except Exception:
+            streaming = True
+
         return {
             "provider": provider,
             "api_key": api_key,
@@ -4315,6 +5021,8 @@ class MainFrame(wx.Frame):
             "qwen_model": qwen_model,
             "timeout_s": timeout_s,
             "chunk_chars": chunk_chars,
+            "use_cache": use_cache,
+            "streaming": streaming,
         }
 
     def _translation_fulltext_cache_suffix(self) -> str:
@@ -4328,13 +5036,20 @@ class MainFrame(wx.Frame):
             return f"::tr[{provider}:{lang}:{model}]"
         return f"::tr[{provider}:{lang}]"
 
-    def _translate_rendered_text_if_enabled(self, rendered: str) -> str:
+    def _translate_rendered_text_if_enabled(self, rendered: str, on_chunk=None, should_cancel=None) -> str:
+        """Translate rendered article text when translation is enabled.
+
+        `on_chunk(index, total, translated)` receives translated chunks in order as they
+        finish (streaming mode); `should_cancel()` lets the caller abandon the request.
+        """
         cfg = self._translation_runtime_config()
         if not cfg:
             return rendered
         text = str(rendered or "")
         if not text.strip():
             return text
+        if not cfg.get("streaming", True):
+            on_chunk = None
         try:
             return translation_mod.translate_text(
                 text,
@@ -4349,7 +5064,12 @@ class MainFrame(wx.Frame):
                 qwen_model=str(cfg.get("qwen_model") or ""),
                 timeout_s=int(cfg.get("timeout_s") or 45),
                 chunk_chars=int(cfg.get("chunk_chars") or 3500),
+                use_cache=bool(cfg.get("use_cache", True)),
+                on_chunk=on_chunk,
+                should_cancel=should_cancel,
             )
+        except translation_mod.TranslationCancelled:
+            return text
         except Exception as e:
             log.warning("Translation failed; showing original text: %s", e)
             try:
@@ -4362,6 +5082,55 @@ class MainFrame(wx.Frame):
                 pass
             return text
 
+    def _make_translation_progress_callback(self, cache_key: str, token_snapshot):
+        """Build an on_chunk callback that appends translated chunks to the content view."""
+        state = {"text": ""}
+
+        def _on_chunk(index: int, total: int, translated: str):
+            state["text"] += str(translated or "")
+            snapshot = state["text"]
+            try:
+                wx.CallAfter(self._apply_partial_translation, cache_key, token_snapshot, snapshot, index, total)
+            except Exception:
+                pass
+
+        return _on_chunk
+
+    def _apply_partial_translation(self, cache_key: str, token_snapshot, text: str, index: int, total: int):
+        if token_snapshot is not None and token_snapshot != int(getattr(self, "_fulltext_token", 0)):
+            return
+        try:
+            idx_now = self.list_ctrl.GetFirstSelected()
+        except Exception:
+            idx_now = -1
+        if idx_now is None or idx_now < 0 or idx_now >= len(self.current_articles):
+            return
+        cur_key, _cur_url, _aid = self._fulltext_cache_key_for_article(self.current_articles[idx_now], idx_now)
+        if cur_key != cache_key:
+            return
+
+        try:
+            current = self.content_ctrl.GetValue()
+            if index > 0 and getattr(self, "_translation_partial_key", None) == cache_key and text.startswith(current):
+                # Append only the new tail and keep the caret where the reader left it.
+                pos = self.content_ctrl.GetInsertionPoint()
+                self.content_ctrl.AppendText(text[len(current):])
+                self.content_ctrl.SetInsertionPoint(pos)
+            elif current != text:
+                self.content_ctrl.SetValue(text)
+                self.content_ctrl.SetInsertionPoint(0)
+            self._translation_partial_key = cache_key
+        except Exception:
+            pass
+
+        try:
+            if index + 1 < total:
+                self.SetStatusText(f"Translating... {index + 1} of {total} parts")
+            else:
+                self.SetStatusText("Translation complete")
+        except Exception:
+            pass
+
     def _fulltext_prefetch_enabled(self) -> bool:
         try:
             # Background prefetching can poison full-text extraction on some sites.
@@ -4875,8 +5644,19 @@ class MainFrame(wx.Frame):
             cache_source = render_source or ("feed" if not is_web_eligible else "unknown")
 
             # Optional automatic translation (runs inside the background full-text worker).
+            # Foreground loads stream translated chunks into the content view as they land.
             try:
-                rendered = self._translate_rendered_text_if_enabled(rendered)
+                if apply_to_ui and not is_prefetch:
+                    rendered = self._translate_rendered_text_if_enabled(
+                        rendered,
+                        on_chunk=self._make_translation_progress_callback(cache_key, token_snapshot),
+                        should_cancel=lambda: (
+                            token_snapshot is not None
+                            and token_snapshot != int(getattr(self, "_fulltext_token", 0))
+                        ),
+                    )
+                else:
+                    rendered = self._translate_rendered_text_if_enabled(rendered)
             except Exception:
                 pass
 
@@ -4911,8 +5691,11 @@ class MainFrame(wx.Frame):
 
                     try:
                         self._fulltext_loading_url = None
-                        self.content_ctrl.SetValue(rendered)
-                        self.content_ctrl.SetInsertionPoint(0)
+                        # Streaming translation may already have rendered this exact text;
+                        # don't reset it and lose the reader's position.
+                        if self.content_ctrl.GetValue() != rendered:
+                            self.content_ctrl.SetValue(rendered)
+                            self.content_ctrl.SetInsertionPoint(0)
                     except Exception:
                         pass
 
@@ -5089,9 +5872,9 @@ class MainFrame(wx.Frame):
             return
         article = self.current_articles[idx]
         if not article.is_read:
-            threading.Thread(target=self.provider.mark_read, args=(article.id,), daemon=True).start()
+            self._read_state_queue.mark(article.id, True, previous=False)
             article.is_read = True
-            self.list_ctrl.SetItem(idx, 4, "Read")
+            self.list_ctrl.refresh_rows([idx])
             self._update_feed_unread_count_ui(article.feed_id, -1)
 
     def mark_article_unread(self, idx):
@@ -5099,9 +5882,9 @@ class MainFrame(wx.Frame):
             return
         article = self.current_articles[idx]
         if article.is_read:
-            threading.Thread(target=self.provider.mark_unread, args=(article.id,), daemon=True).start()
+            self._read_state_queue.mark(article.id, False, previous=True)
             article.is_read = False
-            self.list_ctrl.SetItem(idx, 4, "Unread")
+            self.list_ctrl.refresh_rows([idx])
             self._update_feed_unread_count_ui(article.feed_id, 1)
 
     def on_mark_all_read(self, event=None):
@@ -5122,6 +5905,10 @@ class MainFrame(wx.Frame):
         unread_ids: list[str] = []
         used_direct = False
         try:
+            # Land queued single toggles first so they cannot undo the bulk mark.
+            queue = getattr(self, "_read_state_queue", None)
+            if queue is not None:
+                queue.flush()
             provider_mark_all = getattr(self.provider, "mark_all_read", None)
             if callable(provider_mark_all) and self._should_mark_all_view(feed_id):
                 try:
@@ -5229,14 +6016,14 @@ class MainFrame(wx.Frame):
 
         id_set = set(unread_ids or [])
         try:
+            changed_rows = []
             for i, article in enumerate(self.current_articles or []):
                 if getattr(article, "id", None) in id_set and not article.is_read:
                     article.is_read = True
                     if not self._is_load_more_row(i):
-                        try:
-                            self.list_ctrl.SetItem(i, 4, "Read")
-                        except Exception:
-                            pass
+                        changed_rows.append(i)
+            if changed_rows:
+                self.list_ctrl.refresh_rows(changed_rows)
         except Exception:
             pass
 
@@ -5273,32 +6060,8 @@ class MainFrame(wx.Frame):
             return
 
         if self._should_play_in_player(article):
-            # Decision logic for which URL to play
-            media_url = getattr(article, "media_url", None)
-            media_type = (getattr(article, "media_type", None) or "").lower()
-            use_ytdlp = media_type == "video/youtube"
-
-            is_direct_media = False
-            try:
-                if media_url:
-                    if utils.media_type_is_audio_video_or_podcast(media_type):
-                        is_direct_media = True
-                    else:
-                        media_path = urlsplit(str(media_url)).path.lower()
-                        if media_path.endswith(
-                            (".mp3", ".m4a", ".m4b", ".aac", ".ogg", ".opus", ".wav", ".flac", ".mp4", ".m4v", ".webm", ".mkv", ".mov")
-                        ):
-                            is_direct_media = True
-            except Exception:
-                is_direct_media = False
-
+            media_url, use_ytdlp = self._playback_target(article)
             article_url = str(getattr(article, "url", "") or "").strip()
-            if article_url and core.discovery.is_ytdlp_supported(article_url):
-                if use_ytdlp or (not media_url) or (not is_direct_media):
-                    media_url = article_url
-                    use_ytdlp = True
-            elif not media_url and article_url:
-                media_url = article_url
 
             if not media_url:
                 if article_url:
@@ -5393,6 +6156,81 @@ class MainFrame(wx.Frame):
         except Exception:
             pass
 
+    def _playback_target(self, article):
+        """(url to load, use_ytdlp) for a playable article."""
+        media_url = getattr(article, "media_url", None)
+        media_type = (getattr(article, "media_type", None) or "").lower()
+        use_ytdlp = media_type == "video/youtube"
+
+        is_direct_media = False
+        try:
+            if media_url:
+                if utils.media_type_is_audio_video_or_podcast(media_type):
+                    is_direct_media = True
+                else:
+                    media_path = urlsplit(str(media_url)).path.lower()
+                    if media_path.endswith(
+                        (".mp3", ".m4a", ".m4b", ".aac", ".ogg", ".opus", ".wav", ".flac", ".mp4", ".m4v", ".webm", ".mkv", ".mov")
+                    ):
+                        is_direct_media = True
+        except Exception:
+            is_direct_media = False
+
+        article_url = str(getattr(article, "url", "") or "").strip()
+        if article_url and core.discovery.is_ytdlp_supported(article_url):
+            if use_ytdlp or (not media_url) or (not is_direct_media):
+                media_url = article_url
+                use_ytdlp = True
+        elif not media_url and article_url:
+            media_url = article_url
+        return media_url, use_ytdlp
+
+    def _prefetch_media_around(self, idx: int) -> None:
+        """Start resolving the focused playable article (and the next one) before it is played."""
+        if not bool(self.config_manager.get("media_prefetch_enabled", False)):
+            return
+        # Only warm an existing player: building it (VLC, casting, proxies) while the user
+        # arrows through the list would bring the deferred startup cost back mid-navigation.
+        pw = getattr(self, "player_window", None)
+        if not pw:
+            return
+        # Classifying links needs yt-dlp's extractors; don't load them on the UI thread for a guess.
+        if not core.discovery.ytdlp_extractors_loaded():
+            return
+        targets = []
+        for article in list(self.current_articles[idx:idx + 1 + MEDIA_PREFETCH_AHEAD]):
+            try:
+                if not self._should_play_in_player(article):
+                    continue
+                url, use_ytdlp = self._playback_target(article)
+            except Exception:
+                continue
+            if url:
+                targets.append((url, use_ytdlp))
+        if targets:
+            pw.prefetch_media(targets)
+
+    def _refresh_resolved_streams_for(self, articles) -> None:
+        """Let an open player re-resolve cached streams of listed items before they expire."""
+        pw = getattr(self, "player_window", None)
+        if not pw or not bool(self.config_manager.get("media_resolve_cache_enabled", False)):
+            return
+        urls = []
+        for article in list(articles or [])[:STREAM_REFRESH_SCAN_LIMIT]:
+            try:
+                if not self._should_play_in_player(article):
+                    continue
+                url, use_ytdlp = self._playback_target(article)
+            except Exception:
+                continue
+            if url and use_ytdlp:
+                urls.append(url)
+        if urls:
+            try:
+                pw.refresh_resolved_streams(urls)
+            except Exception:
+                log.debug("Resolved stream refresh failed", exc_info=True)
+
     def _should_play_in_player(self, article):
         """Only treat bona-fide podcast/media items as playable; everything else opens in browser."""
         
@@ -6223,6 +7061,7 @@ class MainFrame(wx.Frame):
                 try:
                     from core.factory import get_provider
                     self.provider = get_provider(self.config_manager)
+                    self._read_state_queue.set_provider(self.provider)
                 except Exception as e:
                     try:
                         print(f"Error switching provider: {e}")
@@ -11,6 +11,8 @@ import subprocess
 import sys
 from core import utils
 from core import discovery
+from core import media_prefetch
+from core import media_resolve_cache
 from core import playback_state
 from core.casting import CastingManager
 from urllib.parse import urlparse
@@ -44,6 +46,9 @@ _SEEKABLE_EXTENSIONS = (
 # Prefer AAC/M4A for broader compatibility with older/bundled VLC builds.
 # Fall back to the previous bestaudio behavior when M4A is unavailable.
 _YTDLP_VLC_AUDIO_FORMAT = "bestaudio[ext=m4a]/bestaudio[ext=mp4]/bestaudio/best"
+# Cached stream URLs are re-resolved this long before they expire.
+_STREAM_REFRESH_LEAD_S = 10 * 60
+_STREAM_LIST_REFRESH_MAX = 5
 
 
 def _is_googlevideo_url(url: str | None) -> bool:
@@ -236,27 +241,76 @@ class CastDialog(wx.Dialog):
         
         self.SetSizer(sizer)
         self.Centre()
-        
-        # Initial scan
-        self.on_refresh(None)
+
+        # Last-known and passively discovered devices are listed right away; a full
+        # scan only runs when the table is empty or on Refresh.
+        self._scanning = False
+        self.devices = self.manager.known_devices()
+        self.manager.add_device_listener(self._on_devices_changed)
+        self.Bind(wx.EVT_WINDOW_DESTROY, self._on_destroy)
+        if self.devices:
+            self._update_list()
+            threading.Thread(target=self._revalidate, daemon=True).start()
+        else:
+            self.on_refresh(None)
+
+    def _on_destroy(self, event):
+        if event.GetEventObject() is self:
+            self.manager.remove_device_listener(self._on_devices_changed)
+        event.Skip()
+
+    def _on_devices_changed(self):
+        wx.CallAfter(self._refresh_from_table)
+
+    def _refresh_from_table(self):
+        if self._scanning or not self.list_box.IsEnabled():
+            return
+        self.devices = self.manager.known_devices()
+        self._update_list()
+
+    def _revalidate(self):
+        try:
+            self.manager.revalidate_known_devices()
+        except Exception as e:
+            log.debug("Cast device revalidation failed: %s", e)
+        wx.CallAfter(self._refresh_from_table)
 
     def on_refresh(self, event):
+        self._scanning = True
         self.list_box.Clear()
         self.list_box.Append("Scanning...")
         threading.Thread(target=self._scan, daemon=True).start()
 
     def _scan(self):
-        self.devices = self.manager.discover_all()
-        wx.CallAfter(self._update_list)
+        try:
+            devices = self.manager.discover_all()
+        except Exception as e:
+            log.debug("Cast discovery failed: %s", e)
+            devices = []
+        wx.CallAfter(self._on_scan_done, devices)
+
+    def _on_scan_done(self, devices):
+        self._scanning = False
+        self.devices = devices
+        self._update_list()
 
     def _update_list(self):
+        selected_id = None
+        sel = self.list_box.GetSelection()
+        if sel != wx.NOT_FOUND and sel < len(getattr(self, "_listed_devices", [])):
+            selected_id = self._listed_devices[sel].unique_id
         self.list_box.Clear()
+        self._listed_devices = list(self.devices)
         if not self.devices:
             self.list_box.Append("No devices found")
             return
             
         for dev in self.devices:
             self.list_box.Append(dev.display_name)
+        for i, dev in enumerate(self.devices):
+            if dev.unique_id == selected_id:
+                self.list_box.SetSelection(i)
+                break
 
     def on_connect(self, event):
         sel = self.list_box.GetSelection()
@@ -359,6 +413,11 @@ class PlayerFrame(wx.Frame):
         self.current_article_id = None
         self._load_seq = 0
         self._active_load_seq = 0
+        # Resolved-stream cache state (see core.media_resolve_cache)
+        self._current_stream_cached = False
+        self._stream_refresh_timer = None
+        self._stream_list_refresh_running = False
+        self._prefetcher = None
         self.current_title = "No Track Loaded"
 
         # Persistent playback resume (stored locally in SQLite, keyed by the input URL).
@@ -1283,6 +1342,13 @@ class PlayerFrame(wx.Frame):
     def _on_vlc_error(self, event) -> None:
         _log("VLC encountered an error event.")
         log.debug("VLC error event")
+        if getattr(self, "_current_stream_cached", False):
+            # The cached signed URL may have been revoked early; resolve afresh on reload.
+            self._current_stream_cached = False
+            try:
+                media_resolve_cache.invalidate(getattr(self, "current_url", None))
+            except Exception:
+                pass
         try:
             wx.CallAfter(self._handle_vlc_error)
         except Exception:
@@ -2548,6 +2614,99 @@ class PlayerFrame(wx.Frame):
         except Exception:
             pass
 
+    def _range_cache_plan(self, url: str, headers: dict | None = None):
+        """Proxy, request headers and settings when `url` should play through the range cache, else None."""
+        low = url.lower()
+        if not (low.startswith('http://') or low.startswith('https://')):
+            return None
+        try:
+            parsed = urlparse(url)
+            host = (parsed.netloc or "").lower()
+            host_name = (parsed.hostname or "").lower()
+        except Exception:
+            host = ""
+            host_name = ""
+        if host_name in ("127.0.0.1", "localhost"):
+            return None
+        # YouTube direct media URLs (googlevideo CDN) can be sensitive to
+        # proxying in packaged builds; prefer direct VLC playback.
+        if _is_googlevideo_url(url):
+            return None
+        # HLS playlists often contain relative segment URLs; proxying them through
+        # the range cache breaks resolution and also isn't helpful for caching.
+        if ".m3u8" in low:
+            return None
+        force_proxy = False
+        try:
+            force_proxy = bool(self.config_manager.get("skip_silence", False))
+        except Exception:
+            force_proxy = False
+        if not force_proxy:
+            if not bool(self.config_manager.get('range_cache_enabled', True)):
+                return None
+            apply_all = bool(self.config_manager.get('range_cache_apply_all_hosts', True))
+            hosts = self.config_manager.get('range_cache_hosts', []) or []
+            try:
+                if any(str(h).strip() in ('*', 'all', 'ALL') for h in hosts):
+                    apply_all = True
+            except Exception:
+                pass
+            if not apply_all:
+                if not host or not hosts:
+                    return None
+                host_ok = False
+                for h in hosts:
+                    try:
+                        hs = str(h).strip().lower()
+                    except Exception:
+                        continue
+                    if not hs:
+                        continue
+                    if hs.startswith('*.') and host.endswith(hs[1:]):
+                        host_ok = True
+                        break
+                    if host == hs or host.endswith('.' + hs):
+                        host_ok = True
+                        break
+                    if hs in host:
+                        host_ok = True
+                        break
+                if not host_ok:
+                    return None
+        cache_dir = self.config_manager.get('range_cache_dir', '') or None
+        prefetch_kb = int(self.config_manager.get('range_cache_prefetch_kb', 16384) or 16384)
+        inline_window_kb = int(self.config_manager.get('range_cache_inline_window_kb', 1024) or 1024)
+        background_download = bool(self.config_manager.get('range_cache_background_download', True))
+        background_chunk_kb = int(self.config_manager.get('range_cache_background_chunk_kb', 8192) or 8192)
+        initial_burst_kb = int(self.config_manager.get('range_cache_initial_burst_kb', 65536) or 65536)
+        initial_inline_kb = int(self.config_manager.get('range_cache_initial_inline_prefetch_kb', 1024) or 1024)
+        proxy = get_range_cache_proxy(cache_dir=cache_dir if cache_dir else None, prefetch_kb=prefetch_kb,
+                                     background_download=background_download, background_chunk_kb=background_chunk_kb,
+                                     inline_window_kb=inline_window_kb,
+                                     initial_burst_kb=initial_burst_kb,
+                                     initial_inline_prefetch_kb=initial_inline_kb,
+                                     debug_logs=bool(self.config_manager.get('range_cache_debug', False)))
+
+        # Default headers
+        req_headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+        }
+        # Merge with passed headers (e.g. from yt-dlp)
+        if headers:
+            req_headers.update(headers)
+
+        if 'promodj.com' in host:
+            req_headers['Referer'] = 'https://promodj.com/'
+
+        return {
+            "proxy": proxy,
+            "headers": req_headers,
+            "cache_dir": cache_dir if cache_dir else None,
+            "prefetch_kb": prefetch_kb,
+            "initial_burst_kb": initial_burst_kb,
+            "initial_inline_kb": initial_inline_kb,
+        }
+
     def _maybe_range_cache_url(self, url: str, headers: dict | None = None, url_is_resolved: bool = False) -> str:
         try:
             if not url:
@@ -2563,94 +2722,18 @@ class PlayerFrame(wx.Frame):
             self._last_vlc_url = url
             self._range_proxy_retry_count = 0
             self._stream_proxy_retry_count = 0
-            low = url.lower()
-            if not (low.startswith('http://') or low.startswith('https://')):
-                return url
-            try:
-                parsed = urlparse(url)
-                host = (parsed.netloc or "").lower()
-                host_name = (parsed.hostname or "").lower()
-            except Exception:
-                host = ""
-                host_name = ""
-            if host_name in ("127.0.0.1", "localhost"):
-                return url
-            # YouTube direct media URLs (googlevideo CDN) can be sensitive to
-            # proxying in packaged builds; prefer direct VLC playback.
-            if _is_googlevideo_url(url):
+            plan = self._range_cache_plan(url, headers)
+            if plan is None:
                 return url
-            # HLS playlists often contain relative segment URLs; proxying them through
-            # the range cache breaks resolution and also isn't helpful for caching.
-            if ".m3u8" in low:
-                return url
-            force_proxy = False
-            try:
-                force_proxy = bool(self.config_manager.get("skip_silence", False))
-            except Exception:
-                force_proxy = False
-            if not force_proxy:
-                if not bool(self.config_manager.get('range_cache_enabled', True)):
-                    return url
-                apply_all = bool(self.config_manager.get('range_cache_apply_all_hosts', True))
-                hosts = self.config_manager.get('range_cache_hosts', []) or []
-                try:
-                    if any(str(h).strip() in ('*', 'all', 'ALL') for h in hosts):
-                        apply_all = True
-                except Exception:
-                    pass
-                if not apply_all:
-                    if not host or not hosts:
-                        return url
-                    host_ok = False
-                    for h in hosts:
-                        try:
-                            hs = str(h).strip().lower()
-                        except Exception:
-                            continue
-                        if not hs:
-                            continue
-                        if hs.startswith('*.') and host.endswith(hs[1:]):
-                            host_ok = True
-                            break
-                        if host == hs or host.endswith('.' + hs):
-                            host_ok = True
-                            break
-                        if hs in host:
-                            host_ok = True
-                            break
-                    if not host_ok:
-                        return url
-            cache_dir = self.config_manager.get('range_cache_dir', '') or None
-            prefetch_kb = int(self.config_manager.get('range_cache_prefetch_kb', 16384) or 16384)
-            inline_window_kb = int(self.config_manager.get('range_cache_inline_window_kb', 1024) or 1024)
-            background_download = bool(self.config_manager.get('range_cache_background_download', True))
-            background_chunk_kb = int(self.config_manager.get('range_cache_background_chunk_kb', 8192) or 8192)
-            initial_burst_kb = int(self.config_manager.get('range_cache_initial_burst_kb', 65536) or 65536)
-            initial_inline_kb = int(self.config_manager.get('range_cache_initial_inline_prefetch_kb', 1024) or 1024)
-            proxy = get_range_cache_proxy(cache_dir=cache_dir if cache_dir else None, prefetch_kb=prefetch_kb,
-                                         background_download=background_download, background_chunk_kb=background_chunk_kb,
-                                         inline_window_kb=inline_window_kb,
-                                         initial_burst_kb=initial_burst_kb,
-                                         initial_inline_prefetch_kb=initial_inline_kb,
-                                         debug_logs=bool(self.config_manager.get('range_cache_debug', False)))
-            
-            # Default headers
-            req_headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-            }
-            # Merge with passed headers (e.g. from yt-dlp)
-            if headers:
-                req_headers.update(headers)
+            proxy = plan["proxy"]
+            req_headers = plan["headers"]
 
-            if 'promodj.com' in host:
-                req_headers['Referer'] = 'https://promodj.com/'
-            
             self._last_used_range_proxy = True
             self._last_range_proxy_headers = dict(req_headers)
-            self._last_range_proxy_cache_dir = cache_dir if cache_dir else None
-            self._last_range_proxy_prefetch_kb = prefetch_kb
-            self._last_range_proxy_initial_burst_kb = initial_burst_kb
-            self._last_range_proxy_initial_inline_kb = initial_inline_kb
+            self._last_range_proxy_cache_dir = plan["cache_dir"]
+            self._last_range_proxy_prefetch_kb = plan["prefetch_kb"]
+            self._last_range_proxy_initial_burst_kb = plan["initial_burst_kb"]
+            self._last_range_proxy_initial_inline_kb = plan["initial_inline_kb"]
             
             proxied = proxy.proxify(url, headers=req_headers, skip_redirect_resolve=url_is_resolved)
             log.debug("Proxy URL generated: %s (skip_redirect_resolve=%s)", proxied, url_is_resolved)
@@ -2693,6 +2776,137 @@ class PlayerFrame(wx.Frame):
         except Exception:
             pass
 
+    def _stream_cache_enabled(self) -> bool:
+        try:
+            return bool(self.config_manager.get("media_resolve_cache_enabled", False))
+        except Exception:
+            return False
+
+    def _get_cached_stream(self, url: str):
+        if not self._stream_cache_enabled():
+            return None
+        try:
+            return media_resolve_cache.get(url)
+        except Exception:
+            log.debug("Resolve cache lookup failed", exc_info=True)
+            return None
+
+    def _remember_stream(self, url: str, media_url: str, headers, title, formats) -> None:
+        if not self._stream_cache_enabled():
+            return
+        try:
+            ttl_s = int(self.config_manager.get("media_resolve_cache_ttl_s", media_resolve_cache.DEFAULT_TTL_S))
+        except Exception:
+            ttl_s = media_resolve_cache.DEFAULT_TTL_S
+        try:
+            entry = media_resolve_cache.put(url, media_url, headers=headers, title=title, formats=formats, ttl_s=ttl_s)
+        except Exception:
+            log.debug("Resolve cache store failed", exc_info=True)
+            return
+        if entry is not None:
+            self._schedule_stream_refresh(url, title, entry.expires_at)
+
+    def _schedule_stream_refresh(self, url: str, title, expires_at: int) -> None:
+        """Re-resolve the loaded item shortly before its cached stream URL expires."""
+        if str(url) != str(getattr(self, "current_url", "") or ""):
+            return
+        old = getattr(self, "_stream_refresh_timer", None)
+        if old is not None:
+            try:
+                old.cancel()
+            except Exception:
+                pass
+        delay = max(30.0, float(expires_at) - time.time() - _STREAM_REFRESH_LEAD_S)
+
+        def _refresh():
+            try:
+                if str(url) != str(getattr(self, "current_url", "") or ""):
+                    return
+                self._resolve_media_worker(-1, str(url), True, title, None, refresh_only=True)
+            except Exception:
+                # The player may have been closed meanwhile.
+                log.debug("Scheduled stream refresh failed", exc_info=True)
+
+        timer = threading.Timer(delay, _refresh)
+        timer.daemon = True
+        self._stream_refresh_timer = timer
+        timer.start()
+
+    def refresh_resolved_streams(self, urls) -> None:
+        """Refresh cached streams of list items that are about to expire (in the background)."""
+        if not self._stream_cache_enabled() or not urls:
+            return
+        if getattr(self, "_stream_list_refresh_running", False):
+            return
+        self._stream_list_refresh_running = True
+        wanted = list(urls)
+
+        def _worker():
+            try:
+                due = media_resolve_cache.expiring(wanted, _STREAM_REFRESH_LEAD_S)
+                for page_url in due[:_STREAM_LIST_REFRESH_MAX]:
+                    self._resolve_media_worker(-1, page_url, True, None, None, refresh_only=True)
+            except Exception:
+                log.debug("Background stream refresh failed", exc_info=True)
+            finally:
+                self._stream_list_refresh_running = False
+
+        threading.Thread(target=_worker, daemon=True).start()
+
+    def prefetch_media(self, targets) -> None:
+        """Resolve and warm `targets` ((url, use_ytdlp) pairs) before they are played."""
+        try:
+            if not bool(self.config_manager.get("media_prefetch_enabled", False)):
+                return
+        except Exception:
+            return
+        if getattr(self, "_shutdown_done", False):
+            return
+        current = str(getattr(self, "current_url", "") or "")
+        wanted = [(u, bool(y)) for u, y in (targets or []) if u and str(u) != current]
+        if not wanted:
+            return
+        if self._prefetcher is None:
+            self._prefetcher = media_prefetch.SpeculativeResolver(self._prefetch_one)
+        self._prefetcher.submit(wanted)
+
+    def _prefetch_one(self, url: str, use_ytdlp: bool) -> None:
+        if getattr(self, "_shutdown_done", False):
+            return
+        resolved = None
+        if use_ytdlp:
+            # Without the resolved-stream cache there is nowhere to keep the result.
+            if not self._stream_cache_enabled():
+                return
+            cached = self._get_cached_stream(url)
+            if cached is not None:
+                resolved = (cached.media_url, dict(cached.headers or {}), True)
+        if resolved is None:
+            resolved = self._resolve_media_worker(-1, url, use_ytdlp, None, None, refresh_only=True)
+        if resolved and not bool(getattr(self, "is_casting", False)):
+            self._warm_stream(*resolved)
+
+    def _warm_stream(self, media_url: str, headers: dict | None, url_is_resolved: bool) -> None:
+        """Probe `media_url` and cache its first bytes in the range-cache proxy."""
+        try:
+            warm_kb = int(self.config_manager.get("media_prefetch_warm_kb", 512) or 0)
+        except Exception:
+            warm_kb = 512
+        if warm_kb <= 0:
+            return
+        try:
+            plan = self._range_cache_plan(media_url, headers)
+            if plan is None:
+                return
+            plan["proxy"].warm(
+                media_url,
+                headers=plan["headers"],
+                max_bytes=warm_kb * 1024,
+                skip_redirect_resolve=url_is_resolved,
+            )
+        except Exception as e:
+            log.debug("Stream warm-up failed for %s: %s", media_url, e)
+
     def _resolve_media_worker(
         self,
         load_seq: int,
@@ -2700,30 +2914,48 @@ class PlayerFrame(wx.Frame):
         use_ytdlp: bool,
         title: str | None,
         chapters,
-    ) -> None:
+        refresh_only: bool = False,
+    ):
+        """Resolve `url` to something VLC can open and hand it to _finish_media_load.
+
+        With `refresh_only` nothing is loaded: yt-dlp/Rumble results are stored in
+        the resolved-stream cache and `(final_url, headers, url_is_resolved)` is
+        returned (background refresh of an expiring URL, speculative prefetch).
+        """
         final_url = url
         ytdlp_headers = {}
         resolved_title = title or "Playing Audio..."
         should_resolve = True
+        if not refresh_only:
+            self._current_stream_cached = False
 
         if use_ytdlp:
-            rumble_handled = False
+            cached = None if refresh_only else self._get_cached_stream(url)
+            stream_handled = cached is not None
+            if cached is not None:
+                final_url = cached.media_url
+                ytdlp_headers = dict(cached.headers or {})
+                resolved_title = cached.title or title or "Media Stream"
+                self._current_stream_cached = True
+                self._schedule_stream_refresh(url, title, cached.expires_at)
+                _log("Media stream served from resolve cache")
             try:
                 from core import rumble as rumble_mod
 
-                if rumble_mod.is_rumble_url(url):
+                if not stream_handled and rumble_mod.is_rumble_url(url):
                     resolved = rumble_mod.resolve_rumble_media(url)
                     final_url = resolved.media_url
                     ytdlp_headers = resolved.headers or {}
                     resolved_title = resolved.title or title or "Media Stream"
-                    rumble_handled = True
+                    stream_handled = True
+                    self._remember_stream(url, final_url, ytdlp_headers, resolved.title, None)
             except Exception as e:
                 try:
                     _log(f"Rumble resolve failed: {e}")
                 except Exception:
                     pass
 
-            if not rumble_handled:
+            if not stream_handled:
                 try:
                     import yt_dlp
                     from core.dependency_check import _get_startup_info
@@ -2995,7 +3227,11 @@ class PlayerFrame(wx.Frame):
 
                     ytdlp_headers = info.get('http_headers', {})
                     resolved_title = info.get('title', title or 'Media Stream')
+                    self._remember_stream(url, final_url, ytdlp_headers, info.get('title'), info.get('formats'))
                 except Exception as e:
+                    if refresh_only:
+                        log.debug("Background stream resolve failed for %s: %s", url, e)
+                        return None
                     err_text = str(e or "")
                     err_lower = err_text.lower()
                     if "rokfin playback is broken on the source site" in err_lower or "rokfin playback requires a rokfin login/cookies" in err_lower:
@@ -3070,9 +3306,18 @@ class PlayerFrame(wx.Frame):
                     resolve_timeout_s = float(self.config_manager.get("playback_resolve_timeout_s", 4.0) or 4.0)
                 except Exception:
                     resolve_timeout_s = 4.0
-                final_url = utils.resolve_final_url(final_url, max_redirects=maxr, timeout_s=resolve_timeout_s)
+                redirected = media_prefetch.cached_redirect(final_url)
+                if redirected:
+                    final_url = redirected
+                else:
+                    start_url = final_url
+                    final_url = utils.resolve_final_url(final_url, max_redirects=maxr, timeout_s=resolve_timeout_s)
+                    if final_url and final_url != start_url:
+                        media_prefetch.remember_redirect(start_url, final_url)
             final_url = utils.normalize_url_for_vlc(final_url)
 
+        if refresh_only:
+            return final_url, dict(ytdlp_headers or {}), bool(should_resolve)
         try:
             if int(load_seq) != int(getattr(self, "_active_load_seq", 0) or 0):
                 return
@@ -5083,6 +5328,14 @@ class PlayerFrame(wx.Frame):
         except Exception:
             log.exception("Error canceling silence scan during shutdown")
 
+        try:
+            if self._prefetcher is not None:
+                self._prefetcher.shutdown()
+            if self._stream_refresh_timer is not None:
+                self._stream_refresh_timer.cancel()
+        except Exception:
+            log.exception("Error stopping media prefetch during shutdown")
+
         try:
             self.timer.Stop()
         except Exception:
@@ -44,12 +44,12 @@ def _enable_debug_console(config_manager):
 from core.dependency_check import check_and_install_dependencies
 import wx
 from core.config import ConfigManager
+from core.db import convert_to_incremental_vacuum
 from core.factory import get_provider
+from core.lazy_import import is_loaded
 from core import updater as app_updater
 from core import windows_integration
 from gui.mainframe import MainFrame
-from core.stream_proxy import get_proxy
-from core.range_cache_proxy import get_range_cache_proxy
 
 class GlobalMediaKeyFilter(wx.EventFilter):
     """Capture media shortcuts globally so they work in dialogs too."""
@@ -134,6 +134,12 @@ class RSSApp(wx.App):
         except Exception as e:
             log.debug(f"Update cleanup failed: {e}")
 
+        # One-time switch of older databases to incremental auto_vacuum, before anything holds the file.
+        try:
+            convert_to_incremental_vacuum()
+        except Exception as e:
+            log.debug(f"Database auto_vacuum conversion skipped: {e}")
+
         self.provider = get_provider(self.config_manager)
         
         self.frame = MainFrame(self.provider, self.config_manager)
@@ -153,15 +159,22 @@ class RSSApp(wx.App):
 
     def OnExit(self):
         log.info("Shutting down proxies...")
-        try:
-            get_proxy().stop()
-        except Exception as e:
-            log.error(f"Error stopping StreamProxy: {e}")
-        
-        try:
-            get_range_cache_proxy().stop()
-        except Exception as e:
-            log.error(f"Error stopping RangeCacheProxy: {e}")
+        # The proxies are imported with the player; if it never loaded there is nothing to stop.
+        if is_loaded("core.stream_proxy"):
+            try:
+                from core.stream_proxy import get_proxy
+
+                get_proxy().stop()
+            except Exception as e:
+                log.error(f"Error stopping StreamProxy: {e}")
+
+        if is_loaded("core.range_cache_proxy"):
+            try:
+                from core.range_cache_proxy import get_range_cache_proxy
+
+                get_range_cache_proxy().stop()
+            except Exception as e:
+                log.error(f"Error stopping RangeCacheProxy: {e}")
             
         # Release the lock implicitly by object destruction, but explicit delete is good practice
         try:
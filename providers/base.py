@@ -5,6 +5,9 @@ from core.models import Article, Feed
 
 class RSSProvider(abc.ABC):
     """Abstract base class for RSS providers (Local, Feedly, etc.)"""
+
+    # Hosted providers may keep a core.article_mirror.ArticleMirror of their account.
+    _mirror = None
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
@@ -68,10 +71,83 @@ class RSSProvider(abc.ABC):
         limit = int(limit)
         return articles[offset:offset + limit], total
 
+    # Optional: providers with an indexed article store can offer full-text search.
+    def supports_article_search(self) -> bool:
+        return False
+
+    def search_articles(
+        self,
+        query: str,
+        feed_id: str = "all",
+        offset: int = 0,
+        limit: int = 200,
+        title_only: bool = False,
+    ) -> Tuple[List[Article], int]:
+        """Return (best-ranked matches, total match count) for `query` within a view.
+
+        `feed_id` accepts the same view ids as get_articles_page (feed id, "all",
+        "category:...", and favorites:/unread:/read: prefixes).
+        """
+        return [], 0
+
     # Optional: providers can override for fast single-article lookup.
     def get_article_by_id(self, article_id: str) -> Optional[Article]:
         return None
 
+    # Optional: batch lookup used to re-hydrate evicted views without re-paging them.
+    # Providers without a local store return [] so callers fall back to get_articles_page().
+    def get_articles_by_ids(self, article_ids: List[str]) -> List[Article]:
+        if self._mirror is not None:
+            try:
+                return self._mirror.get_articles_by_ids(article_ids)
+            except Exception:
+                return []
+        return []
+
+    # Hosted providers with a mirror implement the provider-specific sync here.
+    def _sync_mirror(self, mirror) -> None:
+        pass
+
+    def _mirror_page(self, feed_id: str, offset: int, limit: int):
+        """(articles, total) for a view from the local mirror, or None to ask the server.
+
+        Also schedules a background sync so the mirror keeps up with the account.
+        """
+        mirror = self._mirror
+        if mirror is None:
+            return None
+        try:
+            mirror.schedule_sync(self._sync_mirror)
+            return mirror.page(feed_id, offset, limit)
+        except Exception:
+            return None
+
+    def _mirror_note_total(self, feed_id: str, total) -> None:
+        """Tell the mirror how many rows the server has for a view it could not serve.
+
+        Only pass totals that cover the whole view, not the length of a truncated fetch.
+        """
+        mirror = self._mirror
+        if mirror is None or total is None:
+            return
+        try:
+            mirror.note_view_total(feed_id, total)
+        except Exception:
+            pass
+
+    def _sync_mirror_now(self) -> None:
+        if self._mirror is not None:
+            self._mirror.sync_now(self._sync_mirror)
+
+    # Optional: providers on a metered API report {"name", "limit", "used", "remaining", "reset_in_s"}.
+    def get_request_quota(self) -> Optional[Dict[str, Any]]:
+        return None
+
+    # Optional: providers whose refresh publishes core.change_feed records let the UI
+    # apply those deltas instead of reloading the selected view after each feed.
+    def publishes_article_changes(self) -> bool:
+        return False
+
     @abc.abstractmethod
     def mark_read(self, article_id: str) -> bool:
         pass
@@ -88,6 +164,14 @@ class RSSProvider(abc.ABC):
                 success = False
         return success
 
+    def mark_unread_batch(self, article_ids: List[str]) -> bool:
+        """Default implementation: loop over single mark_unread."""
+        success = True
+        for aid in article_ids:
+            if not self.mark_unread(aid):
+                success = False
+        return success
+
     # Optional: providers can override to mark all items in a view (feed/category/all).
     def mark_all_read(self, feed_id: str) -> bool:
         return False
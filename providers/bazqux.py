@@ -4,7 +4,7 @@ import time
 from typing import List, Dict, Any
 from .base import RSSProvider
 from core.models import Feed, Article
-from core import utils
+from core import article_mirror, utils
 
 log = logging.getLogger(__name__)
 
@@ -19,6 +19,7 @@ class BazQuxProvider(RSSProvider):
         self.session = requests.Session()
         self.session.headers.update(utils.HEADERS)
         self._categories_cache = set()
+        self._mirror = article_mirror.for_provider(config, self.get_name(), self.email)
 
     def get_name(self) -> str:
         return "BazQux"
@@ -176,13 +177,49 @@ class BazQuxProvider(RSSProvider):
             except Exception as e:
                 log.error(f"BazQux batch edit-tag failed: {e}")
                 ok = False
+        if ok and self._mirror is not None:
+            self._mirror.set_read(article_ids, is_read)
         return ok
 
     def refresh(self, progress_cb=None, force: bool = False) -> bool:
         if not self.email or not self.password:
             log.warning("BazQux credentials missing.")
             return False
-        return self._login()
+        if not self._login():
+            return False
+        self._sync_mirror_now()
+        return True
+
+    def _stream_get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        resp = self.session.get(
+            f"{self.base_url}/{path}",
+            headers=self._headers(),
+            params=dict(params, output="json"),
+            timeout=self._timeout_s(),
+        )
+        resp.raise_for_status()
+        return resp.json() or {}
+
+    def _sync_mirror(self, mirror) -> None:
+        if not self._login():
+            return
+
+        def fetch_contents(params):
+            data = self._stream_get(f"stream/contents/{article_mirror.GREADER_READING_LIST}", params)
+            return self._items_to_articles(data.get("items") or [], ""), data.get("continuation")
+
+        def fetch_unread_ids(params):
+            data = self._stream_get(
+                "stream/items/ids",
+                dict(params, s=article_mirror.GREADER_READING_LIST, xt=article_mirror.GREADER_READ),
+            )
+            return article_mirror.greader_item_ids(data), data.get("continuation")
+
+        def fetch_starred_ids(params):
+            data = self._stream_get("stream/items/ids", dict(params, s=article_mirror.GREADER_STARRED))
+            return article_mirror.greader_item_ids(data), data.get("continuation")
+
+        article_mirror.sync_greader(mirror, fetch_contents, fetch_unread_ids, fetch_starred_ids=fetch_starred_ids)
 
     def get_feeds(self) -> List[Feed]:
         if not self._login(): return []
@@ -242,11 +279,71 @@ class BazQuxProvider(RSSProvider):
                 )
                 f.unread_count = unread_map.get(feed_id, 0)
                 feeds.append(f)
+            if self._mirror is not None:
+                self._mirror.sync_feeds(feeds)
             return feeds
         except Exception as e:
             log.error(f"BazQux Feeds Error: {e}")
             return []
 
+    def _items_to_articles(self, items: List[Dict[str, Any]], fallback_feed_id: str) -> List[Article]:
+        article_ids = [item["id"] for item in items]
+        chapters_map = utils.get_chapters_batch(article_ids)
+
+        articles = []
+        for item in items:
+            content = ""
+            if "summary" in item: content = item["summary"]["content"]
+            if "content" in item: content = item["content"]["content"]
+
+            media_url = None
+            media_type = None
+            if "enclosure" in item and item["enclosure"]:
+                encs = item["enclosure"]
+                if isinstance(encs, list) and encs:
+                    media_url = encs[0].get("href")
+                    media_type = encs[0].get("type")
+
+            article_id = item["id"]
+            article_feed_id = self._resolve_item_feed_id(item, fallback_feed_id)
+            cache_id = self._build_item_cache_id(item, fallback_feed_id)
+            article_url = item.get("alternate", [{}])[0].get("href", "")
+            display_title = utils.enhance_activity_entry_title(item.get("title", ""), article_url, content) or item.get("title", "No Title")
+            date = utils.normalize_date(
+                str(item.get("published", "")),
+                display_title,
+                content,
+                article_url,
+            )
+
+            chapters = chapters_map.get(article_id, [])
+
+            is_fav = False
+            is_read_flag = False
+            for cat in item.get("categories", []):
+                if "com.google" in cat:
+                    if cat.endswith("/starred"):
+                        is_fav = True
+                    if cat.endswith("/read"):
+                        is_read_flag = True
+
+            articles.append(Article(
+                id=article_id,
+                feed_id=article_feed_id,
+                title=display_title,
+                url=article_url,
+                content=content,
+                date=date,
+                author=item.get("author", "Unknown"),
+                is_read=is_read_flag,
+                is_favorite=is_fav,
+                media_url=media_url,
+                media_type=media_type,
+                chapters=chapters,
+                cache_id=cache_id,
+            ))
+        return articles
+
     def _fetch_articles(self, feed_id: str, count: int = 50, continuation: str = None) -> List[Article]:
         if not self._login(): return []
         try:
@@ -294,70 +391,16 @@ class BazQuxProvider(RSSProvider):
             data = resp.json()
             
             items = data.get("items", [])
-            article_ids = [item["id"] for item in items]
-            chapters_map = utils.get_chapters_batch(article_ids)
-            
             articles = []
-            fallback_feed_id = real_feed_id or feed_id
-            for item in items:
-                content = ""
-                if "summary" in item: content = item["summary"]["content"]
-                if "content" in item: content = item["content"]["content"]
-                
-                media_url = None
-                media_type = None
-                if "enclosure" in item and item["enclosure"]:
-                    encs = item["enclosure"]
-                    if isinstance(encs, list) and encs:
-                        media_url = encs[0].get("href")
-                        media_type = encs[0].get("type")
-                
-                article_id = item["id"]
-                article_feed_id = self._resolve_item_feed_id(item, fallback_feed_id)
-                cache_id = self._build_item_cache_id(item, fallback_feed_id)
-                article_url = item.get("alternate", [{}])[0].get("href", "")
-                display_title = utils.enhance_activity_entry_title(item.get("title", ""), article_url, content) or item.get("title", "No Title")
-                date = utils.normalize_date(
-                    str(item.get("published", "")),
-                    display_title,
-                    content,
-                    article_url,
-                )
-                
-                chapters = chapters_map.get(article_id, [])
-                
-                is_fav = False
-                is_read_flag = False
-                for cat in item.get("categories", []):
-                    if "com.google" in cat:
-                        if cat.endswith("/starred"):
-                            is_fav = True
-                        if cat.endswith("/read"):
-                            is_read_flag = True
-
+            for article in self._items_to_articles(items, real_feed_id or feed_id):
                 # Client-side safety filter
-                if filter_unread and is_read_flag:
+                if filter_unread and article.is_read:
                     continue
-                if filter_read and not is_read_flag:
+                if filter_read and not article.is_read:
                     continue
-                if filter_favorites and not is_fav:
+                if filter_favorites and not article.is_favorite:
                     continue
-
-                articles.append(Article(
-                    id=article_id,
-                    feed_id=article_feed_id,
-                    title=display_title,
-                    url=article_url,
-                    content=content,
-                    date=date,
-                    author=item.get("author", "Unknown"),
-                    is_read=is_read_flag, 
-                    is_favorite=is_fav,
-                    media_url=media_url,
-                    media_type=media_type,
-                    chapters=chapters,
-                    cache_id=cache_id,
-                ))
+                articles.append(article)
 
             return articles
         except Exception as e:
@@ -368,12 +411,16 @@ class BazQuxProvider(RSSProvider):
         return self._fetch_articles(feed_id, count=50)
 
     def get_articles_page(self, feed_id: str, offset: int = 0, limit: int = 200) -> tuple[List[Article], int | None]:
+        local = self._mirror_page(feed_id, offset, limit)
+        if local is not None:
+            return local
         count = offset + limit
         articles = self._fetch_articles(feed_id, count=count)
         total = None
         if len(articles) < count:
             total = len(articles)
         sliced_articles = articles[offset:offset + limit]
+        self._mirror_note_total(feed_id, total)
         return sliced_articles, total
 
     def get_article_chapters(self, article_id: str) -> List[Dict]:
@@ -386,6 +433,8 @@ class BazQuxProvider(RSSProvider):
                 "i": article_id,
                 "a": "user/-/state/com.google/read"
             }, timeout=self._timeout_s())
+            if self._mirror is not None:
+                self._mirror.set_read([article_id], True)
             return True
         except Exception as e:
             log.error(f"BazQux Mark Read Error: {e}")
@@ -398,6 +447,8 @@ class BazQuxProvider(RSSProvider):
                 "i": article_id,
                 "r": "user/-/state/com.google/read"
             }, timeout=self._timeout_s())
+            if self._mirror is not None:
+                self._mirror.set_read([article_id], False)
             return True
         except Exception as e:
             log.error(f"BazQux Mark Unread Error: {e}")
@@ -406,6 +457,9 @@ class BazQuxProvider(RSSProvider):
     def mark_read_batch(self, article_ids: List[str]) -> bool:
         return self._set_read_state_batch(article_ids, True)
 
+    def mark_unread_batch(self, article_ids: List[str]) -> bool:
+        return self._set_read_state_batch(article_ids, False)
+
     def mark_all_read(self, feed_id: str) -> bool:
         if not self._login():
             return False
@@ -424,6 +478,8 @@ class BazQuxProvider(RSSProvider):
                 timeout=self._timeout_s(),
             )
             if resp.ok:
+                if self._mirror is not None:
+                    self._mirror.mark_view_read(feed_id)
                 return True
         except Exception as e:
             log.error(f"BazQux mark-all-as-read failed for {feed_id}: {e}")
@@ -448,6 +504,8 @@ class BazQuxProvider(RSSProvider):
                 "i": article_id,
                 action: "user/-/state/com.google/starred"
             }, timeout=self._timeout_s())
+            if self._mirror is not None:
+                self._mirror.set_favorite(article_id, is_favorite)
             return True
         except Exception as e:
             log.error(f"BazQux Set Favorite Error: {e}")
@@ -7,11 +7,28 @@ from email.utils import parsedate_to_datetime
 from typing import List, Dict, Any
 from .base import RSSProvider
 from core.models import Feed, Article
-from core import utils
+from core import article_mirror, request_budget, stream_page_cache, utils
 from core import inoreader_oauth
 
 log = logging.getLogger(__name__)
 
+# Endpoints Inoreader bills to Zone 2 (writes); everything else is Zone 1 (reads).
+_WRITE_ENDPOINTS = (
+    "/edit-tag",
+    "/mark-all-as-read",
+    "/subscription/edit",
+    "/subscription/quickadd",
+    "/rename-tag",
+    "/disable-tag",
+)
+# Re-read a little before the cached head page's fetch time so items crawled meanwhile are not missed.
+_NEWER_THAN_SLACK_S = 60
+# More new items than this many pages means the cached head is not worth patching.
+_NEWER_THAN_MAX_PAGES = 3
+# Unread/read/starred streams change membership as items are marked elsewhere, which `ot`
+# top-ups can't see; their cached pages are only reused this long.
+_STATE_STREAM_PAGE_TTL_S = 300
+
 class RateLimitError(RuntimeError):
     def __init__(self, retry_after: int | None, message: str):
         super().__init__(message)
@@ -27,6 +44,8 @@ class InoreaderProvider(RSSProvider):
         self.app_id = (self.conf.get("app_id") or "").strip()
         self.app_key = (self.conf.get("app_key") or "").strip()
         self.refresh_token = (self.conf.get("refresh_token") or "").strip()
+        # Set at authorization (see inoreader_oauth.account_key); older configs only have the app id.
+        self.account_id = (self.conf.get("account_id") or "").strip()
         self.token_expires_at = self._parse_timestamp(self.conf.get("token_expires_at"))
         self._rate_limit_lock = threading.Lock()
         self._rate_limit_until = 0.0
@@ -41,10 +60,32 @@ class InoreaderProvider(RSSProvider):
         self._article_view_cache: Dict[str, Dict[str, Any]] = {}
         self._article_cache_ttl_s = self._articles_cache_ttl_s()
         self._article_page_n = self._articles_page_n()
+        self._read_budget = request_budget.RequestBudget("Inoreader")
+        self._write_budget = request_budget.RequestBudget("Inoreader writes")
+        # Stream pages persist in rss.db per account; heads fetched before this time are re-checked.
+        self._page_cache_account = (
+            self._account_key() if bool(self.conf.get("persistent_page_cache", False)) else ""
+        )
+        self._page_cache_ttl_s = self._stream_page_cache_ttl_s()
+        self._head_stale_before = 0.0
+        # Inoreader's per-app request quota is small; sync the mirror less eagerly.
+        self._mirror = article_mirror.for_provider(
+            config, self.get_name(), self._account_key(), sync_interval_s=self._MIRROR_MIN_INTERVAL_S
+        )
+
+    # Mirror syncs are at least this far apart, and the full unread/starred id walks
+    # (several requests each on large accounts) run at most this often.
+    _MIRROR_MIN_INTERVAL_S = 900
+    _MIRROR_IDS_INTERVAL_S = 6 * 3600
+    # Share of the background allowance left before the quota resets that mirror syncs may use.
+    _MIRROR_BUDGET_SHARE = 0.5
 
     def get_name(self) -> str:
         return "Inoreader"
 
+    def _account_key(self) -> str:
+        return self.account_id or self.app_id or self.token
+
     def _metadata_cache_ttl_s(self) -> int:
         """Cache feed/category metadata aggressively to avoid burning Inoreader API quotas.
 
@@ -89,6 +130,25 @@ class InoreaderProvider(RSSProvider):
             n = 100
         return max(20, min(1000, n))
 
+    def _stream_page_cache_ttl_s(self) -> int:
+        """How long persisted stream pages are reused; the first page is topped up with `ot` meanwhile."""
+        try:
+            raw = (
+                self.conf.get("page_cache_ttl_seconds")
+                if isinstance(self.conf, dict)
+                else None
+            )
+            ttl = int(raw if raw is not None else 6 * 3600)
+        except Exception:
+            ttl = 6 * 3600
+        return max(60, min(7 * 24 * 3600, ttl))
+
+    def _stream_page_ttl_s(self, url: str, params: Dict[str, Any]) -> int:
+        """Page cache TTL for one stream: short for read-state and starred filtered streams."""
+        if params.get("xt") or params.get("it") or urllib.parse.unquote(url).endswith("/state/com.google/starred"):
+            return min(self._page_cache_ttl_s, _STATE_STREAM_PAGE_TTL_S)
+        return self._page_cache_ttl_s
+
     def _timeout_s(self) -> int:
         """Default network timeout for Inoreader API calls.
 
@@ -213,9 +273,36 @@ class InoreaderProvider(RSSProvider):
             raise RateLimitError(retry_after, f"Inoreader rate limit active. Retry in {retry_after}s.")
         time.sleep(wait_s)
 
-    def _request(self, method: str, url: str, *, params=None, data=None, **kwargs):
+    def _budget_for(self, url: str) -> request_budget.RequestBudget:
+        path = str(url or "")
+        if any(ep in path for ep in _WRITE_ENDPOINTS):
+            return self._write_budget
+        return self._read_budget
+
+    def _record_quota(self, resp) -> None:
+        try:
+            headers = resp.headers
+            reset_after = headers.get("X-Reader-Limits-Reset-After")
+            self._read_budget.record(
+                headers.get("X-Reader-Zone1-Limit"), headers.get("X-Reader-Zone1-Usage"), reset_after
+            )
+            self._write_budget.record(
+                headers.get("X-Reader-Zone2-Limit"), headers.get("X-Reader-Zone2-Usage"), reset_after
+            )
+        except Exception:
+            pass
+
+    def get_request_quota(self) -> Dict[str, Any] | None:
+        return self._read_budget.status()
+
+    def _request(self, method: str, url: str, *, params=None, data=None, priority: str = request_budget.FOREGROUND, **kwargs):
+        budget = self._budget_for(url)
+        if not budget.allow(priority):
+            retry_after = budget.seconds_until_reset() or 60
+            raise RateLimitError(retry_after, "Inoreader request quota is reserved for foreground reads.")
         allow_sleep = threading.current_thread() is not threading.main_thread()
         self._respect_rate_limit(allow_sleep)
+        budget.note_request()
         headers = kwargs.pop("headers", None)
         # Always set a timeout unless explicitly overridden by the caller.
         kwargs.setdefault("timeout", self._timeout_s())
@@ -223,12 +310,15 @@ class InoreaderProvider(RSSProvider):
         if headers:
             req_headers.update(headers)
         resp = requests.request(method, url, headers=req_headers, params=params, data=data, **kwargs)
+        self._record_quota(resp)
         if resp.status_code == 429:
             retry_after = self._parse_retry_after(resp.headers.get("Retry-After")) or 30
             self._apply_rate_limit(retry_after)
             if allow_sleep:
                 self._respect_rate_limit(True)
+                budget.note_request()
                 resp = requests.request(method, url, headers=req_headers, params=params, data=data, **kwargs)
+                self._record_quota(resp)
                 if resp.status_code == 429:
                     retry_after = self._parse_retry_after(resp.headers.get("Retry-After")) or retry_after
                     self._apply_rate_limit(retry_after)
@@ -502,17 +592,73 @@ class InoreaderProvider(RSSProvider):
         with self._article_cache_lock:
             self._article_view_cache[key] = state
 
-    def _fetch_articles_page_from_api(self, state: Dict[str, Any]) -> None:
-        params = dict(state.get("base_params") or {})
-        params["n"] = self._article_page_n
-        continuation = state.get("continuation")
-        if continuation:
-            params["c"] = continuation
+    def _stream_cache_key(self, url: str, params: Dict[str, Any]) -> str:
+        return url + "?" + urllib.parse.urlencode(sorted((str(k), str(v)) for k, v in params.items()))
+
+    def _fetch_newer_items(self, url: str, params: Dict[str, Any], since: int) -> List[Dict[str, Any]] | None:
+        """Items crawled after `since` (the `ot` filter), or None if there are too many to patch in."""
+        newer: List[Dict[str, Any]] = []
+        continuation = None
+        for _ in range(_NEWER_THAN_MAX_PAGES):
+            p = dict(params, ot=int(since))
+            if continuation:
+                p["c"] = continuation
+            resp = self._request("get", url, params=p)
+            data = resp.json() if resp is not None else {}
+            page = data.get("items") or []
+            newer.extend(page)
+            continuation = data.get("continuation")
+            if not page or not continuation:
+                return newer
+        return None
 
-        resp = self._request("get", state["url"], params=params)
+    def _load_stream_page(self, url: str, params: Dict[str, Any], continuation: str | None):
+        """(items, next continuation) for one stream page, from the persistent cache when possible."""
+        account = self._page_cache_account
+        key = self._stream_cache_key(url, params) if account else ""
+        if account:
+            cached = stream_page_cache.get_page(account, key, continuation)
+            ttl = self._stream_page_ttl_s(url, params)
+            if cached is not None:
+                items, next_continuation, fetched_at = cached
+                age = time.time() - fetched_at
+                if continuation:
+                    # Continuation tokens address a fixed slice of the stream; reuse them until the TTL.
+                    if age < ttl:
+                        return items, next_continuation
+                elif age < ttl:
+                    if age < self._article_cache_ttl_s and fetched_at >= self._head_stale_before:
+                        return items, next_continuation
+                    started = int(time.time())
+                    newer = self._fetch_newer_items(url, params, fetched_at - _NEWER_THAN_SLACK_S)
+                    if newer is not None:
+                        seen = {i.get("id") for i in newer}
+                        items = newer + [i for i in items if i.get("id") not in seen]
+                        stream_page_cache.put_page(
+                            account, key, None, items, next_continuation, fetched_at=started,
+                            max_age_s=self._page_cache_ttl_s,
+                        )
+                        return items, next_continuation
+
+        p = dict(params)
+        if continuation:
+            p["c"] = continuation
+        fetched_at = int(time.time())
+        resp = self._request("get", url, params=p)
         data = resp.json() if resp is not None else {}
         items = data.get("items") or []
-        continuation = data.get("continuation")
+        next_continuation = data.get("continuation")
+        if account:
+            stream_page_cache.put_page(
+                account, key, continuation, items, next_continuation, fetched_at=fetched_at,
+                max_age_s=self._page_cache_ttl_s,
+            )
+        return items, next_continuation
+
+    def _fetch_articles_page_from_api(self, state: Dict[str, Any]) -> None:
+        params = dict(state.get("base_params") or {})
+        params["n"] = self._article_page_n
+        items, continuation = self._load_stream_page(state["url"], params, state.get("continuation"))
 
         new_articles = self._items_to_articles(items, state.get("fallback_feed_id", ""))
         for article in new_articles:
@@ -594,19 +740,99 @@ class InoreaderProvider(RSSProvider):
             except Exception as e:
                 log.error(f"Inoreader batch edit-tag failed: {e}")
                 ok = False
+        if ok:
+            self._note_flags(article_ids, is_read=is_read)
         return ok
 
+    def _note_flags(self, article_ids: List[str], is_read: bool | None = None, is_starred: bool | None = None) -> None:
+        """Carry a successful read/starred edit into the mirror and the persisted stream pages."""
+        if self._mirror is not None:
+            if is_read is not None:
+                self._mirror.set_read(article_ids, is_read)
+            if is_starred is not None:
+                for aid in article_ids:
+                    self._mirror.set_favorite(aid, is_starred)
+        if self._page_cache_account:
+            stream_page_cache.set_flags(self._page_cache_account, article_ids, is_read=is_read, is_starred=is_starred)
+
     def refresh(self, progress_cb=None, force: bool = False) -> bool:
         if force:
             self._mark_cache_dirty()
             self._clear_article_cache()
+            # Persisted first pages are topped up with an `ot` request on next use.
+            self._head_stale_before = time.time()
+            if self._has_required_auth() and self._mirror is not None:
+                self._mirror.sync_interval_s = self._mirror_sync_interval_s()
+                self._mirror.schedule_sync(self._sync_mirror)
             return True
+        if self._mirror is not None and self._has_required_auth():
+            self._mirror.sync_interval_s = self._mirror_sync_interval_s()
+            self._mirror.schedule_sync(self._sync_mirror)
         # Inoreader is already server-synced; avoid triggering subscription/category fetches on
         # every client refresh tick when metadata is still cached.
         if self._get_cached_feeds(allow_stale=False) is not None:
             return False
         return True
 
+    def _mirror_sync_interval_s(self) -> float:
+        """Spread mirror syncs over what the background allowance has left until the quota resets."""
+        allowance = self._read_budget.background_remaining()
+        reset_in = self._read_budget.seconds_until_reset()
+        if allowance is None or reset_in is None:
+            return float(self._MIRROR_MIN_INTERVAL_S)
+        syncs = int(allowance * self._MIRROR_BUDGET_SHARE)
+        if syncs <= 0:
+            return float(max(self._MIRROR_MIN_INTERVAL_S, reset_in))
+        return float(max(self._MIRROR_MIN_INTERVAL_S, reset_in / syncs))
+
+    def _sync_mirror(self, mirror) -> None:
+        # Always background priority, so a sync never eats into the reserve for views.
+        priority = request_budget.BACKGROUND
+        reading_list = urllib.parse.quote(article_mirror.GREADER_READING_LIST, safe="")
+
+        def fetch_contents(params):
+            resp = self._request(
+                "get",
+                f"{self.base_url}/stream/contents/{reading_list}",
+                params=dict(params, output="json"),
+                priority=priority,
+            )
+            data = resp.json() if resp is not None else {}
+            return self._items_to_articles(data.get("items") or [], ""), data.get("continuation")
+
+        def fetch_unread_ids(params):
+            resp = self._request(
+                "get",
+                f"{self.base_url}/stream/items/ids",
+                params=dict(
+                    params,
+                    s=article_mirror.GREADER_READING_LIST,
+                    xt=article_mirror.GREADER_READ,
+                    output="json",
+                ),
+                priority=priority,
+            )
+            data = resp.json() if resp is not None else {}
+            return article_mirror.greader_item_ids(data), data.get("continuation")
+
+        def fetch_starred_ids(params):
+            resp = self._request(
+                "get",
+                f"{self.base_url}/stream/items/ids",
+                params=dict(params, s=article_mirror.GREADER_STARRED, output="json"),
+                priority=priority,
+            )
+            data = resp.json() if resp is not None else {}
+            return article_mirror.greader_item_ids(data), data.get("continuation")
+
+        article_mirror.sync_greader(
+            mirror,
+            fetch_contents,
+            fetch_unread_ids,
+            fetch_starred_ids=fetch_starred_ids,
+            ids_interval_s=self._MIRROR_IDS_INTERVAL_S,
+        )
+
     def get_feeds(self) -> List[Feed]:
         if not self._has_required_auth():
             return []
@@ -633,6 +859,8 @@ class InoreaderProvider(RSSProvider):
                     icon_url=sub.get("iconUrl", "")
                 ))
             self._set_feed_cache(feeds)
+            if self._mirror is not None:
+                self._mirror.sync_feeds(feeds)
             return feeds
         except RateLimitError as e:
             cached = self._get_cached_feeds(allow_stale=True)
@@ -664,7 +892,12 @@ class InoreaderProvider(RSSProvider):
             lim = max(0, int(limit or 0))
             if lim <= 0:
                 return [], 0
-            return self._get_articles_page_cached(feed_id, off, lim)
+            local = self._mirror_page(feed_id, off, lim)
+            if local is not None:
+                return local
+            articles, total = self._get_articles_page_cached(feed_id, off, lim)
+            self._mirror_note_total(feed_id, total)
+            return articles, total
         except RateLimitError:
             stale = self._get_article_view_state(feed_id, require_fresh=False)
             if stale:
@@ -694,6 +927,7 @@ class InoreaderProvider(RSSProvider):
                 "a": "user/-/state/com.google/read"
             })
             self._invalidate_article_cache()
+            self._note_flags([article_id], is_read=True)
             return True
         except Exception as e:
             log.error(f"Inoreader Mark Read Error: {e}")
@@ -707,6 +941,7 @@ class InoreaderProvider(RSSProvider):
                 "r": "user/-/state/com.google/read"
             })
             self._invalidate_article_cache()
+            self._note_flags([article_id], is_read=False)
             return True
         except Exception as e:
             log.error(f"Inoreader Mark Unread Error: {e}")
@@ -718,6 +953,12 @@ class InoreaderProvider(RSSProvider):
             self._invalidate_article_cache()
         return ok
 
+    def mark_unread_batch(self, article_ids: List[str]) -> bool:
+        ok = self._set_read_state_batch(article_ids, False)
+        if ok:
+            self._invalidate_article_cache()
+        return ok
+
     def mark_all_read(self, feed_id: str) -> bool:
         if not self._has_required_auth():
             return False
@@ -737,6 +978,11 @@ class InoreaderProvider(RSSProvider):
             )
             if getattr(resp, "ok", False):
                 self._invalidate_article_cache()
+                if self._mirror is not None:
+                    self._mirror.mark_view_read(feed_id)
+                if self._page_cache_account:
+                    # Which cached items the server just marked is unknown; start those pages over.
+                    stream_page_cache.drop_stream(self._page_cache_account)
                 return True
         except Exception as e:
             log.error(f"Inoreader mark-all-as-read failed for {feed_id}: {e}")
@@ -766,6 +1012,7 @@ class InoreaderProvider(RSSProvider):
                 action: "user/-/state/com.google/starred"
             })
             self._invalidate_article_cache()
+            self._note_flags([article_id], is_starred=is_favorite)
             return True
         except Exception as e:
             log.error(f"Inoreader Set Favorite Error: {e}")
@@ -11,12 +11,16 @@ from collections import defaultdict
 from urllib.parse import urlparse
 from .base import RSSProvider
 from core.models import Feed, Article
-from core.db import get_connection, init_db
+from core.db import get_connection, init_db, connection as db_connection
 from core.discovery import discover_feed
 from core import utils
 from core import rumble as rumble_mod
 from core import odysee as odysee_mod
 from core import npr as npr_mod
+from core import listing_sources
+from core import search_index
+from core import change_feed
+from core import view_delta
 from bs4 import BeautifulSoup as BS, XMLParsedAsHTMLWarning
 import xml.etree.ElementTree as ET
 import logging
@@ -92,6 +96,24 @@ def _rollback_and_abort_on_foreign_key(conn: sqlite3.Connection, error: Exceptio
     return True
 
 
+def _conflicting_article_ids(cursor, feed_id: str, article_ids) -> set:
+    """Ids among article_ids already used by another feed's articles (these get feed-scoped ids)."""
+    ids = list(dict.fromkeys(aid for aid in article_ids if aid))
+    conflicting = set()
+    chunk_size = 900
+    for i in range(0, len(ids), chunk_size):
+        chunk = ids[i:i + chunk_size]
+        placeholders = ",".join(["?"] * len(chunk))
+        cursor.execute(
+            f"SELECT id, feed_id FROM articles WHERE id IN ({placeholders})",
+            chunk,
+        )
+        for row in cursor.fetchall():
+            if row[1] != feed_id:
+                conflicting.add(row[0])
+    return conflicting
+
+
 def _adaptive_refresh_worker_cap(cpu_count: Optional[int] = None) -> int:
     cpu = max(1, int(cpu_count if cpu_count is not None else (os.cpu_count() or 1)))
     if cpu <= 2:
@@ -483,6 +505,9 @@ class LocalProvider(RSSProvider):
         status = "ok"
         new_items = 0
         new_article_summaries = []
+        # Ids written by this refresh, published on the change feed once the feed is done.
+        added_ids = []
+        updated_ids = []
         error_msg = None
         final_title = feed_title or "Unknown Feed"
         failure_cooldown_seconds = None
@@ -518,6 +543,7 @@ class LocalProvider(RSSProvider):
             return text
 
         def _record_new_article(article_id, title, author, preview="", url="", media_url="", media_type=""):
+            added_ids.append(article_id)
             if len(new_article_summaries) >= 500:
                 return
             try:
@@ -563,76 +589,34 @@ class LocalProvider(RSSProvider):
         new_last_modified = None
 
         try:
-            from core import rumble as rumble_mod
-            from core import odysee as odysee_mod
-
-            is_odysee_listing = (
-                odysee_mod.is_odysee_url(feed_url)
-                and not str(feed_url).lower().endswith((".xml", ".rss", ".atom"))
-            )
-            if is_odysee_listing:
-                normalized_feed_url = odysee_mod.normalize_odysee_feed_url(feed_url)
-                if normalized_feed_url and normalized_feed_url != feed_url:
-                    try:
-                        connu = get_connection()
-                        try:
-                            cu = connu.cursor()
-                            cu.execute("UPDATE feeds SET url = ? WHERE id = ?", (normalized_feed_url, feed_id))
-                            connu.commit()
-                            feed_url = normalized_feed_url
-                        finally:
-                            connu.close()
-                    except Exception:
-                        feed_url = normalized_feed_url
-
-                existing_count = 0
-                try:
-                    conn0 = get_connection()
-                    try:
-                        c0 = conn0.cursor()
-                        c0.execute("SELECT COUNT(*) FROM articles WHERE feed_id = ?", (feed_id,))
-                        existing_count = int(c0.fetchone()[0] or 0)
-                    finally:
-                        conn0.close()
-                except Exception:
-                    existing_count = 0
-
-                try:
-                    max_items = int(
-                        self.config.get("odysee_max_items_initial", 150)
-                        if existing_count == 0
-                        else self.config.get("odysee_max_items_refresh", 60)
-                    )
-                except Exception:
-                    max_items = 150 if existing_count == 0 else 60
-                max_items = max(1, min(500, max_items))
-
-                page_title = None
-                all_items = []
-
-                with limiter:
-                    last_exc = None
-                    attempts = retries + 1
-                    for attempt in range(1, attempts + 1):
-                        try:
-                            page_title, all_items = odysee_mod.fetch_listing_items(
-                                feed_url,
-                                max_items=int(max_items),
-                                timeout_s=float(feed_timeout),
-                            )
-                            break
-                        except Exception as e:
-                            last_exc = e
-                            status = "error"
-                            error_msg = str(e)
-                            if attempt <= retries:
-                                backoff = min(4, attempt)
-                                time.sleep(backoff)
-                                continue
-                            raise last_exc
-
-                if page_title:
-                    final_title = page_title
+            listing_source = listing_sources.source_for(feed_url)
+            if listing_source is not None:
+                # Rumble/Odysee channel and playlist pages are listings, not RSS. Their pages are
+                # fetched in parallel on the listing resolver pool (not under this host's
+                # semaphore) and stop at the first page holding an article we already have.
+                normalized_feed_url = listing_source.normalize(feed_url) or feed_url
+
+                with db_connection() as conn0:
+                    c0 = conn0.cursor()
+                    c0.execute("SELECT id, date FROM articles WHERE feed_id = ?", (feed_id,))
+                    existing_articles = {row[0]: row[1] or "" for row in c0.fetchall()}
+                scoped_prefix = f"{feed_id}:"
+                known_ids = {
+                    aid[len(scoped_prefix):] if aid.startswith(scoped_prefix) else aid
+                    for aid in existing_articles
+                }
+
+                listing = listing_sources.fetch_listing(
+                    listing_source,
+                    normalized_feed_url,
+                    known_ids=known_ids,
+                    max_pages=listing_source.max_pages(self.config, initial=not existing_articles),
+                    timeout_s=float(feed_timeout),
+                    retries=retries,
+                )
+                feed_url = normalized_feed_url
+                if listing.title:
+                    final_title = listing.title
 
                 conn = get_connection()
                 try:
@@ -643,200 +627,56 @@ class LocalProvider(RSSProvider):
                     title_to_store = (
                         str(feed_title or "").strip() if bool(int(title_is_custom or 0)) and str(feed_title or "").strip() else final_title
                     )
+                    # Listing pages have no ETag/Last-Modified; the normalized URL is stored with the title.
                     c.execute(
-                        "UPDATE feeds SET title = ?, etag = ?, last_modified = ? WHERE id = ?",
-                        (title_to_store, None, None, feed_id),
+                        "UPDATE feeds SET url = ?, title = ?, etag = ?, last_modified = ? WHERE id = ?",
+                        (feed_url, title_to_store, None, None, feed_id),
                     )
-                    conn.commit()
-
-                    total_entries = len(all_items)
-                    for i, item in enumerate(all_items):
-                        try:
-                            article_id = item.id
-                            title = item.title or "No Title"
-                            url = item.url or ""
-                            author = item.author or final_title or "Odysee"
-                            raw_date = item.published or ""
-                            date = utils.normalize_date(raw_date, title, "", url)
-
-                            c.execute("SELECT date FROM articles WHERE id = ?", (article_id,))
-                            row = c.fetchone()
-                            if row:
-                                existing_date = row[0] or ""
-                                if existing_date != date:
-                                    c.execute("UPDATE articles SET date = ? WHERE id = ?", (date, article_id))
-                                    if i % 5 == 0 or i == total_entries - 1:
-                                        conn.commit()
-                                continue
 
-                            c.execute(
-                                "INSERT INTO articles (id, feed_id, title, url, content, date, author, is_read, media_url, media_type) "
-                                "VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?, ?)",
-                                (article_id, feed_id, title, url, "", date, author, None, None),
-                            )
-                            new_items += 1
-                            _record_new_article(article_id, title, author, url=url)
-
-                            if i % 5 == 0 or i == total_entries - 1:
-                                conn.commit()
-                        except sqlite3.IntegrityError as e:
-                            if _rollback_and_abort_on_foreign_key(conn, e):
-                                return
-                            log.debug(f"Odysee entry parse/insert failed for {feed_url}: {e}")
-                            continue
-                        except Exception as e:
-                            log.debug(f"Odysee entry parse/insert failed for {feed_url}: {e}")
+                    entry_ids = [
+                        item.id
+                        for item in listing.items
+                        if item.id not in existing_articles and f"{feed_id}:{item.id}" not in existing_articles
+                    ]
+                    conflicting_ids = _conflicting_article_ids(c, feed_id, entry_ids)
+
+                    for item in listing.items:
+                        base_id = item.id
+                        scoped_id = f"{feed_id}:{base_id}"
+                        title = item.title or "No Title"
+                        url = item.url or ""
+                        author = item.author or final_title or listing_source.label
+                        date = utils.normalize_date(item.published or "", title, "", url)
+
+                        known_id = base_id if base_id in existing_articles else scoped_id if scoped_id in existing_articles else None
+                        if known_id is not None:
+                            if existing_articles[known_id] != date:
+                                c.execute("UPDATE articles SET date = ? WHERE id = ?", (date, known_id))
+                                updated_ids.append(known_id)
                             continue
-                finally:
-                    try:
-                        conn.close()
-                    except Exception:
-                        pass
-
-                return
 
-            is_rumble_listing = (
-                rumble_mod.is_rumble_url(feed_url)
-                and not str(feed_url).lower().endswith((".xml", ".rss", ".atom"))
-            )
-
-            if is_rumble_listing:
-                # Rumble listing pages (channels/playlists/subscriptions) are HTML, not RSS.
-                # Fetch via curl and scrape the video list into synthetic entries.
-                normalized_feed_url = rumble_mod.normalize_rumble_feed_url(feed_url)
-                if normalized_feed_url and normalized_feed_url != feed_url:
-                    try:
-                        connu = get_connection()
+                        article_id = scoped_id if base_id in conflicting_ids else base_id
                         try:
-                            cu = connu.cursor()
-                            cu.execute("UPDATE feeds SET url = ? WHERE id = ?", (normalized_feed_url, feed_id))
-                            connu.commit()
-                            feed_url = normalized_feed_url
-                        finally:
-                            connu.close()
-                    except Exception:
-                        feed_url = normalized_feed_url
-
-                existing_count = 0
-                try:
-                    conn0 = get_connection()
-                    try:
-                        c0 = conn0.cursor()
-                        c0.execute("SELECT COUNT(*) FROM articles WHERE feed_id = ?", (feed_id,))
-                        existing_count = int(c0.fetchone()[0] or 0)
-                    finally:
-                        conn0.close()
-                except Exception:
-                    existing_count = 0
-
-                try:
-                    max_pages = int(self.config.get("rumble_max_pages_initial", 3) if existing_count == 0 else self.config.get("rumble_max_pages_refresh", 1))
-                except Exception:
-                    max_pages = 3 if existing_count == 0 else 1
-                max_pages = max(1, min(10, max_pages))
-
-                from urllib.parse import urlencode, urlsplit, urlunsplit, parse_qs
-
-                def _with_page(u: str, page: int) -> str:
-                    try:
-                        parts = urlsplit(u)
-                        qs = parse_qs(parts.query)
-                        qs["page"] = [str(int(page))]
-                        return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(qs, doseq=True), ""))
-                    except Exception:
-                        return u
-
-                page_title = None
-                all_items = []
-
-                with limiter:
-                    last_exc = None
-                    attempts = retries + 1
-                    for attempt in range(1, attempts + 1):
-                        try:
-                            all_items.clear()
-                            page_title = None
-                            for page in range(1, max_pages + 1):
-                                page_url = feed_url if page == 1 else _with_page(feed_url, page)
-                                t, items = rumble_mod.fetch_listing_items(page_url, timeout_s=float(feed_timeout))
-                                if t and not page_title:
-                                    page_title = t
-                                if not items:
-                                    break
-                                all_items.extend(items)
-                            break
-                        except Exception as e:
-                            last_exc = e
-                            status = "error"
-                            error_msg = str(e)
-                            if attempt <= retries:
-                                backoff = min(4, attempt)
-                                time.sleep(backoff)
-                                continue
-                            raise last_exc
-
-                if page_title:
-                    final_title = page_title
-
-                conn = get_connection()
-                try:
-                    c = conn.cursor()
-                    c.execute("SELECT 1 FROM feeds WHERE id = ? LIMIT 1", (feed_id,))
-                    if not c.fetchone():
-                        return
-                    # Clear conditional-cache metadata (HTML listing refresh does not use ETag/Last-Modified)
-                    title_to_store = (
-                        str(feed_title or "").strip() if bool(int(title_is_custom or 0)) and str(feed_title or "").strip() else final_title
-                    )
-                    c.execute(
-                        "UPDATE feeds SET title = ?, etag = ?, last_modified = ? WHERE id = ?",
-                        (title_to_store, None, None, feed_id),
-                    )
-                    conn.commit()
-
-                    total_entries = len(all_items)
-                    for i, item in enumerate(all_items):
-                        try:
-                            article_id = item.id
-                            title = item.title or "No Title"
-                            url = item.url or ""
-                            author = item.author or final_title or "Rumble"
-                            raw_date = item.published or ""
-                            date = utils.normalize_date(raw_date, title, "", url)
-
-                            c.execute("SELECT date FROM articles WHERE id = ?", (article_id,))
-                            row = c.fetchone()
-                            if row:
-                                existing_date = row[0] or ""
-                                if existing_date != date:
-                                    c.execute("UPDATE articles SET date = ? WHERE id = ?", (date, article_id))
-                                    if i % 5 == 0 or i == total_entries - 1:
-                                        conn.commit()
-                                continue
-
                             c.execute(
-                                "INSERT INTO articles (id, feed_id, title, url, content, date, author, is_read, media_url, media_type) "
-                                "VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?, ?)",
-                                (article_id, feed_id, title, url, "", date, author, None, None),
+                                "INSERT INTO articles (id, feed_id, title, url, content, date, author, is_read, media_url, media_type, published_ts) "
+                                "VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?, ?, ?)",
+                                (article_id, feed_id, title, url, "", date, author, None, None, utils.date_to_timestamp(date)),
                             )
-                            new_items += 1
-                            _record_new_article(article_id, title, author, url=url)
-
-                            if i % 5 == 0 or i == total_entries - 1:
-                                conn.commit()
                         except sqlite3.IntegrityError as e:
                             if _rollback_and_abort_on_foreign_key(conn, e):
+                                status = "deleted"
+                                error_msg = None
                                 return
-                            log.debug(f"Rumble entry parse/insert failed for {feed_url}: {e}")
-                            continue
-                        except Exception as e:
-                            log.debug(f"Rumble entry parse/insert failed for {feed_url}: {e}")
+                            log.debug(f"{listing_source.label} entry insert failed for {feed_url}: {e}")
                             continue
+                        new_items += 1
+                        _record_new_article(article_id, title, author, url=url)
+                        existing_articles[article_id] = date
+
+                    # Commit once at the end
+                    conn.commit()
                 finally:
-                    try:
-                        conn.close()
-                    except Exception:
-                        pass
+                    conn.close()
 
                 return
 
@@ -1002,20 +842,7 @@ class LocalProvider(RSSProvider):
                     if base_id in existing_articles or scoped_id in existing_articles:
                         continue
                     entry_ids.append(base_id)
-                entry_ids = list(dict.fromkeys(entry_ids))
-                conflicting_ids = set()
-                if entry_ids:
-                    chunk_size = 900
-                    for i in range(0, len(entry_ids), chunk_size):
-                        chunk = entry_ids[i:i + chunk_size]
-                        placeholders = ",".join(["?"] * len(chunk))
-                        c.execute(
-                            f"SELECT id, feed_id FROM articles WHERE id IN ({placeholders})",
-                            chunk,
-                        )
-                        for row in c.fetchall():
-                            if row[1] != feed_id:
-                                conflicting_ids.add(row[0])
+                conflicting_ids = _conflicting_article_ids(c, feed_id, entry_ids)
                 
                 total_entries = len(d.entries)
                 for i, entry in enumerate(d.entries):
@@ -1082,12 +909,14 @@ class LocalProvider(RSSProvider):
                     if existing_date is not None:
                         if existing_date != date:
                                 c.execute("UPDATE articles SET date = ? WHERE id = ?", (date, base_id))
+                                updated_ids.append(base_id)
                         continue
 
                     existing_date = existing_articles.get(scoped_id)
                     if existing_date is not None:
                         if existing_date != date:
                                 c.execute("UPDATE articles SET date = ? WHERE id = ?", (date, scoped_id))
+                                updated_ids.append(scoped_id)
                         continue
 
                     if base_id in conflicting_ids:
@@ -1164,8 +993,8 @@ class LocalProvider(RSSProvider):
 
                     try:
                         c.execute(
-                            "INSERT INTO articles (id, feed_id, title, url, content, date, author, is_read, media_url, media_type, chapter_url) VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?, ?, ?)",
-                            (article_id, feed_id, title, url, content, date, author, media_url, media_type, chapter_url),
+                            "INSERT INTO articles (id, feed_id, title, url, content, date, author, is_read, media_url, media_type, chapter_url, published_ts) VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?, ?, ?, ?)",
+                            (article_id, feed_id, title, url, content, date, author, media_url, media_type, chapter_url, utils.date_to_timestamp(date)),
                         )
                         new_items += 1
                         _record_new_article(
@@ -1196,12 +1025,13 @@ class LocalProvider(RSSProvider):
                                 if existing_feed_id == feed_id:
                                     if existing_date != date:
                                         c.execute("UPDATE articles SET date = ? WHERE id = ?", (date, base_id))
+                                        updated_ids.append(base_id)
                                     continue
 
                                 try:
                                     c.execute(
-                                        "INSERT INTO articles (id, feed_id, title, url, content, date, author, is_read, media_url, media_type, chapter_url) VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?, ?, ?)",
-                                        (scoped_id, feed_id, title, url, content, date, author, media_url, media_type, chapter_url),
+                                        "INSERT INTO articles (id, feed_id, title, url, content, date, author, is_read, media_url, media_type, chapter_url, published_ts) VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?, ?, ?, ?)",
+                                        (scoped_id, feed_id, title, url, content, date, author, media_url, media_type, chapter_url, utils.date_to_timestamp(date)),
                                     )
                                     article_id = scoped_id
                                     new_items += 1
@@ -1242,6 +1072,12 @@ class LocalProvider(RSSProvider):
                     failure_cooldown_seconds or _TRANSIENT_FAILURE_COOLDOWN_SECONDS,
                     error_msg,
                 )
+            if added_ids or updated_ids:
+                try:
+                    change_feed.publish_ids(change_feed.ADDED, feed_id, added_ids)
+                    change_feed.publish_ids(change_feed.UPDATED, feed_id, updated_ids)
+                except Exception:
+                    log.debug("Publishing article changes failed", exc_info=True)
             state = self._collect_feed_state(
                 feed_id,
                 final_title,
@@ -1255,25 +1091,18 @@ class LocalProvider(RSSProvider):
 
     def _collect_feed_state(self, feed_id, title, category, status, new_items, error_msg, new_articles=None):
         unread = 0
-        conn = None
         try:
-            conn = get_connection()
-            c = conn.cursor()
-            c.execute("SELECT title, category FROM feeds WHERE id = ?", (feed_id,))
-            row = c.fetchone()
-            if row:
-                title = row[0] or title
-                category = row[1] or category
-            c.execute("SELECT COUNT(*) FROM articles WHERE feed_id = ? AND is_read = 0", (feed_id,))
-            unread = c.fetchone()[0] or 0
+            with db_connection() as conn:
+                c = conn.cursor()
+                c.execute("SELECT title, category FROM feeds WHERE id = ?", (feed_id,))
+                row = c.fetchone()
+                if row:
+                    title = row[0] or title
+                    category = row[1] or category
+                c.execute("SELECT COUNT(*) FROM articles WHERE feed_id = ? AND is_read = 0", (feed_id,))
+                unread = c.fetchone()[0] or 0
         except Exception as e:
             log.debug(f"Feed state fetch failed for {feed_id}: {e}")
-        finally:
-            if conn:
-                try:
-                    conn.close()
-                except Exception:
-                    pass
         return {
             "id": feed_id,
             "title": title,
@@ -1313,28 +1142,8 @@ class LocalProvider(RSSProvider):
             conn.close()
 
     def _parse_article_view_filters(self, feed_id: str) -> Tuple[str, Optional[int], Optional[int]]:
-        filter_read = None  # None=all, 0=unread, 1=read
-        filter_favorite = None  # None=all, 1=favorites only
-        real_feed_id = feed_id or ""
-
         # Allow stacking prefixes in any order, e.g. "favorites:unread:all".
-        while True:
-            if real_feed_id.startswith("favorites:"):
-                filter_favorite = 1
-                real_feed_id = real_feed_id[10:]
-            elif real_feed_id.startswith("fav:"):
-                filter_favorite = 1
-                real_feed_id = real_feed_id[4:]
-            elif real_feed_id.startswith("unread:"):
-                filter_read = 0
-                real_feed_id = real_feed_id[7:]
-            elif real_feed_id.startswith("read:"):
-                filter_read = 1
-                real_feed_id = real_feed_id[5:]
-            else:
-                break
-
-        return real_feed_id, filter_read, filter_favorite
+        return view_delta.split_view_id(feed_id)
 
     def get_articles(self, feed_id: str) -> List[Article]:
         conn = get_connection()
@@ -1344,7 +1153,7 @@ class LocalProvider(RSSProvider):
             # Determine filters
             real_feed_id, filter_read, filter_favorite = self._parse_article_view_filters(feed_id)
 
-            sql_parts = ["SELECT id, feed_id, title, url, content, date, author, is_read, is_favorite, media_url, media_type FROM articles"]
+            sql_parts = ["SELECT id, feed_id, title, url, content, date, author, is_read, is_favorite, media_url, media_type, published_ts FROM articles"]
             where_clauses = []
             params = []
             
@@ -1359,7 +1168,7 @@ class LocalProvider(RSSProvider):
                 sub_cats = get_subcategory_titles(cat_name)
                 cat_names = [cat_name] + sub_cats
                 sql_parts = ["""
-                    SELECT a.id, a.feed_id, a.title, a.url, a.content, a.date, a.author, a.is_read, a.is_favorite, a.media_url, a.media_type
+                    SELECT a.id, a.feed_id, a.title, a.url, a.content, a.date, a.author, a.is_read, a.is_favorite, a.media_url, a.media_type, a.published_ts
                     FROM articles a
                     JOIN feeds f ON a.feed_id = f.id
                 """]
@@ -1384,7 +1193,7 @@ class LocalProvider(RSSProvider):
             if where_clauses:
                 sql_parts.append("WHERE " + " AND ".join(where_clauses))
             
-            sort_col = "a.date" if is_category else "date"
+            sort_col = "a.published_ts" if is_category else "published_ts"
             sort_id = "a.id" if is_category else "id"
             sql_parts.append(f"ORDER BY {sort_col} DESC, {sort_id} DESC")
             
@@ -1415,7 +1224,7 @@ class LocalProvider(RSSProvider):
                 
                 articles.append(Article(
                     id=row[0], feed_id=row[1], title=row[2], url=row[3], content=row[4], date=row[5], author=row[6], is_read=bool(row[7]),
-                    is_favorite=bool(row[8]), media_url=row[9], media_type=row[10], chapters=chs
+                    is_favorite=bool(row[8]), media_url=row[9], media_type=row[10], chapters=chs, published_ts=row[11]
                 ))
             return articles
         finally:
@@ -1480,13 +1289,13 @@ class LocalProvider(RSSProvider):
             total = int(c.fetchone()[0] or 0)
 
             # 2. Fetch Page
-            sql_parts = ["SELECT id, feed_id, title, url, content, date, author, is_read, is_favorite, media_url, media_type FROM articles"]
+            sql_parts = ["SELECT id, feed_id, title, url, content, date, author, is_read, is_favorite, media_url, media_type, published_ts FROM articles"]
             where_clauses = []
             params = []
 
             if is_category:
                 sql_parts = ["""
-                    SELECT a.id, a.feed_id, a.title, a.url, a.content, a.date, a.author, a.is_read, a.is_favorite, a.media_url, a.media_type
+                    SELECT a.id, a.feed_id, a.title, a.url, a.content, a.date, a.author, a.is_read, a.is_favorite, a.media_url, a.media_type, a.published_ts
                     FROM articles a
                     JOIN feeds f ON a.feed_id = f.id
                 """]
@@ -1510,7 +1319,7 @@ class LocalProvider(RSSProvider):
             if where_clauses:
                 sql_parts.append("WHERE " + " AND ".join(where_clauses))
                 
-            sort_col = "a.date" if is_category else "date"
+            sort_col = "a.published_ts" if is_category else "published_ts"
             sort_id = "a.id" if is_category else "id"
             sql_parts.append(f"ORDER BY {sort_col} DESC, {sort_id} DESC LIMIT ? OFFSET ?")
             params.append(limit)
@@ -1552,12 +1361,150 @@ class LocalProvider(RSSProvider):
                     is_favorite=bool(r[8]),
                     media_url=r[9],
                     media_type=r[10],
-                    chapters=chapters
+                    chapters=chapters,
+                    published_ts=r[11],
                 ))
             return articles, total
         finally:
             conn.close()
 
+    def publishes_article_changes(self) -> bool:
+        return True
+
+    def supports_article_search(self) -> bool:
+        conn = get_connection()
+        try:
+            return search_index.index_exists(conn)
+        finally:
+            conn.close()
+
+    def search_articles(
+        self,
+        query: str,
+        feed_id: str = "all",
+        offset: int = 0,
+        limit: int = 200,
+        title_only: bool = False,
+    ):
+        """Ranked full-text search over stored articles using the FTS5 index."""
+        match = search_index.build_match_query(query, title_only=title_only)
+        if not match:
+            return [], 0
+        offset = int(max(0, offset))
+        limit = int(limit)
+
+        conn = get_connection()
+        try:
+            if not search_index.index_exists(conn):
+                return [], 0
+            c = conn.cursor()
+
+            real_feed_id, filter_read, filter_favorite = self._parse_article_view_filters(feed_id)
+            where_clauses = [f"{search_index.FTS_TABLE} MATCH ?"]
+            params: List[Any] = [match]
+            join_feeds = ""
+            if real_feed_id.startswith("category:"):
+                cat_name = real_feed_id.split(":", 1)[1]
+                from core.db import get_subcategory_titles
+                cat_names = [cat_name] + get_subcategory_titles(cat_name)
+                join_feeds = "JOIN feeds f ON a.feed_id = f.id"
+                where_clauses.append(f"f.category IN ({','.join('?' for _ in cat_names)})")
+                params.extend(cat_names)
+            elif real_feed_id and real_feed_id != "all":
+                where_clauses.append("a.feed_id = ?")
+                params.append(real_feed_id)
+            if filter_read is not None:
+                where_clauses.append("a.is_read = ?")
+                params.append(filter_read)
+            if filter_favorite is not None:
+                where_clauses.append("a.is_favorite = ?")
+                params.append(filter_favorite)
+
+            from_sql = (
+                f"FROM {search_index.FTS_TABLE} "
+                f"JOIN articles a ON a.rowid = {search_index.FTS_TABLE}.rowid "
+                f"{join_feeds} WHERE " + " AND ".join(where_clauses)
+            )
+            c.execute(f"SELECT COUNT(*) {from_sql}", tuple(params))
+            total = int(c.fetchone()[0] or 0)
+            if limit <= 0 or total == 0:
+                return [], total
+
+            c.execute(
+                "SELECT a.id, a.feed_id, a.title, a.url, a.content, a.date, a.author, a.is_read, a.is_favorite, "
+                f"a.media_url, a.media_type, a.published_ts {from_sql} "
+                f"ORDER BY {search_index.bm25_expression()}, a.published_ts DESC LIMIT ? OFFSET ?",
+                tuple(params) + (limit, offset),
+            )
+            rows = c.fetchall()
+
+            chapters_map = utils.get_chapters_batch([r[0] for r in rows]) if rows else {}
+            articles: List[Article] = []
+            for r in rows:
+                articles.append(Article(
+                    id=r[0],
+                    feed_id=r[1],
+                    title=r[2],
+                    url=r[3],
+                    content=r[4],
+                    date=r[5],
+                    author=r[6],
+                    is_read=bool(r[7]),
+                    is_favorite=bool(r[8]),
+                    media_url=r[9],
+                    media_type=r[10],
+                    chapters=chapters_map.get(r[0], []),
+                    published_ts=r[11],
+                ))
+            return articles, total
+        except sqlite3.OperationalError as e:
+            log.warning("Article search failed for %r: %s", query, e)
+            return [], 0
+        finally:
+            conn.close()
+
+    def get_articles_by_ids(self, article_ids: List[str]) -> List[Article]:
+        ids = [str(a) for a in (article_ids or []) if a]
+        if not ids:
+            return []
+
+        conn = get_connection()
+        try:
+            c = conn.cursor()
+            rows = []
+            chunk_size = 900
+            for i in range(0, len(ids), chunk_size):
+                chunk = ids[i:i + chunk_size]
+                placeholders = ",".join("?" for _ in chunk)
+                c.execute(
+                    "SELECT id, feed_id, title, url, content, date, author, is_read, is_favorite, media_url, media_type, published_ts "
+                    f"FROM articles WHERE id IN ({placeholders})",
+                    chunk,
+                )
+                rows.extend(c.fetchall())
+        finally:
+            conn.close()
+
+        chapters_map = utils.get_chapters_batch([r[0] for r in rows]) if rows else {}
+        return [
+            Article(
+                id=r[0],
+                feed_id=r[1],
+                title=r[2],
+                url=r[3],
+                content=r[4],
+                date=r[5],
+                author=r[6],
+                is_read=bool(r[7]),
+                is_favorite=bool(r[8]),
+                media_url=r[9],
+                media_type=r[10],
+                chapters=chapters_map.get(r[0], []),
+                published_ts=r[11],
+            )
+            for r in rows
+        ]
+
     def get_article_by_id(self, article_id: str) -> Optional[Article]:
         aid = str(article_id or "").strip()
         if not aid:
@@ -1567,7 +1514,7 @@ class LocalProvider(RSSProvider):
         try:
             c = conn.cursor()
             c.execute(
-                "SELECT id, feed_id, title, url, content, date, author, is_read, is_favorite, media_url, media_type "
+                "SELECT id, feed_id, title, url, content, date, author, is_read, is_favorite, media_url, media_type, published_ts "
                 "FROM articles WHERE id = ? LIMIT 1",
                 (aid,),
             )
@@ -1594,6 +1541,7 @@ class LocalProvider(RSSProvider):
                 media_url=row[9],
                 media_type=row[10],
                 chapters=chapters,
+                published_ts=row[11],
             )
         finally:
             conn.close()
@@ -1618,6 +1566,28 @@ class LocalProvider(RSSProvider):
         finally:
             conn.close()
 
+    def mark_read_batch(self, article_ids: List[str]) -> bool:
+        return self._set_read_state_batch(article_ids, True)
+
+    def mark_unread_batch(self, article_ids: List[str]) -> bool:
+        return self._set_read_state_batch(article_ids, False)
+
+    def _set_read_state_batch(self, article_ids: List[str], is_read: bool) -> bool:
+        ids = [str(aid) for aid in (article_ids or []) if aid]
+        if not ids:
+            return True
+        # One write transaction for the whole batch, chunked under SQLite's variable limit.
+        with db_connection(write=True) as conn:
+            c = conn.cursor()
+            for i in range(0, len(ids), 900):
+                chunk = ids[i:i + 900]
+                placeholders = ",".join("?" for _ in chunk)
+                c.execute(
+                    f"UPDATE articles SET is_read = ? WHERE id IN ({placeholders})",
+                    [1 if is_read else 0] + chunk,
+                )
+        return True
+
     def mark_all_read(self, feed_id: str) -> bool:
         if not feed_id:
             return False
@@ -1731,12 +1701,9 @@ class LocalProvider(RSSProvider):
         
         title = real_url
         try:
-            if rumble_mod.is_rumble_url(real_url) and not real_url.lower().endswith((".xml", ".rss", ".atom")):
-                page_title, _items = rumble_mod.fetch_listing_items(real_url, timeout_s=10.0)
-                title = page_title or real_url
-            elif odysee_mod.is_odysee_url(real_url) and not real_url.lower().endswith((".xml", ".rss", ".atom")):
-                page_title, _items = odysee_mod.fetch_listing_items(real_url, max_items=1, timeout_s=10.0)
-                title = page_title or real_url
+            listing_source = listing_sources.source_for(real_url)
+            if listing_source is not None:
+                title = listing_source.fetch_title(real_url, timeout_s=10.0) or real_url
             else:
                 resp = utils.safe_requests_get(real_url, timeout=10)
                 d = feedparser.parse(resp.text)
@@ -3,16 +3,27 @@ import re
 import logging
 import time
 import copy
+import json
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup
 from datetime import datetime, timezone, timedelta
 from dateutil import parser as dateparser
 from .base import RSSProvider
 from core.models import Feed, Article
-from core import utils
+from core import article_mirror, utils
 
 log = logging.getLogger(__name__)
 
+# Local mirror sync (see core.article_mirror).
+MIRROR_PAGE_SIZE = 250
+MIRROR_MAX_DELTA_PAGES = 20
+# changed_at has second resolution; re-read a little so edits within the same second are not lost.
+MIRROR_WATERMARK_SLACK_S = 2
+# Miniflux purges old read entries without marking them changed; after a long pause resync instead.
+MIRROR_MAX_GAP_S = 7 * 24 * 3600
+# Servers without changed_after list starred entries in full to reconcile them; do that at most this often.
+MIRROR_LEGACY_STARRED_INTERVAL_S = 3600
+
 class MinifluxProvider(RSSProvider):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
@@ -49,6 +60,11 @@ class MinifluxProvider(RSSProvider):
         # This avoids hammering a single broken feed refresh route and spamming logs.
         self._targeted_refresh_backoff_until: dict[str, float] = {}
         self._targeted_refresh_fail_counts: dict[str, int] = {}
+        self._mirror = article_mirror.for_provider(
+            config,
+            self.get_name(),
+            f"{self.base_url}|{self.conf.get('api_key', '')}" if self.base_url else "",
+        )
 
     def _cacheable_get_endpoint(self, endpoint: str) -> str | None:
         ep = str(endpoint or "").split("?", 1)[0].strip()
@@ -671,6 +687,9 @@ class MinifluxProvider(RSSProvider):
                         info.get("status_code"),
                     )
 
+        # Pull new entries into the local mirror before the UI reloads its views.
+        self._sync_mirror_now()
+
         # Re-read feed/counter metadata after targeted refresh requests.
         feeds = self._req("GET", "/v1/feeds") or feeds
         counters_data = self._req("GET", "/v1/feeds/counters") or {}
@@ -790,6 +809,8 @@ class MinifluxProvider(RSSProvider):
             feed.unread_count = counts.get(str(f["id"]), 0) or counts.get(int(f["id"]), 0)
             feeds.append(feed)
 
+        if self._mirror is not None:
+            self._mirror.sync_feeds(feeds)
         return feeds
 
     def get_articles(self, feed_id: str) -> List[Article]:
@@ -882,6 +903,10 @@ class MinifluxProvider(RSSProvider):
 
     def get_articles_page(self, feed_id: str, offset: int = 0, limit: int = 200):
         """Fetch a single page of articles quickly (used by the UI for fast-first loading)."""
+        local = self._mirror_page(feed_id, offset, limit)
+        if local is not None:
+            return local
+
         base_params: Dict[str, Any] = {
             "direction": "desc",
             "order": "published_at",
@@ -918,8 +943,200 @@ class MinifluxProvider(RSSProvider):
             total_int = None
 
         fallback_feed_id = self._strip_view_prefixes(feed_id)
+        self._mirror_note_total(feed_id, total_int)
         return self._entries_to_articles(entries, fallback_feed_id=fallback_feed_id), total_int
 
+    def _entries_changed_at(self, entries: List[Dict[str, Any]]) -> int:
+        return max((utils.date_to_timestamp(e.get("changed_at")) for e in entries), default=0)
+
+    def _get_entries_window(
+        self, params: Dict[str, Any], max_pages: int, offset: int = 0, endpoint: str = "/v1/entries"
+    ) -> tuple[List[Dict[str, Any]], bool] | None:
+        """Page an entries endpoint (ordered by id) up to max_pages; returns (entries, complete) or None on error."""
+        entries: List[Dict[str, Any]] = []
+        for _ in range(int(max_pages)):
+            p = dict(params, limit=MIRROR_PAGE_SIZE, offset=int(offset) + len(entries))
+            data = self._req("GET", endpoint, params=p)
+            if not data:
+                return None
+            page = data.get("entries") or []
+            entries.extend(page)
+            if len(page) < MIRROR_PAGE_SIZE:
+                return entries, True
+        return entries, False
+
+    def _sync_mirror(self, mirror) -> None:
+        """Keep the local mirror current with as little transfer as possible.
+
+        The first sync backfills the newest entries. After that only entries whose
+        changed_at is past the stored watermark are requested; Miniflux bumps
+        changed_at on new entries and on read/starred changes, so one small request
+        carries both new items and status changes. A long pause or an oversized
+        delta drops the mirror for a clean backfill.
+        """
+        watermark = mirror.get_int("changed_watermark")
+        synced_at = mirror.get_int("synced_at") or 0
+        if watermark is None or not mirror.is_primed():
+            self._mirror_backfill(mirror)
+            return
+        if time.time() - synced_at > MIRROR_MAX_GAP_S:
+            log.info("Miniflux mirror is too old for a delta sync; starting over")
+            mirror.reset()
+            self._mirror_backfill(mirror)
+            return
+        if mirror.get_state("changed_after_unsupported") == "1":
+            self._mirror_sync_legacy(mirror)
+            return
+
+        since = max(0, watermark - MIRROR_WATERMARK_SLACK_S)
+        params = {"order": "id", "direction": "asc", "status": ["unread", "read", "removed"], "changed_after": since}
+        window = self._get_entries_window(params, 1)
+        if window is None:
+            return
+        entries, complete = window
+        # Checked on the first page: a server ignoring the filter returns the whole account,
+        # which would otherwise always look like an oversized delta.
+        if any(0 < utils.date_to_timestamp(e.get("changed_at")) < since for e in entries):
+            # Servers before changed_after existed ignore the filter and return everything.
+            log.info("Miniflux server ignores changed_after; falling back to entry-id sync")
+            mirror.set_states({"changed_after_unsupported": 1})
+            self._mirror_sync_legacy(mirror)
+            return
+        if not complete:
+            rest = self._get_entries_window(params, MIRROR_MAX_DELTA_PAGES - 1, offset=len(entries))
+            if rest is None:
+                return
+            entries, complete = entries + rest[0], rest[1]
+        if not complete:
+            log.info("Miniflux mirror delta is too large; starting over")
+            mirror.reset()
+            return
+
+        removed = [str(e.get("id")) for e in entries if e.get("status") == "removed"]
+        kept = [e for e in entries if e.get("status") != "removed"]
+        mirror.delete_articles(removed)
+        mirror.upsert_articles(self._entries_to_articles(kept))
+        mirror.set_states({
+            "changed_watermark": max(watermark, self._entries_changed_at(entries)),
+            "max_entry_id": max([mirror.get_int("max_entry_id") or 0] + [int(e.get("id") or 0) for e in entries]),
+            "synced_at": int(time.time()),
+        })
+
+    def _mirror_backfill(self, mirror) -> None:
+        params: Dict[str, Any] = {
+            "order": "published_at",
+            "direction": "desc",
+            "status": ["unread", "read"],
+        }
+        entries: List[Dict[str, Any]] = []
+        total = None
+        while len(entries) < article_mirror.DEFAULT_INITIAL_ITEMS:
+            p = dict(params, limit=MIRROR_PAGE_SIZE, offset=len(entries))
+            data = self._req("GET", "/v1/entries", params=p)
+            if not data:
+                return
+            page = data.get("entries") or []
+            total = data.get("total")
+            entries.extend(page)
+            if len(page) < MIRROR_PAGE_SIZE:
+                break
+        mirror.upsert_articles(self._entries_to_articles(entries))
+        try:
+            complete = total is not None and len(entries) >= int(total)
+        except (TypeError, ValueError):
+            complete = False
+        oldest = min((utils.date_to_timestamp(e.get("published_at")) for e in entries), default=0)
+        mirror.set_states({
+            "max_entry_id": max((int(e.get("id") or 0) for e in entries), default=0),
+            "changed_watermark": self._entries_changed_at(entries) or int(time.time()),
+            # Entries sharing the oldest timestamp may continue on the next server page.
+            "coverage_ts": 0 if complete else oldest + 1,
+            "synced_at": int(time.time()),
+        })
+
+    def _mirror_sync_legacy(self, mirror) -> None:
+        """New entries by id, then per-feed status reconciliation (servers without changed_after)."""
+        max_id = mirror.get_int("max_entry_id") or 0
+        window = self._get_entries_window(
+            {"order": "id", "direction": "asc", "status": ["unread", "read"], "after_entry_id": max_id},
+            MIRROR_MAX_DELTA_PAGES,
+        )
+        if window is None:
+            return
+        entries, complete = window
+        if not complete:
+            mirror.reset()
+            return
+        mirror.upsert_articles(self._entries_to_articles(entries))
+
+        now = int(time.time())
+        states: Dict[str, Any] = {
+            "max_entry_id": max([max_id] + [int(e.get("id") or 0) for e in entries]),
+            "synced_at": now,
+        }
+        added: Dict[str, int] = {}
+        for e in entries:
+            fid = str(e.get("feed_id") or "")
+            added[fid] = added.get(fid, 0) + 1
+        feed_totals = self._mirror_reconcile_feeds(mirror, added)
+        if feed_totals is not None:
+            states["feed_totals"] = json.dumps(feed_totals, separators=(",", ":"))
+
+        starred_at = mirror.get_int("starred_synced_at") or 0
+        if now - starred_at >= MIRROR_LEGACY_STARRED_INTERVAL_S:
+            listed = self._get_entries_window({"starred": "true", "order": "id", "direction": "asc"}, MIRROR_MAX_DELTA_PAGES)
+            if listed is not None and listed[1]:
+                mirror.reconcile_starred([str(e.get("id")) for e in listed[0]])
+                states["starred_synced_at"] = now
+        mirror.set_states(states)
+
+    def _mirror_reconcile_feeds(self, mirror, added: Dict[str, int]) -> Dict[str, int] | None:
+        """Re-list only feeds whose server counters disagree with the mirror.
+
+        /v1/feeds/counters costs one small request. A feed whose unread count differs
+        gets its unread entries listed; a feed with fewer entries than the mirror holds,
+        or than it had last time plus this sync's additions, lost entries to cleanup and
+        gets its ids listed so the gone ones are pruned. Returns the server's per-feed
+        totals, or None if the server has no counters.
+        """
+        counters = self._req("GET", "/v1/feeds/counters")
+        if not isinstance(counters, dict) or "unreads" not in counters:
+            return None
+        try:
+            unreads = {str(k): int(v) for k, v in (counters.get("unreads") or {}).items()}
+            reads = {str(k): int(v) for k, v in (counters.get("reads") or {}).items()}
+        except (TypeError, ValueError):
+            return None
+        try:
+            previous = json.loads(mirror.get_state("feed_totals") or "{}")
+        except ValueError:
+            previous = {}
+        local = mirror.feed_counts()
+        totals = {fid: unreads.get(fid, 0) + reads.get(fid, 0) for fid in set(unreads) | set(reads)}
+        for fid, (local_unread, local_total) in local.items():
+            server_total = totals.get(fid, 0)
+            last = previous.get(fid)
+            shrank = local_total > server_total or (last is not None and server_total < int(last) + added.get(fid, 0))
+            if shrank:
+                listed = self._get_entries_window(
+                    {"status": ["unread", "read"], "order": "id", "direction": "asc"},
+                    MIRROR_MAX_DELTA_PAGES,
+                    endpoint=f"/v1/feeds/{fid}/entries",
+                )
+                if listed is None or not listed[1]:
+                    continue
+                mirror.prune_feed(fid, [str(e.get("id")) for e in listed[0]])
+                mirror.reconcile_unread([str(e.get("id")) for e in listed[0] if e.get("status") == "unread"], feed_id=fid)
+            elif local_unread != unreads.get(fid, 0):
+                listed = self._get_entries_window(
+                    {"status": ["unread"], "order": "id", "direction": "asc"},
+                    MIRROR_MAX_DELTA_PAGES,
+                    endpoint=f"/v1/feeds/{fid}/entries",
+                )
+                if listed is not None and listed[1]:
+                    mirror.reconcile_unread([str(e.get("id")) for e in listed[0]], feed_id=fid)
+        return totals
+
     def mark_read(self, article_id: str) -> bool:
         return self._set_entries_status([article_id], "read")
 
@@ -929,6 +1146,9 @@ class MinifluxProvider(RSSProvider):
     def mark_read_batch(self, article_ids: List[str]) -> bool:
         return self._set_entries_status(article_ids, "read")
 
+    def mark_unread_batch(self, article_ids: List[str]) -> bool:
+        return self._set_entries_status(article_ids, "unread")
+
     def mark_all_read(self, feed_id: str) -> bool:
         if not self.base_url:
             return False
@@ -973,6 +1193,8 @@ class MinifluxProvider(RSSProvider):
         status = (status or "").strip().lower()
         if status not in ("read", "unread"):
             return False
+        if self._mirror is not None:
+            self._mirror.set_read(entry_ids, status == "read")
 
         # Miniflux supports batching via PUT /v1/entries.
         chunk_size = 200
@@ -1034,6 +1256,8 @@ class MinifluxProvider(RSSProvider):
         current = entry.get("starred", False)
         if current != is_favorite:
             self._req("PUT", f"/v1/entries/{article_id}/bookmark")
+        if self._mirror is not None:
+            self._mirror.set_favorite(article_id, is_favorite)
         return True
 
     def add_feed(self, url: str, category: str = "Uncategorized") -> bool:
@@ -6,7 +6,7 @@ from typing import List, Dict, Any
 from datetime import datetime, timezone
 from .base import RSSProvider
 from core.models import Feed, Article
-from core import utils
+from core import article_mirror, utils
 
 log = logging.getLogger(__name__)
 
@@ -18,6 +18,7 @@ class TheOldReaderProvider(RSSProvider):
         self.password = self.conf.get("password", "")
         self.token = None
         self.base_url = "https://theoldreader.com/reader/api/0"
+        self._mirror = article_mirror.for_provider(config, self.get_name(), self.email)
 
     def get_name(self) -> str:
         return "TheOldReader"
@@ -181,14 +182,49 @@ class TheOldReaderProvider(RSSProvider):
             except Exception as e:
                 log.error(f"TheOldReader batch edit-tag failed: {e}")
                 ok = False
+        if ok and self._mirror is not None:
+            self._mirror.set_read(article_ids, is_read)
         return ok
 
     def refresh(self, progress_cb=None, force: bool = False) -> bool:
         if not self._login():
             log.warning("TheOldReader: Refresh skipped due to login failure.")
             return False
+        self._sync_mirror_now()
         return True
 
+    def _stream_get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        resp = requests.get(
+            f"{self.base_url}/{path}",
+            headers=self._headers(),
+            params=dict(params, output="json"),
+            timeout=self._timeout_s(),
+        )
+        resp.raise_for_status()
+        return resp.json() or {}
+
+    def _sync_mirror(self, mirror) -> None:
+        if not self._login():
+            return
+
+        def fetch_contents(params):
+            # Use 's' parameter for stream ID to avoid path encoding issues with TheOldReader
+            data = self._stream_get("stream/contents", dict(params, s=article_mirror.GREADER_READING_LIST))
+            return self._items_to_articles(data.get("items") or [], ""), data.get("continuation")
+
+        def fetch_unread_ids(params):
+            data = self._stream_get(
+                "stream/items/ids",
+                dict(params, s=article_mirror.GREADER_READING_LIST, xt=article_mirror.GREADER_READ),
+            )
+            return article_mirror.greader_item_ids(data), data.get("continuation")
+
+        def fetch_starred_ids(params):
+            data = self._stream_get("stream/items/ids", dict(params, s=article_mirror.GREADER_STARRED))
+            return article_mirror.greader_item_ids(data), data.get("continuation")
+
+        article_mirror.sync_greader(mirror, fetch_contents, fetch_unread_ids, fetch_starred_ids=fetch_starred_ids)
+
     def get_feeds(self) -> List[Feed]:
         if not self._login(): 
             log.warning("TheOldReader: Get Feeds skipped due to login failure.")
@@ -232,11 +268,88 @@ class TheOldReaderProvider(RSSProvider):
                 ))
                 feeds[-1].unread_count = counts.get(feed_id, 0)
             log.info(f"TheOldReader: Found {len(feeds)} feeds.")
+            if self._mirror is not None:
+                self._mirror.sync_feeds(feeds)
             return feeds
         except Exception as e:
             log.exception(f"TheOldReader Feeds Error: {e}")
             return []
 
+    def _items_to_articles(self, items: List[Dict[str, Any]], fallback_feed_id: str) -> List[Article]:
+        article_ids = [item["id"] for item in items]
+        chapters_map = utils.get_chapters_batch(article_ids)
+        
+        articles = []
+        for item in items:
+            content = ""
+            if "summary" in item: content = item["summary"]["content"]
+            if "content" in item: content = item["content"]["content"]
+            
+            media_url = None
+            media_type = None
+            if "enclosure" in item and item["enclosure"]:
+                encs = item["enclosure"]
+                if isinstance(encs, list) and encs:
+                    media_url = encs[0].get("href")
+                    media_type = encs[0].get("type")
+            
+            article_id = item["id"]
+            article_feed_id = self._resolve_item_feed_id(item, fallback_feed_id)
+            cache_id = self._build_item_cache_id(item, fallback_feed_id)
+            article_url = item.get("alternate", [{}])[0].get("href", "")
+            display_title = utils.enhance_activity_entry_title(item.get("title", ""), article_url, content) or item.get("title", "No Title")
+            pub_timestamp = item.get("published")
+            date = "0001-01-01 00:00:00"
+            if pub_timestamp:
+                try:
+                    dt = datetime.fromtimestamp(int(pub_timestamp), timezone.utc)
+                    date = utils.format_datetime(dt)
+                    log.debug(f"TheOldReader: Parsed date from {pub_timestamp} to {date}")
+                except Exception as date_e:
+                    log.debug(f"TheOldReader: Date parsing error for {pub_timestamp}: {date_e}. Falling back to normalize_date.")
+                    date = utils.normalize_date(
+                        str(pub_timestamp),
+                        display_title,
+                        content,
+                        article_url
+                    )
+            else:
+                log.debug("TheOldReader: 'published' field missing. Falling back to normalize_date.")
+                date = utils.normalize_date(
+                    "",
+                    display_title,
+                    content,
+                    article_url
+                )
+            log.debug(f"TheOldReader: Final article date for '{display_title[:30]}...': {date}")
+            
+            chapters = chapters_map.get(article_id, [])
+
+            is_fav = False
+            is_read_flag = False
+            for cat in item.get("categories", []):
+                if "starred" in cat:
+                    is_fav = True
+                if "read" in cat and "com.google" in cat:
+                    is_read_flag = True
+
+            articles.append(Article(
+                id=article_id,
+                feed_id=article_feed_id,
+                title=display_title,
+                url=article_url,
+                content=content,
+                date=date,
+                author=item.get("author", "Unknown"),
+                is_read=is_read_flag,
+                is_favorite=is_fav,
+                media_url=media_url,
+                media_type=media_type,
+                chapters=chapters,
+                cache_id=cache_id,
+            ))
+        return articles
+
     def get_articles(self, feed_id: str) -> List[Article]:
         if not self._login(): 
             log.warning("TheOldReader: Login failed, cannot get articles.")
@@ -276,79 +389,7 @@ class TheOldReaderProvider(RSSProvider):
             items = data.get("items", [])
             log.info(f"TheOldReader: Found {len(items)} items in API response.")
             
-            article_ids = [item["id"] for item in items]
-            chapters_map = utils.get_chapters_batch(article_ids)
-            
-            articles = []
-            fallback_feed_id = real_feed_id or stream_id or feed_id
-            for item in items:
-                content = ""
-                if "summary" in item: content = item["summary"]["content"]
-                if "content" in item: content = item["content"]["content"]
-                
-                media_url = None
-                media_type = None
-                if "enclosure" in item and item["enclosure"]:
-                    encs = item["enclosure"]
-                    if isinstance(encs, list) and encs:
-                        media_url = encs[0].get("href")
-                        media_type = encs[0].get("type")
-                
-                article_id = item["id"]
-                article_feed_id = self._resolve_item_feed_id(item, fallback_feed_id)
-                cache_id = self._build_item_cache_id(item, fallback_feed_id)
-                article_url = item.get("alternate", [{}])[0].get("href", "")
-                display_title = utils.enhance_activity_entry_title(item.get("title", ""), article_url, content) or item.get("title", "No Title")
-                pub_timestamp = item.get("published")
-                date = "0001-01-01 00:00:00"
-                if pub_timestamp:
-                    try:
-                        dt = datetime.fromtimestamp(int(pub_timestamp), timezone.utc)
-                        date = utils.format_datetime(dt)
-                        log.debug(f"TheOldReader: Parsed date from {pub_timestamp} to {date}")
-                    except Exception as date_e:
-                        log.debug(f"TheOldReader: Date parsing error for {pub_timestamp}: {date_e}. Falling back to normalize_date.")
-                        date = utils.normalize_date(
-                            str(pub_timestamp),
-                            display_title,
-                            content,
-                            article_url
-                        )
-                else:
-                    log.debug("TheOldReader: 'published' field missing. Falling back to normalize_date.")
-                    date = utils.normalize_date(
-                        "",
-                        display_title,
-                        content,
-                        article_url
-                    )
-                log.debug(f"TheOldReader: Final article date for '{display_title[:30]}...': {date}")
-                
-                chapters = chapters_map.get(article_id, [])
-
-                is_fav = False
-                is_read_flag = False
-                for cat in item.get("categories", []):
-                    if "starred" in cat:
-                        is_fav = True
-                    if "read" in cat and "com.google" in cat:
-                        is_read_flag = True
-
-                articles.append(Article(
-                    id=article_id,
-                    feed_id=article_feed_id,
-                    title=display_title,
-                    url=article_url,
-                    content=content,
-                    date=date,
-                    author=item.get("author", "Unknown"),
-                    is_read=is_read_flag,
-                    is_favorite=is_fav,
-                    media_url=media_url,
-                    media_type=media_type,
-                    chapters=chapters,
-                    cache_id=cache_id,
-                ))
+            articles = self._items_to_articles(items, real_feed_id or stream_id or feed_id)
             log.info(f"TheOldReader: Returning {len(articles)} processed articles.")
             return articles
         except requests.exceptions.HTTPError as he:
@@ -358,6 +399,12 @@ class TheOldReaderProvider(RSSProvider):
             log.exception(f"TheOldReader Articles General Error: {e}")
             return []
 
+    def get_articles_page(self, feed_id: str, offset: int = 0, limit: int = 200):
+        local = self._mirror_page(feed_id, offset, limit)
+        if local is not None:
+            return local
+        return super().get_articles_page(feed_id, offset, limit)
+
     def get_article_chapters(self, article_id: str) -> List[Dict]:
         return utils.get_chapters_from_db(article_id)
 
@@ -368,6 +415,8 @@ class TheOldReaderProvider(RSSProvider):
                 "i": article_id,
                 "a": "user/-/state/com.google/read"
             }, timeout=self._timeout_s())
+            if self._mirror is not None:
+                self._mirror.set_read([article_id], True)
             return True
         except:
             return False
@@ -379,6 +428,8 @@ class TheOldReaderProvider(RSSProvider):
                 "i": article_id,
                 "r": "user/-/state/com.google/read"
             }, timeout=self._timeout_s())
+            if self._mirror is not None:
+                self._mirror.set_read([article_id], False)
             return True
         except:
             return False
@@ -386,6 +437,9 @@ class TheOldReaderProvider(RSSProvider):
     def mark_read_batch(self, article_ids: List[str]) -> bool:
         return self._set_read_state_batch(article_ids, True)
 
+    def mark_unread_batch(self, article_ids: List[str]) -> bool:
+        return self._set_read_state_batch(article_ids, False)
+
     def mark_all_read(self, feed_id: str) -> bool:
         if not self._login():
             return False
@@ -404,6 +458,8 @@ class TheOldReaderProvider(RSSProvider):
                 timeout=self._timeout_s(),
             )
             if resp.ok:
+                if self._mirror is not None:
+                    self._mirror.mark_view_read(feed_id)
                 return True
         except Exception as e:
             log.error(f"TheOldReader mark-all-as-read failed for {feed_id}: {e}")
@@ -428,6 +484,8 @@ class TheOldReaderProvider(RSSProvider):
                 "i": article_id,
                 action: "user/-/state/com.google/starred"
             }, timeout=self._timeout_s())
+            if self._mirror is not None:
+                self._mirror.set_favorite(article_id, is_favorite)
             return True
         except Exception as e:
             log.error(f"TheOldReader Set Favorite Error: {e}")
@@ -0,0 +1,166 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import core.db
+from core import change_feed, view_delta
+from core.models import Article
+from providers.local import LocalProvider
+
+_FEED = {"date": "Tue, 27 Jan 2026 05:00:00 GMT"}
+
+
+def _feed_xml():
+    return f"""<?xml version='1.0' encoding='UTF-8'?>
+<rss version='2.0'><channel><title>Delta Feed</title>
+<item><guid>d-1</guid><title>One</title><link>http://example.com/1</link><pubDate>{_FEED['date']}</pubDate></item>
+<item><guid>d-2</guid><title>Two</title><link>http://example.com/2</link><pubDate>Mon, 26 Jan 2026 05:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = _feed_xml().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args, **kwargs):
+        return
+
+
+@pytest.fixture
+def feed_server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}/rss"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+@pytest.fixture
+def changes():
+    seen = []
+    token = change_feed.subscribe(seen.extend)
+    try:
+        yield seen
+    finally:
+        change_feed.unsubscribe(token)
+
+
+def _art(aid, ts, feed_id="f1", is_read=False, is_favorite=False):
+    a = Article(title=aid, url="", content="", date="", author="", feed_id=feed_id, is_read=is_read, id=aid)
+    a.is_favorite = is_favorite
+    a.timestamp = ts
+    return a
+
+
+def _key(a):
+    return a.id
+
+
+def test_refresh_publishes_added_then_updated_changes(tmp_path, monkeypatch, feed_server, changes):
+    monkeypatch.setattr(core.db, "DB_FILE", str(tmp_path / "rss.db"))
+    core.db.init_db()
+    conn = core.db.get_connection()
+    conn.execute(
+        "INSERT INTO feeds (id, url, title, category, icon_url) VALUES ('f1', ?, 'Delta', 'Tests', '')",
+        (feed_server,),
+    )
+    conn.commit()
+    conn.close()
+
+    provider = LocalProvider({"feed_retry_attempts": 0, "feed_timeout_seconds": 2})
+    assert provider.publishes_article_changes()
+    progress = []
+
+    def _progress(state):
+        # Deltas for a feed are published before its progress update.
+        progress.append(len(changes))
+
+    monkeypatch.setitem(_FEED, "date", "Tue, 27 Jan 2026 05:00:00 GMT")
+    provider.refresh(_progress, force=True)
+    assert {(c.feed_id, c.kind) for c in changes} == {("f1", change_feed.ADDED)}
+    assert len(changes) == 2 and progress[-1] == 2
+    ids = {c.article_id for c in changes}
+
+    changes.clear()
+    monkeypatch.setitem(_FEED, "date", "Wed, 28 Jan 2026 05:00:00 GMT")
+    provider.refresh(_progress, force=True)
+    assert len(changes) == 1
+    assert changes[0].kind == change_feed.UPDATED and changes[0].article_id in ids
+
+
+def test_retention_cleanup_publishes_deletions(tmp_path, monkeypatch, changes):
+    monkeypatch.setattr(core.db, "DB_FILE", str(tmp_path / "rss.db"))
+    core.db.init_db()
+    conn = core.db.get_connection()
+    conn.execute("INSERT INTO feeds (id, url, title, category, icon_url) VALUES ('f1', 'u', 'F', 'Tests', '')")
+    conn.execute(
+        "INSERT INTO articles (id, feed_id, title, url, content, date, author, is_read) "
+        "VALUES ('old', 'f1', 't', '', '', '2001-01-01 00:00:00', '', 1)"
+    )
+    conn.commit()
+    conn.close()
+
+    assert core.db.cleanup_old_articles(30) == 1
+    assert changes == [change_feed.ArticleChange("old", "f1", change_feed.DELETED)]
+
+
+def test_subscriber_errors_do_not_stop_other_subscribers(changes):
+    def _boom(_changes):
+        raise RuntimeError("boom")
+
+    token = change_feed.subscribe(_boom)
+    try:
+        change_feed.publish_ids(change_feed.ADDED, "f1", ["a", None, "b"])
+    finally:
+        change_feed.unsubscribe(token)
+    assert [c.article_id for c in changes] == ["a", "b"]
+
+
+def test_article_in_view_follows_scope_and_filters():
+    unread = _art("a", 1, feed_id="f1")
+    fav_read = _art("b", 1, feed_id="f2", is_read=True, is_favorite=True)
+
+    assert view_delta.article_in_view("all", unread)
+    assert view_delta.article_in_view("f1", unread) and not view_delta.article_in_view("f2", unread)
+    assert view_delta.article_in_view("unread:all", unread) and not view_delta.article_in_view("unread:all", fav_read)
+    assert view_delta.article_in_view("favorites:read:f2", fav_read)
+    assert not view_delta.article_in_view("fav:all", unread)
+    assert view_delta.article_in_view("category:News", unread, "News")
+    assert view_delta.article_in_view("category:News", unread, "World", {"News", "World"})
+    assert not view_delta.article_in_view("category:News", unread, "Sports", {"News", "World"})
+
+
+def test_apply_to_view_splices_without_rebuilding():
+    loaded = [_art("c", 30), _art("b", 20), _art("a", 10)]
+    id_set = {"a", "b", "c"}
+
+    delta = view_delta.apply_to_view(
+        loaded,
+        id_set,
+        [(_art("n", 25), True), (_art("old", 5), True), (_art("a", 40), False)],
+        ["b", "missing"],
+        _key,
+    )
+
+    assert [a.id for a in delta.articles] == ["a", "c", "n"]
+    assert id_set == {"a", "c", "n"}
+    assert [a.id for a in loaded] == ["c", "b", "a"]  # input list is left alone
+    # "n" joined the loaded rows, "b" left, "a" moved; "old" is beyond the loaded window.
+    assert delta.loaded_delta == 0
+    assert delta.total_delta == 1
+    assert {a.id for a in delta.entered} == {"n", "a"}
+
+    full = view_delta.apply_to_view(delta.articles, id_set, [(_art("old", 5), True)], [], _key, fully_loaded=True)
+    assert [a.id for a in full.articles][-1] == "old" and full.loaded_delta == 1
+
+    unchanged = view_delta.apply_to_view(full.articles, id_set, [], ["zzz"], _key)
+    assert not unchanged.changed and unchanged.articles is full.articles
@@ -0,0 +1,53 @@
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gui.article_list import ArticleRowModel
+
+
+def _model():
+    calls = []
+
+    def _cells(article):
+        calls.append(article.id)
+        return (article.title, "", "", "", "Read" if article.is_read else "Unread")
+
+    return ArticleRowModel(_cells), calls
+
+
+def test_cells_are_formatted_lazily_and_cached():
+    model, calls = _model()
+    articles = [SimpleNamespace(id=f"a{i}", title=f"T{i}", is_read=False) for i in range(5000)]
+    model.set_articles(articles)
+
+    assert len(model) == 5000
+    assert calls == []
+    assert model.cell(10, 0) == "T10"
+    assert model.cell(10, 4) == "Unread"
+    assert calls == ["a10"]
+
+    articles[10].is_read = True
+    assert model.cell(10, 4) == "Unread"
+    model.invalidate(10)
+    assert model.cell(10, 4) == "Read"
+
+
+def test_static_rows_shift_with_inserts_and_deletes():
+    model, _calls = _model()
+    articles = [SimpleNamespace(id=f"a{i}", title=f"T{i}", is_read=False) for i in range(3)]
+    model.set_articles(articles)
+    row = model.insert_static(len(model), "Load more items (Enter)")
+    assert row == 3 and model.is_static(3)
+    assert model.cell(1, 0) == "T1"
+
+    model.delete(0)
+    assert model.is_static(2)
+    assert model.cell(2, 0) == "Load more items (Enter)"
+    assert model.cell(0, 0) == "T1"
+    assert model.article_at(2) is None
+
+    assert model.set_static_cell(2, 0, "Loading more...")
+    assert model.cell(2, 0) == "Loading more..."
+    assert not model.set_static_cell(0, 0, "nope")
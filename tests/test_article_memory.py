@@ -0,0 +1,72 @@
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from core import models
+from core.models import Article, Feed
+
+
+def _rows(n):
+    # Mimic sqlite3 rows: every row carries its own copy of the feed id / MIME type strings.
+    feed_ids = [f"feed-{i:032d}" for i in range(50)]
+    return [
+        (
+            f"id-{i}",
+            "".join(feed_ids[i % 50]),
+            f"Title {i}",
+            f"https://example.com/{i}",
+            "2026-01-01 00:00:00",
+            "".join("audio/mpeg"),
+        )
+        for i in range(n)
+    ]
+
+
+def test_article_and_feed_have_no_instance_dict():
+    a = Article(title="t", url="u", content="", date="", author="", feed_id="f")
+    f = Feed(id="f", title="t", url="u")
+    assert not hasattr(a, "__dict__")
+    assert not hasattr(f, "__dict__")
+    assert a.chapters == ()
+
+
+def test_feed_ids_and_empty_chapters_are_shared():
+    rows = _rows(3)
+    a, b = (
+        Article(title=r[2], url=r[3], content="", date=r[4], author="", feed_id=r[1], id=r[0], media_type=r[5], published_ts=0)
+        for r in (rows[0], _rows(51)[50])
+    )
+    assert a.feed_id is b.feed_id
+    assert a.media_type is b.media_type
+    assert a.chapters is b.chapters
+
+
+def test_every_field_is_a_slot():
+    a = Article(title="t", url="u", content="", date="", author="", feed_id="f", chapters=[{"start": 0}])
+    f = Feed(id="f", title="t", url="u")
+    # Assigning anything outside __slots__ fails instead of growing a __dict__.
+    assert set(Article.__slots__) >= {"id", "feed_id", "media_type", "chapters", "cache_id", "timestamp"}
+    assert not any("__dict__" in getattr(cls, "__slots__", ()) for cls in (Article, Feed))
+    for obj in (a, f):
+        with pytest.raises(AttributeError):
+            obj.unexpected = 1
+    assert isinstance(a.chapters, tuple)
+
+
+def test_repeated_ids_are_interned_and_empty_chapters_share_one_tuple():
+    rows = _rows(51)
+    articles = [
+        Article(title=r[2], url=r[3], content="", date=r[4], author="", feed_id=r[1], id=r[0], media_type=r[5], chapters=[])
+        for r in rows
+    ]
+    # Rows built separate string objects; the articles hold the interned copies.
+    assert rows[0][1] is not rows[50][1]
+    assert articles[0].feed_id is sys.intern(rows[0][1])
+    assert articles[0].media_type is sys.intern("audio/mpeg")
+    assert articles[0].chapters is articles[50].chapters is models._NO_CHAPTERS
+    assert Feed(id="".join("feed-x"), title="t", url="u").id is sys.intern("feed-x")
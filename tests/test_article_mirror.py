@@ -0,0 +1,209 @@
+import core.db
+from core import article_mirror, utils
+from core.article_mirror import ArticleMirror
+from core.models import Article, Feed
+
+
+def _art(aid, feed_id, day, is_read=False, is_favorite=False):
+    return Article(
+        title=aid,
+        url=f"https://example.com/{aid}",
+        content="",
+        date=f"2026-01-{day:02d} 12:00:00",
+        author="",
+        feed_id=feed_id,
+        is_read=is_read,
+        id=aid,
+        is_favorite=is_favorite,
+    )
+
+
+def _mirror(tmp_path, monkeypatch):
+    # Chapters are still looked up in the main database.
+    monkeypatch.setattr(core.db, "DB_FILE", str(tmp_path / "rss.db"))
+    core.db.init_db()
+    return ArticleMirror("Miniflux", str(tmp_path / "mirror.db"))
+
+
+def test_unprimed_mirror_defers_to_the_server(tmp_path, monkeypatch):
+    mirror = _mirror(tmp_path, monkeypatch)
+    mirror.upsert_articles([_art("a1", "f1", 1)])
+    assert mirror.page("all", 0, 10) is None
+
+
+def test_pages_views_locally_within_coverage(tmp_path, monkeypatch):
+    mirror = _mirror(tmp_path, monkeypatch)
+    mirror.sync_feeds([Feed(id="f1", title="One", url="u1", category="News"), Feed(id="f2", title="Two", url="u2", category="Sports")])
+    mirror.upsert_articles([_art(f"a{d}", "f1" if d % 2 else "f2", d, is_read=d < 3) for d in range(1, 9)])
+    mirror.set_states({"coverage_ts": 0})
+
+    articles, total = mirror.page("all", 0, 3)
+    assert [a.id for a in articles] == ["a8", "a7", "a6"] and total == 8
+    assert articles[0].cache_id == "Miniflux:f2:a8"
+    articles, total = mirror.page("unread:category:News", 0, 10)
+    assert [a.id for a in articles] == ["a7", "a5", "a3"] and total == 3
+
+    # Partial coverage: pages that would reach past it, and favorites views, go to the server.
+    mirror.set_states({"coverage_ts": utils.date_to_timestamp("2026-01-05 12:00:00")})
+    articles, total = mirror.page("all", 0, 4)
+    assert [a.id for a in articles] == ["a8", "a7", "a6", "a5"] and total is None
+    assert mirror.page("all", 2, 4) is None
+    assert mirror.page("starred:all", 0, 1) is None
+
+
+def test_views_with_a_known_total_are_served_past_coverage(tmp_path, monkeypatch):
+    mirror = _mirror(tmp_path, monkeypatch)
+    mirror.sync_feeds([Feed(id="f1", title="One", url="u1", category="News"), Feed(id="f2", title="Two", url="u2", category="News")])
+    mirror.upsert_articles([_art(f"a{d}", "f1", d) for d in range(1, 4)] + [_art(f"b{d}", "f2", d) for d in range(1, 9)])
+    mirror.set_states({"coverage_ts": utils.date_to_timestamp("2026-01-05 12:00:00")})
+    assert mirror.page("f1", 0, 50) is None
+
+    # The server says f1 has 3 entries and the mirror holds all of them.
+    mirror.note_view_total("f1", 3)
+    articles, total = mirror.page("f1", 0, 50)
+    assert [a.id for a in articles] == ["a3", "a2", "a1"] and total == 3
+    articles, total = mirror.page("unread:f1", 0, 50)
+    assert total == 3
+
+    # f2 has more on the server than mirrored.
+    mirror.note_view_total("f2", 20)
+    assert mirror.page("f2", 0, 50) is None
+
+    # Unread ids the mirror doesn't hold invalidate read-filtered marks, not whole-feed ones.
+    mirror.note_view_total("unread:f2", 8)
+    assert mirror.page("unread:f2", 0, 50)[1] == 8
+    mirror.reconcile_unread([f"b{d}" for d in range(1, 9)] + ["a1", "a2", "a3", "elsewhere"])
+    assert mirror.page("unread:f2", 0, 50) is None
+    assert mirror.page("unread:f1", 0, 50)[1] == 3
+
+
+def test_local_writes_and_unread_reconciliation(tmp_path, monkeypatch):
+    mirror = _mirror(tmp_path, monkeypatch)
+    mirror.upsert_articles([_art("a1", "f1", 1), _art("a2", "f1", 2), _art("a3", "f1", 3)])
+    mirror.set_states({"coverage_ts": 0})
+
+    mirror.set_read(["a1"], True)
+    mirror.set_favorite("a2", True)
+    assert [a.id for a in mirror.page("unread:all", 0, 10)[0]] == ["a3", "a2"]
+    assert [a.id for a in mirror.page("favorites:all", 0, 10)[0]] == ["a2"]
+
+    assert mirror.reconcile_unread(["a1"])
+    assert [a.id for a in mirror.page("unread:all", 0, 10)[0]] == ["a1"]
+    # Ids that match nothing mirrored are ignored rather than marking everything read.
+    assert not mirror.reconcile_unread(["tag:google.com,2005:reader/item/00000000000000ff"])
+
+    mirror.mark_view_read("f1")
+    assert mirror.page("unread:all", 0, 10) == ([], 0)
+    assert {a.id for a in mirror.get_articles_by_ids(["a2", "missing"])} == {"a2"}
+
+
+def test_greader_sync_backfills_then_fetches_only_newer_items(tmp_path, monkeypatch):
+    mirror = _mirror(tmp_path, monkeypatch)
+    stream = [_art(f"i{d}", "feed/1", d) for d in range(9, 0, -1)]
+    calls = []
+
+    def fetch_contents(params):
+        calls.append(dict(params))
+        items = stream
+        if "ot" in params:
+            items = [a for a in stream if a.id == "i10"]
+        start = int(params.get("c") or 0)
+        page = items[start:start + params["n"]]
+        more = start + params["n"] < len(items)
+        return page, (str(start + params["n"]) if more else None)
+
+    def fetch_item_ids(params):
+        return ["-1", "i9", "i10"], None
+
+    article_mirror.sync_greader(mirror, fetch_contents, fetch_item_ids, initial_items=4, page_size=2)
+    assert [c.get("c") for c in calls] == [None, "2"]
+    # The stream is in crawl order, so only the last page's newest publish time is trusted.
+    articles, total = mirror.page("all", 0, 3)
+    assert [a.id for a in articles] == ["i9", "i8", "i7"] and total is None
+    assert mirror.page("all", 0, 4) is None
+    assert [a.id for a in mirror.page("unread:all", 0, 1)[0]] == ["i9"]
+
+    calls.clear()
+    stream.insert(0, _art("i10", "feed/1", 10))
+    article_mirror.sync_greader(mirror, fetch_contents, fetch_item_ids, initial_items=4, page_size=2)
+    assert len(calls) == 1 and "ot" in calls[0]
+    assert [a.id for a in mirror.page("unread:all", 0, 2)[0]] == ["i10", "i9"]
+
+
+def test_greader_sync_reconciles_starred_items_changed_elsewhere(tmp_path, monkeypatch):
+    mirror = _mirror(tmp_path, monkeypatch)
+    stream = [_art(f"i{d}", "feed/1", d, is_favorite=d == 2) for d in range(3, 0, -1)]
+    starred = {"ids": ["i2"], "fail": False}
+
+    def fetch_contents(params):
+        return ([] if "ot" in params else stream), None
+
+    def fetch_starred_ids(params):
+        if starred["fail"]:
+            raise RuntimeError("quota")
+        return list(starred["ids"]), None
+
+    article_mirror.sync_greader(mirror, fetch_contents, fetch_starred_ids=fetch_starred_ids)
+    assert [a.id for a in mirror.page("favorites:all", 0, 10)[0]] == ["i2"]
+
+    # Starred and unstarred in another client: `ot` deltas don't carry these changes.
+    starred["ids"] = ["i3"]
+    article_mirror.sync_greader(mirror, fetch_contents, fetch_starred_ids=fetch_starred_ids)
+    assert [a.id for a in mirror.page("starred:all", 0, 10)[0]] == ["i3"]
+
+    # Without a fresh starred list, favorites go to the server again.
+    starred["fail"] = True
+    article_mirror.sync_greader(mirror, fetch_contents, fetch_starred_ids=fetch_starred_ids)
+    assert mirror.page("favorites:all", 0, 10) is None
+    assert mirror.page("all", 0, 10) is not None
+
+
+def test_greader_sync_walks_id_lists_at_most_every_ids_interval(tmp_path, monkeypatch):
+    mirror = _mirror(tmp_path, monkeypatch)
+    stream = [_art(f"i{d}", "feed/1", d) for d in range(3, 0, -1)]
+    walks = []
+
+    def fetch_contents(params):
+        return ([] if "ot" in params else stream), None
+
+    def fetch_item_ids(params):
+        walks.append("unread")
+        return ["i3"], None
+
+    def fetch_starred_ids(params):
+        walks.append("starred")
+        return [], None
+
+    def sync():
+        article_mirror.sync_greader(
+            mirror, fetch_contents, fetch_item_ids, fetch_starred_ids=fetch_starred_ids, ids_interval_s=3600
+        )
+
+    sync()
+    assert walks == ["unread", "starred"]
+    sync()
+    assert walks == ["unread", "starred"]
+    # The starred list reconciled last time still stands, so favorites stay local.
+    assert mirror.page("favorites:all", 0, 10) is not None
+
+    mirror.set_states({"ids_synced_at": int(mirror.get_int("ids_synced_at")) - 3600})
+    sync()
+    assert walks == ["unread", "starred"] * 2
+
+
+def test_greader_item_ids_normalizes_short_ids():
+    ids = article_mirror.greader_item_ids({"itemRefs": [{"id": "255"}, {"id": "-1"}, {"id": "tag:x"}]})
+    assert ids == [
+        "tag:google.com,2005:reader/item/00000000000000ff",
+        "tag:google.com,2005:reader/item/ffffffffffffffff",
+        "tag:x",
+    ]
+
+
+def test_mirror_is_opt_in_per_config(tmp_path, monkeypatch):
+    monkeypatch.setattr(article_mirror, "MIRROR_DIR", str(tmp_path))
+    assert article_mirror.for_provider({}, "Miniflux", "acct") is None
+    assert article_mirror.for_provider({"hosted_article_mirror": True}, "Miniflux", "") is None
+    mirror = article_mirror.for_provider({"hosted_article_mirror": True}, "Miniflux", "acct")
+    assert mirror is not None
+    assert mirror.path != article_mirror.mirror_path("Miniflux", "other")
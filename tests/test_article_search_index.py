@@ -0,0 +1,104 @@
+import sqlite3
+
+import pytest
+
+import core.db
+from core import search_index
+from providers.local import LocalProvider
+
+
+def _insert_article(c, article_id, feed_id, title, content, date, author="", is_read=0, is_favorite=0):
+    c.execute(
+        "INSERT INTO articles (id, feed_id, title, url, content, date, author, is_read, is_favorite, media_url, media_type) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, '', '')",
+        (article_id, feed_id, title, f"https://example.com/{article_id}", content, date, author, is_read, is_favorite),
+    )
+
+
+@pytest.fixture
+def provider(tmp_path, monkeypatch):
+    monkeypatch.setattr(core.db, "DB_FILE", str(tmp_path / "rss.db"))
+    core.db.init_db()
+    conn = core.db.get_connection()
+    try:
+        c = conn.cursor()
+        c.execute(
+            "INSERT INTO feeds (id, url, title, category, icon_url) VALUES (?, ?, ?, ?, ?)",
+            ("f1", "https://a.example/feed", "Science Weekly", "News", ""),
+        )
+        c.execute(
+            "INSERT INTO feeds (id, url, title, category, icon_url) VALUES (?, ?, ?, ?, ?)",
+            ("f2", "https://b.example/feed", "Cooking Club", "Food", ""),
+        )
+        _insert_article(c, "a1", "f1", "Telescope finds exoplanet", "<p>Astronomers <b>found</b> a planet.</p>", "2026-01-01 10:00:00", "Ada")
+        _insert_article(c, "a2", "f1", "Weekly roundup", "<div class='x'>A telescope mention in passing.</div>", "2026-01-02 10:00:00", "Bob", is_read=1)
+        _insert_article(c, "a3", "f2", "Sourdough basics", "<p>Flour, water &amp; salt.</p>", "2026-01-03 10:00:00", "Cy", is_favorite=1)
+        conn.commit()
+    finally:
+        conn.close()
+    return LocalProvider(config={})
+
+
+def test_search_ranks_title_matches_first_and_supports_prefixes(provider):
+    assert provider.supports_article_search()
+
+    results, total = provider.search_articles("telesc")
+    assert total == 2
+    assert [a.id for a in results] == ["a1", "a2"]
+
+    results, total = provider.search_articles("flour salt")
+    assert total == 1 and results[0].id == "a3"
+
+    # Markup is stripped before indexing.
+    _results, total = provider.search_articles("div class")
+    assert total == 0
+
+
+def test_search_respects_view_scope_and_filters(provider):
+    _r, total = provider.search_articles("telescope", feed_id="f2")
+    assert total == 0
+    results, _t = provider.search_articles("telescope", feed_id="unread:category:News")
+    assert [a.id for a in results] == ["a1"]
+    results, _t = provider.search_articles("sourdough", feed_id="favorites:all")
+    assert [a.id for a in results] == ["a3"]
+    results, _t = provider.search_articles("cooking")
+    assert [a.id for a in results] == ["a3"]  # feed title is indexed
+    _r, total = provider.search_articles("astronomers", title_only=True)
+    assert total == 0
+
+
+def test_search_index_follows_deletes_updates_and_feed_renames(provider):
+    conn = core.db.get_connection()
+    try:
+        c = conn.cursor()
+        c.execute("UPDATE articles SET title = 'Bread basics' WHERE id = 'a3'")
+        c.execute("UPDATE feeds SET title = 'Baking Club' WHERE id = 'f2'")
+        c.execute("DELETE FROM articles WHERE id = 'a1'")
+        conn.commit()
+    finally:
+        conn.close()
+
+    assert provider.search_articles("sourdough")[1] == 0
+    assert [a.id for a in provider.search_articles("bread baking")[0]] == ["a3"]
+    assert [a.id for a in provider.search_articles("telescope")[0]] == ["a2"]
+
+
+def test_search_index_backfills_existing_database(tmp_path):
+    db_path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(db_path)
+    search_index.register_functions(conn)
+    conn.execute("CREATE TABLE feeds (id TEXT PRIMARY KEY, title TEXT)")
+    conn.execute("CREATE TABLE articles (id TEXT PRIMARY KEY, feed_id TEXT, title TEXT, author TEXT, content TEXT)")
+    conn.execute("INSERT INTO articles VALUES ('x', NULL, 'Legacy item', '', '<i>old</i> body')")
+    assert search_index.ensure_schema(conn)
+    rows = conn.execute(
+        "SELECT rowid FROM articles_fts WHERE articles_fts MATCH ?",
+        (search_index.build_match_query("old bod"),),
+    ).fetchall()
+    conn.close()
+    assert len(rows) == 1
+
+
+def test_build_match_query_neutralizes_fts_syntax():
+    assert search_index.build_match_query('foo "bar" OR -baz*') == '"foo"* AND "bar"* AND "OR"* AND "baz"*'
+    assert search_index.build_match_query("   ") == ""
@@ -0,0 +1,94 @@
+import asyncio
+import os
+import socket
+import sys
+
+# Ensure repo root on path
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import core.db
+from core import cast_device_cache, cast_discovery
+from core.casting import CastDevice, CastingManager, CastProtocol
+
+
+def _use_temp_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(core.db, "DB_FILE", str(tmp_path / "rss.db"))
+    core.db.init_db()
+
+
+def test_device_cache_keeps_addresses_and_orders_connected_first(tmp_path, monkeypatch):
+    _use_temp_db(tmp_path, monkeypatch)
+    tv = {"protocol": "DLNA", "identifier": "uuid:tv::urn:schemas-upnp-org:device:MediaRenderer:1", "name": "TV",
+          "host": "192.168.1.20", "port": 49152, "metadata": {"location": "http://192.168.1.20:49152/desc.xml", "conf": object()}}
+    speaker = {"protocol": "Chromecast", "identifier": "5a1d", "name": "Kitchen", "host": "192.168.1.30", "port": 8009, "metadata": {}}
+
+    assert cast_device_cache.remember([tv, speaker]) == 2
+    assert cast_device_cache.remember([speaker], connected=True) == 1
+
+    rows = cast_device_cache.load()
+    assert [r["name"] for r in rows] == ["Kitchen", "TV"]
+    assert rows[0]["last_connected"]
+    # Non-JSON metadata (pyatv configs) is dropped; the location survives.
+    assert rows[1]["metadata"] == {"location": "http://192.168.1.20:49152/desc.xml"}
+    assert rows[1]["port"] == 49152
+
+    cast_device_cache.forget("Chromecast:5a1d")
+    assert [r["name"] for r in cast_device_cache.load()] == ["TV"]
+
+
+def test_ssdp_listener_reports_renderers_once_and_byebye():
+    alive, gone = [], []
+    listener = cast_discovery.SsdpListener(lambda usn, st, loc, h: alive.append((usn, loc)), gone.append)
+    usn = "uuid:abc::urn:schemas-upnp-org:device:MediaRenderer:1"
+    notify = (
+        "NOTIFY * HTTP/1.1\r\nHOST: 239.255.255.250:1900\r\nNT: urn:schemas-upnp-org:device:MediaRenderer:1\r\n"
+        f"NTS: ssdp:alive\r\nUSN: {usn}\r\nLOCATION: http://10.0.0.5:1400/xml/device_description.xml\r\n\r\n"
+    ).encode()
+    listener.datagram_received(notify, ("10.0.0.5", 1900))
+    listener.datagram_received(notify, ("10.0.0.5", 1900))
+    # Searches from other hosts and non-renderers are ignored.
+    listener.datagram_received(cast_discovery.search_request(), ("10.0.0.9", 50000))
+    listener.datagram_received(notify.replace(b"MediaRenderer", b"MediaServer"), ("10.0.0.6", 1900))
+    assert alive == [(usn, "http://10.0.0.5:1400/xml/device_description.xml")]
+
+    listener.datagram_received(notify.replace(b"ssdp:alive", b"ssdp:byebye"), ("10.0.0.5", 1900))
+    assert gone == [usn]
+
+
+def test_manager_lists_cached_devices_and_drops_unreachable_ones(tmp_path, monkeypatch):
+    _use_temp_db(tmp_path, monkeypatch)
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    closed = socket.socket()
+    closed.bind(("127.0.0.1", 0))
+    closed_port = closed.getsockname()[1]
+    closed.close()
+
+    cast_device_cache.remember([
+        {"protocol": "Chromecast", "identifier": "up", "name": "Living Room", "host": "127.0.0.1", "port": server.getsockname()[1]},
+        {"protocol": "AirPlay", "identifier": "down", "name": "Bedroom", "host": "127.0.0.1", "port": closed_port},
+    ])
+    manager = CastingManager(passive_discovery=False)
+    manager.casters = {}
+    changes = []
+    manager.add_device_listener(lambda: changes.append(1))
+    manager.start()
+    try:
+        manager.dispatch(asyncio.sleep(0.2))
+        assert [d.name for d in manager.known_devices()] == ["Bedroom", "Living Room"]
+        assert manager.known_devices(live_only=True) == []
+        assert changes
+
+        assert [d.name for d in manager.revalidate_known_devices(timeout=1.0)] == ["Living Room"]
+        assert [d.name for d in manager.known_devices(live_only=True)] == ["Living Room"]
+
+        announced = CastDevice(name="TV", protocol=CastProtocol.DLNA, identifier="uuid:tv", host="10.0.0.7", port=80)
+        manager._update_devices([announced])
+        manager.dispatch(asyncio.sleep(0.2))
+        assert "DLNA:uuid:tv" in {r["protocol"] + ":" + r["identifier"] for r in cast_device_cache.load()}
+    finally:
+        manager.stop()
+        server.close()
@@ -0,0 +1,85 @@
+import sqlite3
+import threading
+
+import pytest
+
+import core.db
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "rss.db")
+    monkeypatch.setattr(core.db, "DB_FILE", path)
+    core.db.init_db()
+    core.db.reset_query_stats()
+    yield path
+    core.db.close_pool()
+
+
+def test_readers_are_reused_per_thread(db_path):
+    with core.db.connection() as a:
+        pass
+    with core.db.connection() as b:
+        pass
+    assert a is b
+
+    other = {}
+
+    def _worker():
+        with core.db.connection() as conn:
+            other["conn"] = conn
+
+    t = threading.Thread(target=_worker)
+    t.start()
+    t.join()
+    assert other["conn"] is not a
+
+    stats = core.db.query_stats()
+    assert stats["read"]["count"] == 3
+    assert stats["read"]["total_s"] >= 0.0
+
+
+def test_writer_commits_on_success_and_rolls_back_on_error(db_path):
+    with core.db.connection(write=True) as conn:
+        conn.execute("INSERT INTO categories (id, title) VALUES ('c1', 'One')")
+
+    with pytest.raises(RuntimeError):
+        with core.db.connection(write=True) as conn:
+            conn.execute("INSERT INTO categories (id, title) VALUES ('c2', 'Two')")
+            raise RuntimeError("boom")
+
+    with core.db.connection() as conn:
+        titles = {r[0] for r in conn.execute("SELECT title FROM categories").fetchall()}
+    assert "One" in titles
+    assert "Two" not in titles
+    assert core.db.query_stats()["write"]["count"] == 2
+
+
+def test_writer_lock_timeout_reports_locked(db_path):
+    held = threading.Event()
+    release = threading.Event()
+
+    def _hold():
+        with core.db.connection(write=True):
+            held.set()
+            release.wait(5)
+
+    t = threading.Thread(target=_hold)
+    t.start()
+    try:
+        assert held.wait(5)
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            with core.db.connection(write=True, lock_timeout=0.05):
+                pass
+    finally:
+        release.set()
+        t.join()
+
+
+def test_close_pool_replaces_connections(db_path):
+    with core.db.connection() as before:
+        pass
+    core.db.close_pool()
+    with core.db.connection() as after:
+        assert after.execute("SELECT 1").fetchone() == (1,)
+    assert after is not before
@@ -282,7 +282,7 @@ def test_run_ytdlp_query_search_accepts_zero_returncode():
     with patch("core.discovery.subprocess.run", return_value=_FakeProc()), patch(
         "core.discovery.platform.system", return_value="Windows"
     ), patch("core.dependency_check._get_startup_info", return_value=None):
-        out = discovery._run_ytdlp_query_search("ytsearch", "north korea", limit=3, timeout=10)
+        out = discovery._run_ytdlp_query_search_subprocess("ytsearch", "north korea", limit=3, timeout=10)
 
     assert isinstance(out, list)
     assert len(out) == 1
@@ -0,0 +1,150 @@
+import io
+import os
+import sys
+import time
+
+# Ensure repo root on path
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from core import stream_proxy
+from core.hls_remux_store import RemuxStore, Segment, parse_media_playlist, segment_name
+
+SOURCE = "http://iptv.example/vod/movie.ts"
+
+
+def _write_segments(item, indexes, size=10):
+    for i in indexes:
+        with open(os.path.join(item.dir, segment_name(i)), "wb") as f:
+            f.write(b"\x47" * size)
+
+
+def test_playlist_is_event_while_remuxing_and_vod_when_complete(tmp_path):
+    store = RemuxStore(root=str(tmp_path))
+    item = store.open(SOURCE)
+    _write_segments(item, range(3))
+    run = "#EXTM3U\n#EXT-X-PLAYLIST-TYPE:EVENT\n" + "".join(f"#EXTINF:4.000000,\nseg_{i:05d}.ts\n" for i in range(3))
+    assert item.ingest(parse_media_playlist(run)) == 3
+    assert item.ingest(parse_media_playlist(run)) == 0
+
+    playlist = item.render_playlist()
+    assert "#EXT-X-PLAYLIST-TYPE:EVENT" in playlist and "#EXT-X-ENDLIST" not in playlist
+
+    _write_segments(item, [3])
+    item.ingest([Segment("seg_00003.ts", 2.5)], discontinuity_at="seg_00003.ts")
+    item.complete = True
+    playlist = item.render_playlist()
+    assert "#EXT-X-PLAYLIST-TYPE:VOD" in playlist and playlist.rstrip().endswith("#EXT-X-ENDLIST")
+    assert "#EXT-X-DISCONTINUITY\n#EXTINF:2.500000,\nseg_00003.ts" in playlist
+    assert item.remuxed_seconds == 14.5
+
+    assert item.segment_path("seg_00001.ts")
+    assert item.segment_path("../index.json") is None
+    assert item.segment_path("seg_00009.ts") is None
+
+
+def test_manifest_survives_restart_and_drops_lost_segments(tmp_path):
+    item = RemuxStore(root=str(tmp_path)).open(SOURCE)
+    _write_segments(item, range(4))
+    item.ingest([Segment(segment_name(i), 4.0) for i in range(4)])
+    item.duration = 600.0
+    item.save()
+
+    reopened = RemuxStore(root=str(tmp_path)).open(SOURCE)
+    assert [s.name for s in reopened.segments] == [segment_name(i) for i in range(4)]
+    assert reopened.resumable and reopened.next_index == 4
+
+    reopened.complete = True
+    reopened.save()
+    os.remove(os.path.join(reopened.dir, segment_name(2)))
+    again = RemuxStore(root=str(tmp_path)).open(SOURCE)
+    assert len(again.segments) == 2 and not again.complete
+
+
+def test_budget_evicts_idle_items_oldest_first(tmp_path):
+    store = RemuxStore(root=str(tmp_path))
+    store.max_bytes = 250
+    items = [store.open(f"http://iptv.example/{n}.ts") for n in range(3)]
+    for n, item in enumerate(items):
+        _write_segments(item, range(2), size=60)
+        os.utime(item.dir, (time.time() - 100 + n, time.time() - 100 + n))
+
+    store.enforce_budget(active_keys=[items[0].key])
+    assert os.path.isdir(items[0].dir)
+    assert not os.path.isdir(items[1].dir)
+    assert os.path.isdir(items[2].dir)
+
+
+class _FakeFfmpeg:
+    def __init__(self, cmd, **kwargs):
+        self.cmd = cmd
+        out_dir = os.path.dirname(cmd[-1])
+        start = int(cmd[cmd.index("-start_number") + 1])
+        lines = ["#EXTM3U"]
+        for i in range(start, start + 2):
+            with open(os.path.join(out_dir, segment_name(i)), "wb") as f:
+                f.write(b"\x47" * 188)
+            lines += ["#EXTINF:4.000000,", segment_name(i)]
+        with open(cmd[-1], "w", encoding="utf-8") as f:
+            f.write("\n".join(lines + ["#EXT-X-ENDLIST"]) + "\n")
+        self.stderr = io.BytesIO(b"  Duration: 00:10:00.00, start: 1.4, bitrate: 2000 kb/s\n")
+        _FakeFfmpeg.runs.append(self)
+
+    def poll(self):
+        return 0
+
+    def wait(self, timeout=None):
+        return 0
+
+    runs = []
+
+
+def test_converter_resumes_then_reuses_a_finished_remux(tmp_path, monkeypatch):
+    store = RemuxStore(root=str(tmp_path))
+    item = store.open(SOURCE)
+    _write_segments(item, range(3))
+    item.ingest([Segment(segment_name(i), 4.0) for i in range(3)])
+    item.duration = 20.0
+    item.save()
+
+    _FakeFfmpeg.runs = []
+    monkeypatch.setattr(stream_proxy.shutil, "which", lambda name: "/usr/bin/ffmpeg")
+    monkeypatch.setattr(stream_proxy.subprocess, "Popen", _FakeFfmpeg)
+
+    conv = stream_proxy.HLSConverter(SOURCE, {"User-Agent": "UA"}, store=store)
+    conv._monitor_thread.join(5)
+    cmd = _FakeFfmpeg.runs[0].cmd
+    assert cmd[cmd.index("-ss") + 1] == "12.000" and cmd[cmd.index("-start_number") + 1] == "3"
+    assert "-hls_list_size" in cmd and cmd[cmd.index("-hls_list_size") + 1] == "0"
+    assert item.complete and [s.index for s in item.segments] == [0, 1, 2, 3, 4]
+    assert b"#EXT-X-DISCONTINUITY\n#EXTINF:4.000000,\nseg_00003.ts" in conv.playlist_bytes()
+    assert conv.stream_type == "BUFFERED"
+    conv.stop()
+
+    again = stream_proxy.HLSConverter(SOURCE, store=store)
+    assert len(_FakeFfmpeg.runs) == 1 and again.process is None
+    assert again.wait_for_playlist(timeout=0.1)
+
+
+def test_clean_ffmpeg_exit_short_of_the_source_stays_resumable(tmp_path, monkeypatch):
+    # IPTV origins often drop the connection early; ffmpeg takes that as EOF and exits 0.
+    store = RemuxStore(root=str(tmp_path))
+    item = store.open(SOURCE)
+    item.duration = 600.0
+    item.save()
+    live = store.open("http://iptv.example/live/channel.ts")
+    live.live = True
+    live.save()
+
+    _FakeFfmpeg.runs = []
+    monkeypatch.setattr(stream_proxy.shutil, "which", lambda name: "/usr/bin/ffmpeg")
+    monkeypatch.setattr(stream_proxy.subprocess, "Popen", _FakeFfmpeg)
+
+    for source, target in ((SOURCE, item), (live.source_url, live)):
+        conv = stream_proxy.HLSConverter(source, store=store)
+        conv._monitor_thread.join(5)
+        conv.stop()
+        assert len(target.segments) == 2 and not target.complete
+        assert "#EXT-X-ENDLIST" not in target.render_playlist()
+    assert item.resumable and not live.resumable
@@ -0,0 +1,192 @@
+import os
+import sys
+import time
+
+import pytest
+
+# Ensure repo root on path
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import core.db
+from core import request_budget, stream_page_cache
+from core.request_budget import RequestBudget
+from providers.inoreader import InoreaderProvider, RateLimitError
+
+
+class _Resp:
+    def __init__(self, payload=None, headers=None, status_code=200):
+        self._payload = payload or {}
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.ok = status_code < 400
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        return None
+
+
+def _item(iid, read=False):
+    cats = ["user/-/state/com.google/read"] if read else []
+    return {"id": iid, "title": iid, "published": 1, "alternate": [{"href": f"https://example.com/{iid}"}], "categories": cats}
+
+
+def _provider(**conf):
+    base = {"app_id": "app", "app_key": "key", "token": "token", "article_request_page_size": 20}
+    base.update(conf)
+    return InoreaderProvider({"providers": {"inoreader": base}})
+
+
+def test_budget_keeps_a_reserve_for_foreground_requests():
+    budget = RequestBudget("Test", background_reserve=0.25, min_reserve=2)
+    assert budget.allow(request_budget.BACKGROUND) and budget.status() is None
+
+    budget.record(limit="100", used="74", reset_after_s="3600")
+    assert budget.remaining() == 26
+    assert budget.allow(request_budget.BACKGROUND)
+    budget.note_request()
+    assert not budget.allow(request_budget.BACKGROUND)
+    assert budget.allow(request_budget.FOREGROUND)
+
+    budget.record(used=100)
+    assert not budget.allow(request_budget.FOREGROUND)
+    budget.record(reset_after_s=0)
+    assert budget.remaining() == 100
+
+
+def test_inoreader_spreads_mirror_syncs_over_the_remaining_budget():
+    provider = _provider()
+    assert provider._mirror is None
+    assert provider._mirror_sync_interval_s() == 900
+
+    # 100 - 40 used - 25 reserved = 35 background requests; half of them over 7 hours.
+    provider._read_budget.record(limit=100, used=40, reset_after_s=7 * 3600)
+    assert provider._mirror_sync_interval_s() == pytest.approx(7 * 3600 / 17, rel=0.01)
+    provider._read_budget.record(used=75)
+    assert provider._mirror_sync_interval_s() == pytest.approx(7 * 3600, rel=0.01)
+
+
+def test_inoreader_tracks_quota_headers_and_defers_background_reads(monkeypatch):
+    provider = _provider()
+    quota_headers = {
+        "X-Reader-Zone1-Limit": "100",
+        "X-Reader-Zone1-Usage": "80",
+        "X-Reader-Zone2-Limit": "100",
+        "X-Reader-Zone2-Usage": "3",
+        "X-Reader-Limits-Reset-After": "7200",
+    }
+    calls = []
+
+    def _fake_request(method, url, headers=None, params=None, data=None, **kwargs):
+        calls.append(url)
+        return _Resp({}, headers=dict(quota_headers))
+
+    monkeypatch.setattr("providers.inoreader.requests.request", _fake_request)
+
+    assert provider._budget_for(f"{provider.base_url}/subscription/list") is provider._read_budget
+    assert provider._budget_for(f"{provider.base_url}/subscription/edit") is provider._write_budget
+    provider._request("get", f"{provider.base_url}/subscription/list")
+    quota = provider.get_request_quota()
+    assert quota["limit"] == 100 and quota["remaining"] == 20 and quota["reset_in_s"] > 7000
+
+    with pytest.raises(RateLimitError):
+        provider._request("get", f"{provider.base_url}/stream/contents/x", priority=request_budget.BACKGROUND)
+    assert len(calls) == 1
+    # Writes are billed separately and are unaffected.
+    provider._request("post", f"{provider.base_url}/edit-tag", data={"i": "x"}, priority=request_budget.BACKGROUND)
+    assert len(calls) == 2
+
+
+def test_stream_pages_persist_and_first_page_is_topped_up_with_ot(tmp_path, monkeypatch):
+    monkeypatch.setattr(core.db, "DB_FILE", str(tmp_path / "rss.db"))
+    core.db.init_db()
+    monkeypatch.setattr("providers.inoreader.utils.get_chapters_batch", lambda ids: {})
+    monkeypatch.setattr(
+        "providers.inoreader.utils.normalize_date", lambda raw, title, content, url: "2024-01-01T00:00:00Z"
+    )
+    calls = []
+    responses = []
+
+    def _fake_request(self, method, url, *, params=None, data=None, **kwargs):
+        if method == "post":
+            return _Resp({})
+        calls.append(dict(params or {}))
+        return _Resp(responses.pop(0))
+
+    monkeypatch.setattr(InoreaderProvider, "_request", _fake_request)
+
+    provider = _provider(persistent_page_cache=True, article_request_page_size=20)
+    responses[:] = [
+        {"items": [_item(f"a{i}") for i in range(20)], "continuation": "c1"},
+        {"items": [_item("b1"), _item("b2")]},
+    ]
+    page, total = provider.get_articles_page("all", 0, 22)
+    assert len(page) == 22 and total == 22 and len(calls) == 2
+    assert provider.mark_read("a3") is True
+
+    # A new session reuses both pages; the local read mark is applied to the cached copy.
+    calls.clear()
+    provider = _provider(persistent_page_cache=True, article_request_page_size=20)
+    page, total = provider.get_articles_page("all", 0, 22)
+    assert calls == [] and total == 22
+    assert [a.is_read for a in page if a.id == "a3"] == [True]
+
+    # After a manual refresh the first page is patched with items newer than its fetch time.
+    provider.refresh(force=True)
+    responses[:] = [{"items": [_item("new1")]}]
+    page, _total = provider.get_articles_page("all", 0, 3)
+    assert [a.id for a in page] == ["new1", "a0", "a1"]
+    assert len(calls) == 1 and "ot" in calls[0] and "c" not in calls[0]
+
+    calls.clear()
+    provider = _provider(persistent_page_cache=True, article_request_page_size=20)
+    page, _total = provider.get_articles_page("all", 0, 2)
+    assert [a.id for a in page] == ["new1", "a0"] and calls == []
+
+
+def test_read_state_streams_reuse_cached_pages_only_briefly(tmp_path, monkeypatch):
+    monkeypatch.setattr(core.db, "DB_FILE", str(tmp_path / "rss.db"))
+    core.db.init_db()
+    calls = []
+
+    def _fake_request(self, method, url, *, params=None, data=None, **kwargs):
+        calls.append(url)
+        return _Resp({"items": [_item("fresh")]})
+
+    monkeypatch.setattr(InoreaderProvider, "_request", _fake_request)
+    provider = _provider(persistent_page_cache=True)
+    account = provider._page_cache_account
+    hour_ago = int(time.time()) - 3600
+    for feed_id in ("all", "unread:all", "starred:all"):
+        url, params, _fallback = provider._build_articles_request(feed_id)
+        key = provider._stream_cache_key(url, params)
+        stream_page_cache.put_page(account, key, "c1", [_item("old")], None, fetched_at=hour_ago)
+
+        items, _next = provider._load_stream_page(url, params, "c1")
+        expected = "old" if feed_id == "all" else "fresh"
+        assert [i["id"] for i in items] == [expected], feed_id
+    assert len(calls) == 2
+
+
+def test_caches_are_keyed_by_account_not_by_app(monkeypatch):
+    from core import inoreader_oauth
+
+    def _fake_get(url, headers=None, timeout=None):
+        assert url == inoreader_oauth.USER_INFO_URL and headers["Authorization"] == "Bearer tok-b"
+        return _Resp({"userId": "1006"})
+
+    monkeypatch.setattr("core.inoreader_oauth.requests.get", _fake_get)
+    account_b = inoreader_oauth.account_key("tok-b", "app", "key")
+    assert account_b == "user:1006"
+
+    a = _provider(persistent_page_cache=True, account_id="user:1005")
+    b = _provider(persistent_page_cache=True, account_id=account_b)
+    assert a._page_cache_account != b._page_cache_account
+    assert a._account_key() == "user:1005"
+
+    # Without a readable user id every authorization gets its own key.
+    monkeypatch.setattr("core.inoreader_oauth.fetch_user_id", lambda *args, **kwargs: "")
+    assert inoreader_oauth.account_key("tok") != inoreader_oauth.account_key("tok")
@@ -0,0 +1,132 @@
+import os
+import sys
+import threading
+
+# Ensure repo root on path
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import core.db
+from core import listing_sources
+from core import rumble as rumble_mod
+from core.rumble import RumbleListingItem
+from providers.local import LocalProvider
+
+
+class _PagedSource(listing_sources.ListingSource):
+    name = "paged"
+    label = "Paged"
+    page_size = 2
+
+    def __init__(self, pages, barrier=None):
+        self.pages = pages
+        self.barrier = barrier
+        self.fetched = []
+        self._lock = threading.Lock()
+
+    def matches(self, url):
+        return url.startswith("paged://")
+
+    def max_pages(self, config, initial):
+        return 4
+
+    def fetch_page(self, url, page, timeout_s):
+        with self._lock:
+            self.fetched.append(page)
+        if self.barrier is not None:
+            # Every page of the round must be in flight at once to get past this.
+            self.barrier.wait(timeout=5)
+        return f"Channel p{page}", [RumbleListingItem(url=u, title=u) for u in self.pages.get(page, [])]
+
+
+def test_initial_listing_fetches_pages_in_one_parallel_round():
+    pages = {1: ["a", "b"], 2: ["c", "b"], 3: ["d"], 4: []}
+    source = _PagedSource(pages, barrier=threading.Barrier(4))
+
+    result = listing_sources.fetch_listing(source, "paged://chan", max_pages=4)
+
+    assert sorted(source.fetched) == [1, 2, 3, 4]
+    assert result.title == "Channel p1"
+    # Page order is kept, repeats across pages are dropped, the short page 3 ends the listing.
+    assert [it.id for it in result.items] == ["a", "b", "c", "d"]
+    assert result.pages == 3 and not result.reached_known
+
+
+def test_refresh_stops_at_first_page_with_known_item():
+    pages = {1: ["new", "old"], 2: ["older", "oldest"]}
+    source = _PagedSource(pages)
+
+    result = listing_sources.fetch_listing(source, "paged://chan", known_ids={"old"}, max_pages=4)
+    assert source.fetched == [1]
+    assert [it.id for it in result.items] == ["new", "old"]
+    assert result.reached_known
+
+    # Nothing on page 1 is known: the rest of the listing is read in one more round.
+    source = _PagedSource(pages)
+    result = listing_sources.fetch_listing(source, "paged://chan", known_ids={"elsewhere"}, max_pages=3)
+    assert sorted(source.fetched) == [1, 2, 3]
+    assert [it.id for it in result.items] == ["new", "old", "older", "oldest"]
+
+
+def test_rumble_feed_refresh_uses_listing_source(tmp_path, monkeypatch):
+    monkeypatch.setattr(core.db, "DB_FILE", str(tmp_path / "rss.db"))
+    core.db.init_db()
+    conn = core.db.get_connection()
+    conn.execute(
+        "INSERT INTO feeds (id, url, title, category, icon_url) "
+        "VALUES ('r1', 'https://rumble.com/c/Example', 'Example', 'Tests', '')"
+    )
+    # Another feed already owns one of the video URLs.
+    conn.execute("INSERT INTO feeds (id, url, title, category, icon_url) VALUES ('f2', 'u', 'Other', 'Tests', '')")
+    conn.execute(
+        "INSERT INTO articles (id, feed_id, title, url, content, date, author, is_read) "
+        "VALUES ('https://rumble.com/v3-shared.html', 'f2', 't', '', '', '2026-01-01 00:00:00', '', 0)"
+    )
+    conn.commit()
+    conn.close()
+
+    base = "https://rumble.com/c/Example/videos"
+    listing = {
+        base: ["v5", "v4"],
+        base + "?page=2": ["v3-shared"],
+        base + "?page=3": [],
+    }
+    requested = []
+
+    def _fake_fetch(url, timeout_s=20.0):
+        requested.append(url)
+        items = [
+            RumbleListingItem(url=f"https://rumble.com/{v}.html", title=v, published="2026-01-02T10:00:00+00:00")
+            for v in listing.get(url, [])
+        ]
+        return "Example Channel", items
+
+    monkeypatch.setattr(rumble_mod, "fetch_listing_items", _fake_fetch)
+    provider = LocalProvider({"feed_retry_attempts": 0, "feed_timeout_seconds": 2})
+
+    assert provider.refresh_feed("r1")
+    assert sorted(requested) == sorted(listing)
+    conn = core.db.get_connection()
+    try:
+        assert conn.execute("SELECT url, title FROM feeds WHERE id = 'r1'").fetchone() == (base, "Example Channel")
+        ids = {row[0] for row in conn.execute("SELECT id FROM articles WHERE feed_id = 'r1'")}
+    finally:
+        conn.close()
+    assert ids == {
+        "https://rumble.com/v5.html",
+        "https://rumble.com/v4.html",
+        "r1:https://rumble.com/v3-shared.html",
+    }
+
+    # A new upload on top: page 1 already holds a known video, so it is the only request.
+    requested.clear()
+    listing[base] = ["v6", "v5", "v4"]
+    assert provider.refresh_feed("r1")
+    assert requested == [base]
+    conn = core.db.get_connection()
+    try:
+        count = conn.execute("SELECT COUNT(*) FROM articles WHERE feed_id = 'r1'").fetchone()[0]
+    finally:
+        conn.close()
+    assert count == 4
@@ -0,0 +1,44 @@
+import pytest
+
+import core.db
+from providers.local import LocalProvider
+
+
+@pytest.fixture
+def provider(tmp_path, monkeypatch):
+    monkeypatch.setattr(core.db, "DB_FILE", str(tmp_path / "rss.db"))
+    core.db.init_db()
+    conn = core.db.get_connection()
+    try:
+        c = conn.cursor()
+        c.execute(
+            "INSERT INTO feeds (id, url, title, category, icon_url) VALUES ('f1', 'https://a.example/feed', 'A', 'News', '')"
+        )
+        for i in range(1200):
+            c.execute(
+                "INSERT INTO articles (id, feed_id, title, url, content, date, author, is_read, is_favorite, media_url, media_type) "
+                "VALUES (?, 'f1', ?, '', '', '2026-01-01 00:00:00', '', ?, 0, NULL, NULL)",
+                (f"a{i}", f"Item {i}", i % 2),
+            )
+        c.execute(
+            "INSERT INTO chapters (id, article_id, start, title, href) VALUES ('c1', 'a7', 12.5, 'Intro', '')"
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    return LocalProvider(config={})
+
+
+def test_get_articles_by_ids_loads_rows_across_chunks(provider):
+    ids = [f"a{i}" for i in range(1200)] + ["missing"]
+    articles = provider.get_articles_by_ids(ids)
+
+    assert len(articles) == 1200
+    by_id = {a.id: a for a in articles}
+    assert by_id["a3"].is_read is True
+    assert by_id["a4"].is_read is False
+    assert [ch["title"] for ch in by_id["a7"].chapters] == ["Intro"]
+
+
+def test_get_articles_by_ids_empty(provider):
+    assert provider.get_articles_by_ids([]) == []
@@ -0,0 +1,119 @@
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gui.mainframe as mainframe
+from core import change_feed
+from core.models import Article, Feed
+
+
+class _DummyMain:
+    _ensure_view_state = mainframe.MainFrame._ensure_view_state
+    _prune_view_cache_locked = mainframe.MainFrame._prune_view_cache_locked
+    _view_state_bytes = mainframe.MainFrame._view_state_bytes
+    _stub_view_state = mainframe.MainFrame._stub_view_state
+    _apply_article_changes = mainframe.MainFrame._apply_article_changes
+    _article_cache_id = mainframe.MainFrame._article_cache_id
+    _invalidate_views_after_failed_changes = mainframe.MainFrame._invalidate_views_after_failed_changes
+
+    def __init__(self):
+        self.view_cache = {}
+        self._view_cache_lock = threading.Lock()
+        self.max_cached_views = 15
+        self.view_cache_max_bytes = 0
+        self.article_page_size = 400
+        self.current_feed_id = None
+        self._base_view_id = None
+        self.stop_event = threading.Event()
+        self.feed_map = {
+            "f1": Feed(id="f1", title="One", url="u1", category="News"),
+            "f2": Feed(id="f2", title="Two", url="u2", category="Sports"),
+        }
+        self.shown = []
+
+        self.loads = []
+
+    def _show_current_view_delta(self, feed_id):
+        self.shown.append(feed_id)
+
+    def _begin_articles_load(self, feed_id, full_load=True, clear_list=True, reconcile=False):
+        self.loads.append((feed_id, full_load, clear_list, reconcile))
+
+
+def _art(aid, feed_id, ts, is_read=False):
+    a = Article(title=aid, url="", content="", date="", author="", feed_id=feed_id, is_read=is_read, id=aid)
+    a.timestamp = ts
+    return a
+
+
+def _fill(host, view_id, articles, total):
+    st = host._ensure_view_state(view_id)
+    st["articles"] = articles
+    st["id_set"] = {a.cache_id for a in articles}
+    st["total"] = total
+    st["paged_offset"] = len(articles)
+    return st
+
+
+def test_deltas_update_matching_views_incrementally():
+    host = _DummyMain()
+    all_st = _fill(host, "all", [_art("a2", "f1", 20), _art("b1", "f2", 10)], 5)
+    news = _fill(host, "category:News", [_art("a2", "f1", 20)], 1)
+    unread_f2 = _fill(host, "unread:f2", [_art("b1", "f2", 10)], 1)
+    id_set_before = all_st["id_set"]
+    host.current_feed_id = "all"
+    host._base_view_id = "all"
+
+    changes = [
+        change_feed.ArticleChange("a3", "f1", change_feed.ADDED),
+        change_feed.ArticleChange("b1", "f2", change_feed.DELETED),
+    ]
+    host._apply_article_changes(changes, [_art("a3", "f1", 30)], {"category:News": {"News"}})
+
+    assert [a.id for a in all_st["articles"]] == ["a3", "a2"]
+    assert all_st["id_set"] is id_set_before and id_set_before == {"f1:a3", "f1:a2"}
+    assert all_st["total"] == 5 and all_st["paged_offset"] == 2
+    assert [a.id for a in news["articles"]] == ["a3", "a2"] and news["total"] == 2
+    assert unread_f2["articles"] == [] and unread_f2["total"] == 0
+    assert host.shown == ["all"]
+
+
+def test_stub_views_and_non_matching_views_are_left_alone():
+    host = _DummyMain()
+    sports = _fill(host, "category:Sports", [_art("b1", "f2", 10)], 1)
+    stub = _fill(host, "f1", [_art("a1", "f1", 5)], 1)
+    host._stub_view_state(stub)
+
+    host._apply_article_changes(
+        [change_feed.ArticleChange("a3", "f1", change_feed.ADDED)],
+        [_art("a3", "f1", 30)],
+        {},
+    )
+
+    assert [a.id for a in sports["articles"]] == ["b1"] and sports["total"] == 1
+    assert stub["stub"] is True and stub["articles"] == []
+    assert host.shown == []
+
+
+def test_only_deleted_changes_remove_articles():
+    host = _DummyMain()
+    all_st = _fill(host, "all", [_art("a2", "f1", 20), _art("b1", "f2", 10)], 2)
+
+    # b1 changed but wasn't returned by the fetch: it stays until a DELETED change says otherwise.
+    host._apply_article_changes([change_feed.ArticleChange("b1", "f2", change_feed.UPDATED)], [], {})
+    assert [a.id for a in all_st["articles"]] == ["a2", "b1"] and all_st["total"] == 2
+
+
+def test_failed_fetch_invalidates_views_and_reloads_the_open_one():
+    host = _DummyMain()
+    _fill(host, "all", [_art("a2", "f1", 20)], 1)
+    _fill(host, "f2", [_art("b1", "f2", 10)], 1)
+    host.current_feed_id = "all"
+    host._base_view_id = "all"
+
+    host._invalidate_views_after_failed_changes()
+
+    assert list(host.view_cache) == ["all"]
+    assert host.loads == [("all", False, False, True)]
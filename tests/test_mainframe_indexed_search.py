@@ -0,0 +1,75 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gui.mainframe as mainframe
+from core.models import Article
+
+
+class _DummyMain:
+    _apply_indexed_search_results = mainframe.MainFrame._apply_indexed_search_results
+    _article_cache_id = mainframe.MainFrame._article_cache_id
+
+    def __init__(self, shown):
+        self.current_feed_id = "all"
+        self.current_articles = list(shown)
+        self._search_index_token = 2
+        self.rendered = []
+        self.status = []
+
+    def _is_search_active(self):
+        return True
+
+    def _capture_list_view_state(self):
+        return None, None, None, False
+
+    def _sort_articles_for_display(self, articles):
+        return sorted(articles, key=lambda a: a.timestamp, reverse=True)
+
+    def _get_base_articles_for_current_view(self):
+        return list(self.current_articles)
+
+    def _remove_loading_more_placeholder(self):
+        pass
+
+    def _render_articles_list(self, articles, empty_label=""):
+        self.rendered.append([a.id for a in articles])
+
+    def _should_show_load_more_placeholder(self, count):
+        return False
+
+    def _restore_list_view(self, *args):
+        pass
+
+    def _reset_fulltext_prefetch(self, articles):
+        pass
+
+    def SetStatusText(self, text):
+        self.status.append(text)
+
+
+def _art(aid, ts):
+    a = Article(title=aid, url="", content="", date="", author="", feed_id="f1", is_read=False, id=aid)
+    a.timestamp = ts
+    return a
+
+
+def test_index_results_merge_into_the_filtered_list():
+    host = _DummyMain([_art("a2", 20)])
+
+    host._apply_indexed_search_results(2, "all", [_art("a1", 10), _art("a2", 20)], 2)
+
+    assert [a.id for a in host.current_articles] == ["a2", "a1"]
+    assert host.rendered == [["a2", "a1"]]
+    assert host.status == ["Filter: 2 shown, 2 in database"]
+
+
+def test_results_for_an_older_search_or_another_view_are_dropped():
+    host = _DummyMain([_art("a2", 20)])
+
+    host._apply_indexed_search_results(1, "all", [_art("a1", 10)], 1)
+    host._apply_indexed_search_results(2, "f9", [_art("a1", 10)], 1)
+
+    assert [a.id for a in host.current_articles] == ["a2"]
+    assert host.rendered == []
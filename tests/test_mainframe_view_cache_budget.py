@@ -0,0 +1,76 @@
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gui.mainframe as mainframe
+from core.models import Article, approx_article_bytes
+
+
+class _DummyMain:
+    _ensure_view_state = mainframe.MainFrame._ensure_view_state
+    _prune_view_cache_locked = mainframe.MainFrame._prune_view_cache_locked
+    _view_state_bytes = mainframe.MainFrame._view_state_bytes
+    _stub_view_state = mainframe.MainFrame._stub_view_state
+
+    def __init__(self, max_views=15, max_bytes=0):
+        self.view_cache = {}
+        self._view_cache_lock = threading.Lock()
+        self.max_cached_views = max_views
+        self.view_cache_max_bytes = max_bytes
+        self.article_page_size = 400
+        self.current_feed_id = None
+
+
+def _articles(prefix, n, body=2000):
+    return [
+        Article(
+            title=f"{prefix} {i}",
+            url=f"https://example.com/{prefix}/{i}",
+            content="x" * body,
+            date="2026-01-01 00:00:00",
+            author="",
+            feed_id=prefix,
+            is_read=False,
+            id=f"{prefix}-{i}",
+        )
+        for i in range(n)
+    ]
+
+
+def _fill(host, view_id, articles, ts):
+    st = host._ensure_view_state(view_id)
+    st["articles"] = articles
+    st["id_set"] = {a.id for a in articles}
+    st["last_access"] = ts
+    return st
+
+
+def test_views_over_memory_budget_become_stubs_lru_first():
+    per_view = sum(approx_article_bytes(a) for a in _articles("x", 50))
+    host = _DummyMain(max_bytes=int(per_view * 2.5))
+    _fill(host, "a", _articles("a", 50), 1.0)
+    _fill(host, "b", _articles("b", 50), 2.0)
+    host.current_feed_id = "c"
+    _fill(host, "c", _articles("c", 50), 3.0)
+    host._ensure_view_state("c")
+
+    a = host.view_cache["a"]
+    assert a["stub"] is True
+    assert a["articles"] == []
+    assert a["stub_ids"] == [f"a-{i}" for i in range(50)]
+    assert not host.view_cache["b"].get("stub")
+    assert not host.view_cache["c"].get("stub")
+
+
+def test_current_view_is_never_stubbed_and_count_limit_still_applies():
+    host = _DummyMain(max_views=1, max_bytes=1)
+    host.current_feed_id = "b"
+    _fill(host, "a", _articles("a", 5), 1.0)
+    _fill(host, "b", _articles("b", 5), 2.0)
+    host._ensure_view_state("b")
+
+    assert host.view_cache["a"]["stub"] is True
+    assert not host.view_cache["b"].get("stub")
+    assert len(host.view_cache["b"]["articles"]) == 5
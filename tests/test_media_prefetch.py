@@ -0,0 +1,149 @@
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+# Ensure repo root on path
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from core import media_prefetch
+from core.range_cache_proxy import RangeCacheProxy
+
+
+def test_redirect_cache_expires_and_stays_bounded(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(media_prefetch.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(media_prefetch, "_REDIRECT_CACHE_MAX", 2)
+    media_prefetch.clear_redirects()
+
+    media_prefetch.remember_redirect("https://op3.dev/e/a.mp3", "https://cdn.example/a.mp3", ttl_s=60)
+    assert media_prefetch.cached_redirect("https://op3.dev/e/a.mp3") == "https://cdn.example/a.mp3"
+    clock[0] += 61
+    assert media_prefetch.cached_redirect("https://op3.dev/e/a.mp3") is None
+
+    for name in ("a", "b", "c"):
+        media_prefetch.remember_redirect(f"https://pdst.fm/{name}.mp3", f"https://cdn.example/{name}.mp3")
+    assert media_prefetch.cached_redirect("https://pdst.fm/a.mp3") is None
+    assert media_prefetch.cached_redirect("https://pdst.fm/c.mp3") == "https://cdn.example/c.mp3"
+    media_prefetch.clear_redirects()
+
+
+def test_newer_focus_replaces_queued_work_and_recent_items_are_skipped():
+    started = threading.Event()
+    release = threading.Event()
+    done = []
+    all_done = threading.Event()
+
+    def _resolve(url, use_ytdlp):
+        if url == "first":
+            started.set()
+            release.wait(5)
+        done.append((url, use_ytdlp))
+        if len(done) == 3:
+            all_done.set()
+
+    resolver = media_prefetch.SpeculativeResolver(_resolve, max_workers=1)
+    try:
+        assert resolver.submit([("first", False)]) == 1
+        assert started.wait(5)
+        # Queued behind the running item, then superseded before it starts.
+        assert resolver.submit([("stale", True)]) == 1
+        assert resolver.submit([("first", False), ("focused", True), ("next", False), ("next", False)]) == 2
+        release.set()
+        assert all_done.wait(5)
+        assert done == [("first", False), ("focused", True), ("next", False)]
+        # Resolved moments ago: nothing to do.
+        assert resolver.submit([("focused", True), ("next", False)]) == 0
+    finally:
+        resolver.shutdown()
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    body = bytes(range(256)) * 64
+    requests = []
+
+    def log_message(self, fmt, *args):
+        return
+
+    def do_GET(self):
+        rng = self.headers.get("Range", "")
+        _RangeHandler.requests.append(rng)
+        start, _, end = rng.replace("bytes=", "").partition("-")
+        start = int(start or 0)
+        end = min(int(end) if end else len(self.body) - 1, len(self.body) - 1)
+        chunk = self.body[start:end + 1]
+        self.send_response(206)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Content-Range", f"bytes {start}-{end}/{len(self.body)}")
+        self.send_header("Content-Length", str(len(chunk)))
+        self.end_headers()
+        self.wfile.write(chunk)
+
+
+def test_warm_caches_the_start_of_the_file_for_a_later_proxify():
+    _RangeHandler.requests = []
+    server = HTTPServer(("127.0.0.1", 0), _RangeHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/episode.mp3"
+    proxy = RangeCacheProxy(cache_dir=tempfile.mkdtemp(prefix="BlindRSS_test_cache_"), background_download=False)
+    try:
+        assert proxy.warm(url, headers={"User-Agent": "test"}, max_bytes=6000, skip_redirect_resolve=True)
+        assert _RangeHandler.requests == ["bytes=0-0", "bytes=0-5999"]
+
+        sid = proxy._sid_for(url, {"User-Agent": "test"})
+        ent = proxy._entries[sid]
+        assert ent.total_length == len(_RangeHandler.body)
+        assert ent._read_from_cache(0, 5999)[1] == _RangeHandler.body[:6000]
+
+        proxied = proxy.proxify(url, headers={"User-Agent": "test"}, skip_redirect_resolve=True)
+        assert proxied.endswith(f"id={sid}") and proxy._entries[sid] is ent
+    finally:
+        proxy.stop()
+        server.shutdown()
+        server.server_close()
+
+
+def test_focus_prefetch_never_builds_the_player_window(monkeypatch):
+    import pytest
+
+    pytest.importorskip("wx")
+    import gui.mainframe as mainframe
+
+    class _Cfg:
+        def get(self, key, default=None):
+            return {"media_prefetch_enabled": True}.get(key, default)
+
+    class _Player:
+        def __init__(self):
+            self.targets = []
+
+        def prefetch_media(self, targets):
+            self.targets.extend(targets)
+
+    class _Host:
+        _prefetch_media_around = mainframe.MainFrame._prefetch_media_around
+
+        def __init__(self):
+            self.config_manager = _Cfg()
+            self.current_articles = ["ep1", "ep2"]
+            self.player_window = None
+
+        def _should_play_in_player(self, article):
+            return True
+
+        def _playback_target(self, article):
+            return f"https://example.com/{article}.mp3", False
+
+        def _ensure_player_window(self):
+            raise AssertionError("arrowing through the list must not create the player")
+
+    monkeypatch.setattr(mainframe.core.discovery, "ytdlp_extractors_loaded", lambda: True)
+    host = _Host()
+    host._prefetch_media_around(0)
+
+    host.player_window = _Player()
+    host._prefetch_media_around(0)
+    assert host.player_window.targets[0] == ("https://example.com/ep1.mp3", False)
@@ -0,0 +1,69 @@
+import os
+import sys
+import time
+
+# Ensure repo root on path
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import core.db
+from core import media_resolve_cache
+
+
+def _use_temp_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(core.db, "DB_FILE", str(tmp_path / "rss.db"))
+    core.db.init_db()
+
+
+def test_signed_url_expiry_reads_query_and_path_stamps():
+    assert media_resolve_cache.signed_url_expiry(
+        "https://rr1---sn-x.googlevideo.com/videoplayback?expire=1767225600&itag=140"
+    ) == 1767225600
+    assert media_resolve_cache.signed_url_expiry(
+        "https://manifest.googlevideo.com/api/manifest/hls_playlist/expire/1767225600/ei/abc/index.m3u8"
+    ) == 1767225600
+    assert media_resolve_cache.signed_url_expiry("https://cdn.example/a.mp4?Expires=1767225600&Signature=x") == 1767225600
+    # Durations and other non-epoch values are not expiries.
+    assert media_resolve_cache.signed_url_expiry("https://cdn.example/a.mp4?exp=3600") is None
+    assert media_resolve_cache.signed_url_expiry("https://cdn.example/a.mp4") is None
+
+
+def test_entries_expire_before_the_signed_url_does(tmp_path, monkeypatch):
+    _use_temp_db(tmp_path, monkeypatch)
+    now = int(time.time())
+    signed = f"https://rr1---sn-x.googlevideo.com/videoplayback?expire={now + 3600}&itag=140"
+
+    entry = media_resolve_cache.put(
+        "https://www.youtube.com/watch?v=abc",
+        signed,
+        headers={"User-Agent": "UA"},
+        title="Video",
+        formats=[{"format_id": "140", "ext": "m4a", "url": signed, "fragments": [1, 2, 3]}],
+    )
+    assert entry.expires_at == now + 3600 - media_resolve_cache.EXPIRY_MARGIN_S
+
+    cached = media_resolve_cache.get("https://www.youtube.com/watch?v=abc")
+    assert cached.media_url == signed and cached.headers == {"User-Agent": "UA"} and cached.title == "Video"
+    assert cached.formats == [{"format_id": "140", "ext": "m4a", "url": signed}]
+    # Not good for long enough any more -> miss.
+    assert media_resolve_cache.get("https://www.youtube.com/watch?v=abc", min_remaining_s=3600) is None
+
+    # A URL that is about to expire isn't worth caching at all.
+    soon = f"https://rr1---sn-x.googlevideo.com/videoplayback?expire={now + 600}"
+    assert media_resolve_cache.put("https://www.youtube.com/watch?v=old", soon) is None
+    assert media_resolve_cache.get("https://www.youtube.com/watch?v=old") is None
+
+
+def test_unsigned_urls_use_the_ttl_and_can_be_invalidated(tmp_path, monkeypatch):
+    _use_temp_db(tmp_path, monkeypatch)
+    media_resolve_cache.put("https://rumble.com/v1-a.html", "https://cdn.rumble.example/a.mp4", ttl_s=120)
+    media_resolve_cache.put("https://rumble.com/v2-b.html", "https://cdn.rumble.example/b.mp4", ttl_s=7200)
+
+    assert media_resolve_cache.expiring(
+        ["https://rumble.com/v2-b.html", "https://rumble.com/v1-a.html", "https://rumble.com/unknown"], 600
+    ) == ["https://rumble.com/v1-a.html"]
+
+    media_resolve_cache.invalidate("https://rumble.com/v2-b.html")
+    assert media_resolve_cache.get("https://rumble.com/v2-b.html") is None
+    assert media_resolve_cache.get("https://rumble.com/v1-a.html").media_url == "https://cdn.rumble.example/a.mp4"
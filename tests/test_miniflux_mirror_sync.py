@@ -0,0 +1,173 @@
+import os
+import sys
+
+# Ensure repo root on path
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import core.db
+from core import utils
+from core.article_mirror import ArticleMirror
+from providers.miniflux import MinifluxProvider
+
+
+def _entry(eid, day, status="unread", starred=False, changed_day=None, feed_id=7):
+    return {
+        "id": eid,
+        "feed_id": feed_id,
+        "title": f"Entry {eid}",
+        "url": f"https://example.test/{eid}",
+        "content": "body",
+        "published_at": f"2026-01-{day:02d}T12:00:00Z",
+        "changed_at": f"2026-01-{(changed_day or day):02d}T12:00:00Z",
+        "status": status,
+        "starred": starred,
+        "enclosures": [],
+    }
+
+
+class _FakeServer:
+    def __init__(self, entries):
+        self.entries = list(entries)
+        self.calls = []
+        self.endpoints = []
+        self.honor_changed_after = True
+
+    def req(self, method, endpoint, json=None, params=None):
+        params = dict(params or {})
+        self.calls.append(params)
+        self.endpoints.append(endpoint)
+        if endpoint == "/v1/feeds/counters":
+            counters = {"reads": {}, "unreads": {}}
+            for e in self.entries:
+                if e["status"] != "removed":
+                    bucket = counters["unreads" if e["status"] == "unread" else "reads"]
+                    bucket[str(e["feed_id"])] = bucket.get(str(e["feed_id"]), 0) + 1
+            return counters
+        rows = [e for e in self.entries if e["status"] in params.get("status", ["unread", "read", "removed"])]
+        if endpoint.startswith("/v1/feeds/"):
+            rows = [e for e in rows if endpoint == f"/v1/feeds/{e['feed_id']}/entries"]
+        if "changed_after" in params and self.honor_changed_after:
+            rows = [e for e in rows if _ts(e["changed_at"]) > int(params["changed_after"])]
+        if "after_entry_id" in params:
+            rows = [e for e in rows if e["id"] > int(params["after_entry_id"])]
+        if params.get("starred") == "true":
+            rows = [e for e in rows if e["starred"]]
+        if params.get("order") == "published_at":
+            rows.sort(key=lambda e: e["published_at"], reverse=True)
+        else:
+            rows.sort(key=lambda e: e["id"])
+        offset = int(params.get("offset", 0))
+        return {"total": len(rows), "entries": rows[offset:offset + int(params.get("limit", 100))]}
+
+
+def _ts(value):
+    return utils.date_to_timestamp(value)
+
+
+def _setup(tmp_path, monkeypatch, entries):
+    monkeypatch.setattr(core.db, "DB_FILE", str(tmp_path / "rss.db"))
+    core.db.init_db()
+    provider = MinifluxProvider({"providers": {"miniflux": {"url": "https://example.test", "api_key": "k"}}})
+    provider._mirror = ArticleMirror(provider.get_name(), str(tmp_path / "mirror.db"))
+    server = _FakeServer(entries)
+    monkeypatch.setattr(provider, "_req", server.req)
+    return provider, server
+
+
+def test_delta_sync_requests_only_changes_since_the_watermark(tmp_path, monkeypatch):
+    provider, server = _setup(tmp_path, monkeypatch, [_entry(1, 1), _entry(2, 2), _entry(3, 3)])
+    provider._sync_mirror_now()
+    articles, total = provider.get_articles_page("all", 0, 10)
+    assert [a.id for a in articles] == ["3", "2", "1"] and total == 3
+
+    # One new entry, one read elsewhere, one starred elsewhere, one purged.
+    server.entries[0].update(status="read", changed_at="2026-01-05T12:00:00Z")
+    server.entries[1].update(starred=True, changed_at="2026-01-05T12:00:00Z")
+    server.entries[2].update(status="removed", changed_at="2026-01-05T12:00:00Z")
+    server.entries.append(_entry(4, 4, changed_day=5))
+    server.calls.clear()
+    provider._sync_mirror_now()
+
+    assert len(server.calls) == 1
+    assert server.calls[0]["changed_after"] == _ts("2026-01-03T12:00:00Z") - 2
+    articles, total = provider.get_articles_page("all", 0, 10)
+    assert [(a.id, a.is_read, a.is_favorite) for a in articles] == [
+        ("4", False, False),
+        ("2", False, True),
+        ("1", True, False),
+    ]
+    assert total == 3
+
+
+def test_servers_without_changed_after_fall_back_to_id_sync_and_bulk_status(tmp_path, monkeypatch):
+    provider, server = _setup(tmp_path, monkeypatch, [_entry(1, 1), _entry(2, 2)])
+    provider._sync_mirror_now()
+    server.honor_changed_after = False
+    server.entries[0].update(status="read")
+    server.entries[1].update(starred=True)
+    server.entries.append(_entry(3, 3))
+    provider._sync_mirror_now()
+
+    assert provider._mirror.get_state("changed_after_unsupported") == "1"
+    articles, _total = provider.get_articles_page("all", 0, 10)
+    assert [(a.id, a.is_read, a.is_favorite) for a in articles] == [
+        ("3", False, False),
+        ("2", False, True),
+        ("1", True, False),
+    ]
+
+
+def test_id_sync_lists_only_disagreeing_feeds_and_prunes_deleted_entries(tmp_path, monkeypatch):
+    entries = [_entry(1, 1), _entry(2, 2), _entry(3, 3, feed_id=8), _entry(4, 4, feed_id=9)]
+    provider, server = _setup(tmp_path, monkeypatch, entries)
+    provider._sync_mirror_now()
+    server.honor_changed_after = False
+    provider._sync_mirror_now()
+
+    # Feed 7 lost entry 1 to cleanup, feed 8 was read elsewhere, feed 9 is unchanged.
+    server.entries = [e for e in server.entries if e["id"] != 1]
+    server.entries[1].update(status="read")
+    server.calls.clear()
+    server.endpoints.clear()
+    provider._sync_mirror_now()
+
+    assert sorted(set(server.endpoints)) == ["/v1/entries", "/v1/feeds/7/entries", "/v1/feeds/8/entries", "/v1/feeds/counters"]
+    # Starred entries were listed on the previous sync; the hourly reconcile is not due yet.
+    assert not [c for c in server.calls if c.get("starred")]
+    assert [c["status"] for e, c in zip(server.endpoints, server.calls) if e == "/v1/feeds/8/entries"] == [["unread"]]
+    articles, total = provider.get_articles_page("all", 0, 10)
+    assert [(a.id, a.is_read) for a in articles] == [("4", False), ("3", True), ("2", False)]
+    assert total == 3
+
+
+def test_long_gap_triggers_a_full_resync(tmp_path, monkeypatch):
+    provider, server = _setup(tmp_path, monkeypatch, [_entry(1, 1)])
+    provider._sync_mirror_now()
+    provider._mirror.set_states({"synced_at": 1})
+    server.entries = [_entry(2, 2)]
+    server.calls.clear()
+    provider._sync_mirror_now()
+
+    assert "changed_after" not in server.calls[0]
+    articles, _total = provider.get_articles_page("all", 0, 10)
+    assert [a.id for a in articles] == ["2"]
+
+
+def test_ignored_changed_after_is_detected_before_the_delta_size_cap(tmp_path, monkeypatch):
+    monkeypatch.setattr("providers.miniflux.MIRROR_PAGE_SIZE", 2)
+    monkeypatch.setattr("providers.miniflux.MIRROR_MAX_DELTA_PAGES", 2)
+    provider, server = _setup(tmp_path, monkeypatch, [_entry(i, i) for i in range(1, 7)])
+    provider._sync_mirror_now()
+    server.honor_changed_after = False
+    server.entries.append(_entry(7, 7))
+    server.calls.clear()
+    provider._sync_mirror_now()
+
+    # The whole account (more than the page cap) came back: not a reset, a switch to id sync.
+    assert provider._mirror.get_state("changed_after_unsupported") == "1"
+    assert provider._mirror.is_primed()
+    assert len([c for c in server.calls if "changed_after" in c]) == 1
+    articles, _total = provider.get_articles_page("all", 0, 10)
+    assert [a.id for a in articles][0] == "7"
@@ -0,0 +1,118 @@
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("wx")
+pytest.importorskip("vlc")
+
+import core.db
+from core import media_prefetch, media_resolve_cache
+from gui import player as player_mod
+from gui.player import PlayerFrame
+
+
+class _Config:
+    def __init__(self, **values):
+        self.values = dict(values)
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+class _Host:
+    _resolve_media_worker = PlayerFrame._resolve_media_worker
+    _stream_cache_enabled = PlayerFrame._stream_cache_enabled
+    _get_cached_stream = PlayerFrame._get_cached_stream
+    _remember_stream = PlayerFrame._remember_stream
+    _schedule_stream_refresh = PlayerFrame._schedule_stream_refresh
+    _prefetch_one = PlayerFrame._prefetch_one
+
+    def __init__(self):
+        self.config_manager = _Config(media_resolve_cache_enabled=True)
+        self.current_url = None
+        self._active_load_seq = 1
+        self._current_stream_cached = False
+        self._stream_refresh_timer = None
+        self.finished = []
+        self.warmed = []
+        self.is_casting = False
+
+    def _finish_media_load(self, *args):
+        self.finished.append(args)
+
+    def _warm_stream(self, *args):
+        self.warmed.append(args)
+
+
+class _FakeYDL:
+    calls = 0
+
+    def __init__(self, opts):
+        self.opts = opts
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def extract_info(self, url, download=False):
+        _FakeYDL.calls += 1
+        expire = int(time.time()) + 6 * 3600
+        return {
+            "url": f"https://rr1---sn-x.googlevideo.com/videoplayback?expire={expire}&n={_FakeYDL.calls}",
+            "http_headers": {"User-Agent": "UA"},
+            "title": "Resolved title",
+            "formats": [{"format_id": "140", "ext": "m4a"}],
+        }
+
+
+def test_replays_are_served_from_the_resolve_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(core.db, "DB_FILE", str(tmp_path / "rss.db"))
+    core.db.init_db()
+    monkeypatch.setitem(sys.modules, "yt_dlp", type(sys)("yt_dlp"))
+    sys.modules["yt_dlp"].YoutubeDL = _FakeYDL
+    _FakeYDL.calls = 0
+    monkeypatch.setattr(player_mod.discovery, "get_ytdlp_cookie_sources", lambda url: [])
+    monkeypatch.setattr(player_mod.wx, "CallAfter", lambda fn, *args: fn(*args), raising=False)
+
+    host = _Host()
+    page = "https://www.youtube.com/watch?v=abc"
+    host._resolve_media_worker(1, page, True, "Title", None)
+    host._resolve_media_worker(1, page, True, "Title", None)
+
+    assert _FakeYDL.calls == 1
+    assert host.finished[0][2] == host.finished[1][2]
+    assert host.finished[1][3] == {"User-Agent": "UA"} and host.finished[1][4] == "Resolved title"
+    assert host._current_stream_cached is True
+
+    # A background refresh re-resolves without touching the loaded item.
+    host._resolve_media_worker(-1, page, True, None, None, refresh_only=True)
+    assert _FakeYDL.calls == 2 and len(host.finished) == 2
+    assert media_resolve_cache.get(page).media_url.endswith("&n=2")
+
+
+def test_prefetched_tracker_redirects_are_reused_on_play(monkeypatch):
+    media_prefetch.clear_redirects()
+    calls = []
+
+    def _resolve(url, max_redirects=30, timeout_s=15.0):
+        calls.append(url)
+        return "https://cdn.example/ep1.mp3"
+
+    monkeypatch.setattr(player_mod.utils, "resolve_final_url", _resolve)
+    monkeypatch.setattr(player_mod.wx, "CallAfter", lambda fn, *args: fn(*args), raising=False)
+
+    host = _Host()
+    tracked = "https://op3.dev/e/feeds.example/ep1.mp3"
+    host._prefetch_one(tracked, False)
+    assert host.warmed == [("https://cdn.example/ep1.mp3", {}, True)]
+
+    host._resolve_media_worker(1, tracked, False, "Episode 1", None)
+    assert calls == [tracked]
+    assert host.finished[0][2] == "https://cdn.example/ep1.mp3"
+    media_prefetch.clear_redirects()
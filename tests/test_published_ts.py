@@ -0,0 +1,92 @@
+import sqlite3
+import time
+
+import core.db
+from core import utils
+from core.models import Article
+from providers.local import LocalProvider
+
+
+def _insert(conn, article_id, date, feed_id="f1", is_favorite=0):
+    conn.execute(
+        "INSERT INTO articles (id, feed_id, title, url, content, date, author, is_read, is_favorite) "
+        "VALUES (?, ?, ?, '', '', ?, '', 0, ?)",
+        (article_id, feed_id, article_id, date, is_favorite),
+    )
+
+
+def test_init_db_backfills_published_ts_for_legacy_rows(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "rss.db")
+    monkeypatch.setattr(core.db, "DB_FILE", db_path)
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE feeds (id TEXT PRIMARY KEY, url TEXT, title TEXT, category TEXT, icon_url TEXT)")
+    conn.execute(
+        "CREATE TABLE articles (id TEXT PRIMARY KEY, feed_id TEXT, title TEXT, url TEXT, content TEXT, date TEXT, "
+        "author TEXT, is_read INTEGER DEFAULT 0)"
+    )
+    conn.execute("INSERT INTO articles (id, feed_id, title, date) VALUES ('old', 'f1', 't', '2024-05-01 12:00:00')")
+    conn.execute("INSERT INTO articles (id, feed_id, title, date) VALUES ('bad', 'f1', 't', '0001-01-01 00:00:00')")
+    conn.commit()
+    conn.close()
+
+    core.db.init_db()
+
+    conn = core.db.get_connection()
+    try:
+        rows = dict(conn.execute("SELECT id, published_ts FROM articles").fetchall())
+        indexes = {r[1] for r in conn.execute("PRAGMA index_list(articles)").fetchall()}
+    finally:
+        conn.close()
+    assert rows["old"] == utils.date_to_timestamp("2024-05-01 12:00:00") == 1714564800
+    assert rows["bad"] == 0
+    assert "idx_articles_feed_id_published_ts_id" in indexes
+
+
+def test_published_ts_tracks_inserts_and_date_updates_and_drives_order(tmp_path, monkeypatch):
+    monkeypatch.setattr(core.db, "DB_FILE", str(tmp_path / "rss.db"))
+    core.db.init_db()
+    conn = core.db.get_connection()
+    try:
+        conn.execute("INSERT INTO feeds (id, url, title, category, icon_url) VALUES ('f1', 'u', 'F', 'News', '')")
+        _insert(conn, "a", "2026-01-01 00:00:00")
+        _insert(conn, "b", "2026-01-03 00:00:00")
+        _insert(conn, "c", "2026-01-02 00:00:00")
+        conn.execute("UPDATE articles SET date = '2026-01-05 00:00:00' WHERE id = 'a'")
+        conn.commit()
+    finally:
+        conn.close()
+
+    articles, total = LocalProvider(config={}).get_articles_page("f1", offset=0, limit=10)
+    assert total == 3
+    assert [a.id for a in articles] == ["a", "b", "c"]
+    assert articles[0].timestamp == utils.date_to_timestamp("2026-01-05 00:00:00")
+
+
+def test_cleanup_old_articles_uses_published_ts(tmp_path, monkeypatch):
+    monkeypatch.setattr(core.db, "DB_FILE", str(tmp_path / "rss.db"))
+    core.db.init_db()
+    now = time.time()
+    fmt = "%Y-%m-%d %H:%M:%S"
+    conn = core.db.get_connection()
+    try:
+        conn.execute("INSERT INTO feeds (id, url, title, category, icon_url) VALUES ('f1', 'u', 'F', 'News', '')")
+        _insert(conn, "fresh", time.strftime(fmt, time.gmtime(now - 2 * 86400)))
+        _insert(conn, "stale", time.strftime(fmt, time.gmtime(now - 20 * 86400)))
+        _insert(conn, "stale_fav", time.strftime(fmt, time.gmtime(now - 20 * 86400)), is_favorite=1)
+        conn.commit()
+    finally:
+        conn.close()
+
+    core.db.cleanup_old_articles(days=7, keep_favorites=True)
+
+    conn = core.db.get_connection()
+    try:
+        ids = {r[0] for r in conn.execute("SELECT id FROM articles").fetchall()}
+    finally:
+        conn.close()
+    assert ids == {"fresh", "stale_fav"}
+
+
+def test_article_uses_published_ts_without_parsing():
+    a = Article(title="t", url="u", content="", date="not a date", author="", feed_id="f", published_ts=123)
+    assert a.timestamp == 123.0
@@ -0,0 +1,116 @@
+import threading
+import time
+
+import core.db
+from core.read_state_queue import ReadStateQueue
+from providers.local import LocalProvider
+
+
+class _RecordingProvider:
+    def __init__(self):
+        self.calls = []
+        self.event = threading.Event()
+
+    def mark_read_batch(self, ids):
+        self.calls.append(("read", sorted(ids)))
+        self.event.set()
+        return True
+
+    def mark_unread_batch(self, ids):
+        self.calls.append(("unread", sorted(ids)))
+        self.event.set()
+        return True
+
+
+def test_toggles_are_coalesced_per_article_and_flushed_in_one_batch():
+    provider = _RecordingProvider()
+    queue = ReadStateQueue(provider, flush_interval=60)
+
+    queue.mark("a", True, previous=False)
+    queue.mark("b", True, previous=False)
+    queue.mark("b", False)  # back where it started: nothing to write
+    queue.mark("c", False, previous=True)
+    queue.mark("a", False)
+    queue.mark("a", True)
+    assert queue.pending_state("a") is True and len(queue) == 3
+
+    assert queue.flush()
+    assert provider.calls == [("read", ["a"]), ("unread", ["c"])]
+    assert len(queue) == 0 and queue.pending_state("a") is None
+
+
+def test_worker_flushes_after_interval_or_when_batch_is_full():
+    provider = _RecordingProvider()
+    queue = ReadStateQueue(provider, flush_interval=0.05)
+    queue.mark("a", True)
+    assert provider.event.wait(2)
+    assert provider.calls == [("read", ["a"])]
+
+    provider = _RecordingProvider()
+    queue = ReadStateQueue(provider, flush_interval=60, max_batch=3)
+    for aid in ("x", "y", "z"):
+        queue.mark(aid, True)
+    assert provider.event.wait(2)
+    assert provider.calls == [("read", ["x", "y", "z"])]
+
+
+def test_close_flushes_and_overlay_reflects_pending_state():
+    provider = _RecordingProvider()
+    queue = ReadStateQueue(provider, flush_interval=60)
+    queue.mark("a", True)
+
+    class _A:
+        def __init__(self, aid):
+            self.id = aid
+            self.is_read = False
+
+    loaded = [_A("a"), _A("b")]
+    queue.overlay(loaded)
+    assert [a.is_read for a in loaded] == [True, False]
+
+    queue.close()
+    assert provider.calls == [("read", ["a"])]
+    # Nothing new is scheduled after close.
+    queue.mark("b", True)
+    time.sleep(0.05)
+    assert provider.calls == [("read", ["a"])]
+
+
+def test_set_provider_writes_old_toggles_to_old_provider():
+    old, new = _RecordingProvider(), _RecordingProvider()
+    queue = ReadStateQueue(old, flush_interval=60)
+    queue.mark("a", True)
+    queue.set_provider(new)
+    queue.mark("b", True)
+    queue.flush()
+
+    assert old.event.wait(2)
+    assert old.calls == [("read", ["a"])]
+    assert new.calls == [("read", ["b"])]
+
+
+def test_local_provider_batches_read_state_in_one_statement(tmp_path, monkeypatch):
+    monkeypatch.setattr(core.db, "DB_FILE", str(tmp_path / "rss.db"))
+    core.db.init_db()
+    conn = core.db.get_connection()
+    conn.execute("INSERT INTO feeds (id, url, title, category, icon_url) VALUES ('f1', 'u', 'F', 'Tests', '')")
+    for i in range(1000):
+        conn.execute(
+            "INSERT INTO articles (id, feed_id, title, url, content, date, author, is_read) "
+            "VALUES (?, 'f1', 't', '', '', '2026-01-01 00:00:00', '', 0)",
+            (f"a{i}",),
+        )
+    conn.commit()
+    conn.close()
+
+    provider = LocalProvider({})
+    assert provider.mark_read_batch([f"a{i}" for i in range(950)])
+    assert provider.mark_unread_batch(["a0", "a1"])
+
+    conn = core.db.get_connection()
+    try:
+        read = conn.execute("SELECT COUNT(*) FROM articles WHERE is_read = 1").fetchone()[0]
+    finally:
+        conn.close()
+    core.db.close_pool()
+    assert read == 948
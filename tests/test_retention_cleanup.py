@@ -0,0 +1,111 @@
+import sqlite3
+import time
+
+import core.db
+
+
+def _seed(n_old, n_new, with_favorite=True):
+    now = time.time()
+    fmt = "%Y-%m-%d %H:%M:%S"
+    old = time.strftime(fmt, time.gmtime(now - 30 * 86400))
+    new = time.strftime(fmt, time.gmtime(now - 86400))
+    conn = core.db.get_connection()
+    try:
+        conn.execute("INSERT INTO feeds (id, url, title, category, icon_url) VALUES ('f1', 'u', 'F', 'News', '')")
+        rows = [(f"old-{i}", old, 0) for i in range(n_old)] + [(f"new-{i}", new, 0) for i in range(n_new)]
+        if with_favorite:
+            rows.append(("old-fav", old, 1))
+        conn.executemany(
+            "INSERT INTO articles (id, feed_id, title, url, content, date, author, is_read, is_favorite) "
+            "VALUES (?, 'f1', 't', '', ?, ?, '', 1, ?)",
+            [(aid, "x" * 2000, date, fav) for aid, date, fav in rows],
+        )
+        conn.executemany(
+            "INSERT INTO chapters (id, article_id, start, title, href) VALUES (?, ?, 0, 'c', '')",
+            [(f"ch-{aid}", aid) for aid, _d, _f in rows],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _count(sql):
+    conn = core.db.get_connection()
+    try:
+        return conn.execute(sql).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_cleanup_deletes_in_batches_and_reports_progress(tmp_path, monkeypatch):
+    monkeypatch.setattr(core.db, "DB_FILE", str(tmp_path / "rss.db"))
+    core.db.init_db()
+    _seed(n_old=1050, n_new=10)
+
+    progress = []
+    deleted = core.db.cleanup_old_articles(
+        7, batch_size=500, pause_seconds=0, progress_cb=lambda done, total: progress.append((done, total))
+    )
+
+    assert deleted == 1050
+    assert progress == [(500, 1050), (1000, 1050), (1050, 1050)]
+    assert _count("SELECT COUNT(*) FROM articles") == 11
+    assert _count("SELECT COUNT(*) FROM chapters") == 11
+
+
+def test_cleanup_can_be_stopped_between_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(core.db, "DB_FILE", str(tmp_path / "rss.db"))
+    core.db.init_db()
+    _seed(n_old=300, n_new=0, with_favorite=False)
+
+    calls = []
+    deleted = core.db.cleanup_old_articles(
+        7, batch_size=100, pause_seconds=0, progress_cb=lambda d, t: calls.append(d), should_stop=lambda: bool(calls)
+    )
+    assert deleted == 100
+    assert _count("SELECT COUNT(*) FROM articles") == 200
+
+
+def test_new_databases_use_incremental_vacuum_and_shrink(tmp_path, monkeypatch):
+    monkeypatch.setattr(core.db, "DB_FILE", str(tmp_path / "rss.db"))
+    core.db.init_db()
+    assert _count("PRAGMA auto_vacuum") == 2
+    _seed(n_old=2000, n_new=0, with_favorite=False)
+
+    core.db.cleanup_old_articles(7, pause_seconds=0)
+    free_before = _count("PRAGMA freelist_count")
+    assert free_before > 0
+
+    released = core.db.reclaim_free_pages(step_pages=64, pause_seconds=0)
+    assert released >= free_before
+    assert _count("PRAGMA freelist_count") == 0
+
+
+def test_legacy_database_is_converted_when_mostly_free(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "rss.db")
+    monkeypatch.setattr(core.db, "DB_FILE", db_path)
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE articles (id TEXT PRIMARY KEY, feed_id TEXT, title TEXT, url TEXT, content TEXT, date TEXT, author TEXT, is_read INTEGER DEFAULT 0)")
+    conn.commit()
+    conn.close()
+    core.db.init_db()
+    assert _count("PRAGMA auto_vacuum") == 0
+    _seed(n_old=2000, n_new=5, with_favorite=False)
+    core.db.cleanup_old_articles(7, pause_seconds=0)
+
+    # The idle path never runs a full VACUUM; conversion is a separate startup step.
+    assert core.db.reclaim_free_pages(pause_seconds=0) == 0
+    assert _count("PRAGMA auto_vacuum") == 0
+    assert not core.db.convert_to_incremental_vacuum(max_file_bytes=1)
+    assert core.db.convert_to_incremental_vacuum()
+    assert _count("PRAGMA auto_vacuum") == 2
+    assert _count("PRAGMA freelist_count") == 0
+    # The FTS index is rebuilt against the renumbered rowids.
+    conn = core.db.get_connection()
+    try:
+        hits = conn.execute(
+            "SELECT COUNT(*) FROM articles_fts f JOIN articles a ON a.rowid = f.rowid WHERE articles_fts MATCH 't'"
+        ).fetchone()[0]
+    finally:
+        conn.close()
+    assert hits == 5
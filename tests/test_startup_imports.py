@@ -0,0 +1,105 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+# Ensure repo root on path
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from core.lazy_import import lazy_module
+
+# What main.py imports before the first window, minus wx/gui (not installed everywhere).
+CORE_STARTUP_MODULES = (
+    "core.dependency_check",
+    "core.config",
+    "core.factory",
+    "core.updater",
+    "core.windows_integration",
+    "core.discovery",
+)
+# Loaded on first use only: playing, casting, translating, full text, yt-dlp.
+DEFERRED_MODULES = (
+    "vlc",
+    "yt_dlp",
+    "trafilatura",
+    "pychromecast",
+    "pyatv",
+    "gui.player",
+    "core.casting",
+    "core.translation",
+    "core.article_extractor",
+    "core.stream_proxy",
+    "core.range_cache_proxy",
+)
+# Sum of the top-level cumulative import times reported by `python -X importtime`.
+# Generous for slow CI machines; a deferred subsystem sneaking back in costs far more.
+STARTUP_IMPORT_BUDGET_S = 2.5
+
+
+def _profile_imports(modules):
+    code = textwrap.dedent(
+        f"""
+        import sys, threading, time
+        for name in {list(modules)!r}:
+            __import__(name)
+        # Give anything started at import time a moment to pull in more modules.
+        time.sleep(0.5)
+        loaded = sorted(m for m in {list(DEFERRED_MODULES)!r} if m in sys.modules or any(k.startswith(m + ".") for k in list(sys.modules)))
+        print("LOADED=" + ",".join(loaded))
+        """
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    loaded = [m for m in proc.stdout.strip().rsplit("LOADED=", 1)[-1].split(",") if m]
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"; top level has no indent.
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line.split("|")
+        if len(parts) != 3 or parts[2].startswith("  "):
+            continue
+        try:
+            total_us += int(parts[1].strip())
+        except ValueError:
+            continue
+    return loaded, total_us / 1_000_000.0
+
+
+def test_core_startup_imports_defer_heavy_subsystems():
+    loaded, seconds = _profile_imports(CORE_STARTUP_MODULES)
+    assert loaded == []
+    assert seconds < STARTUP_IMPORT_BUDGET_S, f"startup imports took {seconds:.2f}s"
+
+
+def test_main_window_imports_defer_heavy_subsystems():
+    pytest.importorskip("wx")
+    loaded, seconds = _profile_imports(("main",))
+    assert loaded == []
+    assert seconds < STARTUP_IMPORT_BUDGET_S + 1.0, f"startup imports took {seconds:.2f}s"
+
+
+def test_lazy_module_imports_on_first_use(tmp_path, monkeypatch):
+    (tmp_path / "blindrss_lazy_probe.py").write_text("VALUE = 1\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "blindrss_lazy_probe", raising=False)
+
+    mod = lazy_module("blindrss_lazy_probe")
+    assert "blindrss_lazy_probe" not in sys.modules
+    assert mod.VALUE == 1
+    real = sys.modules["blindrss_lazy_probe"]
+
+    mod.VALUE = 2
+    assert real.VALUE == 2
+    # Already imported modules are returned as-is.
+    assert lazy_module("blindrss_lazy_probe") is real
@@ -0,0 +1,80 @@
+import os
+import sys
+
+# Ensure repo root on path
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from core import startup_snapshot
+from core.models import Article, Feed
+
+
+class _Config:
+    def __init__(self, provider, pcfg=None):
+        self.data = {"active_provider": provider, "providers": {provider: dict(pcfg or {})}}
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def get_provider_config(self, name):
+        return self.data["providers"].get(name, {})
+
+
+def _article(n, **kw):
+    return Article(
+        title=f"Item {n}",
+        url=f"https://example.com/{n}",
+        content="<p>body</p>",
+        date="2026-01-01 00:00:00",
+        author="A",
+        feed_id="f1",
+        id=f"a{n}",
+        published_ts=1_700_000_000 + n,
+        **kw,
+    )
+
+
+def test_snapshot_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(startup_snapshot, "SNAPSHOT_FILE", str(tmp_path / "startup_snapshot.json"))
+    key = startup_snapshot.provider_key(_Config("miniflux", {"url": "https://RSS.example/", "api_key": "secret"}))
+    assert key == "miniflux|https://rss.example"
+
+    feed = Feed(id="f1", title="Feed", url="https://example.com/rss", category="News")
+    feed.unread_count = 3
+    articles = [_article(2, is_favorite=True), _article(1, is_read=True, media_url="https://example.com/1.mp3", media_type="audio/mpeg")]
+    assert startup_snapshot.save(key, [feed], ["News", "Tech"], {"Tech": "News"}, "all", articles, 42)
+    assert "secret" not in (tmp_path / "startup_snapshot.json").read_text(encoding="utf-8")
+
+    snap = startup_snapshot.load(key)
+    assert snap is not None
+    assert [(f.id, f.title, f.category, f.unread_count) for f in snap.feeds] == [("f1", "Feed", "News", 3)]
+    assert snap.categories == ["News", "Tech"] and snap.hierarchy == {"Tech": "News"}
+    assert snap.view_id == "all" and snap.total == 42
+    assert [(a.id, a.cache_id, a.is_read, a.is_favorite, a.timestamp) for a in snap.articles] == [
+        (a.id, a.cache_id, a.is_read, a.is_favorite, a.timestamp) for a in articles
+    ]
+    assert snap.articles[1].media_url == "https://example.com/1.mp3"
+
+
+def test_snapshot_is_ignored_for_another_account_and_caps_articles(tmp_path, monkeypatch):
+    monkeypatch.setattr(startup_snapshot, "SNAPSHOT_FILE", str(tmp_path / "startup_snapshot.json"))
+    monkeypatch.setattr(startup_snapshot, "MAX_ARTICLES", 5)
+    key = startup_snapshot.provider_key(_Config("theoldreader", {"email": "me@example.com"}))
+    assert startup_snapshot.save(key, [], ["Uncategorized"], view_id="unread:all", articles=[_article(n) for n in range(20)], total=20)
+
+    assert startup_snapshot.load(startup_snapshot.provider_key(_Config("theoldreader", {"email": "you@example.com"}))) is None
+    assert startup_snapshot.load(startup_snapshot.provider_key(_Config("local"))) is None
+
+    ino = {"app_id": "app", "account_id": "user:1005"}
+    ino_key = startup_snapshot.provider_key(_Config("inoreader", ino))
+    assert startup_snapshot.save(ino_key, [], ["Uncategorized"])
+    assert startup_snapshot.load(startup_snapshot.provider_key(_Config("inoreader", dict(ino, account_id="user:1006")))) is None
+    assert startup_snapshot.load(ino_key) is not None
+    assert startup_snapshot.save(key, [], ["Uncategorized"], view_id="unread:all", articles=[_article(n) for n in range(20)], total=20)
+    assert len(startup_snapshot.load(key).articles) == 5
+
+    (tmp_path / "startup_snapshot.json").write_text("{not json", encoding="utf-8")
+    assert startup_snapshot.load(key) is None
+    startup_snapshot.clear()
+    assert startup_snapshot.load(key) is None
@@ -0,0 +1,130 @@
+import os
+import sys
+import tempfile
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Ensure repo root on path
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from core import range_cache_proxy, stream_proxy
+from core.range_cache_proxy import RangeCacheProxy
+from core.stream_proxy import StreamProxy
+
+
+class _Origin(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    body = bytes(range(256)) * 64
+    requests = []
+    connections = set()
+
+    def log_message(self, fmt, *args):
+        return
+
+    def _respond(self, send_body):
+        rng = self.headers.get("Range", "")
+        _Origin.requests.append((self.command, rng))
+        _Origin.connections.add(self.client_address)
+        start, end = 0, len(self.body) - 1
+        if rng:
+            a, _, b = rng.replace("bytes=", "").partition("-")
+            start, end = int(a), min(int(b) if b else end, end)
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(self.body)}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(self.body[start:end + 1])
+
+    def do_GET(self):
+        self._respond(True)
+
+    def do_HEAD(self):
+        self._respond(False)
+
+
+def _serve():
+    _Origin.requests = []
+    _Origin.connections = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Origin)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/episode.mp3"
+
+
+def _fetch(url, rng=None, method="GET"):
+    req = urllib.request.Request(url, method=method, headers={"Range": rng} if rng else {})
+    with urllib.request.urlopen(req, timeout=10) as resp:
+        return resp.status, dict(resp.headers), resp.read()
+
+
+def test_proxy_reuses_upstream_connections():
+    server, url = _serve()
+    proxy = StreamProxy()
+    try:
+        proxied = proxy.get_proxied_url(url, headers={"User-Agent": "test"})
+        for start in (0, 4000, 9000):
+            status, headers, data = _fetch(proxied, f"bytes={start}-{start + 99}")
+            assert status == 206
+            assert headers["Content-Range"] == f"bytes {start}-{start + 99}/{len(_Origin.body)}"
+            assert data == _Origin.body[start:start + 100]
+        assert len(_Origin.requests) == 3
+        # One keep-alive connection to the origin served every request.
+        assert len(_Origin.connections) == 1
+    finally:
+        proxy.stop()
+        server.shutdown()
+        server.server_close()
+
+
+def test_proxy_serves_cached_bytes_and_fetches_only_the_tail(monkeypatch):
+    server, url = _serve()
+    cache = RangeCacheProxy(cache_dir=tempfile.mkdtemp(prefix="BlindRSS_test_cache_"), background_download=False)
+    monkeypatch.setattr(range_cache_proxy, "_RANGE_PROXY_SINGLETON", cache)
+    proxy = StreamProxy()
+    try:
+        assert cache.warm(url, headers={"User-Agent": "test"}, max_bytes=6000, skip_redirect_resolve=True)
+        warmed = len(_Origin.requests)
+        proxied = proxy.get_proxied_url(url, headers={"User-Agent": "cast"})
+
+        status, headers, data = _fetch(proxied, "bytes=100-5999")
+        assert (status, data) == (206, _Origin.body[100:6000])
+        status, headers, _ = _fetch(proxied, method="HEAD")
+        assert status == 200 and headers["Content-Length"] == str(len(_Origin.body))
+        assert len(_Origin.requests) == warmed
+
+        status, headers, data = _fetch(proxied, "bytes=5000-")
+        assert status == 206
+        assert headers["Content-Range"] == f"bytes 5000-{len(_Origin.body) - 1}/{len(_Origin.body)}"
+        assert data == _Origin.body[5000:]
+        assert _Origin.requests[warmed:] == [("GET", f"bytes=6000-{len(_Origin.body) - 1}")]
+    finally:
+        proxy.stop()
+        cache.stop()
+        server.shutdown()
+        server.server_close()
+
+
+def test_send_file_span_without_os_sendfile(tmp_path, monkeypatch):
+    import socket
+
+    path = tmp_path / "data.bin"
+    path.write_bytes(bytes(range(256)) * 8)
+    monkeypatch.delattr(stream_proxy.os, "sendfile", raising=False)
+    a, b = socket.socketpair()
+    try:
+        with open(path, "rb") as f:
+            assert stream_proxy._send_file_span(a, f, 10, 300) == 300
+        received = b""
+        while len(received) < 300:
+            received += b.recv(4096)
+        assert received == path.read_bytes()[10:310]
+    finally:
+        a.close()
+        b.close()
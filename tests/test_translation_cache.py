@@ -0,0 +1,161 @@
+import os
+import sys
+import threading
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import core.db
+import core.translation as tr
+from core import translation_cache
+
+
+def _use_temp_db(monkeypatch, tmp_path):
+    monkeypatch.setattr(core.db, "DB_FILE", str(tmp_path / "rss.db"))
+    core.db.init_db()
+
+
+def test_translate_chunks_uses_cache_on_repeat(monkeypatch, tmp_path):
+    _use_temp_db(monkeypatch, tmp_path)
+    calls = []
+
+    def _fake_chunk(chunk, **kwargs):
+        calls.append(chunk)
+        return chunk.upper()
+
+    monkeypatch.setattr(tr, "_translate_chunk_openai", _fake_chunk)
+    text = "\n\n".join(f"paragraph {i} " + ("x" * 300) for i in range(6))
+
+    first = tr.translate_text_openai(text, api_key="k", target_language="fr", chunk_chars=700, use_cache=True)
+    n_first = len(calls)
+    second = tr.translate_text_openai(text, api_key="k", target_language="fr", chunk_chars=700, use_cache=True)
+
+    assert first == text.upper()
+    assert second == first
+    assert n_first > 1
+    assert len(calls) == n_first
+
+    # A different target language is a different cache entry.
+    tr.translate_text_openai(text, api_key="k", target_language="de", chunk_chars=700, use_cache=True)
+    assert len(calls) == 2 * n_first
+
+
+def test_translate_chunks_runs_misses_concurrently_in_order(monkeypatch, tmp_path):
+    _use_temp_db(monkeypatch, tmp_path)
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def _fake_chunk(chunk, **kwargs):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        return f"<{chunk.strip()[:12]}>"
+
+    monkeypatch.setattr(tr, "_translate_chunk_gemini", _fake_chunk)
+    text = "\n\n".join(f"paragraph {i:02d}" + (" y" * 150) for i in range(8))
+
+    out = tr.translate_text_gemini(text, api_key="k", target_language="es", chunk_chars=400)
+
+    assert out == "".join(f"<paragraph {i:02d}>" for i in range(8))
+    assert 1 < active["peak"] <= tr._PROVIDER_CONCURRENCY["gemini"]
+
+
+def test_translate_chunks_caches_successes_before_raising(monkeypatch, tmp_path):
+    _use_temp_db(monkeypatch, tmp_path)
+    text = "\n\n".join(f"block {i} " + ("z" * 300) for i in range(3))
+    chunks = list(tr._iter_text_chunks(text, max_chars=500))
+    assert len(chunks) == 3
+
+    def _flaky(chunk, **kwargs):
+        if chunk == chunks[1]:
+            raise RuntimeError("boom")
+        return "ok"
+
+    monkeypatch.setattr(tr, "_translate_chunk_groq", _flaky)
+    try:
+        tr.translate_text_groq(text, api_key="k", target_language="fr", chunk_chars=500, use_cache=True)
+        raised = False
+    except RuntimeError:
+        raised = True
+    assert raised
+
+    keys = [translation_cache.make_key("groq", None, "fr", c) for c in chunks]
+    cached = translation_cache.get_many(keys)
+    assert set(cached) == {keys[0], keys[2]}
+
+
+def test_translation_cache_evicts_least_recently_used(monkeypatch, tmp_path):
+    _use_temp_db(monkeypatch, tmp_path)
+    translation_cache.put_many([("a", "x" * 100)], max_bytes=250)
+    translation_cache.put_many([("b", "y" * 100)], max_bytes=250)
+    conn = core.db.get_connection()
+    try:
+        conn.execute("UPDATE translation_cache SET last_used_at = 1 WHERE key = 'a'")
+        conn.commit()
+    finally:
+        conn.close()
+    translation_cache.put_many([("c", "z" * 100)], max_bytes=250)
+
+    assert set(translation_cache.get_many(["a", "b", "c"])) == {"b", "c"}
+
+
+def test_translate_chunks_streams_chunks_in_order(monkeypatch):
+    delays = {}
+
+    def _fake_chunk(chunk, **kwargs):
+        # Later chunks finish first; callbacks must still arrive in document order.
+        time.sleep(delays.get(chunk, 0.0))
+        return chunk.upper()
+
+    monkeypatch.setattr(tr, "_translate_chunk_openai", _fake_chunk)
+    text = "\n\n".join(f"part {i} " + ("w" * 300) for i in range(4))
+    chunks = list(tr._iter_text_chunks(text, max_chars=400))
+    for i, c in enumerate(chunks):
+        delays[c] = 0.02 * (len(chunks) - i)
+
+    seen = []
+    out = tr.translate_text_openai(
+        text,
+        api_key="k",
+        target_language="fr",
+        chunk_chars=400,
+        on_chunk=lambda index, total, translated: seen.append((index, total, translated)),
+    )
+
+    assert out == text.upper()
+    assert [s[0] for s in seen] == list(range(len(chunks)))
+    assert all(s[1] == len(chunks) for s in seen)
+    assert "".join(s[2] for s in seen) == out
+
+
+def test_translate_chunks_cancellation_stops_remaining_work(monkeypatch):
+    calls = []
+    cancel = threading.Event()
+
+    def _fake_chunk(chunk, **kwargs):
+        calls.append(chunk)
+        cancel.set()
+        return chunk
+
+    monkeypatch.setattr(tr, "_translate_chunk_groq", _fake_chunk)
+    text = "\n\n".join(f"part {i} " + ("v" * 300) for i in range(10))
+
+    try:
+        tr.translate_text_groq(
+            text,
+            api_key="k",
+            target_language="fr",
+            chunk_chars=400,
+            should_cancel=cancel.is_set,
+        )
+        raised = False
+    except tr.TranslationCancelled:
+        raised = True
+
+    assert raised
+    assert len(calls) <= tr._PROVIDER_CONCURRENCY["groq"]
@@ -0,0 +1,67 @@
+import time
+
+from core.models import Article
+from core.view_search import ViewSearchIndex
+
+
+def _article(i, title, content="", author="", feed_id="f1"):
+    return Article(
+        title=title,
+        url=f"https://example.com/{i}",
+        content=content,
+        date="2026-01-01 00:00:00",
+        author=author,
+        feed_id=feed_id,
+        id=f"a{i}",
+    )
+
+
+def _index(feed_titles):
+    return ViewSearchIndex(lambda a: a.id, lambda fid: feed_titles.get(fid, ""))
+
+
+def test_filter_matches_stripped_casefolded_text_and_feed_title():
+    feeds = {"f1": "Science Weekly"}
+    idx = _index(feeds)
+    items = [
+        _article(1, "Telescope News", "<p>Found a <b>PLANET</b></p>"),
+        _article(2, "Bread", '<a href="https://telescope.example">link</a>', author="Ada"),
+    ]
+    idx.add(items)
+
+    assert [a.id for a in idx.filter(items, "telescope")] == ["a1"]  # markup attributes aren't searchable
+    assert [a.id for a in idx.filter(items, "planet found")] == ["a1"]
+    assert [a.id for a in idx.filter(items, "ADA")] == ["a2"]
+    assert [a.id for a in idx.filter(items, "weekly")] == ["a1", "a2"]
+    assert idx.filter(items, "planet", title_only=True) == []
+
+    feeds["f1"] = "Astronomy Digest"
+    assert idx.filter(items, "weekly") == []
+    assert len(idx.filter(items, "digest")) == 2
+
+
+def test_add_and_retain_track_view_contents():
+    idx = _index({})
+    first = [_article(i, f"Item {i}") for i in range(3)]
+    idx.add(first)
+    assert len(idx) == 3
+    idx.add(first + [_article(3, "Item 3")])
+    assert len(idx) == 4
+    idx.retain(first[:1])
+    assert len(idx) == 1
+    # Articles missing from the index are indexed on demand.
+    assert [a.id for a in idx.filter(first, "item 2")] == ["a2"]
+
+
+def test_filter_large_view_is_fast_after_build():
+    body = "<div><p>" + ("lorem ipsum dolor sit amet " * 40) + "</p></div>"
+    items = [_article(i, f"Episode {i}", body, author=f"Host {i % 7}") for i in range(10000)]
+    idx = _index({"f1": "Podcast"})
+    idx.add(items)
+
+    start = time.perf_counter()
+    out = idx.filter(items, "episode 99", title_only=True)
+    elapsed = time.perf_counter() - start
+
+    assert len(out) == len([a for a in items if "99" in a.title])
+    assert elapsed < 0.25
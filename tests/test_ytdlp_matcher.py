@@ -0,0 +1,88 @@
+import os
+import re
+import sys
+
+# Ensure repo root on path
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from core import ytdlp_matcher
+
+
+def _ie(name, valid_url):
+    compiled = [re.compile(p) for p in ([valid_url] if isinstance(valid_url, str) else (valid_url or []))]
+
+    class _Extractor:
+        _VALID_URL = valid_url
+
+        @classmethod
+        def ie_key(cls):
+            return name
+
+        @classmethod
+        def suitable(cls, url):
+            return any(p.match(url) for p in compiled)
+
+    _Extractor.__name__ = f"{name}IE"
+    return _Extractor
+
+
+def test_host_keys_come_from_literal_host_text():
+    assert ytdlp_matcher.host_keys(r"https?://(?:www\.)?vimeo\.com/(?P<id>\d+)") == {"vimeo"}
+    assert ytdlp_matcher.host_keys(r"https?://(?:www\.)?(?:twitter|x)\.com/\w+/status/\d+") == {"twitter", "x"}
+    assert ytdlp_matcher.host_keys(r"(?:https?://)?(?:\w+\.)?[yY][oO][uU]tube\.com/watch") == {"youtube"}
+    # Text in the path says nothing about the host.
+    assert ytdlp_matcher.host_keys(r"https?://[^/]+/videos/(?P<id>\d+)") is None
+    assert ytdlp_matcher.host_keys(r"https?://(?:[^.]+\.)?example\.com/") is None
+    # A "scheme:" alternative can't match an http URL and doesn't widen the keys.
+    assert ytdlp_matcher.host_keys(r"(?:coub:|https?://coub\.com/view/)(?P<id>\w+)") == {"coub"}
+    assert ytdlp_matcher.host_keys(r"anvato:(?P<key>[^:]+):(?P<id>\d+)") == set()
+
+
+def test_candidates_match_a_full_scan():
+    extractors = [
+        _ie("Vimeo", r"https?://(?:www\.)?vimeo\.com/(?P<id>\d+)"),
+        _ie("Twitter", (r"https?://(?:www\.)?(?:twitter|x)\.com/\w+/status/\d+", r"https?://t\.co/\w+")),
+        _ie("Search", False),
+        _ie("PeerTube", r"https?://[^/]+/videos/watch/(?P<id>[\w-]+)"),
+        _ie("Generic", r".*"),
+    ]
+    matcher = ytdlp_matcher.ExtractorMatcher(extractors, ytdlp_matcher.build_index(extractors))
+    assert matcher.generic_count == 2
+
+    urls = [
+        "https://vimeo.com/123",
+        "https://www.x.com/someone/status/1",
+        "https://t.co/abc",
+        "https://example.com/videos/watch/abc",
+        "https://news.example.com/story",
+    ]
+    for url in urls:
+        candidates = matcher.candidates(url)
+        assert [e for e in extractors if e.suitable(url)] == [e for e in candidates if e.suitable(url)]
+    assert [e.ie_key() for e in matcher.candidates("https://media.test/videos/watch/1")] == ["PeerTube", "Generic"]
+    assert "Search" not in [e.ie_key() for e in matcher.candidates("https://vimeo.com/123")]
+    # Non-http URLs can't be narrowed by host.
+    assert len(matcher.candidates("lbry://@chan/video")) == len(extractors)
+
+
+def test_index_is_saved_per_version_and_reused(tmp_path, monkeypatch):
+    monkeypatch.setattr(ytdlp_matcher, "INDEX_DIR", str(tmp_path))
+    extractors = [_ie("Vimeo", r"https?://vimeo\.com/\d+"), _ie("Generic", r".*")]
+    ytdlp_matcher.load_matcher(extractors, version="2026.01.01")
+    assert os.path.exists(ytdlp_matcher.index_path("2026.01.01"))
+
+    def _no_rebuild(_extractors):
+        raise AssertionError("index should have been loaded from disk")
+
+    monkeypatch.setattr(ytdlp_matcher, "build_index", _no_rebuild)
+    matcher = ytdlp_matcher.load_matcher(extractors, version="2026.01.01")
+    assert [e.ie_key() for e in matcher.candidates("https://vimeo.com/1")] == ["Vimeo", "Generic"]
+
+    # A new yt-dlp version (or a different extractor set) gets a fresh index.
+    monkeypatch.undo()
+    monkeypatch.setattr(ytdlp_matcher, "INDEX_DIR", str(tmp_path))
+    plugin = _ie("MyPlugin", r"https?://plugin\.example/\d+")
+    matcher = ytdlp_matcher.load_matcher(extractors + [plugin], version="2026.01.01")
+    assert plugin in matcher.candidates("https://plugin.example/1")
@@ -0,0 +1,90 @@
+import os
+import sys
+import threading
+import types
+
+# Ensure repo root on path
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from core import discovery, ytdlp_search
+
+
+class _FakeYDL:
+    instances = []
+
+    def __init__(self, opts):
+        self.params = dict(opts)
+        self.queries = []
+        self.pulled = 0
+        self.on_pull = None
+        _FakeYDL.instances.append(self)
+
+    def extract_info(self, url, download=True, process=True, ie_key=None):
+        assert download is False and process is False
+        self.queries.append(url)
+
+        def _entries():
+            for i in range(50):
+                self.pulled += 1
+                if self.on_pull:
+                    self.on_pull(self.pulled)
+                yield {"_type": "url", "url": f"https://video.example/{i}", "title": f"Video {i}"}
+
+        return {"_type": "playlist", "entries": _entries()}
+
+    def close(self):
+        pass
+
+
+def _fake_module(monkeypatch):
+    _FakeYDL.instances = []
+    monkeypatch.setattr(ytdlp_search, "_yt_dlp", types.SimpleNamespace(YoutubeDL=_FakeYDL))
+    monkeypatch.setattr(ytdlp_search, "_engine", None)
+
+
+def test_searches_reuse_one_ydl_per_thread_and_pull_only_the_limit(monkeypatch):
+    _fake_module(monkeypatch)
+    engine = ytdlp_search.get_engine()
+
+    first = engine.search("ytsearch", "cats", limit=3, timeout=10)
+    second = engine.search("scsearch", "dogs", limit=2, timeout=10)
+
+    assert [e["url"] for e in first] == [f"https://video.example/{i}" for i in range(3)]
+    assert len(second) == 2
+    assert len(_FakeYDL.instances) == 1
+    assert _FakeYDL.instances[0].queries == ["ytsearch3:cats", "scsearch2:dogs"]
+
+    other = []
+    worker = threading.Thread(target=lambda: other.append(engine.search("ytsearch", "x", limit=1, timeout=10)))
+    worker.start()
+    worker.join()
+    assert len(other[0]) == 1 and len(_FakeYDL.instances) == 2
+
+
+def test_cancel_event_stops_a_running_search(monkeypatch):
+    _fake_module(monkeypatch)
+    cancel = threading.Event()
+    engine = ytdlp_search.get_engine()
+    engine.search("ytsearch", "warmup", limit=1, timeout=10)
+    _FakeYDL.instances[0].on_pull = lambda n: cancel.set() if n >= 4 else None
+
+    out = engine.search("ytsearch", "cats", limit=40, timeout=10, cancel_event=cancel)
+
+    assert len(out) == 2
+    assert _FakeYDL.instances[0].pulled < 10
+
+
+def test_query_search_falls_back_to_the_cli_without_the_module(monkeypatch):
+    monkeypatch.setattr(ytdlp_search, "available", lambda: False)
+    calls = []
+
+    def _cli(search_key, term, limit=10, timeout=15):
+        calls.append((search_key, term, limit, timeout))
+        return [{"url": "https://example.com/x"}]
+
+    monkeypatch.setattr(discovery, "_run_ytdlp_query_search_subprocess", _cli)
+    out = discovery._run_ytdlp_query_search("ytsearch", " cats ", limit=3, timeout=10)
+    assert out == [{"url": "https://example.com/x"}]
+    assert calls == [("ytsearch", "cats", 3, 10)]